@@ -1,6 +1,6 @@
 """Atla package for PyPI distribution."""
 
-from atla_insights.client import Client
+from atla_insights.client import AsyncClient, Client
 from atla_insights.custom_metrics import get_custom_metrics, set_custom_metrics
 from atla_insights.experiments import run_experiment
 from atla_insights.frameworks import (
@@ -29,6 +29,7 @@ from atla_insights.frameworks import (
 )
 from atla_insights.instrument import instrument
 from atla_insights.llm_providers import (
+    ainstrument_elevenlabs,
     instrument_anthropic,
     instrument_bedrock,
     instrument_elevenlabs,
@@ -44,13 +45,20 @@ from atla_insights.llm_providers import (
 )
 from atla_insights.main import configure
 from atla_insights.marking import mark_failure, mark_success
-from atla_insights.metadata import get_metadata, set_metadata
+from atla_insights.metadata import (
+    get_metadata,
+    request_metadata,
+    set_metadata,
+    update_metadata,
+)
 from atla_insights.suppression import enable_instrumentation, suppress_instrumentation
 from atla_insights.tool import tool
 
 __all__ = [
+    "AsyncClient",
     "AtlaInsightsClient",
     "Client",
+    "ainstrument_elevenlabs",
     "configure",
     "enable_instrumentation",
     "get_custom_metrics",
@@ -75,6 +83,7 @@ __all__ = [
     "instrument_smolagents",
     "mark_failure",
     "mark_success",
+    "request_metadata",
     "run_experiment",
     "set_custom_metrics",
     "set_metadata",
@@ -97,4 +106,5 @@ __all__ = [
     "uninstrument_openai_agents",
     "uninstrument_pydantic_ai",
     "uninstrument_smolagents",
+    "update_metadata",
 ]
@@ -0,0 +1,355 @@
+"""Bounded capture of function arguments and return values."""
+
+import dataclasses
+import inspect
+import json
+import math
+from collections.abc import Collection, Generator, Mapping
+from types import TracebackType
+from typing import Any, Callable, Optional, Type, Union
+
+from pydantic import BaseModel
+
+# Limits on the serialized representation of captured values. Serialization stops as
+# soon as a limit is hit, so the cost of capturing a value is bounded by these limits
+# rather than by the size of the value itself.
+MAX_CAPTURE_DEPTH = 4
+MAX_CAPTURE_ITEMS = 32
+MAX_CAPTURE_STRING_LENGTH = 1_024
+MAX_CAPTURE_BYTES = 8_192
+
+_TRUNCATION_MARK = "..."
+
+_EXCLUDED_PARAMETERS = frozenset({"self", "cls"})
+
+
+class _BoundedJsonEncoder:
+    """JSON encoder that stops early once any of its limits is hit.
+
+    The output is always valid JSON: values beyond the depth limit are replaced by a
+    short placeholder, containers beyond the length limit and strings beyond the
+    string length limit are truncated, and encoding stops altogether once the output
+    reaches the byte limit. As the output is ASCII-only, its length in characters is
+    equal to its length in bytes. Encoding never fails: values that can't be encoded
+    (e.g. integers too large to convert) are replaced by a placeholder as well.
+    """
+
+    __slots__ = (
+        "_max_bytes",
+        "_max_depth",
+        "_max_items",
+        "_max_string_length",
+        "_parts",
+        "_size",
+    )
+
+    def __init__(
+        self,
+        max_depth: int = MAX_CAPTURE_DEPTH,
+        max_items: int = MAX_CAPTURE_ITEMS,
+        max_string_length: int = MAX_CAPTURE_STRING_LENGTH,
+        max_bytes: int = MAX_CAPTURE_BYTES,
+    ) -> None:
+        """Initialize the bounded JSON encoder.
+
+        :param max_depth (int): The maximum container nesting depth.
+        :param max_items (int): The maximum number of items encoded per container.
+        :param max_string_length (int): The maximum number of characters per string.
+        :param max_bytes (int): The (approximate) maximum size of the output in bytes.
+        """
+        self._max_depth = max_depth
+        self._max_items = max_items
+        self._max_string_length = max_string_length
+        self._max_bytes = max_bytes
+
+        self._parts: list[str] = []
+        self._size = 0
+
+    @property
+    def _exhausted(self) -> bool:
+        return self._size >= self._max_bytes
+
+    def _write(self, part: str) -> None:
+        self._parts.append(part)
+        self._size += len(part)
+
+    def _write_string(self, value: str, within_budget: bool = True) -> None:
+        max_length = self._max_string_length
+        if within_budget:
+            max_length = min(max_length, max(self._max_bytes - self._size, 0))
+        if len(value) > max_length:
+            value = value[:max_length] + _TRUNCATION_MARK
+        self._write(json.dumps(value))
+
+    def encode(self, value: Any) -> str:
+        """Encode a value as a bounded JSON string.
+
+        :param value (Any): The value to encode.
+        :return (str): The bounded JSON string.
+        """
+        self._parts = []
+        self._size = 0
+        self._encode(value, depth=0)
+        return "".join(self._parts)
+
+    def _encode(self, value: Any, depth: int) -> None:
+        num_parts, size = len(self._parts), self._size
+        try:
+            self._encode_value(value, depth)
+        except Exception:
+            # Discard any partial output of the value, so the output stays valid JSON.
+            del self._parts[num_parts:]
+            self._size = size
+            self._write_string(f"<unserializable {type(value).__qualname__}>", False)
+
+    def _encode_value(self, value: Any, depth: int) -> None:
+        if value is None or isinstance(value, (bool, int)):
+            self._write(json.dumps(value))
+        elif isinstance(value, float):
+            if math.isfinite(value):
+                self._write(json.dumps(value))
+            else:
+                # NaN and infinities are not valid JSON numbers.
+                self._write_string(json.dumps(value), False)
+        elif isinstance(value, str):
+            self._write_string(value)
+        elif isinstance(value, (bytes, bytearray)):
+            self._write_string(f"<{type(value).__name__}: {len(value)} bytes>", False)
+        elif isinstance(value, Mapping):
+            self._encode_mapping(value, depth)
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            self._encode_sequence(value, depth)
+        elif isinstance(value, BaseModel):
+            # Iterating over a model yields its fields without dumping them.
+            self._encode_mapping(dict(value), depth)
+        elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+            self._encode_mapping(
+                {
+                    field.name: getattr(value, field.name)
+                    for field in dataclasses.fields(value)
+                },
+                depth,
+            )
+        elif isinstance(value, Collection):
+            # E.g. deques or ranges, of which only the first few items are encoded.
+            self._encode_sequence(value, depth)
+        else:
+            try:
+                self._write_string(repr(value))
+            except Exception:
+                self._write_string(f"<{type(value).__qualname__}>")
+
+    def _encode_mapping(self, value: Mapping[Any, Any], depth: int) -> None:
+        if depth >= self._max_depth:
+            self._write_string(f"<{type(value).__qualname__}: {len(value)} items>", False)
+            return
+
+        self._write("{")
+        for idx, (key, item) in enumerate(value.items()):
+            if idx > 0:
+                self._write(", ")
+            if idx >= self._max_items or self._exhausted:
+                self._write(f'"{_TRUNCATION_MARK}": ')
+                self._write_string(f"{len(value) - idx} more items", False)
+                break
+            key = key if isinstance(key, str) else str(key)
+            self._write(json.dumps(key[: self._max_string_length]))
+            self._write(": ")
+            self._encode(item, depth + 1)
+        self._write("}")
+
+    def _encode_sequence(self, value: Any, depth: int) -> None:
+        if depth >= self._max_depth:
+            self._write_string(f"<{type(value).__qualname__}: {len(value)} items>", False)
+            return
+
+        self._write("[")
+        for idx, item in enumerate(value):
+            if idx > 0:
+                self._write(", ")
+            if idx >= self._max_items or self._exhausted:
+                self._write_string(
+                    f"{_TRUNCATION_MARK} {len(value) - idx} more items", False
+                )
+                break
+            self._encode(item, depth + 1)
+        self._write("]")
+
+
+def bounded_json_dumps(value: Any) -> str:
+    """Serialize a value to a JSON string, within the capture limits.
+
+    :param value (Any): The value to serialize.
+    :return (str): The bounded JSON string.
+    """
+    return _BoundedJsonEncoder().encode(value)
+
+
+class ArgumentCapturePlan:
+    """Plan for capturing the arguments a function gets called with.
+
+    The function signature is inspected once, when the plan is created. Binding the
+    arguments of a call then walks the precomputed parameters, rather than re-inspecting
+    and binding the full signature on every call. Arguments are bound the same way as
+    `inspect.signature(func).bind(*args, **kwargs)` with defaults applied, except that
+    `self` and `cls` are left out.
+    """
+
+    __slots__ = ("_keyword_names", "_num_positional", "_parameters")
+
+    def __init__(self, func: Callable[..., Any]) -> None:
+        """Initialize the argument capture plan.
+
+        :param func (Callable[..., Any]): The function to capture the arguments of.
+        """
+        # Each parameter is stored as (name, kind, positional index, default).
+        self._parameters: list[tuple[str, Any, Optional[int], Any]] = []
+        keyword_names: set[str] = set()
+        num_positional = 0
+
+        for parameter in inspect.signature(func).parameters.values():
+            position: Optional[int] = None
+            if parameter.kind in {
+                inspect.Parameter.POSITIONAL_ONLY,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            }:
+                position = num_positional
+                num_positional += 1
+            if parameter.kind in {
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                inspect.Parameter.KEYWORD_ONLY,
+            }:
+                keyword_names.add(parameter.name)
+
+            if parameter.name not in _EXCLUDED_PARAMETERS:
+                self._parameters.append(
+                    (parameter.name, parameter.kind, position, parameter.default)
+                )
+
+        self._num_positional = num_positional
+        self._keyword_names = frozenset(keyword_names)
+
+    def bind(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Bind the arguments of a call to their parameter names.
+
+        :param args (tuple[Any, ...]): The positional arguments of the call.
+        :param kwargs (dict[str, Any]): The keyword arguments of the call.
+        :return (dict[str, Any]): The arguments, by parameter name.
+        """
+        arguments: dict[str, Any] = {}
+        num_args = len(args)
+
+        for name, kind, position, default in self._parameters:
+            if kind is inspect.Parameter.VAR_POSITIONAL:
+                arguments[name] = args[self._num_positional :]
+            elif kind is inspect.Parameter.VAR_KEYWORD:
+                arguments[name] = {
+                    k: v for k, v in kwargs.items() if k not in self._keyword_names
+                }
+            elif position is not None and position < num_args:
+                arguments[name] = args[position]
+            elif name in kwargs and name in self._keyword_names:
+                arguments[name] = kwargs[name]
+            elif default is not inspect.Parameter.empty:
+                arguments[name] = default
+
+        return arguments
+
+    def dumps(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+        """Serialize the arguments of a call to a bounded JSON string.
+
+        :param args (tuple[Any, ...]): The positional arguments of the call.
+        :param kwargs (dict[str, Any]): The keyword arguments of the call.
+        :return (str): The bounded JSON string.
+        """
+        return bounded_json_dumps(self.bind(args, kwargs))
+
+
+class YieldedItems:
+    """Bounded record of the items yielded by a generator."""
+
+    __slots__ = ("_count", "_items")
+
+    def __init__(self) -> None:
+        """Initialize the yielded items record."""
+        self._items: list[Any] = []
+        self._count = 0
+
+    def append(self, item: Any) -> None:
+        """Record a yielded item, keeping a reference only to the first few items.
+
+        :param item (Any): The yielded item.
+        """
+        self._count += 1
+        if len(self._items) < MAX_CAPTURE_ITEMS:
+            self._items.append(item)
+
+    def get_items(self) -> list[Any]:
+        """Get the recorded items, within the capture limits.
+
+        :return (list[Any]): The first few yielded items. If items were omitted, the
+            last item is replaced with a marker of the number of omitted items.
+        """
+        items = self._items
+        if self._count > len(items):
+            num_omitted = self._count - len(items) + 1
+            items = [*items[:-1], f"... {num_omitted} more items"]
+        return items
+
+
+class RecordingGenerator:
+    """Generator proxy that records the items yielded by a generator.
+
+    Meant to be delegated to with `yield from`, so that values sent into and exceptions
+    thrown into the proxy are forwarded to the underlying generator, and its return
+    value is passed on. The wrapped generator behaves the same whether it is recorded
+    or not.
+    """
+
+    __slots__ = ("_generator", "_on_yield")
+
+    def __init__(
+        self, generator: Generator[Any, Any, Any], on_yield: Callable[[Any], None]
+    ) -> None:
+        """Initialize the recording generator proxy.
+
+        :param generator (Generator[Any, Any, Any]): The generator to record.
+        :param on_yield (Callable[[Any], None]): Called with each yielded item.
+        """
+        self._generator = generator
+        self._on_yield = on_yield
+
+    def __iter__(self) -> "RecordingGenerator":
+        """Get the proxy itself, as an iterator."""
+        return self
+
+    def __next__(self) -> Any:
+        """Get the next item of the underlying generator."""
+        item = next(self._generator)
+        self._on_yield(item)
+        return item
+
+    def send(self, value: Any) -> Any:
+        """Send a value into the underlying generator."""
+        item = self._generator.send(value)
+        self._on_yield(item)
+        return item
+
+    def throw(
+        self,
+        exc_type: Union[Type[BaseException], BaseException],
+        exc_val: Optional[BaseException] = None,
+        exc_tb: Optional[TracebackType] = None,
+    ) -> Any:
+        """Throw an exception into the underlying generator."""
+        # Only forward the arguments given: the three-argument signature is deprecated.
+        if exc_val is None and exc_tb is None:
+            item = self._generator.throw(exc_type)
+        else:
+            item = self._generator.throw(exc_type, exc_val, exc_tb)  # type: ignore[arg-type]
+        self._on_yield(item)
+        return item
+
+    def close(self) -> None:
+        """Close the underlying generator."""
+        self._generator.close()
@@ -1,6 +1,6 @@
 """Client for the Atla Insights data API."""
 
-from atla_insights.client.client import Client
+from atla_insights.client.client import AsyncClient, Client
 from atla_insights.client.types import (
     Annotation,
     CustomMetric,
@@ -15,6 +15,7 @@ from atla_insights.client.types import (
 
 __all__ = [
     "Annotation",
+    "AsyncClient",
     "Client",
     "CustomMetric",
     "CustomMetricValue",
@@ -1,18 +1,93 @@
 """Client for the Atla Insights data API."""
 
+import asyncio
+import importlib.util
+import itertools
 import json
+import math
 import os
+import time
+import warnings
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Dict, Iterator, List, Optional
+from types import SimpleNamespace
+from typing import (
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+)
+
+import httpx
+import urllib3
 
-from atla_insights.client._generated_client import ApiClient, Configuration, SDKApi
+from atla_insights.client._generated_client import (
+    ApiClient,
+    ApiException,
+    Configuration,
+    SDKApi,
+)
+from atla_insights.client._generated_client.rest import RESTResponse
 from atla_insights.client.types import (
     DetailedTraceListResponse,
+    Trace,
     TraceDetailResponse,
     TraceListResponse,
+    TraceWithDetails,
 )
 
 DEFAULT_HOST = "https://app.atla-ai.com"
+DEFAULT_MAX_CONCURRENCY = 10
+DEFAULT_TIMEOUT_S = 60.0
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_MAX_PREFETCH_PAGES = 2
+DEFAULT_TRACE_IDS_CHUNK_SIZE = 100
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_BACKOFF_S = 0.5
+
+# HTTP/2 support in httpx requires the optional `h2` package.
+_HAS_H2 = importlib.util.find_spec("h2") is not None
+
+
+def _get_num_pages(response: TraceListResponse) -> int:
+    """Get the total number of pages of a trace listing.
+
+    :param response (TraceListResponse): Any page of the listing.
+    :return (int): The number of pages.
+    """
+    return math.ceil(response.total / max(response.page_size, 1))
+
+
+def _iter_chunks(items: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    """Lazily split items into chunks.
+
+    :param items (Iterable[str]): The items.
+    :param chunk_size (int): The maximum number of items per chunk.
+    :return (Iterator[List[str]]): Iterator yielding the chunks.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether a failed request is worth retrying.
+
+    :param error (Exception): The error the request failed with.
+    :return (bool): Whether to retry the request.
+    """
+    if isinstance(error, ApiException):
+        return error.status == 429 or (error.status or 0) >= 500
+    return isinstance(error, (httpx.TransportError, urllib3.exceptions.HTTPError))
 
 
 class Client:
@@ -96,6 +171,71 @@ class Client:
             page_size=page_size,
         )
 
+    def iter_traces(
+        self,
+        start_timestamp: Optional[datetime] = None,
+        end_timestamp: Optional[datetime] = None,
+        metadata_filter: Optional[List[Dict[str, str]]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_prefetch_pages: int = DEFAULT_MAX_PREFETCH_PAGES,
+    ) -> Iterator[Trace]:
+        """Iterate over all traces, fetching the next pages in the background.
+
+        ```python
+        from atla_insights.client import Client
+
+        client = Client(api_key="your_api_key_here")
+
+        # Iterate over all traces, 100 per page
+        for trace in client.iter_traces(page_size=100):
+            print(trace.id)
+        ```
+
+        :param start_timestamp (Optional[datetime]): Filter traces from this timestamp.
+        :param end_timestamp (Optional[datetime]): Filter traces until this timestamp.
+        :param metadata_filter (Optional[List[Dict[str, str]]]): Filter by metadata.
+        :param page_size (int): Number of traces per page. Defaults to 100.
+        :param max_prefetch_pages (int): Maximum number of pages fetched ahead of the
+            page being consumed. Defaults to 2.
+
+        :return (Iterator[Trace]): Iterator yielding the traces.
+        """
+        if max_prefetch_pages < 1:
+            raise ValueError("max_prefetch_pages must be at least 1.")
+
+        def list_page(page: int) -> TraceListResponse:
+            return self.list_traces(
+                start_timestamp=start_timestamp,
+                end_timestamp=end_timestamp,
+                metadata_filter=metadata_filter,
+                page=page,
+                page_size=page_size,
+            )
+
+        response = list_page(1)
+        # The total count of the first page is used throughout, so that traces ingested
+        # while iterating can't extend the iteration indefinitely.
+        total, num_pages = int(response.total), _get_num_pages(response)
+
+        executor = ThreadPoolExecutor(max_workers=max_prefetch_pages)
+        pending: Deque[Future[TraceListResponse]] = deque()
+        next_page, num_yielded = 2, 0
+        try:
+            while True:
+                while next_page <= num_pages and len(pending) < max_prefetch_pages:
+                    pending.append(executor.submit(list_page, next_page))
+                    next_page += 1
+
+                for trace in response.traces[: max(total - num_yielded, 0)]:
+                    num_yielded += 1
+                    yield trace
+
+                if not response.traces or not pending:
+                    return
+                response = pending.popleft().result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def get_trace(self, trace_id: str) -> TraceDetailResponse:
         """Get a single trace by ID.
 
@@ -147,6 +287,72 @@ class Client:
             ],
         )
 
+    def iter_traces_by_ids(
+        self,
+        trace_ids: Iterable[str],
+        chunk_size: int = DEFAULT_TRACE_IDS_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_backoff_s: float = DEFAULT_RETRY_BACKOFF_S,
+    ) -> Iterator[TraceWithDetails]:
+        """Get many traces by their IDs, in concurrently fetched chunks.
+
+        Trace IDs are consumed lazily, and at most `max_concurrency` chunks are in
+        flight at once, so memory stays bounded regardless of the number of IDs. Traces
+        are yielded in the order their chunks complete. Chunks failing with server
+        errors, rate limits or connection errors are retried with exponential backoff.
+
+        ```python
+        from atla_insights.client import Client
+
+        client = Client(api_key="your_api_key_here")
+
+        for trace in client.iter_traces_by_ids(my_trace_ids):
+            print(trace.id)
+        ```
+
+        :param trace_ids (Iterable[str]): The trace IDs to retrieve.
+        :param chunk_size (int): Maximum number of trace IDs per request. Defaults to
+            100.
+        :param max_concurrency (int): Maximum number of concurrent requests. Defaults
+            to 10.
+        :param max_retries (int): Maximum number of retries per chunk. Defaults to 3.
+        :param retry_backoff_s (float): Delay before the first retry, in seconds,
+            doubling with each further retry. Defaults to 0.5 seconds.
+
+        :return (Iterator[TraceWithDetails]): Iterator yielding the traces.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+
+        def get_chunk(chunk: List[str]) -> List[TraceWithDetails]:
+            attempt = 0
+            while True:
+                try:
+                    return self.get_traces(chunk).traces
+                except Exception as e:
+                    if attempt >= max_retries or not _is_retryable(e):
+                        raise
+                    time.sleep(retry_backoff_s * 2**attempt)
+                    attempt += 1
+
+        chunks = _iter_chunks(trace_ids, chunk_size)
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        try:
+            pending: Set[Future[List[TraceWithDetails]]] = {
+                executor.submit(get_chunk, chunk)
+                for chunk in itertools.islice(chunks, max_concurrency)
+            }
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    # Keep fetching while the traces are being consumed.
+                    if (chunk := next(chunks, None)) is not None:
+                        pending.add(executor.submit(get_chunk, chunk))
+                    yield from future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def get_audio(self, audio_id: str) -> bytearray:
         """Get audio file by ID.
 
@@ -197,3 +403,451 @@ class Client:
                 yield chunk
         finally:
             response.release_conn()
+
+
+def _to_rest_response(response: httpx.Response) -> RESTResponse:
+    """Convert an httpx response to a (read) response of the generated client.
+
+    :param response (httpx.Response): The httpx response, with its content read.
+    :return (RESTResponse): The response of the generated client.
+    """
+    rest_response = RESTResponse(
+        SimpleNamespace(
+            status=response.status_code,
+            reason=response.reason_phrase,
+            data=response.content,
+            headers=response.headers,
+        )
+    )
+    rest_response.read()
+    return rest_response
+
+
+class AsyncClient:
+    """Asynchronous client for the Atla Insights data API.
+
+    Requests share a pool of connections (multiplexed over HTTP/2 if the `h2` package
+    is installed), with at most `max_concurrency` requests in flight at once. Fetches
+    can therefore be fanned out with `asyncio.gather`.
+
+    Usage:
+    ```python
+    import asyncio
+
+    from atla_insights.client import AsyncClient
+
+    async def main():
+        async with AsyncClient(api_key="your_api_key") as client:
+            result = await client.list_traces(page_size=100)
+            traces = await asyncio.gather(
+                *(client.get_trace(trace.id) for trace in result.traces)
+            )
+
+    asyncio.run(main())
+    ```
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        host: str = DEFAULT_HOST,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        http2: Optional[bool] = None,
+        timeout: Optional[float] = DEFAULT_TIMEOUT_S,
+    ) -> None:
+        """Initialize async client with API key authentication.
+
+        :param api_key (Optional[str]): The Atla Insights token associated with your
+            organization. This can be found in the [Atla Insights platform](https://app.atla-ai.com).
+        :param host (str): Base URL for the API.
+        :param max_concurrency (int): Maximum number of concurrent requests (and
+            pooled connections). Defaults to 10.
+        :param http2 (Optional[bool]): Whether to use HTTP/2, which requires the `h2`
+            package (e.g. via `pip install "httpx[http2]"`). Defaults to `None`, using
+            HTTP/2 if `h2` is installed.
+        :param timeout (Optional[float]): Timeout of each request, in seconds. Defaults
+            to 60 seconds.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+
+        self.api_key = api_key or os.environ["ATLA_INSIGHTS_TOKEN"]
+        self.host = host
+        self.max_concurrency = max_concurrency
+
+        # The generated client (de)serializes requests and responses.
+        config = Configuration()
+        config.host = host
+
+        self._api_client = ApiClient(
+            config, header_name="Authorization", header_value=f"Bearer {self.api_key}"
+        )
+        self._sdk = SDKApi(self._api_client)
+
+        if http2 and not _HAS_H2:
+            warnings.warn(
+                "HTTP/2 requires the `h2` package, falling back to HTTP/1.1. Please "
+                'install it via `pip install "httpx[http2]"`.',
+                stacklevel=2,
+            )
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._http_client = httpx.AsyncClient(
+            http2=_HAS_H2 if http2 is None else http2 and _HAS_H2,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+            timeout=timeout,
+        )
+
+    async def __aenter__(self) -> "AsyncClient":
+        """Enter the client context."""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Exit the client context, closing its connections."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the connections of the client."""
+        await self._http_client.aclose()
+
+    def _deserialize(self, response: httpx.Response, response_type: str) -> Any:
+        """Deserialize a response, raising an `ApiException` on error status codes.
+
+        :param response (httpx.Response): The response, with its content read.
+        :param response_type (str): The type of a successful response.
+        :return (Any): The deserialized response.
+        """
+        return self._api_client.response_deserialize(
+            response_data=_to_rest_response(response),
+            response_types_map={"200": response_type},
+        ).data
+
+    async def _request(self, request: Any, response_type: str) -> Any:
+        """Send a request serialized by the generated client.
+
+        :param request (Any): The serialized request.
+        :param response_type (str): The type of a successful response.
+        :return (Any): The deserialized response.
+        """
+        method, url, headers, body, _ = request
+        async with self._semaphore:
+            response = await self._http_client.request(
+                method, url, headers=headers, content=body
+            )
+        return self._deserialize(response, response_type)
+
+    async def list_traces(
+        self,
+        start_timestamp: Optional[datetime] = None,
+        end_timestamp: Optional[datetime] = None,
+        metadata_filter: Optional[List[Dict[str, str]]] = None,
+        page: Optional[int] = None,
+        page_size: Optional[int] = None,
+    ) -> TraceListResponse:
+        """List traces with pagination and filtering.
+
+        ```python
+        from atla_insights.client import AsyncClient
+
+        async with AsyncClient(api_key="your_api_key_here") as client:
+            # List first 20 traces
+            result = await client.list_traces(page=1, page_size=20)
+
+        traces = result.traces
+        ```
+
+        :param start_timestamp (Optional[datetime]): Filter traces from this timestamp.
+        :param end_timestamp (Optional[datetime]): Filter traces until this timestamp.
+        :param metadata_filter (Optional[List[Dict[str, str]]]): Filter by metadata.
+        :param page (Optional[int]): Page number for pagination.
+        :param page_size (Optional[int]): Number of traces per page.
+
+        :return (TraceListResponse): Response with trace, count, and pagination info.
+        """
+        request = self._sdk._list_traces_serialize(
+            start_timestamp=start_timestamp,
+            end_timestamp=end_timestamp,
+            # Pre-serialize metadata filter.
+            metadata_filter=(
+                json.dumps(metadata_filter) if metadata_filter is not None else None
+            ),
+            page=page,
+            page_size=page_size,
+            _request_auth=None,
+            _content_type=None,
+            _headers=None,
+            _host_index=0,
+        )
+        return await self._request(request, "TraceListResponse")
+
+    async def iter_traces(
+        self,
+        start_timestamp: Optional[datetime] = None,
+        end_timestamp: Optional[datetime] = None,
+        metadata_filter: Optional[List[Dict[str, str]]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_prefetch_pages: int = DEFAULT_MAX_PREFETCH_PAGES,
+    ) -> AsyncIterator[Trace]:
+        """Iterate over all traces, fetching the next pages in the background.
+
+        ```python
+        from atla_insights.client import AsyncClient
+
+        async with AsyncClient(api_key="your_api_key_here") as client:
+            # Iterate over all traces, 100 per page
+            async for trace in client.iter_traces(page_size=100):
+                print(trace.id)
+        ```
+
+        :param start_timestamp (Optional[datetime]): Filter traces from this timestamp.
+        :param end_timestamp (Optional[datetime]): Filter traces until this timestamp.
+        :param metadata_filter (Optional[List[Dict[str, str]]]): Filter by metadata.
+        :param page_size (int): Number of traces per page. Defaults to 100.
+        :param max_prefetch_pages (int): Maximum number of pages fetched ahead of the
+            page being consumed. Defaults to 2.
+
+        :return (AsyncIterator[Trace]): Iterator yielding the traces.
+        """
+        if max_prefetch_pages < 1:
+            raise ValueError("max_prefetch_pages must be at least 1.")
+
+        def list_page(page: int) -> "asyncio.Task[TraceListResponse]":
+            return asyncio.create_task(
+                self.list_traces(
+                    start_timestamp=start_timestamp,
+                    end_timestamp=end_timestamp,
+                    metadata_filter=metadata_filter,
+                    page=page,
+                    page_size=page_size,
+                )
+            )
+
+        response = await list_page(1)
+        # The total count of the first page is used throughout, so that traces ingested
+        # while iterating can't extend the iteration indefinitely.
+        total, num_pages = int(response.total), _get_num_pages(response)
+
+        pending: Deque[asyncio.Task[TraceListResponse]] = deque()
+        next_page, num_yielded = 2, 0
+        try:
+            while True:
+                while next_page <= num_pages and len(pending) < max_prefetch_pages:
+                    pending.append(list_page(next_page))
+                    next_page += 1
+
+                for trace in response.traces[: max(total - num_yielded, 0)]:
+                    num_yielded += 1
+                    yield trace
+
+                if not response.traces or not pending:
+                    return
+                response = await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+            # Await the cancelled tasks, so that none of them is left pending.
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def get_trace(self, trace_id: str) -> TraceDetailResponse:
+        """Get a single trace by ID.
+
+        ```python
+        from atla_insights.client import AsyncClient
+
+        async with AsyncClient(api_key="your_api_key_here") as client:
+            # Get a specific trace by its ID
+            trace = await client.get_trace("my-trace-id")
+        ```
+
+        :param trace_id (str): Unique identifier for the trace.
+
+        :return (TraceDetailResponse): Response containing complete trace data.
+        """
+        request = self._sdk._get_trace_by_id_serialize(
+            trace_id=trace_id,
+            # Automatically include all data.
+            include=[
+                "spans",
+                "annotations",
+                "customMetrics",
+            ],
+            _request_auth=None,
+            _content_type=None,
+            _headers=None,
+            _host_index=0,
+        )
+        return await self._request(request, "TraceDetailResponse")
+
+    async def get_traces(self, trace_ids: List[str]) -> DetailedTraceListResponse:
+        """Get multiple traces by their IDs.
+
+        ```python
+        from atla_insights.client import AsyncClient
+
+        async with AsyncClient(api_key="your_api_key_here") as client:
+            # Get a specific traces by their IDs
+            traces = await client.get_traces(["my-trace-id-1", "my-trace-id-2"])
+        ```
+        :param trace_ids (List[str]): List of trace IDs to retrieve.
+
+        :return (DetailedTraceListResponse): Response containing complete trace data.
+        """
+        request = self._sdk._get_traces_by_ids_serialize(
+            ids=trace_ids,
+            # Automatically include all data.
+            include=[
+                "spans",
+                "annotations",
+                "customMetrics",
+            ],
+            _request_auth=None,
+            _content_type=None,
+            _headers=None,
+            _host_index=0,
+        )
+        return await self._request(request, "DetailedTraceListResponse")
+
+    async def iter_traces_by_ids(
+        self,
+        trace_ids: Iterable[str],
+        chunk_size: int = DEFAULT_TRACE_IDS_CHUNK_SIZE,
+        max_concurrency: Optional[int] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_backoff_s: float = DEFAULT_RETRY_BACKOFF_S,
+    ) -> AsyncIterator[TraceWithDetails]:
+        """Get many traces by their IDs, in concurrently fetched chunks.
+
+        Trace IDs are consumed lazily, and at most `max_concurrency` chunks are in
+        flight at once, so memory stays bounded regardless of the number of IDs. Traces
+        are yielded in the order their chunks complete. Chunks failing with server
+        errors, rate limits or connection errors are retried with exponential backoff.
+
+        ```python
+        from atla_insights.client import AsyncClient
+
+        async with AsyncClient(api_key="your_api_key_here") as client:
+            async for trace in client.iter_traces_by_ids(my_trace_ids):
+                print(trace.id)
+        ```
+
+        :param trace_ids (Iterable[str]): The trace IDs to retrieve.
+        :param chunk_size (int): Maximum number of trace IDs per request. Defaults to
+            100.
+        :param max_concurrency (Optional[int]): Maximum number of chunks in flight.
+            Defaults to `None`, using the concurrency limit of the client.
+        :param max_retries (int): Maximum number of retries per chunk. Defaults to 3.
+        :param retry_backoff_s (float): Delay before the first retry, in seconds,
+            doubling with each further retry. Defaults to 0.5 seconds.
+
+        :return (AsyncIterator[TraceWithDetails]): Iterator yielding the traces.
+        """
+        max_concurrency = max_concurrency or self.max_concurrency
+
+        async def get_chunk(chunk: List[str]) -> List[TraceWithDetails]:
+            attempt = 0
+            while True:
+                try:
+                    return (await self.get_traces(chunk)).traces
+                except Exception as e:
+                    if attempt >= max_retries or not _is_retryable(e):
+                        raise
+                    await asyncio.sleep(retry_backoff_s * 2**attempt)
+                    attempt += 1
+
+        chunks = _iter_chunks(trace_ids, chunk_size)
+        pending: Set[asyncio.Task[List[TraceWithDetails]]] = {
+            asyncio.create_task(get_chunk(chunk))
+            for chunk in itertools.islice(chunks, max_concurrency)
+        }
+        done: Set[asyncio.Task[List[TraceWithDetails]]] = set()
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    # Keep fetching while the traces are being consumed.
+                    if (chunk := next(chunks, None)) is not None:
+                        pending.add(asyncio.create_task(get_chunk(chunk)))
+                    for trace in task.result():
+                        yield trace
+        finally:
+            for task in pending:
+                task.cancel()
+            # Await the cancelled tasks, and retrieve the exceptions of completed tasks
+            # that were not consumed, so that none of them is left unretrieved.
+            await asyncio.gather(*pending, *done, return_exceptions=True)
+
+    async def get_audio(self, audio_id: str) -> bytearray:
+        """Get audio file by ID.
+
+        ```python
+        from atla_insights.client import AsyncClient
+
+        async with AsyncClient(api_key="your_api_key_here") as client:
+            # Retrieves audio bytes
+            result = await client.get_audio("my_audio_id")
+
+        # Saves audio to MP3 file
+        with open("my_file.mp3", "wb") as f:
+            f.write(result)
+        ```
+
+        :param audio_id (str): ID of audio file to retrieve.
+
+        :return (bytearray): Response containing the audio bytes.
+        """
+        request = self._sdk._get_audio_by_id_serialize(
+            audio_id=audio_id,
+            _request_auth=None,
+            _content_type=None,
+            _headers=None,
+            _host_index=0,
+        )
+        return await self._request(request, "bytearray")
+
+    async def get_audio_stream(
+        self, audio_id: str, chunk_size: int = 8192
+    ) -> AsyncIterator[bytes]:
+        """Get audio file by ID as an asynchronous streaming iterator.
+
+        The stream counts towards the concurrency limit until it is consumed or closed.
+
+        ```python
+        from atla_insights.client import AsyncClient
+
+        async with AsyncClient(api_key="your_api_key_here") as client:
+            # Initialize audio bytes stream
+            result = client.get_audio_stream("my_audio_id")
+
+            # Consume stream and save audio to MP3 file
+            with open("my_file.mp3", "wb") as f:
+                async for chunk in result:
+                    f.write(chunk)
+        ```
+
+        :param audio_id (str): ID of audio file to retrieve.
+        :param chunk_size (int): Size of chunks to stream. Defaults to 8k bytes.
+
+        :return (AsyncIterator[bytes]): Iterator yielding audio data in chunks.
+        """
+        method, url, headers, body, _ = self._sdk._get_audio_by_id_serialize(
+            audio_id=audio_id,
+            _request_auth=None,
+            _content_type=None,
+            _headers=None,
+            _host_index=0,
+        )
+        async with self._semaphore:
+            async with self._http_client.stream(
+                method, url, headers=headers, content=body
+            ) as response:
+                if not response.is_success:
+                    await response.aread()
+                    self._deserialize(response, "bytearray")
+
+                async for chunk in response.aiter_bytes(chunk_size):
+                    yield chunk
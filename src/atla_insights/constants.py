@@ -39,6 +39,7 @@ ENVIRONMENT_OPTIONS = ["dev", "prod"]
 ENVIRONMENT_DEFAULT = "prod"
 
 GIT_TRACKING_DISABLED_ENV_VAR = "ATLA_DISABLE_GIT_TRACKING"
+INSTRUMENTATION_DISABLED_ENV_VAR = "ATLA_DISABLE_INSTRUMENTATION"
 
 MAX_CUSTOM_METRICS_FIELDS = 25
 MAX_CUSTOM_METRICS_KEY_CHARS = 100
@@ -58,12 +59,40 @@ VERSION_MARK = f"{OTEL_NAMESPACE}.sdk.version"
 
 EXPERIMENT_NAMESPACE = f"{OTEL_NAMESPACE}.experiment"
 
+STREAMING_NAMESPACE = f"{OTEL_NAMESPACE}.streaming"
+STREAMING_CHUNK_COUNT_MARK = f"{STREAMING_NAMESPACE}.chunk_count"
+STREAMING_INTER_CHUNK_LATENCY_MARK = f"{STREAMING_NAMESPACE}.inter_chunk_latency_ms"
+STREAMING_TTFT_MARK = f"{STREAMING_NAMESPACE}.time_to_first_token_ms"
+
+LLM_METRICS_NAMESPACE = f"{OTEL_NAMESPACE}.llm"
+LLM_METRICS_CALLS = f"{LLM_METRICS_NAMESPACE}.calls"
+LLM_METRICS_DURATION = f"{LLM_METRICS_NAMESPACE}.duration"
+LLM_METRICS_IN_FLIGHT = f"{LLM_METRICS_NAMESPACE}.in_flight"
+LLM_METRICS_TOKENS = f"{LLM_METRICS_NAMESPACE}.tokens"
+LLM_METRICS_EXPORT_INTERVAL_MS = 60_000
+
+MESSAGE_DELTA_NAMESPACE = f"{OTEL_NAMESPACE}.message_delta"
+MESSAGE_DELTA_PARENT_SPAN_MARK = f"{MESSAGE_DELTA_NAMESPACE}.parent_span_id"
+MESSAGE_DELTA_PREFIX_LENGTH_MARK = f"{MESSAGE_DELTA_NAMESPACE}.prefix_length"
+MESSAGE_DELTA_INPUT_VALUE_PREFIX_LENGTH_MARK = (
+    f"{MESSAGE_DELTA_NAMESPACE}.input_value_prefix_length"
+)
+
 OTEL_MODULE_NAME = "atla_insights"
+# Instrumentation scopes of the spans produced by Atla (and its instrumentors).
+OTEL_INSTRUMENTATION_SCOPES = (
+    OTEL_MODULE_NAME,
+    "openinference.instrumentation.*",
+    "pydantic-ai",
+)
 OTEL_TRACES_ENDPOINT = "https://logfire-eu.pydantic.dev/v1/traces"
+OTEL_METRICS_ENDPOINT = "https://logfire-eu.pydantic.dev/v1/metrics"
 
 ELEVENLABS_API_KEY_VERIFY_ENDPOINT = (
     "https://app.atla-ai.com/api/sdk/v1/integrations/elevenlabs"
 )
+ELEVENLABS_SESSION_IDLE_TIMEOUT_S = 30 * 60.0
+ELEVENLABS_SESSION_MAX_AGE_S = 6 * 60 * 60.0
 
 SUPPORTED_LLM_FORMAT = Literal["anthropic", "bedrock", "openai"]
 SUPPORTED_LLM_PROVIDER = Literal["anthropic", "google-genai", "litellm", "openai"]
@@ -7,10 +7,14 @@ from opentelemetry.sdk.trace import Span
 
 if TYPE_CHECKING:
     from atla_insights.experiments import Experiment
+    from atla_insights.metadata import MetadataLayer
 
-metadata_var: ContextVar[Optional[dict[str, str]]] = ContextVar(
+metadata_var: ContextVar[Optional["MetadataLayer"]] = ContextVar(
     "metadata_var", default=None
 )
+request_metadata_var: ContextVar[Optional["MetadataLayer"]] = ContextVar(
+    "request_metadata_var", default=None
+)
 root_span_var: ContextVar[Optional[Span]] = ContextVar("root_span_var", default=None)
 suppress_instrumentation_var: ContextVar[bool] = ContextVar(
     "suppress_instrumentation", default=False
@@ -34,15 +34,14 @@ def instrument_agno(llm_provider: LLM_PROVIDER_TYPE) -> ContextManager[None]:
 
     from atla_insights.frameworks.instrumentors.agno import AtlaAgnoInstrumentor
 
-    # Create an instrumentor for the Agno framework.
-    agno_instrumentor = AtlaAgnoInstrumentor()
-
-    # Create an instrumentor for the underlying LLM provider(s).
-    llm_provider_instrumentors = get_instrumentors_for_provider(llm_provider)
-
+    # Create instrumentors for the underlying LLM provider(s) & the Agno framework.
     return ATLA_INSTANCE.instrument_service(
         service=AtlaAgnoInstrumentor.name,
-        instrumentors=[*llm_provider_instrumentors, agno_instrumentor],
+        instrumentors=lambda: [
+            *get_instrumentors_for_provider(llm_provider),
+            AtlaAgnoInstrumentor(),
+        ],
+        config={"llm_provider": llm_provider},
     )
 
 
@@ -51,16 +51,20 @@ def instrument_baml(
 
     from atla_insights.frameworks.instrumentors.baml import AtlaBamlInstrumentor
 
-    # Create an instrumentor for the BAML framework.
-    baml_instrumentor = AtlaBamlInstrumentor(
-        llm_provider=llm_provider,
-        include_functions=include_functions,
-        exclude_functions=exclude_functions,
-    )
-
     return ATLA_INSTANCE.instrument_service(
         service=AtlaBamlInstrumentor.name,
-        instrumentors=[baml_instrumentor],
+        instrumentors=lambda: [
+            AtlaBamlInstrumentor(
+                llm_provider=llm_provider,
+                include_functions=include_functions,
+                exclude_functions=exclude_functions,
+            )
+        ],
+        config={
+            "llm_provider": llm_provider,
+            "include_functions": include_functions,
+            "exclude_functions": exclude_functions,
+        },
     )
 
 
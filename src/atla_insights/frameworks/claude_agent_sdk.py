@@ -8,7 +8,7 @@ from atla_insights.main import ATLA_INSTANCE
 from atla_insights.suppression import NoOpContextManager, is_instrumentation_suppressed
 
 
-def instrument_claude_agent_sdk() -> ContextManager[None]:
+def instrument_claude_agent_sdk(record_turns: bool = False) -> ContextManager[None]:
     """Instrument the Claude Agent SDK.
 
     This function creates a context manager that instruments the Claude Agent SDK,
@@ -21,6 +21,9 @@ def instrument_claude_agent_sdk() -> ContextManager[None]:
         # My Claude Agent SDK usage here
     ```
 
+    :param record_turns (bool): Whether to record each turn (i.e. each assistant
+        message) of a session as a child span, as soon as it completes. Defaults to
+        `False`.
     :return (ContextManager[None]): A context manager that instruments Claude Agent SDK.
     """
     if is_instrumentation_suppressed():
@@ -33,11 +36,12 @@ def instrument_claude_agent_sdk() -> ContextManager[None]:
     tracer = cast(TracerProvider, ATLA_INSTANCE.tracer_provider).get_tracer(
         "openinference.instrumentation.claude_agent_sdk"
     )
-    claude_agent_sdk_instrumentor = AtlaClaudeAgentSdkInstrumentor(tracer=tracer)
-
     return ATLA_INSTANCE.instrument_service(
         service=AtlaClaudeAgentSdkInstrumentor.name,
-        instrumentors=[claude_agent_sdk_instrumentor],
+        instrumentors=lambda: [
+            AtlaClaudeAgentSdkInstrumentor(tracer=tracer, record_turns=record_turns)
+        ],
+        config={"record_turns": record_turns},
     )
 
 
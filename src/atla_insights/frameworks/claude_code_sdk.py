@@ -8,7 +8,7 @@ from atla_insights.main import ATLA_INSTANCE
 from atla_insights.suppression import NoOpContextManager, is_instrumentation_suppressed
 
 
-def instrument_claude_code_sdk() -> ContextManager[None]:
+def instrument_claude_code_sdk(record_turns: bool = False) -> ContextManager[None]:
     """Instrument the Claude Code SDK.
 
     Note that the `claude-code-sdk` package has been deprecated in favor of
@@ -30,6 +30,9 @@ def instrument_claude_code_sdk() -> ContextManager[None]:
         # My Claude Code SDK usage here
     ```
 
+    :param record_turns (bool): Whether to record each turn (i.e. each assistant
+        message) of a session as a child span, as soon as it completes. Defaults to
+        `False`.
     :return (ContextManager[None]): A context manager that instruments Claude Code SDK.
     """
     if is_instrumentation_suppressed():
@@ -42,11 +45,12 @@ def instrument_claude_code_sdk() -> ContextManager[None]:
     tracer = cast(TracerProvider, ATLA_INSTANCE.tracer_provider).get_tracer(
         "openinference.instrumentation.claude_code_sdk"
     )
-    claude_code_sdk_instrumentor = AtlaClaudeCodeSdkInstrumentor(tracer=tracer)
-
     return ATLA_INSTANCE.instrument_service(
         service=AtlaClaudeCodeSdkInstrumentor.name,
-        instrumentors=[claude_code_sdk_instrumentor],
+        instrumentors=lambda: [
+            AtlaClaudeCodeSdkInstrumentor(tracer=tracer, record_turns=record_turns)
+        ],
+        config={"record_turns": record_turns},
     )
 
 
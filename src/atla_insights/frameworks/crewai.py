@@ -29,15 +29,14 @@ def instrument_crewai() -> ContextManager[None]:
 
     from atla_insights.frameworks.instrumentors.crewai import AtlaCrewAIInstrumentor
 
-    # Create an instrumentor for the CrewAI framework.
-    crewai_instrumentor = AtlaCrewAIInstrumentor(ATLA_INSTANCE.get_tracer())
-
-    # Create an instrumentor for the underlying LLM provider (always litellm).
-    [llm_provider_instrumentor] = get_instrumentors_for_provider("litellm")
-
+    # Create instrumentors for the CrewAI framework & the underlying LLM provider
+    # (always litellm).
     return ATLA_INSTANCE.instrument_service(
         service=AtlaCrewAIInstrumentor.name,
-        instrumentors=[crewai_instrumentor, llm_provider_instrumentor],
+        instrumentors=lambda: [
+            AtlaCrewAIInstrumentor(ATLA_INSTANCE.get_tracer()),
+            *get_instrumentors_for_provider("litellm"),
+        ],
     )
 
 
@@ -35,12 +35,9 @@ def instrument_google_adk() -> ContextManager[None]:
             'Please install it via `pip install "atla-insights[google-adk]"`.'
         ) from e
 
-    # Create an instrumentor for the Google ADK framework.
-    google_adk_instrumentor = GoogleADKInstrumentor()
-
     return ATLA_INSTANCE.instrument_service(
         service="google-adk",
-        instrumentors=[google_adk_instrumentor],
+        instrumentors=lambda: [GoogleADKInstrumentor()],
     )
 
 
@@ -1,6 +1,8 @@
 """BAML instrumentation."""
 
+import asyncio
 import logging
+import threading
 from contextvars import ContextVar
 from importlib import import_module
 from typing import Any, Callable, Collection, Literal, Mapping, Optional
@@ -28,15 +30,82 @@ from wrapt import wrap_function_wrapper
 
 from atla_insights.constants import SUPPORTED_LLM_FORMAT
 from atla_insights.parsers import get_llm_parser
+from atla_insights.streaming import arecord_stream, record_stream
+from atla_insights.suppression import passthrough_if_suppressed
 
 logger = logging.getLogger(__name__)
 
-# Context variable to store the collector for each call
-_atla_collector: ContextVar[Optional[Collector]] = ContextVar(
-    "atla_collector", default=None
+# Attribute of a BAML stream storing the Atla collector of its call
+_STREAM_COLLECTOR_ATTRIBUTE = "_atla_collector"
+
+
+class _PooledCollector:
+    """The reusable Atla collector of a context, with its owner."""
+
+    __slots__ = ("collector", "in_use", "owner")
+
+    def __init__(self, owner: object, collector: Collector) -> None:
+        """Initialize the pooled collector.
+
+        :param owner (object): The task or thread owning the collector.
+        :param collector (Collector): The collector.
+        """
+        self.owner = owner
+        self.collector = collector
+        # Whether a stream in flight still records its LLM call on the collector.
+        self.in_use = False
+
+
+# Context variable to store the reusable collector of a context
+_atla_collector_pool: ContextVar[Optional[_PooledCollector]] = ContextVar(
+    "atla_collector_pool", default=None
 )
 
 
+def _get_context_owner() -> object:
+    """Get the owner of the current context, i.e. the current task or thread."""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    return task if task is not None else threading.get_ident()
+
+
+def _get_atla_collector() -> Collector:
+    """Get the (cleared) Atla collector of the current context.
+
+    The collector is reused across calls in the same task or thread, unless a stream
+    of that task or thread is still in flight. Tasks and threads inheriting the context
+    (e.g. `asyncio.gather`) get their own collector instead, as concurrent calls can't
+    share one.
+    """
+    owner = _get_context_owner()
+
+    pooled = _atla_collector_pool.get()
+    if pooled is not None and pooled.owner == owner and not pooled.in_use:
+        atla_collector = pooled.collector
+        atla_collector.clear()
+    else:
+        atla_collector = Collector(name="atla-insights")
+        _atla_collector_pool.set(_PooledCollector(owner, atla_collector))
+
+    return atla_collector
+
+
+def _set_collector_in_use(atla_collector: Collector, in_use: bool) -> None:
+    """Mark the collector of a stream as in use (or no longer), if it is pooled.
+
+    A collector in use is not reused (and cleared) by other calls, e.g. calls made
+    while consuming the stream.
+
+    :param atla_collector (Collector): The collector of the stream.
+    :param in_use (bool): Whether the collector is in use.
+    """
+    pooled = _atla_collector_pool.get()
+    if pooled is not None and pooled.collector is atla_collector:
+        pooled.in_use = in_use
+
+
 def _get_updated_collectors(
     original_state: Mapping[str, Any],
     atla_collector: Collector,
@@ -60,6 +129,24 @@ def _get_updated_collectors(
     return new_collectors
 
 
+def _set_up_collector(instance: Any) -> Collector:
+    """Set up the Atla collector on a BAML call manager.
+
+    :param instance (Any): The BAML call manager.
+    :return (Collector): The Atla collector.
+    """
+    atla_collector = _get_atla_collector()
+
+    original_state = instance.__getstate__()
+    new_collectors = _get_updated_collectors(original_state, atla_collector)
+
+    # Only rewrite the state if the collectors changed.
+    if new_collectors != original_state.get("baml_options", {}).get("collector"):
+        instance.__setstate__({"baml_options": {"collector": new_collectors}})
+
+    return atla_collector
+
+
 class AtlaBamlInstrumentor(BaseInstrumentor):
     """Atla BAML instrumentor class."""
 
@@ -72,6 +159,10 @@ class AtlaBamlInstrumentor(BaseInstrumentor):
         exclude_functions: Optional[list[str]],
     ) -> None:
         """Initialize the Atla BAML instrumentator."""
+        # Instrumentors are singletons: keep the state of an active instrumentor.
+        if self.is_instrumented_by_opentelemetry:
+            return
+
         super().__init__()
 
         self.llm_parser = get_llm_parser(llm_provider)
@@ -98,6 +189,38 @@ class AtlaBamlInstrumentor(BaseInstrumentor):
             return function_name not in self.exclude_functions
         return True  # Default action is to instrument all BAML functions
 
+    def _record_selected_call(
+        self,
+        span: trace_api.Span,
+        atla_collector: Collector,
+        record_response: bool,
+    ) -> None:
+        """Record the HTTP request (and response) of the last LLM call on a span.
+
+        The bodies are only parsed if the span is recording and sampled, as unsampled
+        spans may still be recorded (e.g. for metrics) without ever being exported.
+
+        :param span (trace_api.Span): The span to record the LLM call on.
+        :param atla_collector (Collector): The Atla collector of the call.
+        :param record_response (bool): Whether to also record the response.
+        """
+        if not span.is_recording() or not span.get_span_context().trace_flags.sampled:
+            return
+
+        if (last := atla_collector.last) is None or (
+            selected_call := last.selected_call
+        ) is None:
+            return
+
+        if llm_request := selected_call.http_request:
+            request_body = llm_request.body.json()
+            span.set_attributes(dict(self.llm_parser.parse_request_body(request_body)))
+
+        if record_response and (llm_response := selected_call.http_response):
+            response_body = llm_response.body.json()
+            span.set_attributes(dict(self.llm_parser.parse_response_body(response_body)))
+
+    @passthrough_if_suppressed
     def _call_function_sync_wrapper(
         self,
         wrapped: Callable[..., Any],
@@ -110,11 +233,7 @@ class AtlaBamlInstrumentor(BaseInstrumentor):
         if function_name and not self._should_instrument_function(function_name):
             return wrapped(*args, **kwargs)
 
-        atla_collector = Collector(name="atla-insights")
-        _atla_collector.set(atla_collector)
-
-        new_collectors = _get_updated_collectors(instance.__getstate__(), atla_collector)
-        instance.__setstate__({"baml_options": {"collector": new_collectors}})
+        atla_collector = _set_up_collector(instance)
 
         with self.tracer.start_as_current_span(
             name=function_name or "GenerateSync",
@@ -137,24 +256,11 @@ class AtlaBamlInstrumentor(BaseInstrumentor):
 
             span.set_status(trace_api.StatusCode.OK)
 
-            if (
-                atla_collector.last is not None
-                and atla_collector.last.selected_call is not None
-            ):
-                if llm_request := atla_collector.last.selected_call.http_request:
-                    request_body = llm_request.body.json()
-                    span.set_attributes(
-                        dict(self.llm_parser.parse_request_body(request_body))
-                    )
-
-                if llm_response := atla_collector.last.selected_call.http_response:
-                    response_body = llm_response.body.json()
-                    span.set_attributes(
-                        dict(self.llm_parser.parse_response_body(response_body))
-                    )
+            self._record_selected_call(span, atla_collector, record_response=True)
 
         return result
 
+    @passthrough_if_suppressed
     def _create_stream_wrapper(
         self,
         wrapped: Callable[..., Any],
@@ -167,13 +273,14 @@ class AtlaBamlInstrumentor(BaseInstrumentor):
         if function_name and not self._should_instrument_function(function_name):
             return wrapped(*args, **kwargs)
 
-        atla_collector = Collector(name="atla-insights")
-        _atla_collector.set(atla_collector)
+        atla_collector = _set_up_collector(instance)
+        _set_collector_in_use(atla_collector, True)
 
-        new_collectors = _get_updated_collectors(instance.__getstate__(), atla_collector)
-        instance.__setstate__({"baml_options": {"collector": new_collectors}})
-        return wrapped(*args, **kwargs)
+        stream = wrapped(*args, **kwargs)
+        setattr(stream, _STREAM_COLLECTOR_ATTRIBUTE, atla_collector)
+        return stream
 
+    @passthrough_if_suppressed
     def _sync_stream_wrapper(
         self,
         wrapped: Callable[..., Any],
@@ -182,7 +289,7 @@ class AtlaBamlInstrumentor(BaseInstrumentor):
         kwargs: Mapping[str, Any],
     ) -> Any:
         """Wrap the BAML stream function."""
-        atla_collector = _atla_collector.get()
+        atla_collector = getattr(instance, _STREAM_COLLECTOR_ATTRIBUTE, None)
         if not atla_collector:
             for item in wrapped(*args, **kwargs):
                 yield item
@@ -199,7 +306,7 @@ class AtlaBamlInstrumentor(BaseInstrumentor):
             set_status_on_exception=False,
         ) as span:
             try:
-                for item in wrapped(*args, **kwargs):
+                for item in record_stream(wrapped(*args, **kwargs), span):
                     yield item
             except Exception as exception:
                 span.set_status(
@@ -210,15 +317,7 @@ class AtlaBamlInstrumentor(BaseInstrumentor):
 
             span.set_status(trace_api.StatusCode.OK)
 
-            if (
-                atla_collector.last is not None
-                and atla_collector.last.selected_call is not None
-            ):
-                if llm_request := atla_collector.last.selected_call.http_request:
-                    request_body = llm_request.body.json()
-                    span.set_attributes(
-                        dict(self.llm_parser.parse_request_body(request_body))
-                    )
+            self._record_selected_call(span, atla_collector, record_response=False)
 
             if isinstance(item, BaseModel):
                 response_body = item.model_dump_json()
@@ -231,6 +330,7 @@ class AtlaBamlInstrumentor(BaseInstrumentor):
                     "assistant",
                 )
 
+    @passthrough_if_suppressed
     def _sync_stream_final_response_wrapper(
         self,
         wrapped: Callable[..., Any],
@@ -239,53 +339,50 @@ class AtlaBamlInstrumentor(BaseInstrumentor):
         kwargs: Mapping[str, Any],
     ) -> Any:
         """Wrap the BAML stream function."""
-        atla_collector = _atla_collector.get()
+        atla_collector = getattr(instance, _STREAM_COLLECTOR_ATTRIBUTE, None)
         if not atla_collector:
             return wrapped(*args, **kwargs)
 
-        with self.tracer.start_as_current_span(
-            name="GenerateStreamSync",  # TODO: Add function name
-            attributes={
-                SpanAttributes.OPENINFERENCE_SPAN_KIND: (
-                    OpenInferenceSpanKindValues.LLM.value
-                ),
-            },
-            record_exception=False,
-            set_status_on_exception=False,
-        ) as span:
-            try:
-                result = wrapped(*args, **kwargs)
-            except Exception as exception:
-                span.set_status(
-                    trace_api.Status(trace_api.StatusCode.ERROR, str(exception))
-                )
-                span.record_exception(exception)
-                raise
+        try:
+            with self.tracer.start_as_current_span(
+                name="GenerateStreamSync",  # TODO: Add function name
+                attributes={
+                    SpanAttributes.OPENINFERENCE_SPAN_KIND: (
+                        OpenInferenceSpanKindValues.LLM.value
+                    ),
+                },
+                record_exception=False,
+                set_status_on_exception=False,
+            ) as span:
+                try:
+                    result = wrapped(*args, **kwargs)
+                except Exception as exception:
+                    span.set_status(
+                        trace_api.Status(trace_api.StatusCode.ERROR, str(exception))
+                    )
+                    span.record_exception(exception)
+                    raise
 
-            span.set_status(trace_api.StatusCode.OK)
+                span.set_status(trace_api.StatusCode.OK)
 
-            if (
-                atla_collector.last is not None
-                and atla_collector.last.selected_call is not None
-            ):
-                if llm_request := atla_collector.last.selected_call.http_request:
-                    request_body = llm_request.body.json()
-                    span.set_attributes(
-                        dict(self.llm_parser.parse_request_body(request_body))
-                    )
+                self._record_selected_call(span, atla_collector, record_response=False)
 
-            if isinstance(result, BaseModel):
-                response_body = result.model_dump_json()
-                span.set_attribute(
-                    f"{SpanAttributes.LLM_OUTPUT_MESSAGES}.0.{MessageAttributes.MESSAGE_CONTENT}",
-                    response_body,
-                )
-                span.set_attribute(
-                    f"{SpanAttributes.LLM_OUTPUT_MESSAGES}.0.{MessageAttributes.MESSAGE_ROLE}",
-                    "assistant",
-                )
+                if isinstance(result, BaseModel):
+                    response_body = result.model_dump_json()
+                    span.set_attribute(
+                        f"{SpanAttributes.LLM_OUTPUT_MESSAGES}.0.{MessageAttributes.MESSAGE_CONTENT}",
+                        response_body,
+                    )
+                    span.set_attribute(
+                        f"{SpanAttributes.LLM_OUTPUT_MESSAGES}.0.{MessageAttributes.MESSAGE_ROLE}",
+                        "assistant",
+                    )
+        finally:
+            # The stream is finished, so its collector can be reused.
+            _set_collector_in_use(atla_collector, False)
         return result
 
+    @passthrough_if_suppressed
     async def _call_function_async_wrapper(
         self,
         wrapped: Callable[..., Any],
@@ -298,11 +395,7 @@ class AtlaBamlInstrumentor(BaseInstrumentor):
         if function_name and not self._should_instrument_function(function_name):
             return await wrapped(*args, **kwargs)
 
-        atla_collector = Collector(name="atla-insights")
-        _atla_collector.set(atla_collector)
-
-        new_collectors = _get_updated_collectors(instance.__getstate__(), atla_collector)
-        instance.__setstate__({"baml_options": {"collector": new_collectors}})
+        atla_collector = _set_up_collector(instance)
 
         with self.tracer.start_as_current_span(
             name=function_name or "GenerateAsync",
@@ -325,24 +418,11 @@ class AtlaBamlInstrumentor(BaseInstrumentor):
 
             span.set_status(trace_api.StatusCode.OK)
 
-            if (
-                atla_collector.last is not None
-                and atla_collector.last.selected_call is not None
-            ):
-                if llm_request := atla_collector.last.selected_call.http_request:
-                    request_body = llm_request.body.json()
-                    span.set_attributes(
-                        dict(self.llm_parser.parse_request_body(request_body))
-                    )
-
-                if llm_response := atla_collector.last.selected_call.http_response:
-                    response_body = llm_response.body.json()
-                    span.set_attributes(
-                        dict(self.llm_parser.parse_response_body(response_body))
-                    )
+            self._record_selected_call(span, atla_collector, record_response=True)
 
         return result
 
+    @passthrough_if_suppressed
     async def _async_stream_wrapper(
         self,
         wrapped: Callable[..., Any],
@@ -351,7 +431,7 @@ class AtlaBamlInstrumentor(BaseInstrumentor):
         kwargs: Mapping[str, Any],
     ) -> Any:
         """Wrap the BAML stream function."""
-        atla_collector = _atla_collector.get()
+        atla_collector = getattr(instance, _STREAM_COLLECTOR_ATTRIBUTE, None)
         if not atla_collector:
             async for item in wrapped(*args, **kwargs):
                 yield item
@@ -368,7 +448,7 @@ class AtlaBamlInstrumentor(BaseInstrumentor):
             set_status_on_exception=False,
         ) as span:
             try:
-                async for item in wrapped(*args, **kwargs):
+                async for item in arecord_stream(wrapped(*args, **kwargs), span):
                     yield item
             except Exception as exception:
                 span.set_status(
@@ -379,15 +459,7 @@ class AtlaBamlInstrumentor(BaseInstrumentor):
 
             span.set_status(trace_api.StatusCode.OK)
 
-            if (
-                atla_collector.last is not None
-                and atla_collector.last.selected_call is not None
-            ):
-                if llm_request := atla_collector.last.selected_call.http_request:
-                    request_body = llm_request.body.json()
-                    span.set_attributes(
-                        dict(self.llm_parser.parse_request_body(request_body))
-                    )
+            self._record_selected_call(span, atla_collector, record_response=False)
 
             if isinstance(item, BaseModel):
                 response_body = item.model_dump_json()
@@ -400,6 +472,7 @@ class AtlaBamlInstrumentor(BaseInstrumentor):
                     "assistant",
                 )
 
+    @passthrough_if_suppressed
     async def _async_stream_final_response_wrapper(
         self,
         wrapped: Callable[..., Any],
@@ -408,51 +481,47 @@ class AtlaBamlInstrumentor(BaseInstrumentor):
         kwargs: Mapping[str, Any],
     ) -> Any:
         """Wrap the BAML stream function."""
-        atla_collector = _atla_collector.get()
+        atla_collector = getattr(instance, _STREAM_COLLECTOR_ATTRIBUTE, None)
         if not atla_collector:
             return await wrapped(*args, **kwargs)
 
-        with self.tracer.start_as_current_span(
-            name="GenerateStreamAsync",  # TODO: Add function name
-            attributes={
-                SpanAttributes.OPENINFERENCE_SPAN_KIND: (
-                    OpenInferenceSpanKindValues.LLM.value
-                ),
-            },
-            record_exception=False,
-            set_status_on_exception=False,
-        ) as span:
-            try:
-                result = await wrapped(*args, **kwargs)
-            except Exception as exception:
-                span.set_status(
-                    trace_api.Status(trace_api.StatusCode.ERROR, str(exception))
-                )
-                span.record_exception(exception)
-                raise
+        try:
+            with self.tracer.start_as_current_span(
+                name="GenerateStreamAsync",  # TODO: Add function name
+                attributes={
+                    SpanAttributes.OPENINFERENCE_SPAN_KIND: (
+                        OpenInferenceSpanKindValues.LLM.value
+                    ),
+                },
+                record_exception=False,
+                set_status_on_exception=False,
+            ) as span:
+                try:
+                    result = await wrapped(*args, **kwargs)
+                except Exception as exception:
+                    span.set_status(
+                        trace_api.Status(trace_api.StatusCode.ERROR, str(exception))
+                    )
+                    span.record_exception(exception)
+                    raise
 
-            span.set_status(trace_api.StatusCode.OK)
+                span.set_status(trace_api.StatusCode.OK)
 
-            if (
-                atla_collector.last is not None
-                and atla_collector.last.selected_call is not None
-            ):
-                if llm_request := atla_collector.last.selected_call.http_request:
-                    request_body = llm_request.body.json()
-                    span.set_attributes(
-                        dict(self.llm_parser.parse_request_body(request_body))
-                    )
+                self._record_selected_call(span, atla_collector, record_response=False)
 
-            if isinstance(result, BaseModel):
-                response_body = result.model_dump_json()
-                span.set_attribute(
-                    f"{SpanAttributes.LLM_OUTPUT_MESSAGES}.0.{MessageAttributes.MESSAGE_CONTENT}",
-                    response_body,
-                )
-                span.set_attribute(
-                    f"{SpanAttributes.LLM_OUTPUT_MESSAGES}.0.{MessageAttributes.MESSAGE_ROLE}",
-                    "assistant",
-                )
+                if isinstance(result, BaseModel):
+                    response_body = result.model_dump_json()
+                    span.set_attribute(
+                        f"{SpanAttributes.LLM_OUTPUT_MESSAGES}.0.{MessageAttributes.MESSAGE_CONTENT}",
+                        response_body,
+                    )
+                    span.set_attribute(
+                        f"{SpanAttributes.LLM_OUTPUT_MESSAGES}.0.{MessageAttributes.MESSAGE_ROLE}",
+                        "assistant",
+                    )
+        finally:
+            # The stream is finished, so its collector can be reused.
+            _set_collector_in_use(atla_collector, False)
         return result
 
     def instrumentation_dependencies(self) -> Collection[str]:
@@ -1,12 +1,14 @@
 """Claude Code SDK instrumentor."""
 
-import json
+import itertools
 import logging
+import time
 import warnings
 from contextvars import ContextVar
 from typing import (
     Any,
     AsyncIterable,
+    AsyncIterator,
     Callable,
     Collection,
     Generator,
@@ -19,7 +21,7 @@ from typing import (
 from opentelemetry.instrumentation.instrumentor import (  # type: ignore[attr-defined]
     BaseInstrumentor,
 )
-from opentelemetry.trace import Status, StatusCode, Tracer
+from opentelemetry.trace import Span, Status, StatusCode, Tracer, set_span_in_context
 from wrapt import wrap_function_wrapper
 
 try:
@@ -38,11 +40,13 @@ from openinference.semconv.trace import (
     OpenInferenceMimeTypeValues,
     OpenInferenceSpanKindValues,
     SpanAttributes,
-    ToolAttributes,
     ToolCallAttributes,
 )
 
+from atla_insights.capture import YieldedItems
 from atla_insights.constants import OTEL_MODULE_NAME
+from atla_insights.serialization import get_tool_attributes, json_dumps
+from atla_insights.suppression import passthrough_if_suppressed
 
 logger = logging.getLogger(OTEL_MODULE_NAME)
 
@@ -60,13 +64,9 @@ def _get_tool_result_presence(content: Any) -> bool:
     return False
 
 
-def _get_input_messages(
-    messages: list[dict[str, Any]], options: dict[str, Any]
-) -> Generator[tuple[str, Any], None, None]:
-    """Get the input messages."""
-    start_idx = 0
+def _get_system_prompt(options: dict[str, Any]) -> Generator[tuple[str, Any], None, None]:
+    """Get the system prompt, as the first input message."""
     if system_prompt := options.get("system_prompt"):
-        start_idx = 1
         if append_system_prompt := options.get("append_system_prompt"):
             system_prompt = f"{system_prompt}\n{append_system_prompt}"
 
@@ -79,22 +79,30 @@ def _get_input_messages(
             str(system_prompt),
         )
 
-    for idx, message in enumerate(messages, start=start_idx):
-        if not isinstance(message, dict):
-            continue
 
-        content = message.get("content")
-        has_tool_result = _get_tool_result_presence(content)
-        if role := message.get("role"):
-            yield (
-                f"{SpanAttributes.LLM_INPUT_MESSAGES}.{idx}.{MessageAttributes.MESSAGE_ROLE}",
-                ("tool" if has_tool_result else role),
-            )
-        if content:
-            yield (
-                f"{SpanAttributes.LLM_INPUT_MESSAGES}.{idx}.{MessageAttributes.MESSAGE_CONTENT}",
-                str(content),
-            )
+def _get_input_message(
+    message: dict[str, Any], message_idx: int
+) -> Generator[tuple[str, Any], None, None]:
+    """Get an input message of the prompt."""
+    if not isinstance(message, dict):
+        return
+
+    # Streamed prompt messages wrap the message in an envelope.
+    if isinstance(message.get("message"), dict):
+        message = message["message"]
+
+    content = message.get("content")
+    has_tool_result = _get_tool_result_presence(content)
+    if role := message.get("role"):
+        yield (
+            f"{SpanAttributes.LLM_INPUT_MESSAGES}.{message_idx}.{MessageAttributes.MESSAGE_ROLE}",
+            ("tool" if has_tool_result else role),
+        )
+    if content:
+        yield (
+            f"{SpanAttributes.LLM_INPUT_MESSAGES}.{message_idx}.{MessageAttributes.MESSAGE_CONTENT}",
+            str(content),
+        )
 
 
 def _get_output_message(
@@ -135,7 +143,7 @@ def _get_output_message(
                             )
                             yield (
                                 f"{prefix}.{message_idx}.{MessageAttributes.MESSAGE_TOOL_CALLS}.{block_idx}.{ToolCallAttributes.TOOL_CALL_FUNCTION_ARGUMENTS_JSON}",
-                                json.dumps(block["input"]),
+                                json_dumps(block["input"]),
                             )
                         elif block.get("type") == "tool_result":
                             yield (
@@ -150,27 +158,9 @@ def _get_output_message(
                     block_idx += 1
 
 
-def _get_output_messages(
-    messages: list[dict[str, Any]], num_inputs: int
-) -> Generator[tuple[str, Any], None, None]:
-    """Get the output messages."""
-    if not messages:
-        return
-
-    last_assistant_idx = None
-    for i, msg in enumerate(messages):
-        if msg.get("type") == "assistant":
-            last_assistant_idx = i
-
-    if last_assistant_idx is not None:
-        yield from _get_output_message(messages[last_assistant_idx], 0, as_input=False)
-        messages = messages[:last_assistant_idx]
-
-    if messages[0].get("type") == "system":
-        num_inputs -= 1
-
-    for message_idx, message in enumerate(messages, start=num_inputs):
-        yield from _get_output_message(message, message_idx, as_input=True)
+def _get_tool_schema(tool: str) -> dict[str, Any]:
+    """Get the JSON schema of a tool, by its name."""
+    return {"type": "function", "function": {"name": tool}}
 
 
 def _get_llm_tools(
@@ -191,12 +181,7 @@ def _get_llm_tools(
         # TODO(mathias): Filter tools based on allowed_tools and disallowed_tools, while
         # accounting for Claude Code SDK's tool filtering logic (e.g. `Bash(rm*)`).
 
-        for idx, tool in enumerate(tools):
-            tool_json = {"type": "function", "function": {"name": tool}}
-            yield (
-                f"{SpanAttributes.LLM_TOOLS}.{idx}.{ToolAttributes.TOOL_JSON_SCHEMA}",
-                json.dumps(tool_json),
-            )
+        yield from get_tool_attributes(SpanAttributes.LLM_TOOLS, tools, _get_tool_schema)
 
 
 def _get_llm_attributes(
@@ -207,20 +192,191 @@ def _get_llm_attributes(
         yield SpanAttributes.LLM_MODEL_NAME, model
 
 
+class _PromptRecorder:
+    """Record the input messages of a query, as they are passed on to the SDK.
+
+    Prompt messages share their message indices with the messages received in the
+    session, so streamed prompt messages sent mid-session are recorded in order. Each
+    message sent mid-session is recorded on the span as it passes, whereas the input
+    value (of the first few messages) is only serialized when the span starts and ends.
+    """
+
+    def __init__(self, options: dict[str, Any]) -> None:
+        """Initialize the prompt recorder.
+
+        :param options (dict[str, Any]): The options of the query.
+        """
+        self.options = options
+        # The span to record messages on, while a response is being received.
+        self.span: Optional[Span] = None
+
+        # The messages sent before any response is received, by message index.
+        self._initial_messages: list[tuple[int, dict[str, Any]]] = []
+        self._messages = YieldedItems()
+        self._has_new_messages = False
+        # The system prompt takes the first message index.
+        self._next_message_idx = 1 if options.get("system_prompt") else 0
+
+    def next_message_idx(self) -> int:
+        """Claim the index of the next message in the session."""
+        message_idx = self._next_message_idx
+        self._next_message_idx += 1
+        return message_idx
+
+    def _get_input_value(self) -> str:
+        """Serialize the (first few) messages recorded so far, and the options."""
+        return json_dumps([*self._messages.get_items(), self.options])
+
+    def get_attributes(self) -> dict[str, Any]:
+        """Get the input attributes of the messages recorded so far."""
+        attributes = {
+            SpanAttributes.LLM_PROVIDER: "anthropic",
+            SpanAttributes.INPUT_MIME_TYPE: OpenInferenceMimeTypeValues.JSON.value,
+            SpanAttributes.INPUT_VALUE: self._get_input_value(),
+            SpanAttributes.OPENINFERENCE_SPAN_KIND: OpenInferenceSpanKindValues.LLM.value,
+            **dict(_get_system_prompt(self.options)),
+        }
+        for message_idx, message in self._initial_messages:
+            attributes.update(_get_input_message(message, message_idx))
+        return attributes
+
+    def add(self, message: dict[str, Any]) -> None:
+        """Record a prompt message."""
+        message_idx = self.next_message_idx()
+        self._messages.append(message)
+
+        if self.span is None:
+            self._initial_messages.append((message_idx, message))
+        else:
+            self.span.set_attributes(dict(_get_input_message(message, message_idx)))
+            self._has_new_messages = True
+
+    def detach(self) -> None:
+        """Stop recording on the span, updating its input value with any new messages."""
+        if self.span is not None and self._has_new_messages:
+            self.span.set_attribute(SpanAttributes.INPUT_VALUE, self._get_input_value())
+        self.span = None
+        self._has_new_messages = False
+
+    async def tee(
+        self, prompt: AsyncIterable[dict[str, Any]]
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Record the messages of a streamed prompt, as they pass through."""
+        async for message in prompt:
+            self.add(message)
+            yield message
+
+
+class _MessageRecorder:
+    """Record the messages received in a session on its span, as they arrive.
+
+    Messages are recorded as input messages as soon as a later assistant message shows
+    that they are not the final output message. Only the messages since the last
+    assistant message are retained in memory. The span itself still holds an attribute
+    per message (part), so in very long sessions, attributes beyond the span attribute
+    count limit (`OTEL_ATTRIBUTE_COUNT_LIMIT`, 4096 by default) are dropped.
+    """
+
+    def __init__(
+        self,
+        tracer: Tracer,
+        span: Span,
+        next_message_idx: Callable[[], int],
+        record_turns: bool,
+    ) -> None:
+        """Initialize the message recorder.
+
+        :param tracer (Tracer): The tracer to start turn spans with.
+        :param span (Span): The span of the session.
+        :param next_message_idx (Callable[[], int]): Claim the index of the next message
+            in the session. Streamed prompts may still be sending input messages.
+        :param record_turns (bool): Whether to record a child span per turn.
+        """
+        self.tracer = tracer
+        self.span = span
+        self.next_message_idx = next_message_idx
+        self.record_turns = record_turns
+
+        self._num_received = 0
+        # The last assistant message and the messages received since, by message index.
+        self._pending: list[tuple[int, dict[str, Any]]] = []
+        self._turn_start_time = time.time_ns()
+
+    def _record_turn(self, message: dict[str, Any]) -> None:
+        """Record a turn, ending with an assistant message, as a child span."""
+        end_time = time.time_ns()
+        attributes = {
+            SpanAttributes.OPENINFERENCE_SPAN_KIND: (
+                OpenInferenceSpanKindValues.CHAIN.value
+            ),
+            SpanAttributes.OUTPUT_MIME_TYPE: OpenInferenceMimeTypeValues.JSON.value,
+            SpanAttributes.OUTPUT_VALUE: json_dumps(message.get("message")),
+        }
+        if turn_inputs := [msg.get("message") for _, msg in self._pending[1:]]:
+            attributes[SpanAttributes.INPUT_MIME_TYPE] = (
+                OpenInferenceMimeTypeValues.JSON.value
+            )
+            attributes[SpanAttributes.INPUT_VALUE] = json_dumps(turn_inputs)
+
+        turn_span = self.tracer.start_span(
+            name="Claude Code SDK Turn",
+            context=set_span_in_context(self.span),
+            attributes=attributes,
+            start_time=self._turn_start_time,
+        )
+        turn_span.end(end_time=end_time)
+        self._turn_start_time = end_time
+
+    def add(self, message: dict[str, Any]) -> None:
+        """Record a received message."""
+        # An initial system message has no content, and takes no message index.
+        if self._num_received == 0 and message.get("type") == "system":
+            self._num_received += 1
+            return
+        message_idx = self.next_message_idx()
+        self._num_received += 1
+
+        if message.get("type") == "assistant":
+            if self.record_turns:
+                self._record_turn(message)
+            # The previous assistant message (and any later messages) are now inputs.
+            for pending_idx, pending_message in self._pending:
+                self.span.set_attributes(
+                    dict(_get_output_message(pending_message, pending_idx, as_input=True))
+                )
+            self._pending = [(message_idx, message)]
+        elif self._pending:
+            self._pending.append((message_idx, message))
+        else:
+            self.span.set_attributes(
+                dict(_get_output_message(message, message_idx, as_input=True))
+            )
+
+        if message.get("type") == "result" and self._pending:
+            _, last_assistant_message = self._pending[0]
+            self.span.set_attributes(
+                dict(_get_output_message(last_assistant_message, 0, as_input=False))
+            )
+
+
 class AtlaClaudeCodeSdkInstrumentor(BaseInstrumentor):
     """Atla Claude Code SDK instrumentor class."""
 
     name = "claude-code-sdk"
 
-    def __init__(self, tracer: Tracer) -> None:
+    def __init__(self, tracer: Tracer, record_turns: bool = False) -> None:
         """Initialize the Atla Claude Code SDK instrumentor."""
+        # Instrumentors are singletons: keep the state of an active instrumentor.
+        if self.is_instrumented_by_opentelemetry:
+            return
+
         super().__init__()
         self.tracer = tracer
+        self.record_turns = record_turns
 
-        self._input_attributes: ContextVar[Optional[Mapping[str, Any]]] = ContextVar(
-            "input_attributes", default=None
+        self._prompt_recorder: ContextVar[Optional[_PromptRecorder]] = ContextVar(
+            "prompt_recorder", default=None
         )
-        self._num_inputs: ContextVar[int] = ContextVar("num_inputs", default=0)
         self._options: ContextVar[Optional[dict[str, Any]]] = ContextVar(
             "options", default=None
         )
@@ -233,6 +389,36 @@ class AtlaClaudeCodeSdkInstrumentor(BaseInstrumentor):
         """Return the instrumentation dependencies."""
         return ("claude_code_sdk",)
 
+    def _record_prompt(
+        self,
+        prompt: Optional[str | AsyncIterable[dict[str, Any]]],
+        options: Optional[ClaudeCodeOptions],
+    ) -> Optional[str | AsyncIterable[dict[str, Any]]]:
+        """Start recording the prompt of a query.
+
+        Streamed prompts are recorded as they are consumed by the SDK, so they are
+        neither delayed nor buffered before being sent.
+
+        :param prompt (Optional[str | AsyncIterable[dict[str, Any]]]): The prompt.
+        :param options (Optional[ClaudeCodeOptions]): The options of the query.
+        :return (Optional[str | AsyncIterable[dict[str, Any]]]): The prompt to pass on
+            to the SDK.
+        """
+        if options is not None:
+            options_dict = options.__dict__.copy()
+            options_dict.pop("debug_stderr")  # Non-hashable (and irrelevant) key
+            self._options.set(options_dict)
+
+        prompt_recorder = _PromptRecorder(self._options.get() or {})
+        self._prompt_recorder.set(prompt_recorder)
+
+        if isinstance(prompt, str):
+            prompt_recorder.add({"role": "user", "content": prompt})
+        elif prompt is not None:
+            prompt = prompt_recorder.tee(prompt)
+        return prompt
+
+    @passthrough_if_suppressed
     async def _wrap_process_query(
         self,
         wrapped: Callable[..., Any],
@@ -244,40 +430,14 @@ class AtlaClaudeCodeSdkInstrumentor(BaseInstrumentor):
         prompt: Optional[str | AsyncIterable[dict[str, Any]]] = kwargs.get("prompt")
         options: Optional[ClaudeCodeOptions] = kwargs.get("options")
 
-        parsed_messages: list[dict[str, Any]] = []
+        prompt = self._record_prompt(prompt, options)
         if prompt is not None:
-            if isinstance(prompt, str):
-                parsed_messages.append({"role": "user", "content": prompt})
-            else:
-                async for message in prompt:
-                    parsed_messages.append(message)
-
-        if options is not None:
-            options_dict = options.__dict__.copy()
-            options_dict.pop("debug_stderr")  # Non-hashable (and irrelevant) key
-            self._options.set(options_dict)
+            kwargs = {**kwargs, "prompt": prompt}
 
-        num_inputs = len(parsed_messages)
-        if options is not None and options.system_prompt is not None:
-            num_inputs += 1
-        self._num_inputs.set(num_inputs)
-
-        self._input_attributes.set(
-            {
-                SpanAttributes.LLM_PROVIDER: "anthropic",
-                SpanAttributes.INPUT_MIME_TYPE: OpenInferenceMimeTypeValues.JSON.value,
-                SpanAttributes.INPUT_VALUE: json.dumps(
-                    [*parsed_messages, self._options.get() or {}]
-                ),
-                SpanAttributes.OPENINFERENCE_SPAN_KIND: (
-                    OpenInferenceSpanKindValues.LLM.value
-                ),
-                **dict(_get_input_messages(parsed_messages, self._options.get() or {})),
-            }
-        )
         async for message in wrapped(*args, **kwargs):
             yield message
 
+    @passthrough_if_suppressed
     async def _wrap_query(
         self,
         wrapped: Callable[..., Any],
@@ -291,39 +451,15 @@ class AtlaClaudeCodeSdkInstrumentor(BaseInstrumentor):
         )
         options: Optional[ClaudeCodeOptions] = getattr(instance, "options", None)
 
-        parsed_messages: list[dict[str, Any]] = []
-        if prompt is not None:
-            if isinstance(prompt, str):
-                parsed_messages.append({"role": "user", "content": prompt})
-            else:
-                async for message in prompt:
-                    parsed_messages.append(message)
-
-        if options is not None:
-            options_dict = options.__dict__.copy()
-            options_dict.pop("debug_stderr")  # Non-hashable (and irrelevant) key
-            self._options.set(options_dict)
+        prompt = self._record_prompt(prompt, options)
+        if "prompt" in kwargs:
+            kwargs = {**kwargs, "prompt": prompt}
+        else:
+            args = (prompt, *args[1:])
 
-        num_inputs = len(parsed_messages)
-        if options is not None and options.system_prompt is not None:
-            num_inputs += 1
-        self._num_inputs.set(num_inputs)
-
-        self._input_attributes.set(
-            {
-                SpanAttributes.LLM_PROVIDER: "anthropic",
-                SpanAttributes.INPUT_MIME_TYPE: OpenInferenceMimeTypeValues.JSON.value,
-                SpanAttributes.INPUT_VALUE: json.dumps(
-                    [*parsed_messages, self._options.get() or {}]
-                ),
-                SpanAttributes.OPENINFERENCE_SPAN_KIND: (
-                    OpenInferenceSpanKindValues.LLM.value
-                ),
-                **dict(_get_input_messages(parsed_messages, self._options.get() or {})),
-            }
-        )
         return await wrapped(*args, **kwargs)
 
+    @passthrough_if_suppressed
     async def _wrap_receive_messages(
         self,
         wrapped: Callable[..., Any],
@@ -332,21 +468,33 @@ class AtlaClaudeCodeSdkInstrumentor(BaseInstrumentor):
         kwargs: Mapping[str, Any],
     ) -> Any:
         """Wrap receive_messages to continue the span until generator is consumed."""
+        prompt_recorder = self._prompt_recorder.get()
         span = self.tracer.start_span(
             name="Claude Code SDK Response",
-            attributes=self._input_attributes.get(),
+            attributes=prompt_recorder.get_attributes() if prompt_recorder else None,
             record_exception=False,
         )
         options = self._options.get() or {}
+        if prompt_recorder is not None:
+            prompt_recorder.span = span
+        message_recorder = _MessageRecorder(
+            self.tracer,
+            span,
+            (
+                prompt_recorder.next_message_idx
+                if prompt_recorder is not None
+                else itertools.count().__next__
+            ),
+            self.record_turns,
+        )
 
         try:
             llm_tools: Optional[dict] = None
             llm_attributes: Optional[dict] = None
 
-            messages: list[dict[str, Any]] = []
             async for message in wrapped(*args, **kwargs):
                 message = cast(dict[str, Any], message)
-                messages.append(message)
+                message_recorder.add(message)
 
                 if llm_tools is None:
                     llm_tools = dict(_get_llm_tools(message, options))
@@ -356,10 +504,6 @@ class AtlaClaudeCodeSdkInstrumentor(BaseInstrumentor):
                     span.set_attributes(llm_attributes)
 
                 if message.get("type") == "result":
-                    output_message_attributes = dict(
-                        _get_output_messages(messages, self._num_inputs.get())
-                    )
-                    span.set_attributes(output_message_attributes)
                     span.set_status(Status(StatusCode.OK))
 
                 yield message
@@ -369,6 +513,8 @@ class AtlaClaudeCodeSdkInstrumentor(BaseInstrumentor):
             span.set_status(Status(StatusCode.ERROR))
             raise
         finally:
+            if prompt_recorder is not None:
+                prompt_recorder.detach()
             span.end()
 
     def _instrument(self, **kwargs) -> None:
@@ -18,6 +18,7 @@ try:
         PydanticFinalResult,
     )
     from pydantic_ai import Agent, InstrumentationSettings
+    from pydantic_ai.models.instrumented import InstrumentedModel
 except ImportError as e:
     raise ImportError(
         "Pydantic AI instrumentation needs to be installed. "
@@ -43,6 +44,7 @@ from opentelemetry.semconv._incubating.attributes.gen_ai_attributes import (
 )
 
 from atla_insights.main import ATLA_INSTANCE
+from atla_insights.suppression import is_instrumentation_suppressed
 
 
 def _atla_extract_from_gen_ai_messages(  # noqa: C901
@@ -224,6 +226,23 @@ def _atla_extract_from_gen_ai_messages(  # noqa: C901
         yield SpanAttributes.OUTPUT_VALUE, output_value
 
 
+def _get_model(
+    wrapped: Callable[..., Any],
+    instance: Agent,
+    args: Tuple[Any, ...],
+    kwargs: Mapping[str, Any],
+) -> Any:
+    """Wrap `Agent._get_model` to skip the default instrumentation when suppressed."""
+    model = wrapped(*args, **kwargs)
+    if (
+        is_instrumentation_suppressed()
+        and instance.instrument is None
+        and isinstance(model, InstrumentedModel)
+    ):
+        return model.wrapped
+    return model
+
+
 class _AtlaOpenInferenceSpanProcessor(OpenInferenceSpanProcessor):
     """Atla extension on the OpenInference Pydantic AI span processor."""
 
@@ -244,6 +263,7 @@ class _PydanticAIInstrumentor(BaseInstrumentor):
 
         self.original_instrument_default: Optional[InstrumentationSettings | bool] = None
         self._original_extract_from_gen_ai_messages = None
+        self._original_get_model: Optional[Callable[..., Any]] = None
 
     def instrumentation_dependencies(self) -> Collection[str]:
         """Return a list of python packages that the will be instrumented."""
@@ -276,12 +296,15 @@ class _PydanticAIInstrumentor(BaseInstrumentor):
             _atla_extract_from_gen_ai_messages,
         )
 
-        # Ensure actual span processor only gets added once to the tracer provider.
-        if not self.is_instrumented:
+        self._original_get_model = Agent._get_model
+        wrap_function_wrapper("pydantic_ai.agent", "Agent._get_model", _get_model)
+
+        # Ensure actual span processor only gets added once to the tracer provider. It
+        # converts Pydantic AI spans, so it needs to run before any other processor.
+        if not self.is_instrumented and ATLA_INSTANCE.span_processor is not None:
             self.is_instrumented = True
-            ATLA_INSTANCE.tracer_provider._active_span_processor._span_processors = (
-                _AtlaOpenInferenceSpanProcessor(),
-                *ATLA_INSTANCE.tracer_provider._active_span_processor._span_processors,
+            ATLA_INSTANCE.span_processor.add_span_processor(
+                _AtlaOpenInferenceSpanProcessor(), scopes=["pydantic-ai"], first=True
             )
 
     def _uninstrument(self, **kwargs: Any) -> None:
@@ -302,6 +325,10 @@ class _PydanticAIInstrumentor(BaseInstrumentor):
             )
             self._original_extract_from_gen_ai_messages = None
 
+        if self._original_get_model is not None:
+            Agent._get_model = self._original_get_model  # type: ignore[method-assign]
+            self._original_get_model = None
+
 
 # Create stateful singleton instrumentor class.
 pydantic_ai_instrumentor = _PydanticAIInstrumentor()
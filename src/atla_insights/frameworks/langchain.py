@@ -31,11 +31,9 @@ def instrument_langchain() -> ContextManager[None]:
 
     from atla_insights.frameworks.instrumentors.langchain import AtlaLangChainInstrumentor
 
-    langchain_instrumentor = AtlaLangChainInstrumentor()
-
     return ATLA_INSTANCE.instrument_service(
         service=AtlaLangChainInstrumentor.name,
-        instrumentors=[langchain_instrumentor],
+        instrumentors=lambda: [AtlaLangChainInstrumentor()],
     )
 
 
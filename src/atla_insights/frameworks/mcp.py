@@ -41,7 +41,7 @@ def instrument_mcp() -> ContextManager[None]:
 
     return ATLA_INSTANCE.instrument_service(
         service="mcp",
-        instrumentors=[MCPInstrumentor()],
+        instrumentors=lambda: [MCPInstrumentor()],
     )
 
 
@@ -41,15 +41,17 @@ def instrument_openai_agents(
         AtlaOpenAIAgentsInstrumentor,
     )
 
-    # Create an instrumentor for the OpenAI Agents SDK.
-    openai_agents_instrumentor = AtlaOpenAIAgentsInstrumentor(exclusive_processor)
-
-    # Create an instrumentor for the underlying LLM provider(s).
-    llm_provider_instrumentors = get_instrumentors_for_provider(llm_provider)
-
+    # Create instrumentors for the OpenAI Agents SDK & the underlying LLM provider(s).
     return ATLA_INSTANCE.instrument_service(
         service=AtlaOpenAIAgentsInstrumentor.name,
-        instrumentors=[openai_agents_instrumentor, *llm_provider_instrumentors],
+        instrumentors=lambda: [
+            AtlaOpenAIAgentsInstrumentor(exclusive_processor),
+            *get_instrumentors_for_provider(llm_provider),
+        ],
+        config={
+            "llm_provider": llm_provider,
+            "exclusive_processor": exclusive_processor,
+        },
     )
 
 
@@ -33,7 +33,7 @@ def instrument_pydantic_ai() -> ContextManager[None]:
 
     return ATLA_INSTANCE.instrument_service(
         service=pydantic_ai_instrumentor.name,
-        instrumentors=[pydantic_ai_instrumentor],
+        instrumentors=lambda: [pydantic_ai_instrumentor],
     )
 
 
@@ -37,15 +37,14 @@ def instrument_smolagents(llm_provider: LLM_PROVIDER_TYPE) -> ContextManager[Non
         AtlaSmolAgentsInstrumentor,
     )
 
-    # Create an instrumentor for the SmolAgents framework.
-    smolagents_instrumentor = AtlaSmolAgentsInstrumentor()
-
-    # Create an instrumentor for the underlying LLM provider(s).
-    llm_provider_instrumentors = get_instrumentors_for_provider(llm_provider)
-
+    # Create instrumentors for the SmolAgents framework & the underlying LLM provider(s).
     return ATLA_INSTANCE.instrument_service(
         service=AtlaSmolAgentsInstrumentor.name,
-        instrumentors=[smolagents_instrumentor, *llm_provider_instrumentors],
+        instrumentors=lambda: [
+            AtlaSmolAgentsInstrumentor(),
+            *get_instrumentors_for_provider(llm_provider),
+        ],
+        config={"llm_provider": llm_provider},
     )
 
 
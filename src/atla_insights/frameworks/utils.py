@@ -45,15 +45,11 @@ def get_instrumentors_for_provider(
                     AtlaLiteLLMIntrumentor(tracer=ATLA_INSTANCE.get_tracer())
                 )
             case "openai":
-                try:
-                    from openinference.instrumentation.openai import OpenAIInstrumentor
-                except ImportError as e:
-                    raise ImportError(
-                        "OpenAI instrumentation needs to be installed. "
-                        'Please install it via `pip install "atla-insights[openai]"`.'
-                    ) from e
-
-                instrumentors.append(OpenAIInstrumentor())
+                from atla_insights.llm_providers.instrumentors.openai import (
+                    AtlaOpenAIInstrumentor,
+                )
+
+                instrumentors.append(AtlaOpenAIInstrumentor())
             case _:
                 raise ValueError(f"Invalid LLM provider: {provider}")
 
@@ -5,6 +5,8 @@ import random
 from opentelemetry import trace
 from opentelemetry.sdk.trace.id_generator import RandomIdGenerator
 
+from atla_insights.utils import register_at_fork_reinit
+
 
 class NoSeedIdGenerator(RandomIdGenerator):
     """Custom OpenTelemetry ID generator, uninfluenced by any pre-existing random seed."""
@@ -24,3 +26,8 @@ class NoSeedIdGenerator(RandomIdGenerator):
         while trace_id == trace.INVALID_TRACE_ID:
             trace_id = self.rng.getrandbits(128)
         return trace_id
+
+
+# Forked processes inherit the random state of their parent, so reseed it to avoid ID
+# collisions between them.
+register_at_fork_reinit(NoSeedIdGenerator.rng, lambda rng: rng.seed())
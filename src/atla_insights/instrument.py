@@ -2,31 +2,47 @@
 
 import functools
 import inspect
-from concurrent.futures import ThreadPoolExecutor
-from contextlib import contextmanager
-from typing import Any, AsyncGenerator, Callable, Generator, Optional, overload
-
+import os
+from contextvars import Token
+from types import TracebackType
+from typing import Any, AsyncGenerator, Callable, Generator, Optional, Type, overload
+
+from openinference.semconv.trace import OpenInferenceMimeTypeValues, SpanAttributes
+from opentelemetry import context as context_api
+from opentelemetry import trace as trace_api
+from opentelemetry.context import Context
 from opentelemetry.trace import Tracer
 
+from atla_insights.capture import (
+    ArgumentCapturePlan,
+    RecordingGenerator,
+    YieldedItems,
+    bounded_json_dumps,
+)
+from atla_insights.constants import INSTRUMENTATION_DISABLED_ENV_VAR
 from atla_insights.main import ATLA_INSTANCE, AtlaInsights, logger
 from atla_insights.suppression import is_instrumentation_suppressed
 
-executor: Optional[ThreadPoolExecutor]
-try:
-    from litellm.litellm_core_utils.thread_pool_executor import executor
-except ImportError:
-    executor = None
-
 
 @overload
 def instrument(func_or_message: Callable) -> Callable: ...
 
 
 @overload
-def instrument(func_or_message: Optional[str] = None) -> Callable: ...
-
-
-def instrument(func_or_message: Callable | Optional[str] = None) -> Callable:
+def instrument(
+    func_or_message: Optional[str] = None,
+    *,
+    capture_args: bool = False,
+    capture_result: bool = False,
+) -> Callable: ...
+
+
+def instrument(
+    func_or_message: Callable | Optional[str] = None,
+    *,
+    capture_args: bool = False,
+    capture_result: bool = False,
+) -> Callable:
     """Instruments a regular Python function.
 
     Can be used as either:
@@ -43,39 +59,200 @@ def instrument(func_or_message: Callable | Optional[str] = None) -> Callable:
     ```py
     from atla_insights import instrument
 
-    @instrument("My function")
+    @instrument("My function", capture_args=True, capture_result=True)
     def my_function(a: int):
         ...
     ```
+
+    Arguments and return values are only captured when opted into, and are serialized
+    within fixed depth, length and size limits. For generator functions, the captured
+    result is the (bounded) list of yielded items.
+
+    If the `ATLA_DISABLE_INSTRUMENTATION` environment variable is set when decorating,
+    the function is returned as is, without any per-call overhead.
+
+    :param func_or_message (Callable | Optional[str]): The function to instrument, or
+        the message to use for the span. Defaults to `None`, meaning the function name.
+    :param capture_args (bool): Whether to capture the function arguments. Defaults to
+        `False`.
+    :param capture_result (bool): Whether to capture the function return value.
+        Defaults to `False`.
+    :return (Callable): The instrumented function, or a decorator that instruments it.
     """
     if callable(func_or_message):
         return instrument()(func=func_or_message)
-    return _instrument(atla_instance=ATLA_INSTANCE, message=func_or_message)
+    return _instrument(
+        atla_instance=ATLA_INSTANCE,
+        message=func_or_message,
+        capture_args=capture_args,
+        capture_result=capture_result,
+    )
+
+
+class _CurrentSpan:
+    """Run a block of code within a new span, set as the current span.
+
+    Equivalent to `tracer.start_as_current_span(span_name)`, without the overhead of its
+    generator-based context manager.
+    """
+
+    __slots__ = ("_span", "_token")
 
+    def __init__(self, tracer: Tracer, span_name: str) -> None:
+        """Initialize the current span context manager.
+
+        :param tracer (Tracer): The tracer to start the span with.
+        :param span_name (str): The name of the span.
+        """
+        self._span = tracer.start_span(span_name)
+        self._token: Optional[Token[Context]] = None
+
+    def __enter__(self) -> trace_api.Span:
+        """Start the span as the current span."""
+        self._token = context_api.attach(trace_api.set_span_in_context(self._span))
+        return self._span
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """End the span, recording any raised exception (but not e.g. GeneratorExit)."""
+        if self._token is not None:
+            context_api.detach(self._token)
+
+        if isinstance(exc_val, Exception) and self._span.is_recording():
+            self._span.record_exception(exc_val)
+            self._span.set_status(
+                trace_api.Status(
+                    status_code=trace_api.StatusCode.ERROR,
+                    description=f"{type(exc_val).__name__}: {exc_val}",
+                )
+            )
+
+        self._span.end()
+
+
+def _is_parent_unsampled() -> bool:
+    """Check whether the current span is part of a trace that is not sampled.
+
+    Spans in such traces are never exported, so there is no need to create them.
+
+    :return (bool): True if there is a current span that is not sampled.
+    """
+    span_context = trace_api.get_current_span().get_span_context()
+    return span_context.is_valid and not span_context.trace_flags.sampled
+
+
+def _record_arguments(
+    span: trace_api.Span,
+    argument_plan: ArgumentCapturePlan,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> None:
+    """Record the (bounded) arguments of a function call on a span.
+
+    :param span (trace_api.Span): The span to record the arguments on.
+    :param argument_plan (ArgumentCapturePlan): The argument capture plan of the function.
+    :param args (tuple[Any, ...]): The positional arguments of the call.
+    :param kwargs (dict[str, Any]): The keyword arguments of the call.
+    """
+    if not span.is_recording():
+        return
 
-def _instrument(atla_instance: AtlaInsights, message: Optional[str]) -> Callable:  # noqa: C901
+    try:
+        input_value = argument_plan.dumps(args, kwargs)
+    except Exception:
+        # Failing to capture the arguments must not fail the function call itself.
+        logger.error("Failed to capture the function arguments", exc_info=True)
+        return
+
+    span.set_attributes(
+        {
+            SpanAttributes.INPUT_VALUE: input_value,
+            SpanAttributes.INPUT_MIME_TYPE: OpenInferenceMimeTypeValues.JSON.value,
+        }
+    )
+
+
+def _record_result(span: trace_api.Span, result: Any) -> None:
+    """Record the (bounded) return value of a function call on a span.
+
+    :param span (trace_api.Span): The span to record the return value on.
+    :param result (Any): The return value of the call.
+    """
+    if not span.is_recording():
+        return
+
+    try:
+        output_value = bounded_json_dumps(result)
+    except Exception:
+        # Failing to capture the return value must not fail the function call itself.
+        logger.error("Failed to capture the function return value", exc_info=True)
+        return
+
+    span.set_attributes(
+        {
+            SpanAttributes.OUTPUT_VALUE: output_value,
+            SpanAttributes.OUTPUT_MIME_TYPE: OpenInferenceMimeTypeValues.JSON.value,
+        }
+    )
+
+
+def _instrument(  # noqa: C901
+    atla_instance: AtlaInsights,
+    message: Optional[str],
+    capture_args: bool = False,
+    capture_result: bool = False,
+) -> Callable:
     """Instrument a function.
 
-    :param tracer (Optional[Tracer]): The tracer to use for instrumentation.
+    The wrapper is specialized at decoration time for the type of function, with its
+    span name (and, if capturing arguments, its argument capture plan) precomputed. On
+    each call, it falls through to the wrapped function as early as possible if
+    instrumentation is suppressed or the trace is not sampled.
+
+    :param atla_instance (AtlaInsights): The Atla instance to instrument with.
     :param message (Optional[str]): The message to use for the span.
+    :param capture_args (bool): Whether to capture the function arguments.
+    :param capture_result (bool): Whether to capture the function return value.
     :return (Callable): A decorator that instruments the function.
     """
 
     def decorator(func: Callable) -> Callable:  # noqa: C901
+        if os.getenv(INSTRUMENTATION_DISABLED_ENV_VAR):
+            return func
+
+        span_name = message or func.__qualname__
+        argument_plan = ArgumentCapturePlan(func) if capture_args else None
+
         if inspect.isgeneratorfunction(func):
 
             @functools.wraps(func)
             def gen_wrapper(*args, **kwargs) -> Generator[Any, Any, Any]:
-                if is_instrumentation_suppressed():
-                    yield from func(*args, **kwargs)
-                    return
-
-                if atla_instance.tracer is None:
+                tracer = atla_instance.tracer
+                if is_instrumentation_suppressed() or _is_parent_unsampled():
+                    return (yield from func(*args, **kwargs))
+                elif tracer is None:
                     logger.error("Atla Insights not configured, skipping instrumentation")
-                    yield from func(*args, **kwargs)
+                    return (yield from func(*args, **kwargs))
                 else:
-                    with _start_span(atla_instance.tracer, message or func.__qualname__):
-                        yield from func(*args, **kwargs)
+                    with _CurrentSpan(tracer, span_name) as span:
+                        if argument_plan is not None:
+                            _record_arguments(span, argument_plan, args, kwargs)
+                        if not capture_result:
+                            return (yield from func(*args, **kwargs))
+
+                        yielded_items = YieldedItems()
+                        try:
+                            return (
+                                yield from RecordingGenerator(
+                                    func(*args, **kwargs), yielded_items.append
+                                )
+                            )
+                        finally:
+                            _record_result(span, yielded_items.get_items())
 
             return gen_wrapper
 
@@ -83,19 +260,30 @@ def _instrument(atla_instance: AtlaInsights, message: Optional[str]) -> Callable
 
             @functools.wraps(func)
             async def async_gen_wrapper(*args, **kwargs) -> AsyncGenerator[Any, Any]:
-                if is_instrumentation_suppressed():
+                tracer = atla_instance.tracer
+                if is_instrumentation_suppressed() or _is_parent_unsampled():
                     async for x in func(*args, **kwargs):
                         yield x
-                    return
-
-                if atla_instance.tracer is None:
+                elif tracer is None:
                     logger.error("Atla Insights not configured, skipping instrumentation")
                     async for x in func(*args, **kwargs):
                         yield x
                 else:
-                    with _start_span(atla_instance.tracer, message or func.__qualname__):
-                        async for x in func(*args, **kwargs):
-                            yield x
+                    with _CurrentSpan(tracer, span_name) as span:
+                        if argument_plan is not None:
+                            _record_arguments(span, argument_plan, args, kwargs)
+                        if not capture_result:
+                            async for x in func(*args, **kwargs):
+                                yield x
+                            return
+
+                        yielded_items = YieldedItems()
+                        try:
+                            async for x in func(*args, **kwargs):
+                                yielded_items.append(x)
+                                yield x
+                        finally:
+                            _record_result(span, yielded_items.get_items())
 
             return async_gen_wrapper
 
@@ -103,60 +291,42 @@ def _instrument(atla_instance: AtlaInsights, message: Optional[str]) -> Callable
 
             @functools.wraps(func)
             async def async_wrapper(*args, **kwargs) -> Any:
-                if is_instrumentation_suppressed():
+                tracer = atla_instance.tracer
+                if is_instrumentation_suppressed() or _is_parent_unsampled():
                     return await func(*args, **kwargs)
 
-                if atla_instance.tracer is None:
+                if tracer is None:
                     logger.error("Atla Insights not configured, skipping instrumentation")
                     return await func(*args, **kwargs)
 
-                with _start_span(atla_instance.tracer, message or func.__qualname__):
-                    return await func(*args, **kwargs)
+                with _CurrentSpan(tracer, span_name) as span:
+                    if argument_plan is not None:
+                        _record_arguments(span, argument_plan, args, kwargs)
+                    result = await func(*args, **kwargs)
+                    if capture_result:
+                        _record_result(span, result)
+                    return result
 
             return async_wrapper
 
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs) -> Any:
-            if is_instrumentation_suppressed():
+            tracer = atla_instance.tracer
+            if is_instrumentation_suppressed() or _is_parent_unsampled():
                 return func(*args, **kwargs)
 
-            if atla_instance.tracer is None:
+            if tracer is None:
                 logger.error("Atla Insights not configured, skipping instrumentation")
                 return func(*args, **kwargs)
 
-            with _start_span(atla_instance.tracer, message or func.__qualname__):
-                return func(*args, **kwargs)
+            with _CurrentSpan(tracer, span_name) as span:
+                if argument_plan is not None:
+                    _record_arguments(span, argument_plan, args, kwargs)
+                result = func(*args, **kwargs)
+                if capture_result:
+                    _record_result(span, result)
+                return result
 
         return sync_wrapper
 
     return decorator
-
-
-@contextmanager
-def _start_span(tracer: Tracer, span_name: str) -> Generator:
-    """Start a new span in the tracer's current context.
-
-    This context manager will also disable multithreaded litellm callbacks for the
-    duration of the context.
-
-    This is used to prevent a litellm ThreadPoolExecutor from scheduling callbacks in
-    different threads, as these will only get executed after a thread lock is released,
-    at which point the OTEL context is already lost.
-
-    :param tracer (Tracer): The tracer to use for instrumentation.
-    :param span_name (str): The name of the span.
-    """
-    with tracer.start_as_current_span(span_name):
-        if executor is not None:
-            original_submit = executor.submit
-            executor.submit = _execute_in_single_thread  # type: ignore[method-assign]
-
-        yield
-
-        if executor is not None:
-            executor.submit = original_submit  # type: ignore[method-assign]
-
-
-def _execute_in_single_thread(fn: Callable, /, *args, **kwargs) -> Any:
-    """Execute a function in a single thread."""
-    return fn(*args, **kwargs)
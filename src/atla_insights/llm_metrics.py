@@ -0,0 +1,236 @@
+"""Pre-aggregated metrics of LLM calls."""
+
+import threading
+import weakref
+from typing import Any, Optional
+
+from openinference.semconv.trace import OpenInferenceSpanKindValues, SpanAttributes
+from opentelemetry.context import Context
+from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
+from opentelemetry.metrics import MeterProvider
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
+from opentelemetry.trace import StatusCode
+from opentelemetry.util.types import Attributes
+
+from atla_insights.constants import (
+    ENVIRONMENT_MARK,
+    LLM_METRICS_CALLS,
+    LLM_METRICS_DURATION,
+    LLM_METRICS_IN_FLIGHT,
+    LLM_METRICS_TOKENS,
+    OTEL_METRICS_ENDPOINT,
+    OTEL_MODULE_NAME,
+    __version__,
+)
+from atla_insights.utils import register_at_fork_reinit, reset_exporter_connections
+
+_LLM_SPAN_KIND = OpenInferenceSpanKindValues.LLM.value
+
+# Upper bounds (in seconds) of the LLM call duration histogram buckets.
+_DURATION_BUCKET_BOUNDS_S = (
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    20.0,
+    40.0,
+    80.0,
+    160.0,
+    320.0,
+)
+
+# Upper bounds of the token count histogram buckets (powers of 4, up to ~1M tokens).
+_TOKEN_BUCKET_BOUNDS = tuple(float(4**i) for i in range(11))
+
+_UNKNOWN = "unknown"
+
+# LiteLLM calls are recorded with GenAI semantic convention attributes instead.
+_INSTRUMENTATION_NAME = "atla.instrumentation.name"
+_LITELLM_INSTRUMENTATION_NAME = "litellm"
+
+# The attributes holding each metric attribute, in order of precedence.
+_MODEL_ATTRIBUTES = (
+    SpanAttributes.LLM_MODEL_NAME,
+    "gen_ai.response.model",
+    "gen_ai.request.model",
+)
+_PROVIDER_ATTRIBUTES = (
+    SpanAttributes.LLM_PROVIDER,
+    SpanAttributes.LLM_SYSTEM,
+    "gen_ai.system",
+)
+_TOKEN_COUNT_ATTRIBUTES = {
+    "prompt": (SpanAttributes.LLM_TOKEN_COUNT_PROMPT, "gen_ai.usage.prompt_tokens"),
+    "completion": (
+        SpanAttributes.LLM_TOKEN_COUNT_COMPLETION,
+        "gen_ai.usage.completion_tokens",
+    ),
+}
+
+
+def _is_llm_span(attributes: Attributes) -> bool:
+    """Check whether a span represents an LLM call.
+
+    :param attributes (Attributes): The span attributes.
+    :return (bool): Whether the span represents an LLM call.
+    """
+    return attributes is not None and (
+        attributes.get(SpanAttributes.OPENINFERENCE_SPAN_KIND) == _LLM_SPAN_KIND
+        or attributes.get(_INSTRUMENTATION_NAME) == _LITELLM_INSTRUMENTATION_NAME
+    )
+
+
+def _get_first_attribute(attributes: Attributes, keys: tuple[str, ...]) -> Any:
+    """Get the first set attribute of the given keys.
+
+    :param attributes (Attributes): The span attributes.
+    :param keys (tuple[str, ...]): The attribute keys, in order of precedence.
+    :return (Any): The first set attribute value, or `None` if none is set.
+    """
+    if attributes is None:
+        return None
+    return next(
+        (value for key in keys if (value := attributes.get(key)) is not None), None
+    )
+
+
+class LLMMetricsSpanProcessor(SpanProcessor):
+    """Span processor that records pre-aggregated metrics of LLM calls.
+
+    The LLM spans produced by the instrumentors feed the following metrics, by model,
+    provider and environment:
+    - `atla.llm.calls`: the number of LLM calls, by status (`ok` or `error`).
+    - `atla.llm.duration`: a histogram of the LLM call duration (in seconds).
+    - `atla.llm.tokens`: a histogram of the number of tokens used per LLM call, by token
+      type (`prompt` or `completion`).
+    - `atla.llm.in_flight`: the number of ongoing LLM calls.
+
+    As this processor sees every recorded span (whether or not it is sampled for export),
+    metrics are not affected by trace sampling.
+    """
+
+    def __init__(self, meter_provider: MeterProvider, environment: str) -> None:
+        """Initialize the LLM metrics span processor.
+
+        :param meter_provider (MeterProvider): The meter provider to record metrics with.
+        :param environment (str): The environment of the LLM calls, for spans without one.
+        """
+        self.environment = environment
+
+        meter = meter_provider.get_meter(OTEL_MODULE_NAME, __version__)
+        self._calls = meter.create_counter(
+            LLM_METRICS_CALLS, unit="{call}", description="Number of LLM calls."
+        )
+        self._duration = meter.create_histogram(
+            LLM_METRICS_DURATION,
+            unit="s",
+            description="Duration of LLM calls.",
+            explicit_bucket_boundaries_advisory=_DURATION_BUCKET_BOUNDS_S,
+        )
+        self._tokens = meter.create_histogram(
+            LLM_METRICS_TOKENS,
+            unit="{token}",
+            description="Number of tokens used per LLM call.",
+            explicit_bucket_boundaries_advisory=_TOKEN_BUCKET_BOUNDS,
+        )
+        self._in_flight = meter.create_up_down_counter(
+            LLM_METRICS_IN_FLIGHT,
+            unit="{call}",
+            description="Number of ongoing LLM calls.",
+        )
+
+        # The attributes each in-flight LLM call was counted with, by span id. Spans that
+        # are garbage collected without ever ending are no longer counted as in-flight.
+        self._in_flight_spans: dict[int, dict[str, str]] = {}
+        self._lock = threading.Lock()
+        register_at_fork_reinit(self, LLMMetricsSpanProcessor._at_fork_reinit)
+
+    def _at_fork_reinit(self) -> None:
+        """Reinitialize the span processor in a forked child process."""
+        self._lock = threading.Lock()
+
+    def _get_metric_attributes(self, attributes: Attributes) -> dict[str, str]:
+        """Get the (low-cardinality) metric attributes of an LLM span.
+
+        :param attributes (Attributes): The span attributes.
+        :return (dict[str, str]): The metric attributes.
+        """
+        environment = attributes.get(ENVIRONMENT_MARK) if attributes else None
+        return {
+            "model": str(_get_first_attribute(attributes, _MODEL_ATTRIBUTES) or _UNKNOWN),
+            "provider": str(
+                _get_first_attribute(attributes, _PROVIDER_ATTRIBUTES) or _UNKNOWN
+            ),
+            "environment": str(environment or self.environment),
+        }
+
+    def _end_in_flight(self, span_id: int) -> None:
+        """Stop counting a span as in-flight, if it is.
+
+        :param span_id (int): The id of the span.
+        """
+        with self._lock:
+            metric_attributes = self._in_flight_spans.pop(span_id, None)
+        if metric_attributes is not None:
+            self._in_flight.add(-1, metric_attributes)
+
+    def on_start(self, span: Span, parent_context: Optional[Context] = None) -> None:
+        """On start span processing.
+
+        :param span (Span): The span to process.
+        :param parent_context (Optional[Context]): The parent context. Defaults to `None`.
+        """
+        # Only spans that are known to be LLM calls on start count as in-flight.
+        if span.context is None or not _is_llm_span(span.attributes):
+            return
+
+        metric_attributes = self._get_metric_attributes(span.attributes)
+        with self._lock:
+            self._in_flight_spans[span.context.span_id] = metric_attributes
+        self._in_flight.add(1, metric_attributes)
+        weakref.finalize(span, self._end_in_flight, span.context.span_id)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        """On end span processing.
+
+        :param span (ReadableSpan): The span to process.
+        """
+        if span.context is not None:
+            self._end_in_flight(span.context.span_id)
+
+        attributes = span.attributes
+        if not _is_llm_span(attributes) or attributes is None:
+            return
+
+        metric_attributes = self._get_metric_attributes(attributes)
+
+        status = "error" if span.status.status_code is StatusCode.ERROR else "ok"
+        self._calls.add(1, {**metric_attributes, "status": status})
+
+        if span.start_time is not None and span.end_time is not None:
+            self._duration.record(
+                (span.end_time - span.start_time) / 1e9, metric_attributes
+            )
+
+        for token_type, token_count_attributes in _TOKEN_COUNT_ATTRIBUTES.items():
+            token_count = _get_first_attribute(attributes, token_count_attributes)
+            if isinstance(token_count, (int, float)) and not isinstance(
+                token_count, bool
+            ):
+                self._tokens.record(
+                    token_count, {**metric_attributes, "token_type": token_type}
+                )
+
+
+def get_atla_metric_exporter(token: str) -> OTLPMetricExporter:
+    """Get the Atla metric exporter."""
+    exporter = OTLPMetricExporter(
+        endpoint=OTEL_METRICS_ENDPOINT,
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    # Connections must not be shared with the parent process after a fork.
+    register_at_fork_reinit(exporter, reset_exporter_connections)
+    return exporter
@@ -9,6 +9,7 @@ from atla_insights.llm_providers.bedrock import (
     uninstrument_bedrock,
 )
 from atla_insights.llm_providers.elevenlabs import (
+    ainstrument_elevenlabs,
     instrument_elevenlabs,
     uninstrument_elevenlabs,
 )
@@ -24,6 +25,7 @@ from atla_insights.llm_providers.litellm import instrument_litellm, uninstrument
 from atla_insights.llm_providers.openai import instrument_openai, uninstrument_openai
 
 __all__ = [
+    "ainstrument_elevenlabs",
     "instrument_anthropic",
     "instrument_bedrock",
     "instrument_elevenlabs",
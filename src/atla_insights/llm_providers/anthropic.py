@@ -28,11 +28,9 @@ def instrument_anthropic() -> ContextManager[None]:
         AtlaAnthropicInstrumentor,
     )
 
-    anthropic_instrumentor = AtlaAnthropicInstrumentor()
-
     return ATLA_INSTANCE.instrument_service(
         service=AtlaAnthropicInstrumentor.name,
-        instrumentors=[anthropic_instrumentor],
+        instrumentors=lambda: [AtlaAnthropicInstrumentor()],
     )
 
 
@@ -39,11 +39,9 @@ def instrument_bedrock() -> ContextManager[None]:
             'Please install it via `pip install "atla-insights[bedrock]"`.'
         ) from e
 
-    bedrock_instrumentor = BedrockInstrumentor()
-
     return ATLA_INSTANCE.instrument_service(
         service="bedrock",
-        instrumentors=[bedrock_instrumentor],
+        instrumentors=lambda: [BedrockInstrumentor()],
     )
 
 
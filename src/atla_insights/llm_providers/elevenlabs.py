@@ -1,46 +1,137 @@
 """ElevenLabs LLM provider instrumentation."""
 
+import threading
+import time
 import warnings
-from typing import ContextManager, cast
+from typing import ContextManager, Optional, cast
 
 import httpx
 from opentelemetry.sdk.trace import TracerProvider
 
-from atla_insights.constants import ELEVENLABS_API_KEY_VERIFY_ENDPOINT
+from atla_insights.constants import (
+    ELEVENLABS_API_KEY_VERIFY_ENDPOINT,
+    ELEVENLABS_SESSION_IDLE_TIMEOUT_S,
+    ELEVENLABS_SESSION_MAX_AGE_S,
+)
 from atla_insights.main import ATLA_INSTANCE
 from atla_insights.suppression import (
     NoOpContextManager,
     is_instrumentation_suppressed,
 )
 
+_API_KEY_VERIFICATION_TTL_S = 600.0
+# Verifications older than this are refreshed in the background when used.
+_API_KEY_VERIFICATION_REFRESH_S = 300.0
 
-def _has_elevenlabs_api_key(url: str = ELEVENLABS_API_KEY_VERIFY_ENDPOINT) -> bool:
-    """Verifies whether the authenticated user has uploaded a valid API key.
+# Verification results and the (monotonic) time they were verified at, by URL & token.
+_api_key_verifications: dict[tuple[str, Optional[str]], tuple[bool, float]] = {}
+_api_key_verifications_refreshing: set[tuple[str, Optional[str]]] = set()
+_api_key_verifications_lock = threading.Lock()
 
-    :param url (str): ElevenLabs API key verification URL.
-    :return (bool): Whether or not the user has a valid ElevenLabs API key.
-    """
-    with httpx.Client() as client:
-        response = client.get(
-            url,
-            headers={
-                "Authorization": f"Bearer {ATLA_INSTANCE.token}",
-                "Content-Type": "application/json",
-            },
-        )
 
+def _get_api_key_verification_headers() -> dict[str, str]:
+    """Get the headers of an ElevenLabs API key verification request."""
+    return {
+        "Authorization": f"Bearer {ATLA_INSTANCE.token}",
+        "Content-Type": "application/json",
+    }
+
+
+def _parse_api_key_verification(response: httpx.Response) -> Optional[bool]:
+    """Parse the response of an ElevenLabs API key verification request.
+
+    :param response (httpx.Response): The verification response.
+    :return (Optional[bool]): Whether the user has a valid ElevenLabs API key, or `None`
+        if this could not be verified.
+    """
     if response.status_code != 200:
-        warnings.warn(
-            "Could not instrument ElevenLabs because we were unable to verify whether "
-            "you have uploaded a valid ElevenLabs API key to the Atla platform. "
-            "This should not happen. Please reach out to the Atla team for support.",
-            stacklevel=1,
-        )
-        return False
+        return None
 
     try:
         response_body = dict(response.json())
     except Exception:
+        return None
+
+    return bool(response_body.get("hasApiKey"))
+
+
+def _cache_api_key_verification(
+    url: str, token: Optional[str], has_api_key: Optional[bool]
+) -> None:
+    """Cache the result of an ElevenLabs API key verification.
+
+    Failed verifications are not cached, so they are retried on the next call.
+
+    :param url (str): ElevenLabs API key verification URL.
+    :param token (Optional[str]): The Atla token the verification was made with.
+    :param has_api_key (Optional[bool]): The verification result.
+    """
+    if has_api_key is None:
+        return
+    with _api_key_verifications_lock:
+        _api_key_verifications[(url, token)] = (has_api_key, time.monotonic())
+
+
+def _refresh_api_key_verification(url: str, token: Optional[str]) -> None:
+    """Refresh a cached ElevenLabs API key verification.
+
+    :param url (str): ElevenLabs API key verification URL.
+    :param token (Optional[str]): The Atla token to verify with.
+    """
+    try:
+        with httpx.Client() as client:
+            response = client.get(url, headers=_get_api_key_verification_headers())
+        if ATLA_INSTANCE.token == token:
+            _cache_api_key_verification(url, token, _parse_api_key_verification(response))
+    except httpx.HTTPError:
+        pass  # Keep the cached verification, until it expires.
+    finally:
+        with _api_key_verifications_lock:
+            _api_key_verifications_refreshing.discard((url, token))
+
+
+def _get_cached_api_key_verification(url: str) -> Optional[bool]:
+    """Get a cached ElevenLabs API key verification of the configured Atla token.
+
+    Verifications close to expiry are refreshed in a background thread.
+
+    :param url (str): ElevenLabs API key verification URL.
+    :return (Optional[bool]): The cached verification result, or `None` if there is no
+        (unexpired) cached verification.
+    """
+    key = (url, ATLA_INSTANCE.token)
+    with _api_key_verifications_lock:
+        if (cached := _api_key_verifications.get(key)) is None:
+            return None
+
+        has_api_key, verified_at = cached
+        age = time.monotonic() - verified_at
+        if age >= _API_KEY_VERIFICATION_TTL_S:
+            del _api_key_verifications[key]
+            return None
+
+        if (
+            age >= _API_KEY_VERIFICATION_REFRESH_S
+            and key not in _api_key_verifications_refreshing
+        ):
+            _api_key_verifications_refreshing.add(key)
+            threading.Thread(
+                target=_refresh_api_key_verification,
+                args=key,
+                name="atla-elevenlabs-api-key-refresh",
+                daemon=True,
+            ).start()
+
+    return has_api_key
+
+
+def _check_api_key_verification(has_api_key: Optional[bool]) -> bool:
+    """Check the result of an ElevenLabs API key verification, warning if it failed.
+
+    :param has_api_key (Optional[bool]): The verification result.
+    :return (bool): Whether or not the user has a valid ElevenLabs API key.
+    """
+    if has_api_key is None:
         warnings.warn(
             "Could not instrument ElevenLabs because we were unable to verify whether "
             "you have uploaded a valid ElevenLabs API key to the Atla platform. "
@@ -49,8 +140,6 @@ def _has_elevenlabs_api_key(url: str = ELEVENLABS_API_KEY_VERIFY_ENDPOINT) -> bo
         )
         return False
 
-    has_api_key = bool(response_body.get("hasApiKey"))
-
     if has_api_key is False:
         warnings.warn(
             "Could not instrument ElevenLabs because you have not yet uploaded a valid "
@@ -62,12 +151,91 @@ def _has_elevenlabs_api_key(url: str = ELEVENLABS_API_KEY_VERIFY_ENDPOINT) -> bo
     return has_api_key
 
 
-def instrument_elevenlabs() -> ContextManager[None]:
+def _has_elevenlabs_api_key(url: str = ELEVENLABS_API_KEY_VERIFY_ENDPOINT) -> bool:
+    """Verifies whether the authenticated user has uploaded a valid API key.
+
+    Verification results are cached per Atla token for `_API_KEY_VERIFICATION_TTL_S`.
+
+    :param url (str): ElevenLabs API key verification URL.
+    :return (bool): Whether or not the user has a valid ElevenLabs API key.
+    """
+    has_api_key = _get_cached_api_key_verification(url)
+    if has_api_key is None:
+        token = ATLA_INSTANCE.token
+        with httpx.Client() as client:
+            response = client.get(url, headers=_get_api_key_verification_headers())
+
+        has_api_key = _parse_api_key_verification(response)
+        _cache_api_key_verification(url, token, has_api_key)
+
+    return _check_api_key_verification(has_api_key)
+
+
+async def _ahas_elevenlabs_api_key(url: str = ELEVENLABS_API_KEY_VERIFY_ENDPOINT) -> bool:
+    """Verifies whether the authenticated user has uploaded a valid API key.
+
+    Async variant of `_has_elevenlabs_api_key`, sharing its cache.
+
+    :param url (str): ElevenLabs API key verification URL.
+    :return (bool): Whether or not the user has a valid ElevenLabs API key.
+    """
+    has_api_key = _get_cached_api_key_verification(url)
+    if has_api_key is None:
+        token = ATLA_INSTANCE.token
+        async with httpx.AsyncClient() as client:
+            response = await client.get(url, headers=_get_api_key_verification_headers())
+
+        has_api_key = _parse_api_key_verification(response)
+        _cache_api_key_verification(url, token, has_api_key)
+
+    return _check_api_key_verification(has_api_key)
+
+
+def _instrument_elevenlabs(
+    session_idle_timeout_s: float, session_max_age_s: float
+) -> ContextManager[None]:
+    """Instrument the ElevenLabs Python SDK, once its API key has been verified.
+
+    :param session_idle_timeout_s (float): The idle timeout of sessions, in seconds.
+    :param session_max_age_s (float): The maximum age of sessions, in seconds.
+    :return (ContextManager[None]): A context manager that instruments ElevenLabs.
+    """
+    from atla_insights.llm_providers.instrumentors.elevenlabs import (
+        AtlaElevenLabsInstrumentor,
+    )
+
+    tracer = cast(TracerProvider, ATLA_INSTANCE.tracer_provider).get_tracer(
+        "openinference.instrumentation.elevenlabs"
+    )
+    return ATLA_INSTANCE.instrument_service(
+        service=AtlaElevenLabsInstrumentor.name,
+        instrumentors=lambda: [
+            AtlaElevenLabsInstrumentor(
+                tracer=tracer,
+                session_idle_timeout_s=session_idle_timeout_s,
+                session_max_age_s=session_max_age_s,
+            )
+        ],
+        config={
+            "session_idle_timeout_s": session_idle_timeout_s,
+            "session_max_age_s": session_max_age_s,
+        },
+    )
+
+
+def instrument_elevenlabs(
+    session_idle_timeout_s: float = ELEVENLABS_SESSION_IDLE_TIMEOUT_S,
+    session_max_age_s: float = ELEVENLABS_SESSION_MAX_AGE_S,
+) -> ContextManager[None]:
     """Instrument the ElevenLabs Python SDK.
 
     This function creates a context manager that instruments the ElevenLabs LLM
     provider, within its context.
 
+    Sessions are expected to be ended with `end_session`. The spans of sessions that
+    are not are ended after `session_idle_timeout_s` without any received messages,
+    after `session_max_age_s`, or once their conversation is garbage collected.
+
     ```py
     from atla_insights import instrument_elevenlabs
 
@@ -75,24 +243,43 @@ def instrument_elevenlabs() -> ContextManager[None]:
         # My ElevenLabs code here
     ```
 
+    :param session_idle_timeout_s (float): The idle timeout of sessions, in seconds.
+        Defaults to 30 minutes.
+    :param session_max_age_s (float): The maximum age of sessions, in seconds.
+        Defaults to 6 hours.
     :return (ContextManager[None]): A context manager that instruments ElevenLabs.
     """
     if is_instrumentation_suppressed() or not _has_elevenlabs_api_key():
         return NoOpContextManager()
 
-    from atla_insights.llm_providers.instrumentors.elevenlabs import (
-        AtlaElevenLabsInstrumentor,
-    )
+    return _instrument_elevenlabs(session_idle_timeout_s, session_max_age_s)
 
-    tracer = cast(TracerProvider, ATLA_INSTANCE.tracer_provider).get_tracer(
-        "openinference.instrumentation.elevenlabs"
-    )
-    instrumentor = AtlaElevenLabsInstrumentor(tracer=tracer)
 
-    return ATLA_INSTANCE.instrument_service(
-        service=AtlaElevenLabsInstrumentor.name,
-        instrumentors=[instrumentor],
-    )
+async def ainstrument_elevenlabs(
+    session_idle_timeout_s: float = ELEVENLABS_SESSION_IDLE_TIMEOUT_S,
+    session_max_age_s: float = ELEVENLABS_SESSION_MAX_AGE_S,
+) -> ContextManager[None]:
+    """Instrument the ElevenLabs Python SDK, without blocking the event loop.
+
+    Async variant of `instrument_elevenlabs`, for use within an event loop.
+
+    ```py
+    from atla_insights import ainstrument_elevenlabs
+
+    with await ainstrument_elevenlabs():
+        # My ElevenLabs code here
+    ```
+
+    :param session_idle_timeout_s (float): The idle timeout of sessions, in seconds.
+        Defaults to 30 minutes.
+    :param session_max_age_s (float): The maximum age of sessions, in seconds.
+        Defaults to 6 hours.
+    :return (ContextManager[None]): A context manager that instruments ElevenLabs.
+    """
+    if is_instrumentation_suppressed() or not await _ahas_elevenlabs_api_key():
+        return NoOpContextManager()
+
+    return _instrument_elevenlabs(session_idle_timeout_s, session_max_age_s)
 
 
 def uninstrument_elevenlabs() -> None:
@@ -28,11 +28,9 @@ def instrument_google_genai() -> ContextManager[None]:
         AtlaGoogleGenAIInstrumentor,
     )
 
-    google_genai_instrumentor = AtlaGoogleGenAIInstrumentor()
-
     return ATLA_INSTANCE.instrument_service(
         service=AtlaGoogleGenAIInstrumentor.name,
-        instrumentors=[google_genai_instrumentor],
+        instrumentors=lambda: [AtlaGoogleGenAIInstrumentor()],
     )
 
 
@@ -37,11 +37,9 @@ def instrument_google_generativeai() -> ContextManager[None]:
         GoogleGenerativeAIInstrumentor,
     )
 
-    google_generativeai_instrumentor = GoogleGenerativeAIInstrumentor()
-
     return ATLA_INSTANCE.instrument_service(
         service=GoogleGenerativeAIInstrumentor.name,
-        instrumentors=[google_generativeai_instrumentor],
+        instrumentors=lambda: [GoogleGenerativeAIInstrumentor()],
     )
 
 
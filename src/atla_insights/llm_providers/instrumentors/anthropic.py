@@ -7,6 +7,8 @@ import opentelemetry.context as context_api
 from opentelemetry import trace as trace_api
 from wrapt import ObjectProxy, wrap_function_wrapper
 
+from atla_insights.streaming import time_stream
+
 try:
     from openinference.instrumentation import get_attributes_from_context
     from openinference.instrumentation.anthropic import AnthropicInstrumentor
@@ -106,6 +108,10 @@ class AtlaAnthropicInstrumentor(AnthropicInstrumentor):
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the AtlaAnthropicInstrumentor."""
+        # Instrumentors are singletons: keep the state of an active instrumentor.
+        if self.is_instrumented_by_opentelemetry:
+            return
+
         super().__init__(*args, **kwargs)
 
         self.original_completions_create = None
@@ -114,12 +120,31 @@ class AtlaAnthropicInstrumentor(AnthropicInstrumentor):
         self.original_async_messages_create = None
         self.original_messages_stream = None
         self.original_async_messages_stream = None
+        self.original_messages_stream_init = None
 
     def _instrument(self, **kwargs) -> None:
         from anthropic.resources.messages import AsyncMessages
 
         super()._instrument(**kwargs)
 
+        # Record streaming latencies (e.g. time-to-first-token) for all message streams.
+        if self.original_messages_stream_init is None:
+            original_messages_stream_init = _MessagesStream.__init__
+            self.original_messages_stream_init = original_messages_stream_init  # type: ignore[assignment]
+
+            def _messages_stream_init(
+                self: _MessagesStream,
+                stream: Any,
+                with_span: _WithSpan,
+                *args: Any,
+                **kwargs: Any,
+            ) -> None:
+                original_messages_stream_init(
+                    self, time_stream(stream, with_span._span), with_span, *args, **kwargs
+                )
+
+            _MessagesStream.__init__ = _messages_stream_init  # type: ignore[method-assign]
+
         self.original_async_messages_stream = AsyncMessages.stream  # type: ignore[assignment]
         wrap_function_wrapper(
             module="anthropic.resources.messages",
@@ -135,9 +160,13 @@ class AtlaAnthropicInstrumentor(AnthropicInstrumentor):
         if self.original_async_messages_stream is not None:
             AsyncMessages.stream = self.original_async_messages_stream
 
+        if self.original_messages_stream_init is not None:
+            _MessagesStream.__init__ = self.original_messages_stream_init  # type: ignore[method-assign]
+
         self.original_completions_create = None
         self.original_async_completions_create = None
         self.original_messages_create = None
         self.original_async_messages_create = None
         self.original_messages_stream = None
         self.original_async_messages_stream = None
+        self.original_messages_stream_init = None
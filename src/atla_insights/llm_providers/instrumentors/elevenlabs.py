@@ -1,13 +1,17 @@
 """ElevenLabs instrumentation."""
 
 import logging
+import threading
+import time
 import warnings
-from contextvars import ContextVar
+import weakref
+from collections import deque
 from typing import Any, Callable, Collection, Mapping, Optional
 
 try:
     from elevenlabs.conversational_ai.conversation import (
         AsyncConversation,
+        BaseConversation,
         Conversation,
     )
 except ImportError as e:
@@ -27,25 +31,240 @@ from opentelemetry.instrumentation.instrumentor import (  # type: ignore[attr-de
 from opentelemetry.trace import Span, Status, StatusCode, Tracer
 from wrapt import wrap_function_wrapper
 
-from atla_insights.constants import OTEL_MODULE_NAME
+from atla_insights.constants import (
+    ELEVENLABS_SESSION_IDLE_TIMEOUT_S,
+    ELEVENLABS_SESSION_MAX_AGE_S,
+    OTEL_MODULE_NAME,
+)
+from atla_insights.suppression import passthrough_if_suppressed
+from atla_insights.utils import register_at_fork_reinit
 
 logger = logging.getLogger(OTEL_MODULE_NAME)
 
+_SESSION_REAP_INTERVAL_S = 60.0
+
+
+class _Session:
+    """An active ElevenLabs conversation session."""
+
+    def __init__(self, span: Span) -> None:
+        """Initialize the session.
+
+        :param span (Span): The span of the session.
+        """
+        self.span = span
+        self.conversation: Optional[weakref.ref] = None
+        self.started_at = time.monotonic()
+        self.last_activity = self.started_at
+        self.ended = False
+
+
+class _SessionRegistry:
+    """Registry of the active ElevenLabs conversation sessions.
+
+    Sessions are normally ended by `end_session`, which is not guaranteed to get called.
+    A background thread therefore reaps sessions that are idle (i.e. no messages were
+    received) for longer than `idle_timeout_s`, that are older than `max_age_s`, or whose
+    conversation was garbage collected. Reaped spans end with an error status describing
+    why they were reaped.
+
+    Conversations are only weakly referenced, so abandoned conversations can be garbage
+    collected.
+    """
+
+    def __init__(
+        self,
+        idle_timeout_s: float,
+        max_age_s: float,
+        reap_interval_s: float = _SESSION_REAP_INTERVAL_S,
+    ) -> None:
+        """Initialize the session registry.
+
+        :param idle_timeout_s (float): The number of seconds after which idle sessions
+            are ended.
+        :param max_age_s (float): The number of seconds after which sessions are ended.
+        :param reap_interval_s (float): The number of seconds between reaping runs.
+            Defaults to 60.
+        """
+        self.idle_timeout_s = idle_timeout_s
+        self.max_age_s = max_age_s
+        self.reap_interval_s = reap_interval_s
+
+        # Active sessions, by conversation ID.
+        self._sessions: dict[int, _Session] = {}
+        # Sessions of garbage collected conversations. Appended to from weakref
+        # callbacks, which could run while the lock is held, so it is lock-free.
+        self._collected: deque[_Session] = deque()
+        self._lock = threading.Lock()
+
+        self._stopped = threading.Event()
+        self._reaper: Optional[threading.Thread] = None
+        register_at_fork_reinit(self, _SessionRegistry._at_fork_reinit)
+
+    def _at_fork_reinit(self) -> None:
+        """Reinitialize the registry in a forked child process.
+
+        Sessions of the parent process are left for the parent to end.
+        """
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self._collected = deque()
+        if self._reaper is not None and not self._stopped.is_set():
+            self.start()
+
+    def start(self) -> None:
+        """Start the background thread reaping sessions."""
+        self._stopped.clear()
+        self._reaper = threading.Thread(
+            target=self._reap_loop, name="atla-elevenlabs-session-reaper", daemon=True
+        )
+        self._reaper.start()
+
+    def stop(self) -> list[Span]:
+        """Stop reaping sessions, and release all active sessions.
+
+        :return (list[Span]): The spans of the sessions that were still active.
+        """
+        self._stopped.set()
+        self.reap()
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        return [span for session in sessions if (span := self._release(session))]
+
+    def _reap_loop(self) -> None:
+        """Reap sessions, until stopped."""
+        while not self._stopped.wait(self.reap_interval_s):
+            try:
+                self.reap()
+            except Exception as e:
+                logger.error(f"Failed to reap ElevenLabs sessions: {e}")
+
+    def add(self, conversation: Any, span: Span) -> None:
+        """Register the session of a conversation.
+
+        :param conversation (Any): The conversation.
+        :param span (Span): The span of the session.
+        """
+        session = _Session(span)
+        session.conversation = weakref.ref(
+            conversation, lambda _: self._collected.append(session)
+        )
+        with self._lock:
+            self._sessions[id(conversation)] = session
+
+    def _get(self, conversation: Any) -> Optional[_Session]:
+        """Get the active session of a conversation."""
+        session = self._sessions.get(id(conversation))
+        if session is None or session.conversation is None:
+            return None
+        if session.conversation() is not conversation:
+            return None
+        return session
+
+    def touch(self, conversation: Any) -> None:
+        """Record activity in the session of a conversation.
+
+        :param conversation (Any): The conversation.
+        """
+        if (session := self._get(conversation)) is not None:
+            session.last_activity = time.monotonic()
+
+    def pop(self, conversation: Any) -> Optional[Span]:
+        """Release the session of a conversation.
+
+        :param conversation (Any): The conversation.
+        :return (Optional[Span]): The span of the session, if it is still active.
+        """
+        with self._lock:
+            if (session := self._get(conversation)) is None:
+                return None
+            del self._sessions[id(conversation)]
+        return self._release(session)
+
+    def _release(self, session: _Session) -> Optional[Span]:
+        """Release a session, so that it is not ended more than once."""
+        with self._lock:
+            if session.ended:
+                return None
+            session.ended = True
+        # Dropping the weak reference also drops its garbage collection callback.
+        session.conversation = None
+        return session.span
+
+    def reap(self) -> None:
+        """End the spans of idle, expired and garbage collected sessions."""
+        now = time.monotonic()
+        reaped: list[tuple[_Session, str]] = []
+
+        while self._collected:
+            reaped.append((self._collected.popleft(), "abandoned"))
+
+        with self._lock:
+            for key, session in list(self._sessions.items()):
+                conversation = session.conversation() if session.conversation else None
+                if conversation is None:
+                    # Garbage collected, so reaped through its weakref callback.
+                    del self._sessions[key]
+                    continue
+
+                if now - session.started_at >= self.max_age_s:
+                    reason = "max_age_exceeded"
+                elif now - session.last_activity >= self.idle_timeout_s:
+                    reason = "idle_timeout"
+                else:
+                    continue
+
+                del self._sessions[key]
+                if conversation_id := getattr(conversation, "_conversation_id", None):
+                    session.span.set_attribute(
+                        "atla.audio.conversation_id", conversation_id
+                    )
+                reaped.append((session, reason))
+
+        for session, reason in reaped:
+            if (span := self._release(session)) is None:
+                continue
+            span.set_attribute("atla.audio.session_end_reason", reason)
+            span.set_status(
+                Status(
+                    StatusCode.ERROR,
+                    f"ElevenLabs session ended without `end_session` ({reason}).",
+                )
+            )
+            span.end()
+
 
 class AtlaElevenLabsInstrumentor(BaseInstrumentor):
     """An instrumentor for `elevenlabs`."""
 
     name = "elevenlabs"
 
-    def __init__(self, tracer: Tracer) -> None:
-        """Initialize the AtlaElevenLabsInstrumentor."""
+    def __init__(
+        self,
+        tracer: Tracer,
+        session_idle_timeout_s: float = ELEVENLABS_SESSION_IDLE_TIMEOUT_S,
+        session_max_age_s: float = ELEVENLABS_SESSION_MAX_AGE_S,
+    ) -> None:
+        """Initialize the AtlaElevenLabsInstrumentor.
+
+        :param tracer (Tracer): The tracer to use.
+        :param session_idle_timeout_s (float): The number of seconds without messages
+            after which a session's span is ended, if `end_session` was not called.
+        :param session_max_age_s (float): The number of seconds after which a session's
+            span is ended, if `end_session` was not called.
+        """
+        # Instrumentors are singletons: keep the state of an active instrumentor.
+        if self.is_instrumented_by_opentelemetry:
+            return
+
         super().__init__()
 
         self.tracer = tracer
+        self.session_idle_timeout_s = session_idle_timeout_s
+        self.session_max_age_s = session_max_age_s
 
-        self._active_span: ContextVar[Optional[Span]] = ContextVar(
-            "_active_span", default=None
-        )
+        self._sessions: Optional[_SessionRegistry] = None
 
         self._original_start_session = None
         self._original_end_session = None
@@ -53,10 +272,14 @@ class AtlaElevenLabsInstrumentor(BaseInstrumentor):
         self._original_async_start_session = None
         self._original_async_end_session = None
 
+        self._original_handle_message: Optional[Callable[..., Any]] = None
+        self._original_async_handle_message: Optional[Callable[..., Any]] = None
+
     def instrumentation_dependencies(self) -> Collection[str]:
         """Return the dependencies required by the instrumentor."""
         return ("elevenlabs",)
 
+    @passthrough_if_suppressed
     def _wrap_start_session(
         self,
         wrapped: Callable[..., Any],
@@ -64,9 +287,6 @@ class AtlaElevenLabsInstrumentor(BaseInstrumentor):
         args: tuple[Any, ...],
         kwargs: Mapping[str, Any],
     ) -> Any:
-        # TODO: Because `end_session` is not guaranteed to be called and could only get
-        # called after uninstrumentation, there is a possibility of spans remaining alive
-        # indefinitely. There should be a cleanup function to guard against this.
         span = self.tracer.start_span(
             name="ElevenLabs Conversation",
             attributes={
@@ -78,18 +298,21 @@ class AtlaElevenLabsInstrumentor(BaseInstrumentor):
             },
             record_exception=False,
         )
-        self._active_span.set(span)
+        if self._sessions is not None:
+            self._sessions.add(instance, span)
 
         try:
             return wrapped(*args, **kwargs)
         except Exception as e:
-            self._active_span.set(None)
+            if self._sessions is not None:
+                self._sessions.pop(instance)
 
             span.record_exception(e)
             span.set_status(Status(StatusCode.ERROR))
             span.end()
             raise
 
+    @passthrough_if_suppressed
     async def _async_wrap_start_session(
         self,
         wrapped: Callable[..., Any],
@@ -97,9 +320,6 @@ class AtlaElevenLabsInstrumentor(BaseInstrumentor):
         args: tuple[Any, ...],
         kwargs: Mapping[str, Any],
     ) -> Any:
-        # TODO: Because `end_session` is not guaranteed to be called and could only get
-        # called after uninstrumentation, there is a possibility of spans remaining alive
-        # indefinitely. There should be a cleanup function to guard against this.
         span = self.tracer.start_span(
             name="ElevenLabs Conversation",
             attributes={
@@ -111,12 +331,14 @@ class AtlaElevenLabsInstrumentor(BaseInstrumentor):
             },
             record_exception=False,
         )
-        self._active_span.set(span)
+        if self._sessions is not None:
+            self._sessions.add(instance, span)
 
         try:
             return await wrapped(*args, **kwargs)
         except Exception as e:
-            self._active_span.set(None)
+            if self._sessions is not None:
+                self._sessions.pop(instance)
 
             span.record_exception(e)
             span.set_status(Status(StatusCode.ERROR))
@@ -130,7 +352,7 @@ class AtlaElevenLabsInstrumentor(BaseInstrumentor):
         args: tuple[Any, ...],
         kwargs: Mapping[str, Any],
     ) -> Any:
-        if not (active_span := self._active_span.get()):
+        if self._sessions is None or not (active_span := self._sessions.pop(instance)):
             return wrapped(*args, **kwargs)
 
         try:
@@ -142,7 +364,6 @@ class AtlaElevenLabsInstrumentor(BaseInstrumentor):
             active_span.set_status(Status(StatusCode.ERROR))
             raise
         finally:
-            self._active_span.set(None)
             active_span.end()
 
     async def _async_wrap_end_session(
@@ -152,7 +373,7 @@ class AtlaElevenLabsInstrumentor(BaseInstrumentor):
         args: tuple[Any, ...],
         kwargs: Mapping[str, Any],
     ) -> Any:
-        if not (active_span := self._active_span.get()):
+        if self._sessions is None or not (active_span := self._sessions.pop(instance)):
             return await wrapped(*args, **kwargs)
 
         try:
@@ -164,10 +385,37 @@ class AtlaElevenLabsInstrumentor(BaseInstrumentor):
             active_span.set_status(Status(StatusCode.ERROR))
             raise
         finally:
-            self._active_span.set(None)
             active_span.end()
 
+    def _wrap_handle_message(
+        self,
+        wrapped: Callable[..., Any],
+        instance: Any,
+        args: tuple[Any, ...],
+        kwargs: Mapping[str, Any],
+    ) -> Any:
+        if self._sessions is not None:
+            self._sessions.touch(instance)
+        return wrapped(*args, **kwargs)
+
+    async def _async_wrap_handle_message(
+        self,
+        wrapped: Callable[..., Any],
+        instance: Any,
+        args: tuple[Any, ...],
+        kwargs: Mapping[str, Any],
+    ) -> Any:
+        if self._sessions is not None:
+            self._sessions.touch(instance)
+        return await wrapped(*args, **kwargs)
+
     def _instrument(self, **kwargs: Any) -> None:
+        self._sessions = _SessionRegistry(
+            idle_timeout_s=self.session_idle_timeout_s,
+            max_age_s=self.session_max_age_s,
+        )
+        self._sessions.start()
+
         self._original_start_session = Conversation.start_session  # type: ignore[assignment]
         wrap_function_wrapper(
             module="elevenlabs.conversational_ai.conversation",
@@ -196,16 +444,47 @@ class AtlaElevenLabsInstrumentor(BaseInstrumentor):
             wrapper=self._async_wrap_end_session,
         )
 
+        # Received messages mark sessions as active (if the SDK version exposes them).
+        if hasattr(BaseConversation, "_handle_message_core"):
+            self._original_handle_message = BaseConversation._handle_message_core
+            wrap_function_wrapper(
+                module="elevenlabs.conversational_ai.conversation",
+                name="BaseConversation._handle_message_core",
+                wrapper=self._wrap_handle_message,
+            )
+
+        if hasattr(BaseConversation, "_handle_message_core_async"):
+            self._original_async_handle_message = (
+                BaseConversation._handle_message_core_async
+            )
+            wrap_function_wrapper(
+                module="elevenlabs.conversational_ai.conversation",
+                name="BaseConversation._handle_message_core_async",
+                wrapper=self._async_wrap_handle_message,
+            )
+
     def _uninstrument(self, **kwargs: Any) -> None:
-        if active_span := self._active_span.get():
-            warnings.warn(
-                "Uninstrumenting ElevenLabs while a span is active is not recommended! "
-                "Please make sure to call `end_session` within the instrumentation "
-                "context to avoid telemetry data loss",
-                stacklevel=1,
+        if self._sessions is not None:
+            if active_spans := self._sessions.stop():
+                warnings.warn(
+                    "Uninstrumenting ElevenLabs while a span is active is not "
+                    "recommended! Please make sure to call `end_session` within the "
+                    "instrumentation context to avoid telemetry data loss",
+                    stacklevel=1,
+                )
+            for active_span in active_spans:
+                active_span.end()
+            self._sessions = None
+
+        if self._original_handle_message is not None:
+            BaseConversation._handle_message_core = self._original_handle_message  # type: ignore[method-assign]
+            self._original_handle_message = None
+
+        if self._original_async_handle_message is not None:
+            BaseConversation._handle_message_core_async = (  # type: ignore[method-assign]
+                self._original_async_handle_message
             )
-            self._active_span.set(None)
-            active_span.end()
+            self._original_async_handle_message = None
 
         if self._original_start_session is not None:
             Conversation.start_session = self._original_start_session
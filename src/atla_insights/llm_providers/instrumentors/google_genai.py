@@ -1,6 +1,5 @@
 """Google GenAI instrumentation."""
 
-import json
 from typing import Any, Iterable, Iterator, Mapping, Tuple
 
 from openai.types.chat import ChatCompletionToolParam
@@ -8,11 +7,13 @@ from openai.types.shared_params.function_definition import FunctionDefinition
 from openinference.semconv.trace import (
     MessageAttributes,
     SpanAttributes,
-    ToolAttributes,
     ToolCallAttributes,
 )
 from opentelemetry.util.types import AttributeValue
 
+from atla_insights.serialization import get_tool_attributes, json_dumps
+from atla_insights.streaming import time_stream
+
 try:
     from openinference.instrumentation.google_genai import GoogleGenAIInstrumentor
 except ImportError as e:
@@ -43,7 +44,7 @@ def _parse_function_call(
     if function_args := getattr(function_call, "args", None):
         if isinstance(function_args, Mapping):
             function_args = dict(function_args)
-        function_args_json = json.dumps(function_args)
+        function_args_json = json_dumps(function_args)
 
     yield (
         ".".join(
@@ -80,8 +81,10 @@ def _get_tool_calls_from_content_parts(
             function_call_idx += 1
 
 
-def _parse_function_declaration(function_declaration: object) -> str:
-    """Parse a function declaration and return the attribute JSON schema value."""
+def _get_function_declaration_schema(
+    function_declaration: object,
+) -> ChatCompletionToolParam:
+    """Get the (OpenAI-compatible) JSON schema of a function declaration."""
     name = getattr(function_declaration, "name", "")
     description = getattr(function_declaration, "description", "")
 
@@ -90,7 +93,7 @@ def _parse_function_declaration(function_declaration: object) -> str:
         if json_schema := getattr(function_parameters, "json_schema", None):
             parameters = json_schema.model_dump(mode="json", exclude_none=True)
 
-    tool_schema = ChatCompletionToolParam(
+    return ChatCompletionToolParam(
         type="function",
         function=FunctionDefinition(
             name=name,
@@ -99,8 +102,6 @@ def _parse_function_declaration(function_declaration: object) -> str:
             strict=None,
         ),
     )
-    tool_schema_json = json.dumps(tool_schema)
-    return tool_schema_json
 
 
 def get_tools_from_request(  # noqa: C901
@@ -193,33 +194,22 @@ def get_tools_from_request(  # noqa: C901
             if not isinstance(tools, Iterable):
                 return
 
-            tool_idx = 0
+            # Each function declaration is seen as a separate tool.
+            function_declarations: list[object] = []
             for tool in tools:
                 if not getattr(tool, "function_declarations", None):
                     continue
 
-                function_declarations = tool.function_declarations
-
-                if not isinstance(function_declarations, Iterable):
+                if not isinstance(tool.function_declarations, Iterable):
                     continue
 
-                for function_declaration in function_declarations:
-                    tool_attr_name = ".".join(
-                        [
-                            SpanAttributes.LLM_TOOLS,
-                            str(tool_idx),
-                            ToolAttributes.TOOL_JSON_SCHEMA,
-                        ]
-                    )
-                    yield (
-                        tool_attr_name,
-                        _parse_function_declaration(
-                            function_declaration=function_declaration,
-                        ),
-                    )
-
-                    # Each function declaration is seen as a separate tool.
-                    tool_idx += 1
+                function_declarations.extend(tool.function_declarations)
+
+            yield from get_tool_attributes(
+                SpanAttributes.LLM_TOOLS,
+                function_declarations,
+                _get_function_declaration_schema,
+            )
 
 
 class AtlaGoogleGenAIInstrumentor(GoogleGenAIInstrumentor):
@@ -229,10 +219,15 @@ class AtlaGoogleGenAIInstrumentor(GoogleGenAIInstrumentor):
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the AtlaGoogleGenAIInstrumentor."""
+        # Instrumentors are singletons: keep the state of an active instrumentor.
+        if self.is_instrumented_by_opentelemetry:
+            return
+
         super().__init__(*args, **kwargs)
 
         self.original_get_extra_attributes_from_request = None
         self.original_get_attributes_from_content_parts = None
+        self.original_stream_init = None
 
     def _instrument(self, **kwargs) -> None:
         from openinference.instrumentation.google_genai._request_attributes_extractor import (  # noqa: E501
@@ -241,6 +236,7 @@ class AtlaGoogleGenAIInstrumentor(GoogleGenAIInstrumentor):
         from openinference.instrumentation.google_genai._response_attributes_extractor import (  # noqa: E501
             _ResponseAttributesExtractor,
         )
+        from openinference.instrumentation.google_genai._stream import _Stream
 
         if self.original_get_extra_attributes_from_request is None:
             original_get_extra_attributes_from_request = (
@@ -281,6 +277,20 @@ class AtlaGoogleGenAIInstrumentor(GoogleGenAIInstrumentor):
                 _get_attributes_from_content_parts
             )
 
+        # Record streaming latencies (e.g. time-to-first-token) for all content streams.
+        if self.original_stream_init is None:
+            original_stream_init = _Stream.__init__
+            self.original_stream_init = original_stream_init  # type: ignore[assignment]
+
+            def _stream_init(
+                self: _Stream, stream: Any, with_span: Any, *args: Any, **kwargs: Any
+            ) -> None:
+                original_stream_init(
+                    self, time_stream(stream, with_span._span), with_span, *args, **kwargs
+                )
+
+            _Stream.__init__ = _stream_init  # type: ignore[method-assign]
+
         super()._instrument(**kwargs)
 
     def _uninstrument(self, **kwargs: Any) -> None:
@@ -290,6 +300,7 @@ class AtlaGoogleGenAIInstrumentor(GoogleGenAIInstrumentor):
         from openinference.instrumentation.google_genai._response_attributes_extractor import (  # noqa: E501
             _ResponseAttributesExtractor,
         )
+        from openinference.instrumentation.google_genai._stream import _Stream
 
         super()._uninstrument(**kwargs)
 
@@ -304,3 +315,7 @@ class AtlaGoogleGenAIInstrumentor(GoogleGenAIInstrumentor):
                 self.original_get_attributes_from_content_parts
             )
             self.original_get_attributes_from_content_parts = None
+
+        if self.original_stream_init is not None:
+            _Stream.__init__ = self.original_stream_init  # type: ignore[method-assign]
+            self.original_stream_init = None
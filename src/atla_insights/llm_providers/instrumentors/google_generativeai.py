@@ -1,6 +1,5 @@
 """Google Generative AI instrumentation."""
 
-import json
 import warnings
 from typing import (
     Any,
@@ -17,15 +16,15 @@ import opentelemetry.trace as trace_api
 from openai.types.chat import ChatCompletionToolParam
 from openai.types.shared_params.function_definition import FunctionDefinition
 from openinference.instrumentation import OITracer, TraceConfig
-from openinference.semconv.trace import (
-    SpanAttributes,
-    ToolAttributes,
-)
+from openinference.semconv.trace import SpanAttributes
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor  # type: ignore
 from opentelemetry.trace import get_tracer, get_tracer_provider
 from opentelemetry.util.types import AttributeValue
 from wrapt import wrap_function_wrapper
 
+from atla_insights.serialization import get_tool_attributes
+from atla_insights.streaming import time_stream
+
 try:
     from openinference.instrumentation.google_genai._stream import _Stream
     from openinference.instrumentation.google_genai._wrappers import (
@@ -48,7 +47,7 @@ except ImportError as e:
 def iter_stream(stream: _Stream) -> Iterator[Any]:
     """Iterate over a stream and finish the tracing."""
     try:
-        for item in stream.__wrapped__:
+        for item in time_stream(stream.__wrapped__, stream._with_span._span):
             stream._response_accumulator._is_null = False
             stream._response_accumulator._values += item.to_dict()
             yield item
@@ -70,7 +69,7 @@ def iter_stream(stream: _Stream) -> Iterator[Any]:
 async def aiter_stream(stream: _Stream) -> AsyncIterator[Any]:
     """Iterate over a stream and finish the tracing."""
     try:
-        async for item in stream.__wrapped__:
+        async for item in time_stream(stream.__wrapped__, stream._with_span._span):
             stream._response_accumulator._is_null = False
             stream._response_accumulator._values += item.to_dict()
             yield item
@@ -89,8 +88,10 @@ async def aiter_stream(stream: _Stream) -> AsyncIterator[Any]:
     stream._finish_tracing(status=status)
 
 
-def _parse_function_declaration(function_declaration: object) -> str:
-    """Parse a function declaration and return the attribute JSON schema value."""
+def _get_function_declaration_schema(
+    function_declaration: object,
+) -> ChatCompletionToolParam:
+    """Get the (OpenAI-compatible) JSON schema of a function declaration."""
     name = getattr(function_declaration, "name", "")
     description = getattr(function_declaration, "description", "")
 
@@ -99,7 +100,7 @@ def _parse_function_declaration(function_declaration: object) -> str:
         if json_schema := getattr(function_parameters, "json_schema", None):
             parameters = json_schema.model_dump(mode="json", exclude_none=True)
 
-    tool_schema = ChatCompletionToolParam(
+    return ChatCompletionToolParam(
         type="function",
         function=FunctionDefinition(
             name=name,
@@ -108,8 +109,6 @@ def _parse_function_declaration(function_declaration: object) -> str:
             strict=None,
         ),
     )
-    tool_schema_json = json.dumps(tool_schema)
-    return tool_schema_json
 
 
 def _get_tools_from_request(
@@ -120,33 +119,22 @@ def _get_tools_from_request(
     if not tools:
         return
 
-    tool_idx = 0
+    # Each function declaration is seen as a separate tool.
+    function_declarations: list[object] = []
     for tool in tools:
         if not getattr(tool, "function_declarations", None):
             continue
 
-        function_declarations = tool.function_declarations
-
-        if not isinstance(function_declarations, Iterable):
+        if not isinstance(tool.function_declarations, Iterable):
             continue
 
-        for function_declaration in function_declarations:
-            tool_attr_name = ".".join(
-                [
-                    SpanAttributes.LLM_TOOLS,
-                    str(tool_idx),
-                    ToolAttributes.TOOL_JSON_SCHEMA,
-                ]
-            )
-            yield (
-                tool_attr_name,
-                _parse_function_declaration(
-                    function_declaration=function_declaration,
-                ),
-            )
+        function_declarations.extend(tool.function_declarations)
 
-            # Each function declaration is seen as a separate tool.
-            tool_idx += 1
+    yield from get_tool_attributes(
+        SpanAttributes.LLM_TOOLS,
+        function_declarations,
+        _get_function_declaration_schema,
+    )
 
 
 def _get_extra_attributes_from_request(
@@ -231,6 +219,10 @@ class GoogleGenerativeAIInstrumentor(BaseInstrumentor):
 
     def __init__(self) -> None:
         """Initialize the GoogleGenerativeAIInstrumentor."""
+        # Instrumentors are singletons: keep the state of an active instrumentor.
+        if self.is_instrumented_by_opentelemetry:
+            return
+
         super().__init__()
 
         self._original_generate_content = None
@@ -1,17 +1,23 @@
 """LiteLLM integration."""
 
-import json
+import contextvars
 import logging
-import time
-from typing import Collection, Optional
+import threading
+from concurrent.futures import Future, wait
+from typing import Any, Callable, Collection, Optional
 
 from opentelemetry import context
 
 from atla_insights.constants import OTEL_MODULE_NAME
+from atla_insights.serialization import json_dumps
+from atla_insights.streaming import StreamingLatencyRecorder
+from atla_insights.suppression import is_instrumentation_suppressed
 
 try:
     import litellm
     from litellm.integrations.opentelemetry import OpenTelemetry
+    from litellm.litellm_core_utils.streaming_handler import CustomStreamWrapper
+    from litellm.litellm_core_utils.thread_pool_executor import executor
     from litellm.proxy._types import SpanAttributes
 except ImportError as e:
     raise ImportError(
@@ -26,6 +32,78 @@ from opentelemetry.trace import SpanKind, Status, StatusCode, Tracer
 
 logger = logging.getLogger(__name__)
 
+_PENDING_CALLBACKS_TIMEOUT_S = 5.0
+
+# Key under which a stream's latency recorder is passed to the (logging) callbacks.
+_STREAMING_RECORDER_KEY = "atla_streaming_recorder"
+
+_executor_lock = threading.Lock()
+_pending_callbacks: set[Future] = set()
+_pending_callbacks_lock = threading.Lock()
+
+
+def _discard_pending_callback(future: Future) -> None:
+    """Stop tracking a finished callback."""
+    with _pending_callbacks_lock:
+        _pending_callbacks.discard(future)
+
+
+def _install_context_propagating_executor() -> None:
+    """Make litellm's callback thread pool propagate the caller's context.
+
+    Litellm schedules (logging) callbacks on a shared `ThreadPoolExecutor`, in whose
+    worker threads the OTEL context of the caller would be lost. Each submitted function
+    is instead run within a copy of the context it was submitted from, so callbacks still
+    run in parallel while their spans attach to the right parent span.
+
+    The wrapper is installed once per process, and is a no-op on subsequent calls.
+    """
+    with _executor_lock:
+        if getattr(executor.submit, "_atla_propagates_context", False):
+            return
+
+        original_submit = executor.submit
+
+        def submit(fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+            future = original_submit(contextvars.copy_context().run, fn, *args, **kwargs)
+            with _pending_callbacks_lock:
+                _pending_callbacks.add(future)
+            future.add_done_callback(_discard_pending_callback)
+            return future
+
+        submit._atla_propagates_context = True  # type: ignore[attr-defined]
+        executor.submit = submit  # type: ignore[method-assign]
+
+
+def _wait_for_pending_callbacks(timeout: float) -> None:
+    """Wait for all callbacks currently scheduled on litellm's thread pool to finish.
+
+    :param timeout (float): The maximum number of seconds to wait.
+    """
+    with _pending_callbacks_lock:
+        pending_callbacks = list(_pending_callbacks)
+
+    if pending_callbacks:
+        wait(pending_callbacks, timeout=timeout)
+
+
+def _record_stream_chunk(stream: CustomStreamWrapper) -> None:
+    """Record the arrival of a chunk of a litellm stream.
+
+    The recorder is stored alongside the call details of the stream's logging object,
+    which litellm passes to the (logging) callbacks once the stream is complete.
+    """
+    if is_instrumentation_suppressed():
+        return
+
+    call_details = stream.logging_obj.model_call_details
+    if (recorder := call_details.get(_STREAMING_RECORDER_KEY)) is None:
+        start_time = getattr(stream.logging_obj, "start_time", None)
+        recorder = call_details[_STREAMING_RECORDER_KEY] = StreamingLatencyRecorder(
+            start_time_ns=int(start_time.timestamp() * 1e9) if start_time else None
+        )
+    recorder.record_chunk()
+
 
 # TODO(mathias): This can be re-worked to be based off OpenInference instrumentation.
 class AtlaLiteLLMOpenTelemetry(OpenTelemetry):
@@ -50,6 +128,11 @@ class AtlaLiteLLMOpenTelemetry(OpenTelemetry):
             value="litellm",
         )
 
+        # Set streaming latencies (e.g. time-to-first-token) of streamed responses
+        recorder = kwargs.get(_STREAMING_RECORDER_KEY)
+        if isinstance(recorder, StreamingLatencyRecorder):
+            span.set_attributes(recorder.get_attributes())
+
         # Set tool calls for assistant messages in the request
         if messages := kwargs.get("messages"):
             for idx, prompt in enumerate(messages):
@@ -57,7 +140,7 @@ class AtlaLiteLLMOpenTelemetry(OpenTelemetry):
                     self.safe_set_attribute(
                         span=span,
                         key=f"{SpanAttributes.LLM_PROMPTS.value}.{idx}.tool_calls",
-                        value=json.dumps(tool_calls),
+                        value=json_dumps(tool_calls),
                     )
 
         # Set tool call IDs (if present) in a tool call response
@@ -75,6 +158,9 @@ class AtlaLiteLLMOpenTelemetry(OpenTelemetry):
                                     )
 
     def _handle_sucess(self, kwargs, response_obj, start_time, end_time) -> None:
+        if is_instrumentation_suppressed():
+            return
+
         self._add_dynamic_span_processor_if_needed(kwargs)
 
         span = self.tracer.start_span(
@@ -89,6 +175,9 @@ class AtlaLiteLLMOpenTelemetry(OpenTelemetry):
         span.end(end_time=self._to_ns(end_time))
 
     def _handle_failure(self, kwargs, response_obj, start_time, end_time) -> None:
+        if is_instrumentation_suppressed():
+            return
+
         span = self.tracer.start_span(
             name="litellm_request",
             start_time=self._to_ns(start_time),
@@ -103,6 +192,8 @@ class AtlaLiteLLMIntrumentor(BaseInstrumentor):
     """Atla instrumentor for LitelLLM."""
 
     atla_otel_logger: Optional[AtlaLiteLLMOpenTelemetry] = None
+    original_stream_next: Optional[Callable[..., Any]] = None
+    original_stream_anext: Optional[Callable[..., Any]] = None
     name = "litellm"
 
     def __init__(self, tracer: Tracer) -> None:
@@ -114,6 +205,8 @@ class AtlaLiteLLMIntrumentor(BaseInstrumentor):
         return ("litellm >= 1.72.0",)
 
     def _instrument(self) -> None:
+        _install_context_propagating_executor()
+
         if any(
             isinstance(callback, AtlaLiteLLMOpenTelemetry)
             for callback in litellm.callbacks
@@ -124,13 +217,36 @@ class AtlaLiteLLMIntrumentor(BaseInstrumentor):
         self.atla_otel_logger = AtlaLiteLLMOpenTelemetry(tracer=self.tracer)
         litellm.callbacks.append(self.atla_otel_logger)
 
+        # Record streaming latencies (e.g. time-to-first-token) for all streams.
+        if self.original_stream_next is None:
+            original_stream_next = CustomStreamWrapper.__next__
+            self.original_stream_next = original_stream_next
+
+            def _stream_next(stream: CustomStreamWrapper) -> Any:
+                chunk = original_stream_next(stream)
+                _record_stream_chunk(stream)
+                return chunk
+
+            CustomStreamWrapper.__next__ = _stream_next  # type: ignore[method-assign]
+
+        if self.original_stream_anext is None:
+            original_stream_anext = CustomStreamWrapper.__anext__
+            self.original_stream_anext = original_stream_anext
+
+            async def _stream_anext(stream: CustomStreamWrapper) -> Any:
+                chunk = await original_stream_anext(stream)
+                _record_stream_chunk(stream)
+                return chunk
+
+            CustomStreamWrapper.__anext__ = _stream_anext  # type: ignore[method-assign]
+
     def _uninstrument(self) -> None:
         if self.atla_otel_logger is None:
             logger.warning("Attempting to uninstrument not instrumented litellm")
             return
 
         # Wait for existing Atla callbacks to trigger before removing them.
-        time.sleep(0.001)
+        _wait_for_pending_callbacks(timeout=_PENDING_CALLBACKS_TIMEOUT_S)
 
         if self.atla_otel_logger in litellm.callbacks:
             litellm.callbacks.remove(self.atla_otel_logger)
@@ -143,3 +259,11 @@ class AtlaLiteLLMIntrumentor(BaseInstrumentor):
 
         if self.atla_otel_logger in litellm.service_callback:
             litellm.service_callback.remove(self.atla_otel_logger)
+
+        if self.original_stream_next is not None:
+            CustomStreamWrapper.__next__ = self.original_stream_next  # type: ignore[method-assign]
+            self.original_stream_next = None
+
+        if self.original_stream_anext is not None:
+            CustomStreamWrapper.__anext__ = self.original_stream_anext  # type: ignore[method-assign]
+            self.original_stream_anext = None
@@ -0,0 +1,62 @@
+"""OpenAI instrumentation."""
+
+from typing import Any, Optional
+
+from atla_insights.streaming import time_stream
+
+try:
+    from openinference.instrumentation.openai import OpenAIInstrumentor
+    from openinference.instrumentation.openai._stream import _Stream
+    from openinference.instrumentation.openai._with_span import _WithSpan
+except ImportError as e:
+    raise ImportError(
+        "OpenAI instrumentation needs to be installed. "
+        'Please install it via `pip install "atla-insights[openai]"`.'
+    ) from e
+
+
+class AtlaOpenAIInstrumentor(OpenAIInstrumentor):
+    """Atla OpenAI instrumentor class."""
+
+    name = "openai"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the AtlaOpenAIInstrumentor."""
+        # Instrumentors are singletons: keep the state of an active instrumentor.
+        if self.is_instrumented_by_opentelemetry:
+            return
+
+        super().__init__(*args, **kwargs)
+
+        self.original_stream_init = None
+
+    def _instrument(self, **kwargs) -> None:
+        super()._instrument(**kwargs)
+
+        # Record streaming latencies (e.g. time-to-first-token) for all streams.
+        if self.original_stream_init is None:
+            original_stream_init = _Stream.__init__
+            self.original_stream_init = original_stream_init  # type: ignore[assignment]
+
+            def _stream_init(
+                self: _Stream,
+                stream: Any,
+                with_span: _WithSpan,
+                response_accumulator: Optional[Any] = None,
+            ) -> None:
+                original_stream_init(
+                    self,
+                    time_stream(stream, with_span._span),
+                    with_span,
+                    response_accumulator,
+                )
+
+            _Stream.__init__ = _stream_init  # type: ignore[method-assign]
+
+    def _uninstrument(self, **kwargs) -> None:
+        super()._uninstrument(**kwargs)
+
+        if self.original_stream_init is not None:
+            _Stream.__init__ = self.original_stream_init  # type: ignore[method-assign]
+
+        self.original_stream_init = None
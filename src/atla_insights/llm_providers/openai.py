@@ -27,19 +27,11 @@ def instrument_openai() -> ContextManager[None]:
     if is_instrumentation_suppressed():
         return NoOpContextManager()
 
-    try:
-        from openinference.instrumentation.openai import OpenAIInstrumentor
-    except ImportError as e:
-        raise ImportError(
-            "OpenAI instrumentation needs to be installed. "
-            'Please install it via `pip install "atla-insights[openai]"`.'
-        ) from e
-
-    openai_instrumentor = OpenAIInstrumentor()
+    from atla_insights.llm_providers.instrumentors.openai import AtlaOpenAIInstrumentor
 
     return ATLA_INSTANCE.instrument_service(
-        service="openai",
-        instrumentors=[openai_instrumentor],
+        service=AtlaOpenAIInstrumentor.name,
+        instrumentors=lambda: [AtlaOpenAIInstrumentor()],
     )
 
 
@@ -48,4 +40,6 @@ def uninstrument_openai() -> None:
     if is_instrumentation_suppressed():
         return
 
-    return ATLA_INSTANCE.uninstrument_service("openai")
+    from atla_insights.llm_providers.instrumentors.openai import AtlaOpenAIInstrumentor
+
+    return ATLA_INSTANCE.uninstrument_service(AtlaOpenAIInstrumentor.name)
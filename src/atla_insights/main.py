@@ -2,17 +2,21 @@
 
 import logging
 import os
+import threading
 from contextlib import contextmanager
-from typing import ContextManager, Optional, Sequence
+from typing import Any, Callable, ContextManager, Mapping, Optional, Sequence
 
 from opentelemetry.instrumentation.instrumentor import (  # type: ignore[attr-defined]
     BaseInstrumentor,
 )
 from opentelemetry.sdk.environment_variables import OTEL_ATTRIBUTE_COUNT_LIMIT
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 from opentelemetry.sdk.trace import SpanProcessor, TracerProvider
 from opentelemetry.sdk.trace.export import (
     BatchSpanProcessor,
     SimpleSpanProcessor,
+    SpanExporter,
 )
 from opentelemetry.sdk.trace.sampling import ALWAYS_ON
 from opentelemetry.trace import Tracer, set_tracer_provider
@@ -20,14 +24,25 @@ from opentelemetry.trace import Tracer, set_tracer_provider
 from atla_insights.console_span_exporter import ConsoleSpanExporter
 from atla_insights.constants import (
     DEFAULT_OTEL_ATTRIBUTE_COUNT_LIMIT,
+    LLM_METRICS_EXPORT_INTERVAL_MS,
+    OTEL_INSTRUMENTATION_SCOPES,
     OTEL_MODULE_NAME,
 )
 from atla_insights.environment import resolve_environment
 from atla_insights.id_generator import NoSeedIdGenerator
+from atla_insights.llm_metrics import LLMMetricsSpanProcessor, get_atla_metric_exporter
+from atla_insights.message_deltas import MessageDeltaSpanExporter
 from atla_insights.metadata import set_global_metadata
-from atla_insights.sampling import SamplerType, _TailSampler
-from atla_insights.span_processors import AtlaRootSpanProcessor, get_atla_span_exporter
-from atla_insights.utils import maybe_get_existing_tracer_provider
+from atla_insights.sampling import SamplerType, _RecordUnsampledSampler, _TailSampler
+from atla_insights.span_processors import (
+    AtlaRootSpanProcessor,
+    ScopeRoutingSpanProcessor,
+    get_atla_span_exporter,
+)
+from atla_insights.utils import (
+    maybe_get_existing_tracer_provider,
+    register_at_fork_reinit,
+)
 
 logger = logging.getLogger(OTEL_MODULE_NAME)
 
@@ -44,12 +59,25 @@ class AtlaInsights:
 
     def __init__(self) -> None:
         """Initialize Atla insights."""
+        # Registry of instrumented services, with the number of active instrumentation
+        # requests (e.g. nested or concurrent instrumentation contexts) for each service.
         self._active_instrumentors: dict[str, Sequence[BaseInstrumentor]] = {}
+        self._instrumentation_ref_counts: dict[str, int] = {}
+        self._instrumentation_configs: dict[str, Optional[Mapping[str, Any]]] = {}
+        self._instrumentation_lock = threading.RLock()
+        register_at_fork_reinit(self, AtlaInsights._at_fork_reinit)
 
         self.configured = False
 
         self.tracer_provider: Optional[TracerProvider] = None
+        self.span_processor: Optional[ScopeRoutingSpanProcessor] = None
         self.tracer: Optional[Tracer] = None
+        self.meter_provider: Optional[MeterProvider] = None
+
+    def _at_fork_reinit(self) -> None:
+        """Reinitialize Atla insights in a forked child process."""
+        # The lock may have been held by another thread of the parent process.
+        self._instrumentation_lock = threading.RLock()
 
     def configure(
         self,
@@ -60,6 +88,8 @@ class AtlaInsights:
         verbose: bool = True,
         debug: bool = False,
         environment: Optional[str] = None,
+        enable_llm_metrics: bool = False,
+        enable_message_deltas: bool = False,
     ) -> None:
         """Configure Atla insights.
 
@@ -97,6 +127,12 @@ class AtlaInsights:
         :param environment (Optional[str]): The environment to use ("dev" or "prod").
             If not provided, will use ATLA_INSIGHTS_ENVIRONMENT environment variable,
             or default to "prod".
+        :param enable_llm_metrics (bool): Whether to export pre-aggregated metrics of
+            LLM calls (latency, token usage, errors and in-flight calls), regardless of
+            trace sampling. Defaults to `False`.
+        :param enable_message_deltas (bool): Whether LLM spans should only record the
+            input messages that are new since the previous LLM span in the same trace,
+            rather than the full message history. Defaults to `False`.
         """
         if self.configured:
             logger.warning("Atla insights already configured, skipping configuration.")
@@ -115,6 +151,8 @@ class AtlaInsights:
             verbose=verbose,
             debug=debug,
             environment=resolve_environment(environment),
+            enable_llm_metrics=enable_llm_metrics,
+            enable_message_deltas=enable_message_deltas,
         )
         self.tracer = self.get_tracer()
 
@@ -129,6 +167,8 @@ class AtlaInsights:
         verbose: bool,
         debug: bool,
         environment: str,
+        enable_llm_metrics: bool = False,
+        enable_message_deltas: bool = False,
     ) -> TracerProvider:
         """Setup the tracer provider.
 
@@ -151,6 +191,10 @@ class AtlaInsights:
             Defaults to `True`.
         :param debug (bool): Whether to log debug outputs. Defaults to `False`.
         :param environment (str): The environment to use ("dev" or "prod").
+        :param enable_llm_metrics (bool): Whether to export pre-aggregated metrics of
+            LLM calls. Defaults to `False`.
+        :param enable_message_deltas (bool): Whether LLM spans should only record new
+            input messages. Defaults to `False`.
 
         :return (TracerProvider): The tracer provider.
         """
@@ -162,7 +206,11 @@ class AtlaInsights:
             tracer_provider = TracerProvider()
             set_tracer_provider(tracer_provider)
 
-        atla_exporter = get_atla_span_exporter(token)
+        span_processor = ScopeRoutingSpanProcessor()
+
+        atla_exporter: SpanExporter = get_atla_span_exporter(token)
+        if enable_message_deltas:
+            atla_exporter = MessageDeltaSpanExporter(atla_exporter)
 
         if isinstance(sampler, _TailSampler):
             # If the sampler is a tail sampler, we add it as a span processor and have the
@@ -171,22 +219,46 @@ class AtlaInsights:
             if verbose:
                 sampler.add_exporter(ConsoleSpanExporter())
 
-            tracer_provider.add_span_processor(sampler)
+            span_processor.add_span_processor(sampler)
         else:
-            tracer_provider.sampler = sampler
+            # With metrics enabled, traces that are not sampled still get recorded (but
+            # not exported) so that the metrics cover all LLM calls.
+            tracer_provider.sampler = (
+                _RecordUnsampledSampler(sampler) if enable_llm_metrics else sampler
+            )
 
-            tracer_provider.add_span_processor(SimpleSpanProcessor(atla_exporter))
+            span_processor.add_span_processor(SimpleSpanProcessor(atla_exporter))
             if verbose:
                 console_span_exporter = ConsoleSpanExporter()
-                tracer_provider.add_span_processor(
+                span_processor.add_span_processor(
                     BatchSpanProcessor(console_span_exporter)
                 )
 
-        tracer_provider.add_span_processor(AtlaRootSpanProcessor(debug, environment))
+        span_processor.add_span_processor(AtlaRootSpanProcessor(debug, environment))
+
+        if enable_llm_metrics:
+            self.meter_provider = MeterProvider(
+                metric_readers=[
+                    PeriodicExportingMetricReader(
+                        get_atla_metric_exporter(token),
+                        export_interval_millis=LLM_METRICS_EXPORT_INTERVAL_MS,
+                    )
+                ]
+            )
+            # Only the spans of Atla's instrumentation can be LLM calls.
+            span_processor.add_span_processor(
+                LLMMetricsSpanProcessor(self.meter_provider, environment),
+                scopes=OTEL_INSTRUMENTATION_SCOPES,
+            )
 
         if additional_span_processors:
-            for span_processor in additional_span_processors:
-                tracer_provider.add_span_processor(span_processor)
+            for additional_span_processor in additional_span_processors:
+                span_processor.add_span_processor(additional_span_processor)
+
+        # Atla's span processors are chained behind a single processor, which only
+        # dispatches spans to the processors handling their instrumentation scope.
+        tracer_provider.add_span_processor(span_processor)
+        self.span_processor = span_processor
 
         tracer_provider.id_generator = NoSeedIdGenerator()
         return tracer_provider
@@ -201,7 +273,10 @@ class AtlaInsights:
         return self.tracer_provider.get_tracer(OTEL_MODULE_NAME)
 
     def instrument_service(
-        self, service: str, instrumentors: Sequence[BaseInstrumentor]
+        self,
+        service: str,
+        instrumentors: Callable[[], Sequence[BaseInstrumentor]],
+        config: Optional[Mapping[str, Any]] = None,
     ) -> ContextManager[None]:
         """Instrument a service (i.e. framework or LLM provider).
 
@@ -209,21 +284,42 @@ class AtlaInsights:
         context. It also registers the relevant instrumentors for the service, so that
         they can be uninstrumented later.
 
+        Instrumentation is reference-counted: only the first request instruments the
+        service, while nested or concurrent requests reuse the active instrumentation.
+        The service is only uninstrumented once every request has been released.
+
+        The instrumentors are only created for the first request, under the
+        instrumentation lock. Instrumentors are singletons, so creating them while the
+        service is being instrumented could otherwise reset their state.
+
         :param service (str): The service to instrument.
-        :param instrumentors (Sequence[BaseInstrumentor]): The instrumentors to use.
+        :param instrumentors (Callable[[], Sequence[BaseInstrumentor]]): Create the
+            instrumentors to use.
+        :param config (Optional[Mapping[str, Any]]): The configuration of the
+            instrumentors. Requests with a different configuration than the active
+            instrumentation keep the active configuration. Defaults to `None`.
         :return (ContextManager[None]): A context manager that instruments the provider.
         """
-        # If the service is already registered as instrumented, first uninstrument it.
-        if service in self._active_instrumentors:
-            logger.warning(f"Attempting to instrument already instrumented {service}")
-            self.uninstrument_service(service)
-
-        # Call each instrumentor for the service.
-        for instrumentor in instrumentors:
-            instrumentor.instrument()
+        with self._instrumentation_lock:
+            ref_count = self._instrumentation_ref_counts.get(service, 0)
+
+            # Only create & call the instrumentors for the first instrumentation request.
+            if ref_count == 0:
+                active_instrumentors = instrumentors()
+                for instrumentor in active_instrumentors:
+                    instrumentor.instrument()
+
+                # Register the instrumentors for the service.
+                self._active_instrumentors[service] = active_instrumentors
+                self._instrumentation_configs[service] = config
+            elif config != self._instrumentation_configs[service]:
+                logger.warning(
+                    f"{service} is already instrumented with a different configuration "
+                    f"({self._instrumentation_configs[service]}), which is kept. "
+                    "Uninstrument it first to use a different configuration."
+                )
 
-        # Register the instrumentors for the service.
-        self._active_instrumentors[service] = instrumentors
+            self._instrumentation_ref_counts[service] = ref_count + 1
 
         # Create a instrumentation context manager that uninstruments on context end.
         @contextmanager
@@ -239,22 +335,31 @@ class AtlaInsights:
         """Uninstrument a service (i.e. framework or LLM provider).
 
         This function will look up a given service in its internal registry of
-        instrumented services, and (if found) uninstrument it & remove it from the
-        registry.
+        instrumented services, and (if found) release one instrumentation request for
+        it. Once all requests are released, the service gets uninstrumented & removed
+        from the registry.
 
         :param service (str): The service to uninstrument.
         """
-        # If service is unregistered, we can't uninstrument it.
-        if service not in self._active_instrumentors.keys():
-            logger.warning(
-                f"Attempting to uninstrument {service} which was not instrumented."
-            )
-            return
-
-        # Uninstrument the service's instrumentors & remove its mention from the registry.
-        instrumentors = self._active_instrumentors.pop(service)
-        for instrumentor in instrumentors:
-            instrumentor.uninstrument()
+        with self._instrumentation_lock:
+            # If service is unregistered, we can't uninstrument it.
+            ref_count = self._instrumentation_ref_counts.get(service, 0)
+            if ref_count == 0:
+                logger.warning(
+                    f"Attempting to uninstrument {service} which was not instrumented."
+                )
+                return
+
+            if ref_count > 1:
+                self._instrumentation_ref_counts[service] = ref_count - 1
+                return
+
+            # Uninstrument the service's instrumentors & remove it from the registry.
+            del self._instrumentation_ref_counts[service]
+            del self._instrumentation_configs[service]
+            instrumentors = self._active_instrumentors.pop(service)
+            for instrumentor in instrumentors:
+                instrumentor.uninstrument()
 
 
 ATLA_INSTANCE = AtlaInsights()
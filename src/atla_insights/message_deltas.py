@@ -0,0 +1,297 @@
+"""Delta encoding of LLM input messages across the spans of a trace."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable, Optional, Sequence
+
+from openinference.semconv.trace import SpanAttributes
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+from atla_insights.constants import (
+    MESSAGE_DELTA_INPUT_VALUE_PREFIX_LENGTH_MARK,
+    MESSAGE_DELTA_PARENT_SPAN_MARK,
+    MESSAGE_DELTA_PREFIX_LENGTH_MARK,
+)
+from atla_insights.utils import register_at_fork_reinit
+
+Message = dict[str, Any]
+
+# The attribute prefixes of the input and output messages, by semantic convention:
+# OpenInference, and the GenAI conventions of LiteLLM spans.
+_MESSAGES_PREFIXES = (
+    (f"{SpanAttributes.LLM_INPUT_MESSAGES}.", f"{SpanAttributes.LLM_OUTPUT_MESSAGES}."),
+    ("gen_ai.prompt.", "gen_ai.completion."),
+)
+
+
+def _get_messages(attributes: Any, prefix: str) -> Optional[list[Message]]:
+    """Get the messages recorded in span attributes.
+
+    :param attributes (Any): The span attributes.
+    :param prefix (str): The attribute prefix of the messages.
+    :return (Optional[list[Message]]): The messages (as attribute suffix-value pairs),
+        or `None` if the attributes under the prefix are not contiguous messages.
+    """
+    messages: dict[int, Message] = {}
+    for key, value in attributes.items():
+        if not key.startswith(prefix):
+            continue
+        idx, _, suffix = key[len(prefix) :].partition(".")
+        if not idx.isdigit() or not suffix:
+            return None
+        messages.setdefault(int(idx), {})[suffix] = value
+
+    if set(messages) != set(range(len(messages))):
+        return None
+    return [messages[idx] for idx in range(len(messages))]
+
+
+def _get_input_messages(attributes: Any) -> tuple[str, Optional[list[Message]]]:
+    """Get the input messages of an LLM span, in whichever convention they are recorded.
+
+    :param attributes (Any): The span attributes.
+    :return (tuple[str, Optional[list[Message]]]): The attribute prefix of the input
+        messages, and the input messages (or `None` if there are none).
+    """
+    for input_prefix, _ in _MESSAGES_PREFIXES:
+        if messages := _get_messages(attributes, input_prefix):
+            return input_prefix, messages
+    return _MESSAGES_PREFIXES[0][0], None
+
+
+def _get_history(attributes: Any) -> tuple[str, list[Message]]:
+    """Get the full message history of an LLM span, i.e. its input and output messages.
+
+    :param attributes (Any): The span attributes.
+    :return (tuple[str, list[Message]]): The attribute prefix of the input messages, and
+        the message history.
+    """
+    for input_prefix, output_prefix in _MESSAGES_PREFIXES:
+        if history := [
+            *(_get_messages(attributes, input_prefix) or []),
+            *(_get_messages(attributes, output_prefix) or []),
+        ]:
+            return input_prefix, history
+    return _MESSAGES_PREFIXES[0][0], []
+
+
+def _common_prefix_length(messages: list[Message], history: list[Message]) -> int:
+    """Get the number of leading messages that are identical to a message history.
+
+    :param messages (list[Message]): The messages.
+    :param history (list[Message]): The message history.
+    :return (int): The length of the common prefix.
+    """
+    length = 0
+    for message, history_message in zip(messages, history, strict=False):
+        if message != history_message:
+            break
+        length += 1
+    return length
+
+
+def _common_string_prefix_length(value: str, previous_value: str) -> int:
+    """Get the length of the common prefix of two strings.
+
+    The prefix is found by bisection, so that characters are only compared in bulk.
+
+    :param value (str): The string.
+    :param previous_value (str): The string to compare it with.
+    :return (int): The length of the common prefix.
+    """
+    low, high = 0, min(len(value), len(previous_value))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if value[low:mid] == previous_value[low:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _with_attributes(span: ReadableSpan, attributes: dict[str, Any]) -> ReadableSpan:
+    """Copy a span, with different attributes.
+
+    :param span (ReadableSpan): The span to copy.
+    :param attributes (dict[str, Any]): The attributes of the copy.
+    :return (ReadableSpan): The copied span.
+    """
+    return ReadableSpan(
+        name=span.name,
+        context=span.context,
+        parent=span.parent,
+        resource=span.resource,
+        attributes=attributes,
+        events=span.events,
+        links=span.links,
+        kind=span.kind,
+        status=span.status,
+        start_time=span.start_time,
+        end_time=span.end_time,
+        instrumentation_scope=span.instrumentation_scope,
+    )
+
+
+class MessageDeltaSpanExporter(SpanExporter):
+    """Span exporter recording only new LLM input messages on each span.
+
+    In multi-turn conversations, each LLM call re-sends the (growing) message history.
+    This exporter drops the input messages that an LLM span shares with the previous
+    LLM span in the same trace (i.e. its input and output messages). Instead, it
+    references that span and the number of shared messages. As the (serialized) input
+    value of such a span typically starts with that of the previous span, only the part
+    of it after their common prefix is kept as well. The full message history and input
+    value can be rebuilt with `expand_message_deltas`.
+
+    Spans must be exported in the order they ended, e.g. by a `SimpleSpanProcessor`.
+    """
+
+    def __init__(self, exporter: SpanExporter, max_traces: int = 10_000) -> None:
+        """Initialize the message delta span exporter.
+
+        :param exporter (SpanExporter): The exporter to export the encoded spans with.
+        :param max_traces (int): The maximum number of traces to keep the last message
+            history of. Defaults to 10,000.
+        """
+        self._exporter = exporter
+        self._max_traces = max_traces
+
+        # The span ID, full message history and input value of the last LLM span, by
+        # trace ID.
+        self._histories: OrderedDict[int, tuple[int, list[Message], Optional[str]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        register_at_fork_reinit(self, MessageDeltaSpanExporter._at_fork_reinit)
+
+    def _at_fork_reinit(self) -> None:
+        """Reinitialize the exporter in a forked child process."""
+        self._lock = threading.Lock()
+        self._histories = OrderedDict()
+
+    def _encode(self, span: ReadableSpan) -> ReadableSpan:
+        """Encode the input messages of a span as a delta on the previous LLM span."""
+        if span.context is None or not span.attributes:
+            return span
+        trace_id = span.context.trace_id
+        # The root span ends last, so no more LLM spans are expected in its trace.
+        is_root = span.parent is None
+
+        input_prefix, messages = _get_input_messages(span.attributes)
+        input_value = span.attributes.get(SpanAttributes.INPUT_VALUE)
+        if not isinstance(input_value, str):
+            input_value = None
+        if not messages:
+            if is_root:
+                with self._lock:
+                    self._histories.pop(trace_id, None)
+            return span
+
+        with self._lock:
+            previous = self._histories.pop(trace_id, None)
+            if not is_root:
+                _, history = _get_history(span.attributes)
+                self._histories[trace_id] = (span.context.span_id, history, input_value)
+                while len(self._histories) > self._max_traces:
+                    self._histories.popitem(last=False)
+
+        if previous is None:
+            return span
+
+        previous_span_id, previous_history, previous_input_value = previous
+        if not (prefix_length := _common_prefix_length(messages, previous_history)):
+            return span
+
+        attributes = {
+            key: value
+            for key, value in span.attributes.items()
+            if not key.startswith(input_prefix)
+            or int(key[len(input_prefix) :].partition(".")[0]) >= prefix_length
+        }
+        attributes[MESSAGE_DELTA_PARENT_SPAN_MARK] = format(previous_span_id, "016x")
+        attributes[MESSAGE_DELTA_PREFIX_LENGTH_MARK] = prefix_length
+
+        if input_value is not None and previous_input_value is not None:
+            if input_value_prefix_length := _common_string_prefix_length(
+                input_value, previous_input_value
+            ):
+                attributes[SpanAttributes.INPUT_VALUE] = input_value[
+                    input_value_prefix_length:
+                ]
+                attributes[MESSAGE_DELTA_INPUT_VALUE_PREFIX_LENGTH_MARK] = (
+                    input_value_prefix_length
+                )
+
+        return _with_attributes(span, attributes)
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        """Export the spans, with delta encoded input messages."""
+        return self._exporter.export([self._encode(span) for span in spans])
+
+    def shutdown(self) -> None:
+        """Shut down the exporter."""
+        self._exporter.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Force flush the exporter."""
+        return self._exporter.force_flush(timeout_millis)
+
+
+def expand_message_deltas(spans: Iterable[ReadableSpan]) -> list[ReadableSpan]:
+    """Rebuild the full input messages (and input value) of delta encoded LLM spans.
+
+    ```py
+    from atla_insights.message_deltas import expand_message_deltas
+
+    spans = expand_message_deltas(exported_spans)
+    ```
+
+    :param spans (Iterable[ReadableSpan]): The spans of one or more traces, including
+        the spans referenced by delta encoded spans.
+    :return (list[ReadableSpan]): The spans (in the same order), with their full input
+        messages and input value.
+    """
+    spans = list(spans)
+    expanded: dict[tuple[int, str], ReadableSpan] = {}
+
+    # Referenced spans ended before the spans referencing them.
+    for span in sorted(spans, key=lambda span: span.end_time or 0):
+        if span.context is None:
+            continue
+        span_key = (span.context.trace_id, format(span.context.span_id, "016x"))
+
+        attributes = dict(span.attributes or {})
+        parent_span_id = attributes.pop(MESSAGE_DELTA_PARENT_SPAN_MARK, None)
+        prefix_length = attributes.pop(MESSAGE_DELTA_PREFIX_LENGTH_MARK, None)
+        input_value_prefix_length = attributes.pop(
+            MESSAGE_DELTA_INPUT_VALUE_PREFIX_LENGTH_MARK, None
+        )
+        if parent_span_id is None or not isinstance(prefix_length, int):
+            expanded[span_key] = span
+            continue
+
+        parent = expanded.get((span.context.trace_id, str(parent_span_id)))
+        if parent is None:
+            raise ValueError(f"Span {parent_span_id} referenced by a delta is missing.")
+
+        # Messages are only shared between spans of the same convention.
+        input_prefix, history = _get_history(parent.attributes)
+        for idx, message in enumerate(history[:prefix_length]):
+            for suffix, value in message.items():
+                attributes[f"{input_prefix}{idx}.{suffix}"] = value
+
+        if isinstance(input_value_prefix_length, int):
+            parent_input_value = (parent.attributes or {}).get(SpanAttributes.INPUT_VALUE)
+            attributes[SpanAttributes.INPUT_VALUE] = str(parent_input_value)[
+                :input_value_prefix_length
+            ] + str(attributes.get(SpanAttributes.INPUT_VALUE, ""))
+
+        expanded[span_key] = _with_attributes(span, attributes)
+
+    return [
+        expanded[(span.context.trace_id, format(span.context.span_id, "016x"))]
+        if span.context is not None
+        else span
+        for span in spans
+    ]
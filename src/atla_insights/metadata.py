@@ -2,8 +2,8 @@
 
 import json
 import logging
-from itertools import islice
-from typing import Optional
+from contextlib import contextmanager
+from typing import Iterator, Optional
 
 from atla_insights.constants import (
     MAX_METADATA_FIELDS,
@@ -12,17 +12,50 @@ from atla_insights.constants import (
     METADATA_MARK,
     OTEL_MODULE_NAME,
 )
-from atla_insights.context import metadata_var, root_span_var
+from atla_insights.context import metadata_var, request_metadata_var, root_span_var
 from atla_insights.suppression import is_instrumentation_suppressed
 from atla_insights.utils import truncate_value
 
 logger = logging.getLogger(OTEL_MODULE_NAME)
 
-_GLOBAL_METADATA: Optional[dict[str, str]] = None
+
+class MetadataLayer:
+    """A layer of validated metadata, with a cached JSON serialization.
+
+    Metadata is layered in increasing order of precedence: global metadata (set on
+    configuration), request metadata (set for the duration of a `request_metadata`
+    context) and trace metadata (set within a trace). The most specific non-empty layer
+    applies. Layers are never mutated once created, so their JSON serialization is
+    computed at most once rather than for every root span.
+    """
+
+    __slots__ = ("_json", "metadata")
+
+    def __init__(self, metadata: dict[str, str]) -> None:
+        """Initialize the metadata layer.
+
+        :param metadata (dict[str, str]): The (validated) metadata of the layer.
+        """
+        self.metadata = metadata
+        self._json: Optional[str] = None
+
+    @property
+    def json(self) -> str:
+        """The JSON serialization of the metadata layer."""
+        if self._json is None:
+            self._json = json.dumps(self.metadata)
+        return self._json
+
+    def __bool__(self) -> bool:
+        """Whether the metadata layer has any metadata."""
+        return bool(self.metadata)
+
+
+_GLOBAL_METADATA: Optional[MetadataLayer] = None
 
 
 def _validate_metadata(metadata: dict[str, str]) -> dict[str, str]:
-    """Validate the user-provided metadata field.
+    """Validate the user-provided metadata field, in a single pass.
 
     :param metadata (dict[str, str]): The metadata field to validate.
     :return (dict[str, str]): The validated metadata.
@@ -30,44 +63,84 @@ def _validate_metadata(metadata: dict[str, str]) -> dict[str, str]:
     if not isinstance(metadata, dict):
         raise ValueError("The metadata field must be a dictionary.")
 
-    if not all(isinstance(k, str) and isinstance(v, str) for k, v in metadata.items()):
+    validated: dict[str, str] = {}
+    has_non_str, has_long_key, has_long_value = False, False, False
+
+    for key, value in metadata.items():
+        if len(validated) >= MAX_METADATA_FIELDS:
+            logger.error(
+                f"The metadata field has {len(metadata)} fields, "
+                f"but the maximum is {MAX_METADATA_FIELDS}."
+            )
+            break
+
+        if not isinstance(key, str) or not isinstance(value, str):
+            has_non_str = True
+            key, value = str(key), str(value)
+        if len(key) > MAX_METADATA_KEY_CHARS:
+            has_long_key = True
+            key = truncate_value(key, MAX_METADATA_KEY_CHARS)
+        if len(value) > MAX_METADATA_VALUE_CHARS:
+            has_long_value = True
+            value = truncate_value(value, MAX_METADATA_VALUE_CHARS)
+
+        validated[key] = value
+
+    if has_non_str:
         logger.error("The metadata field must be a mapping of string to string.")
-        metadata = {str(k): str(v) for k, v in metadata.items()}
-
-    if len(metadata) > MAX_METADATA_FIELDS:
-        logger.error(
-            f"The metadata field has {len(metadata)} fields, "
-            f"but the maximum is {MAX_METADATA_FIELDS}."
-        )
-        metadata = dict(islice(metadata.items(), MAX_METADATA_FIELDS))
-
-    if any(len(k) > MAX_METADATA_KEY_CHARS for k in metadata.keys()):
+    if has_long_key:
         logger.error(
             "The metadata field must have keys with less than "
             f"{MAX_METADATA_KEY_CHARS} characters."
         )
-        metadata = {
-            truncate_value(k, MAX_METADATA_KEY_CHARS): v for k, v in metadata.items()
-        }
-
-    if any(len(v) > MAX_METADATA_VALUE_CHARS for v in metadata.values()):
+    if has_long_value:
         logger.error(
             "The metadata field must have values with less than "
             f"{MAX_METADATA_VALUE_CHARS} characters."
         )
-        metadata = {
-            k: truncate_value(v, MAX_METADATA_VALUE_CHARS) for k, v in metadata.items()
-        }
 
-    return metadata
+    return validated
+
+
+def _get_metadata_layer() -> Optional[MetadataLayer]:
+    """Get the metadata layer that applies to the current context.
+
+    :return (Optional[MetadataLayer]): The most specific metadata layer, if any.
+    """
+    return metadata_var.get() or request_metadata_var.get() or _GLOBAL_METADATA
 
 
 def get_metadata() -> Optional[dict[str, str]]:
     """Get the metadata for the current trace.
 
+    This is the metadata set for the current trace if any, else the request metadata if
+    any, else the global metadata.
+
     :return (Optional[dict[str, str]]): The metadata for the current trace.
     """
-    return metadata_var.get() or _GLOBAL_METADATA
+    if not (layer := _get_metadata_layer()):
+        return None
+    return dict(layer.metadata)
+
+
+def get_metadata_json() -> Optional[str]:
+    """Get the JSON-serialized metadata for the current trace.
+
+    :return (Optional[str]): The JSON-serialized metadata for the current trace.
+    """
+    if not (layer := _get_metadata_layer()):
+        return None
+    return layer.json
+
+
+def _set_root_span_metadata() -> None:
+    """Assign the metadata to the root span of the current trace, if it exists.
+
+    If not, it will be assigned the metadata on creation.
+    """
+    if root_span := root_span_var.get():
+        if (metadata_json := get_metadata_json()) is not None:
+            root_span.set_attribute(METADATA_MARK, metadata_json)
 
 
 def set_global_metadata(metadata: dict[str, str]) -> None:
@@ -75,15 +148,47 @@ def set_global_metadata(metadata: dict[str, str]) -> None:
 
     :param metadata (dict[str, str]): The global metadata.
     """
-    metadata = _validate_metadata(metadata)
-
     global _GLOBAL_METADATA
-    _GLOBAL_METADATA = metadata
+    _GLOBAL_METADATA = MetadataLayer(_validate_metadata(metadata))
+
+
+@contextmanager
+def request_metadata(metadata: dict[str, str]) -> Iterator[None]:
+    """Set metadata for all traces started within a context (e.g. a server request).
+
+    Request metadata takes precedence over the global metadata, while metadata set
+    within a trace (with `set_metadata` or `update_metadata`) takes precedence over the
+    request metadata.
+
+    ```py
+    from atla_insights import instrument, request_metadata
+
+    @instrument("My Function")
+    def my_function():
+        ...
+
+    with request_metadata({"user_id": "some-user"}):
+        my_function()
+    ```
+
+    :param metadata (dict[str, str]): The metadata to set for the context.
+    """
+    if is_instrumentation_suppressed():
+        yield
+        return
+
+    token = request_metadata_var.set(MetadataLayer(_validate_metadata(metadata)))
+    try:
+        yield
+    finally:
+        request_metadata_var.reset(token)
 
 
 def set_metadata(metadata: dict[str, str]) -> None:
     """Set the metadata for the current trace.
 
+    This replaces any metadata previously set for the current trace.
+
     ```py
     from atla_insights import instrument, set_metadata
 
@@ -98,10 +203,46 @@ def set_metadata(metadata: dict[str, str]) -> None:
     if is_instrumentation_suppressed():
         return
 
-    metadata = _validate_metadata(metadata)
+    metadata_var.set(MetadataLayer(_validate_metadata(metadata)))
+    _set_root_span_metadata()
 
-    metadata_var.set(metadata)
-    if root_span := root_span_var.get():
-        # If the root span already exists, we can assign the metadata to it.
-        # If not, it will be assigned the `metadata_var` context var on creation.
-        root_span.set_attribute(METADATA_MARK, json.dumps(metadata))
+
+def update_metadata(metadata: dict[str, str]) -> None:
+    """Update the metadata for the current trace with the given fields.
+
+    Unlike `set_metadata`, this keeps any other metadata that applies to the current
+    trace (including request or global metadata), and only the updated fields get
+    validated.
+
+    ```py
+    from atla_insights import instrument, update_metadata
+
+    @instrument("My Function")
+    def my_function():
+        update_metadata({"some_key": "some_value"})
+        ...
+        update_metadata({"other_key": "other_value"})
+    ```
+
+    :param metadata (dict[str, str]): The metadata fields to update.
+    """
+    if is_instrumentation_suppressed():
+        return
+
+    current_metadata = layer.metadata if (layer := _get_metadata_layer()) else {}
+    validated_updates = _validate_metadata(metadata)
+    if all(current_metadata.get(k) == v for k, v in validated_updates.items()):
+        return
+
+    updated_metadata = dict(current_metadata)
+    for key, value in validated_updates.items():
+        if key not in updated_metadata and len(updated_metadata) >= MAX_METADATA_FIELDS:
+            logger.error(
+                "The metadata field would exceed the maximum of "
+                f"{MAX_METADATA_FIELDS} fields, ignoring new field: {key}."
+            )
+            continue
+        updated_metadata[key] = value
+
+    metadata_var.set(MetadataLayer(updated_metadata))
+    _set_root_span_metadata()
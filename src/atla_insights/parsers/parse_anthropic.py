@@ -24,6 +24,7 @@ from openinference.semconv.trace import (
 )
 
 from atla_insights.parsers.base import BaseParser
+from atla_insights.serialization import json_dumps
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +38,7 @@ class AnthropicParser(BaseParser):
         self, request: dict[str, Any]
     ) -> Generator[tuple[str, Any], None, None]:
         """Parse the Anthropic request."""
-        yield SpanAttributes.INPUT_VALUE, str(request)
+        yield SpanAttributes.INPUT_VALUE, json_dumps(request)
         yield SpanAttributes.INPUT_MIME_TYPE, OpenInferenceMimeTypeValues.JSON.value
 
         yield SpanAttributes.LLM_PROVIDER, OpenInferenceLLMProviderValues.ANTHROPIC.value
@@ -49,14 +50,14 @@ class AnthropicParser(BaseParser):
         if messages := request.get("messages"):
             yield from _get_llm_input_messages(messages)
 
-        if tools := request.get("tools"):
-            yield from _get_llm_tools(tools)
+        if request.get("tools"):
+            yield from _get_llm_tools(request)
 
     def parse_response_body(
         self, response: dict[str, Any]
     ) -> Generator[tuple[str, Any], None, None]:
         """Parse the Anthropic response."""
-        yield SpanAttributes.OUTPUT_VALUE, str(response)
+        yield SpanAttributes.OUTPUT_VALUE, json_dumps(response)
         yield SpanAttributes.OUTPUT_MIME_TYPE, OpenInferenceMimeTypeValues.JSON.value
 
         try:
@@ -24,6 +24,7 @@ from openinference.semconv.trace import (
 )
 
 from atla_insights.parsers.base import BaseParser
+from atla_insights.serialization import json_dumps
 
 logger = logging.getLogger(__name__)
 
@@ -97,7 +98,7 @@ class BedrockParser(BaseParser):
         self, request: dict[str, Any]
     ) -> Generator[tuple[str, Any], None, None]:
         """Parse the Anthropic request."""
-        yield SpanAttributes.INPUT_VALUE, str(request)
+        yield SpanAttributes.INPUT_VALUE, json_dumps(request)
         yield SpanAttributes.INPUT_MIME_TYPE, OpenInferenceMimeTypeValues.JSON.value
 
         yield SpanAttributes.LLM_PROVIDER, OpenInferenceLLMProviderValues.ANTHROPIC.value
@@ -143,7 +144,7 @@ class BedrockParser(BaseParser):
         self, response: dict[str, Any]
     ) -> Generator[tuple[str, Any], None, None]:
         """Parse the Anthropic response."""
-        yield SpanAttributes.OUTPUT_VALUE, str(response)
+        yield SpanAttributes.OUTPUT_VALUE, json_dumps(response)
         yield SpanAttributes.OUTPUT_MIME_TYPE, OpenInferenceMimeTypeValues.JSON.value
 
         match self.api_endpoint:
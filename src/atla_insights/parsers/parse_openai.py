@@ -1,7 +1,7 @@
 """Parsers for the OpenAI LLM."""
 
 import logging
-from typing import Any, Generator, Literal
+from typing import Any, Generator, Iterator, Literal, Optional, TypeVar
 
 try:
     from openinference.instrumentation.openai._request_attributes_extractor import (
@@ -20,16 +20,141 @@ import openai
 from openai.types.chat import ChatCompletion
 from openai.types.responses import Response
 from openinference.semconv.trace import (
+    MessageAttributes,
     OpenInferenceLLMProviderValues,
     OpenInferenceLLMSystemValues,
     OpenInferenceMimeTypeValues,
     SpanAttributes,
+    ToolCallAttributes,
 )
 
 from atla_insights.parsers.base import BaseParser
+from atla_insights.serialization import json_dumps
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+_USAGE_ATTRIBUTES = (
+    ("total_tokens", SpanAttributes.LLM_TOKEN_COUNT_TOTAL),
+    ("prompt_tokens", SpanAttributes.LLM_TOKEN_COUNT_PROMPT),
+    ("completion_tokens", SpanAttributes.LLM_TOKEN_COUNT_COMPLETION),
+)
+_USAGE_DETAILS_ATTRIBUTES = (
+    (
+        "prompt_tokens_details",
+        "cached_tokens",
+        SpanAttributes.LLM_TOKEN_COUNT_PROMPT_DETAILS_CACHE_READ,
+    ),
+    (
+        "prompt_tokens_details",
+        "audio_tokens",
+        SpanAttributes.LLM_TOKEN_COUNT_PROMPT_DETAILS_AUDIO,
+    ),
+    (
+        "completion_tokens_details",
+        "reasoning_tokens",
+        SpanAttributes.LLM_TOKEN_COUNT_COMPLETION_DETAILS_REASONING,
+    ),
+    (
+        "completion_tokens_details",
+        "audio_tokens",
+        SpanAttributes.LLM_TOKEN_COUNT_COMPLETION_DETAILS_AUDIO,
+    ),
+)
+
+
+def _get_field(mapping: dict[str, Any], key: str, field_type: type[T]) -> Optional[T]:
+    """Get an optional field of a raw response body, checking its type.
+
+    :param mapping (dict[str, Any]): The (part of the) raw response body.
+    :param key (str): The key of the field.
+    :param field_type (type[T]): The expected type of the field.
+    :return (Optional[T]): The field value, or `None` if it is missing or null.
+    """
+    value = mapping.get(key)
+    if value is not None and not isinstance(value, field_type):
+        raise TypeError(f"Unexpected type for `{key}`: {type(value).__name__}")
+    return value
+
+
+def _get_chat_completion_message_attributes(
+    message: dict[str, Any],
+) -> Iterator[tuple[str, Any]]:
+    """Get the span attributes of a raw chat completion message.
+
+    :param message (dict[str, Any]): The raw chat completion message.
+    :return (Iterator[tuple[str, Any]]): The span attribute key-value pairs.
+    """
+    if role := _get_field(message, "role", str):
+        yield MessageAttributes.MESSAGE_ROLE, role
+    if content := _get_field(message, "content", str):
+        yield MessageAttributes.MESSAGE_CONTENT, content
+
+    if function_call := _get_field(message, "function_call", dict):
+        if name := _get_field(function_call, "name", str):
+            yield MessageAttributes.MESSAGE_FUNCTION_CALL_NAME, name
+        if arguments := _get_field(function_call, "arguments", str):
+            yield MessageAttributes.MESSAGE_FUNCTION_CALL_ARGUMENTS_JSON, arguments
+
+    for idx, tool_call in enumerate(_get_field(message, "tool_calls", list) or []):
+        if not isinstance(tool_call, dict):
+            raise TypeError(f"Unexpected type for tool call: {type(tool_call).__name__}")
+
+        prefix = f"{MessageAttributes.MESSAGE_TOOL_CALLS}.{idx}"
+        if (tool_call_id := _get_field(tool_call, "id", str)) is not None:
+            yield f"{prefix}.{ToolCallAttributes.TOOL_CALL_ID}", tool_call_id
+        if function := _get_field(tool_call, "function", dict):
+            if name := _get_field(function, "name", str):
+                yield f"{prefix}.{ToolCallAttributes.TOOL_CALL_FUNCTION_NAME}", name
+            if arguments := _get_field(function, "arguments", str):
+                yield (
+                    f"{prefix}.{ToolCallAttributes.TOOL_CALL_FUNCTION_ARGUMENTS_JSON}",
+                    arguments,
+                )
+
+
+def _get_chat_completion_attributes(
+    response: dict[str, Any],
+) -> list[tuple[str, Any]]:
+    """Get the span attributes of a raw chat completion response body.
+
+    Reads only the fields that end up as span attributes, without validating the full
+    response into a `ChatCompletion`. The attributes match those extracted from the
+    validated response.
+
+    :param response (dict[str, Any]): The raw chat completion response body.
+    :return (list[tuple[str, Any]]): The span attribute key-value pairs.
+    :raises TypeError: If the response body is malformed.
+    """
+    attributes: list[tuple[str, Any]] = []
+
+    if model := _get_field(response, "model", str):
+        attributes.append((SpanAttributes.LLM_MODEL_NAME, model))
+
+    if usage := _get_field(response, "usage", dict):
+        for key, attribute in _USAGE_ATTRIBUTES:
+            if (token_count := _get_field(usage, key, int)) is not None:
+                attributes.append((attribute, token_count))
+        for details_key, key, attribute in _USAGE_DETAILS_ATTRIBUTES:
+            if (details := _get_field(usage, details_key, dict)) is not None:
+                if (token_count := _get_field(details, key, int)) is not None:
+                    attributes.append((attribute, token_count))
+
+    for choice in _get_field(response, "choices", list) or []:
+        if not isinstance(choice, dict):
+            raise TypeError(f"Unexpected type for choice: {type(choice).__name__}")
+        if (index := _get_field(choice, "index", int)) is None:
+            continue
+        if (message := _get_field(choice, "message", dict)) is not None:
+            prefix = f"{SpanAttributes.LLM_OUTPUT_MESSAGES}.{index}"
+            attributes.extend(
+                (f"{prefix}.{key}", value)
+                for key, value in _get_chat_completion_message_attributes(message)
+            )
+
+    return attributes
+
 
 class OpenAIChatCompletionParser(BaseParser):
     """Parser for OpenAI's chat completion API format."""
@@ -45,6 +170,7 @@ class OpenAIChatCompletionParser(BaseParser):
         self._request_attributes_extractor = _RequestAttributesExtractor(openai)
         self._response_attributes_extractor = _ResponseAttributesExtractor(openai)
 
+        self.api_endpoint = api_endpoint
         self.cast_to: type[ChatCompletion | Response]
         match api_endpoint:
             case "chat_completions":
@@ -58,7 +184,7 @@ class OpenAIChatCompletionParser(BaseParser):
         self, request: dict[str, Any]
     ) -> Generator[tuple[str, Any], None, None]:
         """Parse the OpenAI request."""
-        yield SpanAttributes.INPUT_VALUE, str(request)
+        yield SpanAttributes.INPUT_VALUE, json_dumps(request)
         yield SpanAttributes.INPUT_MIME_TYPE, OpenInferenceMimeTypeValues.JSON.value
 
         yield SpanAttributes.LLM_PROVIDER, OpenInferenceLLMProviderValues.OPENAI.value
@@ -76,9 +202,20 @@ class OpenAIChatCompletionParser(BaseParser):
         self, response: dict[str, Any]
     ) -> Generator[tuple[str, Any], None, None]:
         """Parse the OpenAI response."""
-        yield SpanAttributes.OUTPUT_VALUE, str(response)
+        yield SpanAttributes.OUTPUT_VALUE, json_dumps(response)
         yield SpanAttributes.OUTPUT_MIME_TYPE, OpenInferenceMimeTypeValues.JSON.value
 
+        if self.api_endpoint == "chat_completions":
+            # Fast path: read the needed fields straight from the raw response body.
+            try:
+                attributes = _get_chat_completion_attributes(response)
+            except TypeError:
+                # Malformed response: fall back to (and log the errors of) validation.
+                pass
+            else:
+                yield from attributes
+                return
+
         try:
             parsed_response = self.cast_to.model_validate(response)
         except Exception as e:
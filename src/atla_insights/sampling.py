@@ -4,18 +4,24 @@ import json
 import logging
 import threading
 import time
-from typing import Callable, Optional, Union
+from typing import Callable, Optional, Sequence, Union
 
 from opentelemetry.context import Context
 from opentelemetry.sdk.trace import ReadableSpan
 from opentelemetry.sdk.trace.export import SpanExporter, SpanProcessor
 from opentelemetry.sdk.trace.sampling import (
+    Decision,
     ParentBased,
     ParentBasedTraceIdRatio,
+    Sampler,
+    SamplingResult,
     StaticSampler,
 )
+from opentelemetry.trace import Link, SpanKind, TraceState
+from opentelemetry.util.types import Attributes
 
 from atla_insights.constants import METADATA_MARK
+from atla_insights.utils import register_at_fork_reinit
 
 logger = logging.getLogger("atla_insights")
 
@@ -52,11 +58,26 @@ class _TailSampler(SpanProcessor):
         self._lock = threading.RLock()
         self._shutdown = False
 
+        self._start_reaper()
+        register_at_fork_reinit(self, _TailSampler._at_fork_reinit)
+
+    def _start_reaper(self) -> None:
+        """Start the background thread reaping expired traces."""
         self._reaper = threading.Thread(
             target=self._reap_loop, name="atla-tail-sampling-reaper", daemon=True
         )
         self._reaper.start()
 
+    def _at_fork_reinit(self) -> None:
+        """Reinitialize the TailSampler in a forked child process.
+
+        Traces buffered by the parent process are left for the parent to export.
+        """
+        self._lock = threading.RLock()
+        self._traces = {}
+        if not self._shutdown:
+            self._start_reaper()
+
     def add_exporter(self, exporter: SpanExporter) -> None:
         """Add an exporter to the TailSampler."""
         self._exporters.append(exporter)
@@ -220,4 +241,42 @@ class MetadataSampler(_TailSampler):
         super().__init__(_decision_fn)
 
 
+class _RecordUnsampledSampler(Sampler):
+    """Sampler that records the spans its delegate sampler drops, without sampling them.
+
+    Recorded spans go through all span processors (e.g. to feed metrics), but spans that
+    are not sampled are never exported.
+    """
+
+    def __init__(self, delegate: Sampler) -> None:
+        """Initialize the RecordUnsampledSampler.
+
+        :param delegate (Sampler): The sampler making the sampling decision.
+        """
+        self._delegate = delegate
+
+    def should_sample(
+        self,
+        parent_context: Optional[Context],
+        trace_id: int,
+        name: str,
+        kind: Optional[SpanKind] = None,
+        attributes: Attributes = None,
+        links: Optional[Sequence[Link]] = None,
+        trace_state: Optional[TraceState] = None,
+    ) -> SamplingResult:
+        """Get the sampling decision of the delegate, recording any dropped spans."""
+        result = self._delegate.should_sample(
+            parent_context, trace_id, name, kind, attributes, links, trace_state
+        )
+        if result.decision is Decision.DROP:
+            # Samplers leave out the span attributes when dropping a span.
+            return SamplingResult(Decision.RECORD_ONLY, attributes, result.trace_state)
+        return result
+
+    def get_description(self) -> str:
+        """Get the description of the sampler."""
+        return f"RecordUnsampled{{{self._delegate.get_description()}}}"
+
+
 SamplerType = Union[ParentBased, StaticSampler, _TailSampler]
@@ -0,0 +1,147 @@
+"""JSON serialization of span attribute values."""
+
+import dataclasses
+import json
+import threading
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+from openinference.semconv.trace import ToolAttributes
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+_TOOL_ATTRIBUTES_CACHE_SIZE = 128
+
+# Tool attributes by tool set, in least recently used order. The tools themselves are
+# kept alongside their attributes, so that their ids can't get reused.
+_tool_attributes_cache: OrderedDict[
+    Hashable, tuple[tuple[Any, ...], tuple[tuple[str, str], ...]]
+] = OrderedDict()
+_tool_attributes_cache_lock = threading.Lock()
+
+
+def _default(value: Any) -> Any:
+    """Convert a value that is not natively JSON serializable.
+
+    :param value (Any): The value to convert.
+    :return (Any): A JSON serializable representation of the value.
+    """
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (bytes, bytearray)):
+        try:
+            return value.decode()
+        except UnicodeDecodeError:
+            return f"<{type(value).__name__}: {len(value)} bytes>"
+    return str(value)
+
+
+def json_dumps(value: Any) -> str:
+    """Serialize a value to a JSON string.
+
+    Uses `orjson` if it is installed, falling back to the standard library otherwise.
+    Values that are not natively JSON serializable (e.g. pydantic models) are converted,
+    so the result is always valid JSON. Both produce compact JSON, but the output is
+    not byte-identical for all values: e.g. `orjson` serializes datetimes natively (as
+    RFC 3339), whereas the standard library fallback stringifies them.
+
+    :param value (Any): The value to serialize.
+    :return (str): The JSON string.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                value, default=_default, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except (TypeError, orjson.JSONEncodeError):
+            # E.g. integers beyond 64 bits, or nesting beyond orjson's depth limit.
+            pass
+
+    try:
+        # Compact output, as produced by orjson.
+        return json.dumps(
+            value,
+            default=_default,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+        )
+    except (TypeError, ValueError):
+        # E.g. non-string keys of an unsupported type, NaN, or circular references.
+        return json.dumps(str(value), ensure_ascii=False)
+
+
+def _serialize_tools(
+    prefix: str,
+    tools: tuple[Any, ...],
+    get_schema: Optional[Callable[[Any], Any]],
+) -> tuple[tuple[str, str], ...]:
+    """Serialize the JSON schemas of a set of tools into attributes.
+
+    :param prefix (str): The attribute prefix of the tools (e.g. `llm.tools`).
+    :param tools (tuple[Any, ...]): The tools.
+    :param get_schema (Optional[Callable[[Any], Any]]): Get the JSON schema of a tool,
+        or `None` to use the tool itself as its schema.
+    :return (tuple[tuple[str, str], ...]): The tool attributes.
+    """
+    return tuple(
+        (
+            f"{prefix}.{idx}.{ToolAttributes.TOOL_JSON_SCHEMA}",
+            json_dumps(get_schema(tool) if get_schema is not None else tool),
+        )
+        for idx, tool in enumerate(tools)
+    )
+
+
+def get_tool_attributes(
+    prefix: str,
+    tools: Iterable[Any],
+    get_schema: Optional[Callable[[Any], Any]] = None,
+) -> tuple[tuple[str, str], ...]:
+    """Get the JSON schema attributes of a set of tools.
+
+    Agents typically send the same tools with every LLM call, so the attributes of the
+    most recently used tool sets are cached. Tool sets are keyed on the identity of
+    their tools (or on their value, for tools given by name). As plain dicts and lists
+    (e.g. user-supplied tool schemas) are commonly mutated in place, tool sets that
+    include any are not cached.
+
+    :param prefix (str): The attribute prefix of the tools (e.g. `llm.tools`).
+    :param tools (Iterable[Any]): The tools.
+    :param get_schema (Optional[Callable[[Any], Any]]): Get the JSON schema of a tool.
+        Defaults to `None`, using the tool itself as its schema.
+    :return (tuple[tuple[str, str], ...]): The tool attributes.
+    """
+    tools = tuple(tools)
+    if any(isinstance(tool, (dict, list)) for tool in tools):
+        return _serialize_tools(prefix, tools, get_schema)
+
+    key = (
+        prefix,
+        get_schema,
+        tuple(tool if isinstance(tool, str) else id(tool) for tool in tools),
+    )
+
+    with _tool_attributes_cache_lock:
+        if (cached := _tool_attributes_cache.get(key)) is not None:
+            _tool_attributes_cache.move_to_end(key)
+            return cached[1]
+
+    attributes = _serialize_tools(prefix, tools, get_schema)
+
+    with _tool_attributes_cache_lock:
+        _tool_attributes_cache[key] = (tools, attributes)
+        if len(_tool_attributes_cache) > _TOOL_ATTRIBUTES_CACHE_SIZE:
+            _tool_attributes_cache.popitem(last=False)
+    return attributes
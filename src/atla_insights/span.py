@@ -1,8 +1,7 @@
 """Span helper functions (lower-level interface)."""
 
-import json
-from contextlib import contextmanager
-from typing import Any, Iterator, Mapping, Optional, Sequence, cast
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Iterator, Mapping, Optional, Sequence, cast
 
 from openai.types.chat import (
     ChatCompletionAssistantMessageParam,
@@ -17,12 +16,16 @@ from openinference.semconv.trace import (
     OpenInferenceMimeTypeValues,
     OpenInferenceSpanKindValues,
     SpanAttributes,
-    ToolAttributes,
     ToolCallAttributes,
 )
-from opentelemetry.trace import Span
+from opentelemetry.trace import Span, Tracer
+from opentelemetry.util.types import AttributeValue
 
 from atla_insights.main import ATLA_INSTANCE
+from atla_insights.serialization import (
+    get_tool_attributes,
+    json_dumps,
+)
 
 
 class AtlaSpan:
@@ -136,10 +139,7 @@ class AtlaSpan:
         :param prefix (str): The prefix to use for the tool attributes.
         :param tools (Sequence[ChatCompletionToolParam]): The tools to record.
         """
-        for tool_idx, tool in enumerate(tools):
-            self._span.set_attribute(
-                f"{prefix}.{tool_idx}.{ToolAttributes.TOOL_JSON_SCHEMA}", json.dumps(tool)
-            )
+        self._span.set_attributes(dict(get_tool_attributes(prefix, tools)))
 
     def record_generation(
         self,
@@ -209,14 +209,14 @@ class AtlaSpan:
         )
 
         # Record input messages
-        self._span.set_attribute(SpanAttributes.INPUT_VALUE, str(input_messages))
+        self._span.set_attribute(SpanAttributes.INPUT_VALUE, json_dumps(input_messages))
         self._span.set_attribute(
             SpanAttributes.INPUT_MIME_TYPE, OpenInferenceMimeTypeValues.JSON.value
         )
         self._record_messages(SpanAttributes.LLM_INPUT_MESSAGES, input_messages)
 
         # Record output messages
-        self._span.set_attribute(SpanAttributes.OUTPUT_VALUE, str(output_messages))
+        self._span.set_attribute(SpanAttributes.OUTPUT_VALUE, json_dumps(output_messages))
         self._span.set_attribute(
             SpanAttributes.OUTPUT_MIME_TYPE, OpenInferenceMimeTypeValues.JSON.value
         )
@@ -227,6 +227,38 @@ class AtlaSpan:
             self._record_tools(SpanAttributes.LLM_TOOLS, tools)
 
 
+def _get_manual_tracer() -> Tracer:
+    """Get the tracer used for manually recorded spans.
+
+    :return (Tracer): The tracer.
+    """
+    tracer_provider = ATLA_INSTANCE.tracer_provider
+    if tracer_provider is None:
+        raise ValueError("Must first configure Atla Insights before using the span API.")
+
+    return tracer_provider.get_tracer("openinference.instrumentation.manual")
+
+
+def _get_agent_attributes(
+    agent_id: str, parent_agent_id: Optional[str]
+) -> dict[str, AttributeValue]:
+    """Get the span attributes of an agent span.
+
+    :param agent_id (str): The name (or other identifier) of the agent.
+    :param parent_agent_id (Optional[str]): The name (or other identifier) of the parent
+        agent, if there is any.
+    :return (dict[str, AttributeValue]): The agent span attributes.
+    """
+    attributes: dict[str, AttributeValue] = {
+        SpanAttributes.OPENINFERENCE_SPAN_KIND: OpenInferenceSpanKindValues.AGENT.value,
+        SpanAttributes.GRAPH_NODE_ID: str(agent_id),
+        SpanAttributes.GRAPH_NODE_NAME: str(agent_id),
+    }
+    if parent_agent_id:
+        attributes[SpanAttributes.GRAPH_NODE_PARENT_ID] = str(parent_agent_id)
+    return attributes
+
+
 @contextmanager
 def start_as_current_span(name: str) -> Iterator[AtlaSpan]:
     """Start a span as the current span.
@@ -246,12 +278,29 @@ def start_as_current_span(name: str) -> Iterator[AtlaSpan]:
     :return (Iterator[AtlaSpan]): An iterator that yields the Atla span to attach
         LLM-related attributes to.
     """
-    tracer_provider = ATLA_INSTANCE.tracer_provider
-    if tracer_provider is None:
-        raise ValueError("Must first configure Atla Insights before using the span API.")
+    with _get_manual_tracer().start_as_current_span(name) as span:
+        yield AtlaSpan(span)
+
+
+@asynccontextmanager
+async def astart_as_current_span(name: str) -> AsyncIterator[AtlaSpan]:
+    """Start a span as the current span, in an async context.
 
-    tracer = tracer_provider.get_tracer("openinference.instrumentation.manual")
-    with tracer.start_as_current_span(name) as span:
+    Async variant of `start_as_current_span`. The span stays current across `await`
+    points, and is inherited as parent by any task created within its context.
+
+    ```py
+    from atla_insights.span import astart_as_current_span
+
+    async with astart_as_current_span("my-llm-generation") as span:
+        span.record_generation(...)
+    ```
+
+    :param name (str): The name of the span.
+    :return (AsyncIterator[AtlaSpan]): An async iterator that yields the Atla span to
+        attach LLM-related attributes to.
+    """
+    with _get_manual_tracer().start_as_current_span(name) as span:
         yield AtlaSpan(span)
 
 
@@ -277,23 +326,36 @@ def record_agent(agent_id: str, parent_agent_id: Optional[str] = None) -> Iterat
         agent, if there is any. Defaults to None.
     :return (Iterator[Span]): An iterator that yields the agent span.
     """
-    tracer_provider = ATLA_INSTANCE.tracer_provider
-    if tracer_provider is None:
-        raise ValueError("Must first configure Atla Insights before using the span API.")
+    with _get_manual_tracer().start_as_current_span(
+        agent_id, attributes=_get_agent_attributes(agent_id, parent_agent_id)
+    ) as span:
+        yield span
 
-    tracer = tracer_provider.get_tracer("openinference.instrumentation.manual")
-    with tracer.start_as_current_span(agent_id) as span:
-        span.set_attributes(
-            {
-                SpanAttributes.OPENINFERENCE_SPAN_KIND: (
-                    OpenInferenceSpanKindValues.AGENT.value
-                ),
-                SpanAttributes.GRAPH_NODE_ID: str(agent_id),
-                SpanAttributes.GRAPH_NODE_NAME: str(agent_id),
-            }
-        )
 
-        if parent_agent_id:
-            span.set_attribute(SpanAttributes.GRAPH_NODE_PARENT_ID, str(parent_agent_id))
+@asynccontextmanager
+async def arecord_agent(
+    agent_id: str, parent_agent_id: Optional[str] = None
+) -> AsyncIterator[Span]:
+    """Start an agent span to nest agent-related spans within, in an async context.
+
+    Async variant of `record_agent`. Tasks created within the agent's context (e.g. via
+    `asyncio.gather` or `asyncio.TaskGroup`) are nested under the agent span.
+
+    ```py
+    import asyncio
+
+    from atla_insights.span import arecord_agent
 
+    async with arecord_agent("my-main-agent") as span:
+        await asyncio.gather(my_sub_agent("a"), my_sub_agent("b"))
+    ```
+
+    :param agent_id (str): The name (or other identifier) of the agent.
+    :param parent_agent_id (Optional[str]): The name (or other identifier) of the parent
+        agent, if there is any. Defaults to None.
+    :return (AsyncIterator[Span]): An async iterator that yields the agent span.
+    """
+    with _get_manual_tracer().start_as_current_span(
+        agent_id, attributes=_get_agent_attributes(agent_id, parent_agent_id)
+    ) as span:
         yield span
@@ -1,8 +1,11 @@
 """Span processors."""
 
-import json
 import os
-from typing import Optional
+import threading
+import weakref
+from fnmatch import fnmatchcase
+from time import time_ns
+from typing import Optional, Sequence
 
 from opentelemetry.context import Context
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
@@ -20,9 +23,14 @@ from atla_insights.constants import (
     VERSION_MARK,
     __version__,
 )
-from atla_insights.context import experiment_var, root_span_var
+from atla_insights.context import (
+    experiment_var,
+    root_span_var,
+    suppress_instrumentation_var,
+)
 from atla_insights.git_info import GitInfo
-from atla_insights.metadata import get_metadata
+from atla_insights.metadata import get_metadata_json
+from atla_insights.utils import register_at_fork_reinit, reset_exporter_connections
 
 
 class AtlaRootSpanProcessor(SpanProcessor):
@@ -54,8 +62,8 @@ class AtlaRootSpanProcessor(SpanProcessor):
         root_span_var.set(span)
         span.set_attribute(SUCCESS_MARK, -1)
 
-        if metadata := get_metadata():
-            span.set_attribute(METADATA_MARK, json.dumps(metadata))
+        if metadata_json := get_metadata_json():
+            span.set_attribute(METADATA_MARK, metadata_json)
 
         if experiment := experiment_var.get():
             # Experiments are by definition run in dev environment.
@@ -69,9 +77,112 @@ class AtlaRootSpanProcessor(SpanProcessor):
         pass
 
 
+class ScopeRoutingSpanProcessor(SpanProcessor):
+    """A span processor dispatching spans to processors by instrumentation scope.
+
+    Each span processor is registered with the instrumentation scope names (as glob
+    patterns, e.g. `openinference.instrumentation.*`) of the spans it processes, or
+    processes all spans if registered without any. Processors are called in the order
+    they were added, and the processors of each scope name are only resolved once.
+    Spans started while Atla Insights instrumentation is suppressed are not dispatched.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scope routing span processor."""
+        self._routes: tuple[tuple[SpanProcessor, Optional[tuple[str, ...]]], ...] = ()
+        self._processors_by_scope: dict[str, tuple[SpanProcessor, ...]] = {}
+        self._lock = threading.Lock()
+        # Weakly referenced, so that spans which never end are not kept alive.
+        self._suppressed_spans: weakref.WeakValueDictionary[int, Span] = (
+            weakref.WeakValueDictionary()
+        )
+        register_at_fork_reinit(self, ScopeRoutingSpanProcessor._at_fork_reinit)
+
+    def _at_fork_reinit(self) -> None:
+        """Reinitialize the span processor in a forked child process."""
+        self._lock = threading.Lock()
+
+    def add_span_processor(
+        self,
+        span_processor: SpanProcessor,
+        scopes: Optional[Sequence[str]] = None,
+        first: bool = False,
+    ) -> None:
+        """Add a span processor.
+
+        :param span_processor (SpanProcessor): The span processor to add.
+        :param scopes (Optional[Sequence[str]]): The instrumentation scope names (as glob
+            patterns) of the spans to process. Defaults to `None`, processing all spans.
+        :param first (bool): Whether to call the span processor before the span
+            processors added so far. Defaults to `False`.
+        """
+        route = (span_processor, tuple(scopes) if scopes is not None else None)
+        with self._lock:
+            self._routes = (route, *self._routes) if first else (*self._routes, route)
+            self._processors_by_scope = {}
+
+    def _get_span_processors(self, span: ReadableSpan) -> tuple[SpanProcessor, ...]:
+        """Get the span processors of a span, by its instrumentation scope name.
+
+        :param span (ReadableSpan): The span.
+        :return (tuple[SpanProcessor, ...]): The span processors of the span.
+        """
+        scope = span.instrumentation_scope
+        scope_name = scope.name if scope is not None else ""
+
+        processors_by_scope = self._processors_by_scope
+        if (span_processors := processors_by_scope.get(scope_name)) is None:
+            span_processors = tuple(
+                span_processor
+                for span_processor, scopes in self._routes
+                if scopes is None
+                or any(fnmatchcase(scope_name, pattern) for pattern in scopes)
+            )
+            processors_by_scope[scope_name] = span_processors
+        return span_processors
+
+    def on_start(self, span: Span, parent_context: Optional[Context] = None) -> None:
+        """On start span processing."""
+        # Spans started while instrumentation is suppressed are neither processed nor
+        # exported. They are tracked by span ID, as they may end in another context.
+        if suppress_instrumentation_var.get():
+            self._suppressed_spans[span.get_span_context().span_id] = span
+            return
+
+        for span_processor in self._get_span_processors(span):
+            span_processor.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        """On end span processing."""
+        if self._suppressed_spans and span.context is not None:
+            if self._suppressed_spans.pop(span.context.span_id, None) is not None:
+                return
+
+        for span_processor in self._get_span_processors(span):
+            span_processor.on_end(span)
+
+    def shutdown(self) -> None:
+        """Shut down all span processors."""
+        for span_processor, _ in self._routes:
+            span_processor.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Force flush all span processors, within a shared timeout."""
+        deadline_ns = time_ns() + timeout_millis * 1_000_000
+        for span_processor, _ in self._routes:
+            if (now_ns := time_ns()) >= deadline_ns:
+                return False
+            if not span_processor.force_flush((deadline_ns - now_ns) // 1_000_000):
+                return False
+        return True
+
+
 def get_atla_span_exporter(token: str) -> OTLPSpanExporter:
     """Get the Atla span exporter."""
-    return OTLPSpanExporter(
+    exporter = OTLPSpanExporter(
         endpoint=OTEL_TRACES_ENDPOINT,
         headers={"Authorization": f"Bearer {token}"},
     )
+    # Connections must not be shared with the parent process after a fork.
+    register_at_fork_reinit(exporter, reset_exporter_connections)
+    return exporter
@@ -0,0 +1,297 @@
+"""Streaming LLM response instrumentation."""
+
+import math
+import time
+from bisect import bisect_left
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Optional,
+    TypeVar,
+)
+
+from opentelemetry.trace import Span
+from opentelemetry.util.types import AttributeValue
+from wrapt import ObjectProxy
+
+from atla_insights.constants import (
+    STREAMING_CHUNK_COUNT_MARK,
+    STREAMING_INTER_CHUNK_LATENCY_MARK,
+    STREAMING_TTFT_MARK,
+)
+
+T = TypeVar("T")
+
+# Upper bounds (in ms) of the log-scaled inter-chunk latency histogram buckets. Each
+# bucket is 25% wider than the previous one, covering 0.1ms up to ~2 minutes.
+_LATENCY_BUCKET_BOUNDS_MS: tuple[float, ...] = tuple(0.1 * 1.25**i for i in range(64))
+
+_LATENCY_PERCENTILES = (50, 90, 99)
+
+
+class StreamingLatencyRecorder:
+    """Streaming latency recorder.
+
+    Records the time-to-first-token, chunk count and inter-chunk latency distribution of
+    a streamed LLM response. Memory usage is constant regardless of the stream length:
+    inter-chunk latencies are counted into log-scaled histogram buckets, from which
+    percentiles are estimated (within the 25% width of a bucket).
+    """
+
+    __slots__ = (
+        "_buckets",
+        "_chunk_count",
+        "_last_chunk_ns",
+        "_latency_max_ms",
+        "_latency_sum_ms",
+        "_start_time_ns",
+        "_ttft_ns",
+    )
+
+    def __init__(self, start_time_ns: Optional[int] = None) -> None:
+        """Initialize the streaming latency recorder.
+
+        :param start_time_ns (Optional[int]): The epoch time (in ns) at which the request
+            was sent. Defaults to `None`, meaning the current time.
+        """
+        self._start_time_ns = time.time_ns() if start_time_ns is None else start_time_ns
+        self._last_chunk_ns: Optional[int] = None
+        self._ttft_ns: Optional[int] = None
+
+        self._chunk_count = 0
+        self._latency_sum_ms = 0.0
+        self._latency_max_ms = 0.0
+        self._buckets = [0] * (len(_LATENCY_BUCKET_BOUNDS_MS) + 1)
+
+    @property
+    def chunk_count(self) -> int:
+        """The number of chunks received so far."""
+        return self._chunk_count
+
+    @property
+    def time_to_first_token_ms(self) -> Optional[float]:
+        """The time between sending the request and receiving the first chunk (in ms)."""
+        if self._ttft_ns is None:
+            return None
+        return self._ttft_ns / 1e6
+
+    def record_chunk(self) -> None:
+        """Record the arrival of a new chunk."""
+        now = time.perf_counter_ns()
+        self._chunk_count += 1
+
+        if self._last_chunk_ns is None:
+            self._ttft_ns = max(0, time.time_ns() - self._start_time_ns)
+        else:
+            latency_ms = (now - self._last_chunk_ns) / 1e6
+            self._latency_sum_ms += latency_ms
+            if latency_ms > self._latency_max_ms:
+                self._latency_max_ms = latency_ms
+            self._buckets[bisect_left(_LATENCY_BUCKET_BOUNDS_MS, latency_ms)] += 1
+
+        self._last_chunk_ns = now
+
+    def get_latency_percentile(self, percentile: float) -> Optional[float]:
+        """Estimate a percentile of the inter-chunk latency distribution.
+
+        :param percentile (float): The percentile to estimate, between 0 and 100.
+        :return (Optional[float]): The estimated latency (in ms), or `None` if fewer than
+            two chunks were received.
+        """
+        num_latencies = self._chunk_count - 1
+        if num_latencies <= 0:
+            return None
+
+        target = max(1, math.ceil(percentile / 100 * num_latencies))
+        cumulative = 0
+        for bucket_idx, count in enumerate(self._buckets):
+            cumulative += count
+            if cumulative >= target:
+                if bucket_idx == len(_LATENCY_BUCKET_BOUNDS_MS):
+                    break
+                return min(_LATENCY_BUCKET_BOUNDS_MS[bucket_idx], self._latency_max_ms)
+        return self._latency_max_ms
+
+    def get_attributes(self) -> dict[str, AttributeValue]:
+        """Get the recorded streaming statistics as span attributes.
+
+        :return (dict[str, AttributeValue]): The span attributes.
+        """
+        attributes: dict[str, AttributeValue] = {
+            STREAMING_CHUNK_COUNT_MARK: self._chunk_count
+        }
+
+        if (ttft_ms := self.time_to_first_token_ms) is not None:
+            attributes[STREAMING_TTFT_MARK] = round(ttft_ms, 3)
+
+        if self._chunk_count > 1:
+            for percentile in _LATENCY_PERCENTILES:
+                latency_ms = self.get_latency_percentile(percentile)
+                if latency_ms is not None:
+                    attributes[f"{STREAMING_INTER_CHUNK_LATENCY_MARK}.p{percentile}"] = (
+                        round(latency_ms, 3)
+                    )
+            attributes[f"{STREAMING_INTER_CHUNK_LATENCY_MARK}.mean"] = round(
+                self._latency_sum_ms / (self._chunk_count - 1), 3
+            )
+            attributes[f"{STREAMING_INTER_CHUNK_LATENCY_MARK}.max"] = round(
+                self._latency_max_ms, 3
+            )
+
+        return attributes
+
+    def record_to_span(self, span: Span) -> None:
+        """Record the streaming statistics on a span, if it is still recording.
+
+        :param span (Span): The span to record the streaming statistics on.
+        """
+        if span.is_recording():
+            span.set_attributes(self.get_attributes())
+
+
+def _get_recorder(span: Span) -> StreamingLatencyRecorder:
+    """Get a streaming latency recorder, timed from the start of the given span."""
+    return StreamingLatencyRecorder(start_time_ns=getattr(span, "start_time", None))
+
+
+def record_stream(stream: Iterable[T], span: Span) -> Iterator[T]:
+    """Iterate over a stream, recording its streaming latencies on the given span.
+
+    The time-to-first-token is recorded as soon as the first chunk arrives, so it is
+    kept even if the stream is abandoned early. All other statistics are recorded once
+    the stream is exhausted, fails or is closed.
+
+    :param stream (Iterable[T]): The stream to iterate over.
+    :param span (Span): The (LLM) span to record the streaming statistics on.
+    :return (Iterator[T]): An iterator over the stream's items.
+    """
+    if not span.is_recording():
+        yield from stream
+        return
+
+    recorder = _get_recorder(span)
+    try:
+        for item in stream:
+            recorder.record_chunk()
+            if recorder.chunk_count == 1:
+                recorder.record_to_span(span)
+            yield item
+    finally:
+        recorder.record_to_span(span)
+
+
+async def arecord_stream(stream: AsyncIterable[T], span: Span) -> AsyncIterator[T]:
+    """Iterate over an async stream, recording its streaming latencies on the given span.
+
+    See `record_stream` for details.
+
+    :param stream (AsyncIterable[T]): The async stream to iterate over.
+    :param span (Span): The (LLM) span to record the streaming statistics on.
+    :return (AsyncIterator[T]): An async iterator over the stream's items.
+    """
+    if not span.is_recording():
+        async for item in stream:
+            yield item
+        return
+
+    recorder = _get_recorder(span)
+    try:
+        async for item in stream:
+            recorder.record_chunk()
+            if recorder.chunk_count == 1:
+                recorder.record_to_span(span)
+            yield item
+    finally:
+        recorder.record_to_span(span)
+
+
+class TimedStream(ObjectProxy):  # type: ignore[misc]
+    """Stream proxy that records streaming latencies on a span when iterated over.
+
+    Streams can either be iterated over (e.g. `for chunk in stream`), or be advanced one
+    chunk at a time by an outer stream proxy (e.g. `stream.__next__()`). In the latter
+    case, all statistics are recorded once the stream is exhausted or fails.
+
+    All other attribute access is forwarded to the underlying (provider SDK) stream.
+    """
+
+    def __init__(self, stream: Any, span: Span) -> None:
+        """Initialize the timed stream.
+
+        :param stream (Any): The (sync or async) stream to wrap.
+        :param span (Span): The (LLM) span to record the streaming statistics on.
+        """
+        super().__init__(stream)
+        self._self_span = span
+        self._self_recorder: Optional[StreamingLatencyRecorder] = None
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the underlying stream."""
+        return record_stream(self.__wrapped__, self._self_span)
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        """Asynchronously iterate over the underlying stream."""
+        return arecord_stream(self.__wrapped__, self._self_span)
+
+    def __next__(self) -> Any:
+        """Get the next chunk of the underlying stream."""
+        try:
+            chunk = self.__wrapped__.__next__()
+        except BaseException:
+            self._finish()
+            raise
+        self._record_chunk()
+        return chunk
+
+    async def __anext__(self) -> Any:
+        """Asynchronously get the next chunk of the underlying stream."""
+        try:
+            chunk = await self.__wrapped__.__anext__()
+        except BaseException:
+            self._finish()
+            raise
+        self._record_chunk()
+        return chunk
+
+    def __enter__(self) -> Any:
+        """Enter the underlying stream, without letting it escape the proxy."""
+        obj = self.__wrapped__.__enter__()
+        return self if obj is self.__wrapped__ else obj
+
+    async def __aenter__(self) -> Any:
+        """Asynchronously enter the underlying stream, without letting it escape."""
+        obj = await self.__wrapped__.__aenter__()
+        return self if obj is self.__wrapped__ else obj
+
+    def _record_chunk(self) -> None:
+        """Record the arrival of a chunk advanced through the proxy."""
+        if (recorder := self._self_recorder) is None:
+            if not self._self_span.is_recording():
+                return
+            recorder = self._self_recorder = _get_recorder(self._self_span)
+
+        recorder.record_chunk()
+        if recorder.chunk_count == 1:
+            recorder.record_to_span(self._self_span)
+
+    def _finish(self) -> None:
+        """Record the statistics of the chunks advanced through the proxy."""
+        if self._self_recorder is not None:
+            self._self_recorder.record_to_span(self._self_span)
+
+
+def time_stream(stream: Any, span: Span) -> Any:
+    """Wrap a stream so that its streaming latencies get recorded on the given span.
+
+    Wrapping is idempotent: an already timed stream is returned as is.
+
+    :param stream (Any): The (sync or async) stream to wrap.
+    :param span (Span): The (LLM) span to record the streaming statistics on.
+    :return (Any): The timed stream.
+    """
+    if isinstance(stream, TimedStream):
+        return stream
+    return TimedStream(stream, span)
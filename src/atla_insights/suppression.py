@@ -1,10 +1,13 @@
 """Instrumentation suppression functionality."""
 
+import functools
 from contextlib import contextmanager
-from typing import Generator
+from typing import Any, Callable, Generator, Mapping, TypeVar
 
 from atla_insights.context import suppress_instrumentation_var
 
+WrapperT = TypeVar("WrapperT", bound=Callable[..., Any])
+
 
 def is_instrumentation_suppressed() -> bool:
     """Check if Atla Insights instrumentation is currently suppressed.
@@ -27,6 +30,13 @@ def suppress_instrumentation() -> Generator[None, None, None]:
     - Marking functions (mark_success, mark_failure)
     - Metadata and custom metrics functions
 
+    Suppression is scoped to the current context (i.e. thread or async task), so it
+    does not affect any code running concurrently. Instrumentors stay in place: their
+    wrappers check the suppression flag on each call and fall through to the wrapped
+    code. Spans started while suppressed (e.g. by OpenInference instrumentors) are not
+    processed or exported by Atla Insights. Any other OpenTelemetry instrumentation
+    (e.g. of HTTP clients) is not affected.
+
     ```py
     from atla_insights import suppress_instrumentation
 
@@ -38,30 +48,43 @@ def suppress_instrumentation() -> Generator[None, None, None]:
             pass
     ```
     """
-    from atla_insights.main import ATLA_INSTANCE
-
-    suppress_instrumentation_var.set(True)
-
+    suppress_token = suppress_instrumentation_var.set(True)
     try:
-        for instrumentors in ATLA_INSTANCE._active_instrumentors.values():
-            for instrumentor in instrumentors:
-                instrumentor.uninstrument()
-
         yield
-
     finally:
-        enable_instrumentation()
+        suppress_instrumentation_var.reset(suppress_token)
 
 
 def enable_instrumentation() -> None:
-    """Enable Atla Insights instrumentation."""
-    from atla_insights.main import ATLA_INSTANCE
-
+    """Enable Atla Insights instrumentation, within the current context."""
     suppress_instrumentation_var.set(False)
 
-    for instrumentors in ATLA_INSTANCE._active_instrumentors.values():
-        for instrumentor in instrumentors:
-            instrumentor.instrument()
+
+def passthrough_if_suppressed(wrapper: WrapperT) -> WrapperT:
+    """Make an instrumentor's (wrapt-style) method wrapper respect suppression.
+
+    While instrumentation is suppressed, the wrapped function gets called directly.
+    As its result (e.g. a coroutine or async generator) is returned as is, this works
+    for sync, async and (async) generator wrappers alike.
+
+    :param wrapper (WrapperT): The method wrapper, with signature
+        `(self, wrapped, instance, args, kwargs)`.
+    :return (WrapperT): The suppression-aware method wrapper.
+    """
+
+    @functools.wraps(wrapper)
+    def suppression_aware_wrapper(
+        self: Any,
+        wrapped: Callable[..., Any],
+        instance: Any,
+        args: tuple[Any, ...],
+        kwargs: Mapping[str, Any],
+    ) -> Any:
+        if suppress_instrumentation_var.get():
+            return wrapped(*args, **kwargs)
+        return wrapper(self, wrapped, instance, args, kwargs)
+
+    return suppression_aware_wrapper  # type: ignore[return-value]
 
 
 class NoOpContextManager:
@@ -1,8 +1,9 @@
 """Tool instrumentation."""
 
 import inspect
+from contextlib import AbstractContextManager, nullcontext
 from functools import wraps
-from typing import Any, Callable
+from typing import Any, AsyncGenerator, Callable, Generator, Optional
 
 from openinference.instrumentation import safe_json_dumps
 from openinference.semconv.trace import (
@@ -11,31 +12,90 @@ from openinference.semconv.trace import (
     SpanAttributes,
 )
 from opentelemetry import trace as trace_api
+from opentelemetry.util.types import AttributeValue
 
+from atla_insights.capture import ArgumentCapturePlan, RecordingGenerator, YieldedItems
 from atla_insights.main import ATLA_INSTANCE
 from atla_insights.suppression import is_instrumentation_suppressed
 
 
-def _get_invocation_params(func: Callable[..., Any], *args, **kwargs) -> dict[str, Any]:
-    """Get the invocation parameters for a function.
+def _get_tool_attributes(func: Callable[..., Any]) -> dict[str, AttributeValue]:
+    """Get the span attributes of a tool that are the same for every invocation.
 
-    :param func (Callable[..., Any]): The function to get the invocation parameters for.
-    :param args (Any): The positional arguments to bind to the function.
-    :param kwargs (Any): The keyword arguments to bind to the function.
-    :return (dict[str, Any]): The invocation parameters.
+    :param func (Callable[..., Any]): The tool function.
+    :return (dict[str, AttributeValue]): The static tool span attributes.
     """
-    func_parameters = inspect.signature(func).bind(*args, **kwargs)
-    func_parameters.apply_defaults()
-    return {
-        k: v for k, v in func_parameters.arguments.items() if k not in {"self", "cls"}
+    attributes: dict[str, AttributeValue] = {
+        SpanAttributes.OPENINFERENCE_SPAN_KIND: OpenInferenceSpanKindValues.TOOL.value,
+        SpanAttributes.TOOL_NAME: func.__name__,
+        SpanAttributes.INPUT_MIME_TYPE: OpenInferenceMimeTypeValues.JSON.value,
+        SpanAttributes.OUTPUT_MIME_TYPE: OpenInferenceMimeTypeValues.TEXT.value,
     }
+    if func.__doc__:
+        attributes[SpanAttributes.TOOL_DESCRIPTION] = func.__doc__
+    return attributes
+
+
+def _start_tool_span(
+    name: str,
+    tool_attributes: dict[str, AttributeValue],
+    argument_plan: ArgumentCapturePlan,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> AbstractContextManager[trace_api.Span]:
+    """Start a tool span, recording the invocation parameters of the tool.
+
+    :param name (str): The name of the tool.
+    :param tool_attributes (dict[str, AttributeValue]): The static tool span attributes.
+    :param argument_plan (ArgumentCapturePlan): The argument capture plan of the tool.
+    :param args (tuple[Any, ...]): The positional arguments of the invocation.
+    :param kwargs (dict[str, Any]): The keyword arguments of the invocation.
+    :return (AbstractContextManager[trace_api.Span]): The tool span context manager.
+    """
+    invocation_params = argument_plan.bind(args, kwargs)
+    invocation_params_json = safe_json_dumps(invocation_params)
+
+    attributes = dict(tool_attributes)
+    attributes[SpanAttributes.INPUT_VALUE] = invocation_params_json
+    if invocation_params:
+        attributes[SpanAttributes.TOOL_PARAMETERS] = invocation_params_json
+
+    return ATLA_INSTANCE.get_tracer().start_as_current_span(
+        name,
+        attributes=attributes,
+        record_exception=False,
+        set_status_on_exception=False,
+    )
+
+
+def _record_tool_exception(span: trace_api.Span, exception: Exception) -> None:
+    """Record a failed tool invocation on its span.
+
+    :param span (trace_api.Span): The tool span.
+    :param exception (Exception): The exception raised by the tool.
+    """
+    span.set_status(trace_api.Status(trace_api.StatusCode.ERROR, str(exception)))
+    span.record_exception(exception)
+
 
+def _record_tool_result(span: trace_api.Span, result: Any) -> None:
+    """Record a successful tool invocation on its span.
 
-def tool(func: Callable[..., Any]) -> Callable[..., Any]:
+    :param span (trace_api.Span): The tool span.
+    :param result (Any): The output value of the tool.
+    """
+    span.set_status(trace_api.StatusCode.OK)
+    if result is not None:
+        span.set_attribute(SpanAttributes.OUTPUT_VALUE, str(result))
+
+
+def tool(func: Callable[..., Any]) -> Callable[..., Any]:  # noqa: C901
     """Instrument a function-based LLM tool.
 
     This decorator instruments a function-based LLM tool to automatically
-    capture the tool invocation parameters and output value.
+    capture the tool invocation parameters and output value. Sync, async, generator
+    and async generator functions are supported. For generator functions, the output
+    value is the list of (the first few) yielded items.
 
     Args:
         func (Callable[..., Any]): The function to instrument.
@@ -43,48 +103,109 @@ def tool(func: Callable[..., Any]) -> Callable[..., Any]:
     Returns:
         Callable[..., Any]: The wrapped function.
     """
+    # Inspect the tool function once, rather than on every invocation.
+    name = func.__name__
+    tool_attributes = _get_tool_attributes(func)
+    argument_plan = ArgumentCapturePlan(func)
+
+    if inspect.isgeneratorfunction(func):
+
+        @wraps(func)
+        def gen_wrapper(*args, **kwargs) -> Generator[Any, Any, Any]:
+            if is_instrumentation_suppressed():
+                return (yield from func(*args, **kwargs))
+
+            with _start_tool_span(
+                name, tool_attributes, argument_plan, args, kwargs
+            ) as span:
+                yielded_items = YieldedItems()
+                try:
+                    result = yield from RecordingGenerator(
+                        func(*args, **kwargs), yielded_items.append
+                    )
+                except Exception as exception:
+                    _record_tool_exception(span, exception)
+                    raise
+                _record_tool_result(span, yielded_items.get_items())
+
+            return result
+
+        return gen_wrapper
+
+    elif inspect.isasyncgenfunction(func):
+
+        @wraps(func)
+        async def async_gen_wrapper(*args, **kwargs) -> AsyncGenerator[Any, Any]:
+            span_context: AbstractContextManager[Optional[trace_api.Span]]
+            if is_instrumentation_suppressed():
+                span_context = nullcontext()
+            else:
+                span_context = _start_tool_span(
+                    name, tool_attributes, argument_plan, args, kwargs
+                )
+
+            generator = func(*args, **kwargs)
+            with span_context as span:
+                yielded_items = YieldedItems()
+                try:
+                    # Async generators cannot delegate with `yield from`, so forward
+                    # sent values and thrown exceptions to the tool explicitly.
+                    item = await generator.__anext__()
+                    while True:
+                        yielded_items.append(item)
+                        try:
+                            value = yield item
+                        except GeneratorExit:
+                            await generator.aclose()
+                            raise
+                        except BaseException as exception:
+                            item = await generator.athrow(exception)
+                        else:
+                            item = await generator.asend(value)
+                except StopAsyncIteration:
+                    pass
+                except Exception as exception:
+                    if span is not None:
+                        _record_tool_exception(span, exception)
+                    raise
+                if span is not None:
+                    _record_tool_result(span, yielded_items.get_items())
+
+        return async_gen_wrapper
+
+    elif inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs) -> Any:
+            if is_instrumentation_suppressed():
+                return await func(*args, **kwargs)
+
+            with _start_tool_span(
+                name, tool_attributes, argument_plan, args, kwargs
+            ) as span:
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception as exception:
+                    _record_tool_exception(span, exception)
+                    raise
+                _record_tool_result(span, result)
+
+            return result
+
+        return async_wrapper
 
     @wraps(func)
     def wrapper(*args, **kwargs) -> Any:
         if is_instrumentation_suppressed():
             return func(*args, **kwargs)
 
-        with ATLA_INSTANCE.get_tracer().start_as_current_span(
-            func.__name__,
-            attributes={
-                SpanAttributes.OPENINFERENCE_SPAN_KIND: OpenInferenceSpanKindValues.TOOL.value,  # noqa: E501
-                SpanAttributes.TOOL_NAME: func.__name__,
-                SpanAttributes.INPUT_MIME_TYPE: OpenInferenceMimeTypeValues.JSON.value,
-                SpanAttributes.OUTPUT_MIME_TYPE: OpenInferenceMimeTypeValues.TEXT.value,
-            },
-            record_exception=False,
-            set_status_on_exception=False,
-        ) as span:
-            if func.__doc__:
-                span.set_attribute(SpanAttributes.TOOL_DESCRIPTION, func.__doc__)
-
-            # Get & log the invocation parameters of the tool function.
-            invocation_params = _get_invocation_params(func, *args, **kwargs)
-            invocation_params_json = safe_json_dumps(invocation_params)
-
-            span.set_attribute(SpanAttributes.INPUT_VALUE, invocation_params_json)
-            if invocation_params:
-                span.set_attribute(SpanAttributes.TOOL_PARAMETERS, invocation_params_json)
-
-            # Execute the tool function.
+        with _start_tool_span(name, tool_attributes, argument_plan, args, kwargs) as span:
             try:
                 result = func(*args, **kwargs)
             except Exception as exception:
-                span.set_status(
-                    trace_api.Status(trace_api.StatusCode.ERROR, str(exception))
-                )
-                span.record_exception(exception)
+                _record_tool_exception(span, exception)
                 raise
-
-            # Log the result of the tool function.
-            span.set_status(trace_api.StatusCode.OK)
-            if result is not None:
-                span.set_attribute(SpanAttributes.OUTPUT_VALUE, str(result))
+            _record_tool_result(span, result)
 
         return result
 
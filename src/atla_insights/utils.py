@@ -1,6 +1,9 @@
 """Utility functions for Atla Insights."""
 
 import importlib
+import os
+import weakref
+from typing import Any, Callable, TypeVar
 
 import opentelemetry.trace
 from cuid2 import Cuid
@@ -9,6 +12,8 @@ from opentelemetry.trace import ProxyTracerProvider, get_tracer_provider
 
 _cuid_generator = Cuid()
 
+T = TypeVar("T")
+
 
 def truncate_value(value: str, max_chars: int) -> str:
     """Truncate a value to a maximum number of characters.
@@ -42,3 +47,37 @@ def maybe_get_existing_tracer_provider() -> SDKTracerProvider | None:
 def generate_cuid() -> str:
     """Generate a new CUID."""
     return _cuid_generator.generate()
+
+
+def reset_exporter_connections(exporter: Any) -> None:
+    """Drop the pooled connections of an OTLP (HTTP) exporter.
+
+    New connections get opened on the next export. The exporter keeps its session (and
+    hence its headers).
+
+    :param exporter (Any): The exporter to reset the connections of.
+    """
+    if (session := getattr(exporter, "_session", None)) is not None:
+        session.close()
+
+
+def register_at_fork_reinit(obj: T, reinit: Callable[[T], Any]) -> None:
+    """Register a function to reinitialize an object in child processes after a fork.
+
+    Background threads, locks and connections are not safe to use after a fork, so
+    objects relying on them need to recreate them in the child process. The object is
+    only weakly referenced, so registering does not keep it alive.
+
+    :param obj (T): The object to reinitialize.
+    :param reinit (Callable[[T], Any]): The function reinitializing the object.
+    """
+    if not hasattr(os, "register_at_fork"):
+        return
+
+    weak_obj = weakref.ref(obj)
+
+    def _after_in_child() -> None:
+        if (alive_obj := weak_obj()) is not None:
+            reinit(alive_obj)
+
+    os.register_at_fork(after_in_child=_after_in_child)
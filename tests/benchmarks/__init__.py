@@ -0,0 +1 @@
+"""Benchmark the per-call overhead of the instrumentation."""
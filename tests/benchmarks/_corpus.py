@@ -0,0 +1,391 @@
+"""Corpus of realistic LLM request and response bodies for the parser benchmarks."""
+
+import base64
+import json
+from typing import Any, Callable
+
+from atla_insights.parsers.base import BaseParser
+
+CORPUS_CASES = ["short_chat", "agent_history_200", "tools_64", "image_content"]
+
+_MODEL = "some-model"
+_SYSTEM_PROMPT = "You are a helpful assistant. Answer concisely and cite your sources. "
+_IMAGE_BYTES = bytes(range(256)) * 256  # 64KiB
+_IMAGE_B64 = base64.b64encode(_IMAGE_BYTES).decode()
+
+
+def _num_turns(case: str) -> int:
+    return 200 if case == "agent_history_200" else 1
+
+
+def _num_tools(case: str) -> int:
+    if case == "tools_64":
+        return 64
+    if case == "agent_history_200":
+        return 8
+    return 0
+
+
+def _text(idx: int) -> str:
+    return f"Turn {idx}: " + "Some reasonably long piece of conversation text. " * 8
+
+
+def _tool_schema(idx: int) -> dict[str, Any]:
+    return {
+        "type": "object",
+        "properties": {
+            "query": {"type": "string", "description": f"The query for tool {idx}."},
+            "limit": {"type": "integer", "description": "The maximum number of results."},
+            "filters": {
+                "type": "array",
+                "items": {"type": "string", "enum": ["recent", "popular", "verified"]},
+            },
+        },
+        "required": ["query"],
+    }
+
+
+def _tool_arguments(idx: int) -> str:
+    return json.dumps({"query": f"query {idx}", "limit": 10})
+
+
+# OpenAI chat completions.
+
+
+def _openai_request(case: str) -> dict[str, Any]:
+    messages: list[dict[str, Any]] = [{"role": "system", "content": _SYSTEM_PROMPT}]
+    for idx in range(_num_turns(case) - 1):
+        messages.extend(
+            [
+                {"role": "user", "content": _text(idx)},
+                {
+                    "role": "assistant",
+                    "content": None,
+                    "tool_calls": [
+                        {
+                            "id": f"call_{idx}",
+                            "type": "function",
+                            "function": {
+                                "name": f"tool_{idx % 8}",
+                                "arguments": _tool_arguments(idx),
+                            },
+                        }
+                    ],
+                },
+                {"role": "tool", "tool_call_id": f"call_{idx}", "content": _text(idx)},
+            ]
+        )
+
+    if case == "image_content":
+        messages.append(
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": "What is in this image?"},
+                    {
+                        "type": "image_url",
+                        "image_url": {"url": f"data:image/png;base64,{_IMAGE_B64}"},
+                    },
+                ],
+            }
+        )
+    else:
+        messages.append({"role": "user", "content": _text(_num_turns(case))})
+
+    request: dict[str, Any] = {"model": _MODEL, "messages": messages, "temperature": 0.2}
+    if num_tools := _num_tools(case):
+        request["tools"] = [
+            {
+                "type": "function",
+                "function": {
+                    "name": f"tool_{idx}",
+                    "description": f"Tool number {idx}, which looks things up.",
+                    "parameters": _tool_schema(idx),
+                },
+            }
+            for idx in range(num_tools)
+        ]
+    return request
+
+
+def _openai_response(case: str) -> dict[str, Any]:
+    message: dict[str, Any] = {"role": "assistant", "content": None, "refusal": None}
+    if _num_tools(case):
+        message["tool_calls"] = [
+            {
+                "id": f"call_out_{idx}",
+                "type": "function",
+                "function": {"name": f"tool_{idx}", "arguments": _tool_arguments(idx)},
+            }
+            for idx in range(4)
+        ]
+    else:
+        message["content"] = _text(0)
+
+    return {
+        "id": "chatcmpl-abc123",
+        "object": "chat.completion",
+        "created": 1677858242,
+        "model": _MODEL,
+        "choices": [
+            {"index": 0, "message": message, "logprobs": None, "finish_reason": "stop"}
+        ],
+        "usage": {
+            "prompt_tokens": 1000,
+            "completion_tokens": 100,
+            "total_tokens": 1100,
+            "prompt_tokens_details": {"cached_tokens": 800, "audio_tokens": 0},
+            "completion_tokens_details": {"reasoning_tokens": 0, "audio_tokens": 0},
+        },
+    }
+
+
+# Anthropic messages (also used as Bedrock `invoke_model` bodies).
+
+
+def _anthropic_request(case: str) -> dict[str, Any]:
+    messages: list[dict[str, Any]] = []
+    for idx in range(_num_turns(case) - 1):
+        messages.extend(
+            [
+                {"role": "user", "content": _text(idx)},
+                {
+                    "role": "assistant",
+                    "content": [
+                        {
+                            "type": "tool_use",
+                            "id": f"toolu_{idx}",
+                            "name": f"tool_{idx % 8}",
+                            "input": {"query": f"query {idx}", "limit": 10},
+                        }
+                    ],
+                },
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "tool_result",
+                            "tool_use_id": f"toolu_{idx}",
+                            "content": _text(idx),
+                        }
+                    ],
+                },
+            ]
+        )
+
+    if case == "image_content":
+        messages.append(
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": "What is in this image?"},
+                    {
+                        "type": "image",
+                        "source": {
+                            "type": "base64",
+                            "media_type": "image/png",
+                            "data": _IMAGE_B64,
+                        },
+                    },
+                ],
+            }
+        )
+    else:
+        messages.append({"role": "user", "content": _text(_num_turns(case))})
+
+    request: dict[str, Any] = {
+        "model": _MODEL,
+        "max_tokens": 1024,
+        "system": _SYSTEM_PROMPT,
+        "messages": messages,
+    }
+    if num_tools := _num_tools(case):
+        request["tools"] = [
+            {
+                "name": f"tool_{idx}",
+                "description": f"Tool number {idx}, which looks things up.",
+                "input_schema": _tool_schema(idx),
+            }
+            for idx in range(num_tools)
+        ]
+    return request
+
+
+def _anthropic_response(case: str) -> dict[str, Any]:
+    content: list[dict[str, Any]]
+    if _num_tools(case):
+        content = [
+            {
+                "type": "tool_use",
+                "id": f"toolu_out_{idx}",
+                "name": f"tool_{idx}",
+                "input": {"query": f"query {idx}", "limit": 10},
+            }
+            for idx in range(4)
+        ]
+    else:
+        content = [{"type": "text", "text": _text(0)}]
+
+    return {
+        "id": "msg_abc123",
+        "type": "message",
+        "role": "assistant",
+        "model": _MODEL,
+        "content": content,
+        "stop_reason": "tool_use" if _num_tools(case) else "end_turn",
+        "stop_sequence": None,
+        "usage": {"input_tokens": 1000, "output_tokens": 100},
+    }
+
+
+# Bedrock.
+
+
+def _bedrock_converse_request(case: str) -> dict[str, Any]:
+    messages: list[dict[str, Any]] = []
+    for idx in range(_num_turns(case) - 1):
+        messages.extend(
+            [
+                {"role": "user", "content": [{"text": _text(idx)}]},
+                {
+                    "role": "assistant",
+                    "content": [
+                        {
+                            "toolUse": {
+                                "toolUseId": f"tooluse_{idx}",
+                                "name": f"tool_{idx % 8}",
+                                "input": {"query": f"query {idx}", "limit": 10},
+                            }
+                        }
+                    ],
+                },
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "toolResult": {
+                                "toolUseId": f"tooluse_{idx}",
+                                "content": [{"text": _text(idx)}],
+                            }
+                        }
+                    ],
+                },
+            ]
+        )
+
+    if case == "image_content":
+        messages.append(
+            {
+                "role": "user",
+                "content": [
+                    {"text": "What is in this image?"},
+                    {"image": {"format": "png", "source": {"bytes": _IMAGE_BYTES}}},
+                ],
+            }
+        )
+    else:
+        messages.append({"role": "user", "content": [{"text": _text(_num_turns(case))}]})
+
+    request: dict[str, Any] = {
+        "modelId": _MODEL,
+        "system": [{"text": _SYSTEM_PROMPT}],
+        "messages": messages,
+        "inferenceConfig": {"maxTokens": 1024, "temperature": 0.2},
+    }
+    if num_tools := _num_tools(case):
+        request["toolConfig"] = {
+            "tools": [
+                {
+                    "toolSpec": {
+                        "name": f"tool_{idx}",
+                        "description": f"Tool number {idx}, which looks things up.",
+                        "inputSchema": {"json": _tool_schema(idx)},
+                    }
+                }
+                for idx in range(num_tools)
+            ]
+        }
+    return request
+
+
+def _bedrock_converse_response(case: str) -> dict[str, Any]:
+    return {
+        "output": {"message": {"role": "assistant", "content": [{"text": _text(0)}]}},
+        "stopReason": "end_turn",
+        "usage": {"inputTokens": 1000, "outputTokens": 100, "totalTokens": 1100},
+        "metrics": {"latencyMs": 1234},
+    }
+
+
+def _bedrock_invoke_model_request(case: str) -> dict[str, Any]:
+    body = _anthropic_request(case)
+    body.pop("model")
+    body["anthropic_version"] = "bedrock-2023-05-31"
+    return {"modelId": f"anthropic.{_MODEL}", "body": body}
+
+
+def _bedrock_invoke_model_response(case: str) -> dict[str, Any]:
+    return {"body": _anthropic_response(case)}
+
+
+CORPUS: dict[str, tuple[Callable[[str], Any], Callable[[str], Any]]] = {
+    "openai": (_openai_request, _openai_response),
+    "anthropic": (_anthropic_request, _anthropic_response),
+    "bedrock_converse": (_bedrock_converse_request, _bedrock_converse_response),
+    "bedrock_invoke_model": (
+        _bedrock_invoke_model_request,
+        _bedrock_invoke_model_response,
+    ),
+}
+
+
+def get_corpus_bodies(parser_name: str, case: str) -> tuple[Any, Any]:
+    """Get the request and response body of a corpus case.
+
+    :param parser_name (str): The name of the parser (e.g. `bedrock_converse`).
+    :param case (str): The corpus case (e.g. `short_chat`).
+    :return (tuple[Any, Any]): The request and response body.
+    """
+    get_request, get_response = CORPUS[parser_name]
+    return get_request(case), get_response(case)
+
+
+def get_parser(parser_name: str) -> BaseParser:
+    """Get the parser of a corpus format.
+
+    :param parser_name (str): The name of the parser (e.g. `bedrock_converse`).
+    :return (BaseParser): The parser.
+    """
+    match parser_name:
+        case "openai":
+            from atla_insights.parsers.parse_openai import OpenAIChatCompletionParser
+
+            return OpenAIChatCompletionParser()
+        case "anthropic":
+            from atla_insights.parsers.parse_anthropic import AnthropicParser
+
+            return AnthropicParser()
+        case "bedrock_converse":
+            from atla_insights.parsers.parse_bedrock import BedrockParser
+
+            return BedrockParser(api_endpoint="converse")
+        case "bedrock_invoke_model":
+            from atla_insights.parsers.parse_bedrock import BedrockParser
+
+            return BedrockParser(api_endpoint="invoke_model")
+        case _:
+            raise ValueError(f"Unknown parser: {parser_name}")
+
+
+def parse_bodies(parser: BaseParser, request: Any, response: Any) -> dict[str, Any]:
+    """Parse a request and response body into span attributes.
+
+    :param parser (BaseParser): The parser to use.
+    :param request (Any): The request body.
+    :param response (Any): The response body.
+    :return (dict[str, Any]): The span attributes.
+    """
+    return {
+        **dict(parser.parse_request_body(request)),
+        **dict(parser.parse_response_body(response)),
+    }
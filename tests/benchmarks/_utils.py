@@ -0,0 +1,59 @@
+"""Utilities for the benchmarks."""
+
+import tracemalloc
+from typing import Any, AsyncIterator, Callable, Coroutine
+
+
+def run_coroutine(coroutine: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine that never suspends to completion, without an event loop.
+
+    This keeps event loop scheduling overhead out of the measurements.
+
+    :param coroutine (Coroutine[Any, Any, Any]): The coroutine to run.
+    :return (Any): The return value of the coroutine.
+    """
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    raise RuntimeError("Benchmarked coroutines must not suspend.")
+
+
+def consume_async_iterator(async_iterator: AsyncIterator[Any]) -> list[Any]:
+    """Consume an async iterator that never suspends, without an event loop.
+
+    :param async_iterator (AsyncIterator[Any]): The async iterator to consume.
+    :return (list[Any]): The items of the async iterator.
+    """
+
+    async def _consume() -> list[Any]:
+        return [item async for item in async_iterator]
+
+    return run_coroutine(_consume())
+
+
+def measure_peak_memory(func: Callable[[], Any], repeat: int = 5) -> int:
+    """Measure the peak memory allocated by a function call, using `tracemalloc`.
+
+    The function is called once beforehand, so that one-off allocations (e.g. caches
+    and lazy imports) are not measured.
+
+    :param func (Callable[[], Any]): The function to measure.
+    :param repeat (int): The number of measured calls. Defaults to 5.
+    :return (int): The lowest peak memory (in bytes) allocated by any measured call.
+    """
+    func()
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(repeat):
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - baseline)
+    finally:
+        tracemalloc.stop()
+
+    return min(peaks)
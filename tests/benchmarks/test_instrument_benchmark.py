@@ -0,0 +1,131 @@
+"""Benchmark the per-call overhead of the instrument decorator."""
+
+from typing import Any, AsyncIterator, Callable, Iterator
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from tests._otel import BaseLocalOtel
+from tests.benchmarks._utils import consume_async_iterator, run_coroutine
+
+
+def _sync_function() -> int:
+    return 1
+
+
+async def _async_function() -> int:
+    return 1
+
+
+def _generator_function() -> Iterator[int]:
+    yield 1
+
+
+async def _async_generator_function() -> AsyncIterator[int]:
+    yield 1
+
+
+def _call_sync(func: Callable[[], Any]) -> Any:
+    return func()
+
+
+def _call_async(func: Callable[[], Any]) -> Any:
+    return run_coroutine(func())
+
+
+def _call_generator(func: Callable[[], Any]) -> Any:
+    return list(func())
+
+
+def _call_async_generator(func: Callable[[], Any]) -> Any:
+    return consume_async_iterator(func())
+
+
+_FUNCTION_TYPES = [
+    pytest.param(_sync_function, _call_sync, id="sync"),
+    pytest.param(_async_function, _call_async, id="async"),
+    pytest.param(_generator_function, _call_generator, id="generator"),
+    pytest.param(_async_generator_function, _call_async_generator, id="async-generator"),
+]
+
+
+class TestInstrumentBenchmark(BaseLocalOtel):
+    """Benchmark the per-call overhead of the instrument decorator."""
+
+    @pytest.mark.benchmark(group="instrument-baseline")
+    @pytest.mark.parametrize("func, call", _FUNCTION_TYPES)
+    def test_baseline(
+        self,
+        benchmark: BenchmarkFixture,
+        func: Callable[[], Any],
+        call: Callable[[Callable[[], Any]], Any],
+    ) -> None:
+        """Benchmark calling an uninstrumented function."""
+        benchmark(call, func)
+
+    @pytest.mark.benchmark(group="instrument-recording")
+    @pytest.mark.parametrize("func, call", _FUNCTION_TYPES)
+    def test_recording(
+        self,
+        benchmark: BenchmarkFixture,
+        func: Callable[[], Any],
+        call: Callable[[Callable[[], Any]], Any],
+    ) -> None:
+        """Benchmark calling an instrumented function that records a span."""
+        from atla_insights import instrument
+
+        benchmark(call, instrument("benchmark")(func))
+
+        assert len(self.get_finished_spans()) > 0
+
+    @pytest.mark.benchmark(group="instrument-suppressed")
+    @pytest.mark.parametrize("func, call", _FUNCTION_TYPES)
+    def test_suppressed(
+        self,
+        benchmark: BenchmarkFixture,
+        func: Callable[[], Any],
+        call: Callable[[Callable[[], Any]], Any],
+    ) -> None:
+        """Benchmark calling an instrumented function with suppressed instrumentation."""
+        from atla_insights import instrument, suppress_instrumentation
+
+        instrumented_func = instrument("benchmark")(func)
+        with suppress_instrumentation():
+            benchmark(call, instrumented_func)
+
+        assert len(self.get_finished_spans()) == 0
+
+    @pytest.mark.benchmark(group="instrument-unsampled")
+    @pytest.mark.parametrize("func, call", _FUNCTION_TYPES)
+    def test_unsampled(
+        self,
+        benchmark: BenchmarkFixture,
+        func: Callable[[], Any],
+        call: Callable[[Callable[[], Any]], Any],
+    ) -> None:
+        """Benchmark calling an instrumented function within an unsampled trace."""
+        from opentelemetry.trace import (
+            NonRecordingSpan,
+            SpanContext,
+            TraceFlags,
+            use_span,
+        )
+
+        from atla_insights import instrument
+
+        instrumented_func = instrument("benchmark")(func)
+        unsampled_parent = NonRecordingSpan(
+            SpanContext(
+                trace_id=1,
+                span_id=1,
+                is_remote=False,
+                trace_flags=TraceFlags(TraceFlags.DEFAULT),
+            )
+        )
+        with use_span(unsampled_parent):
+            benchmark(call, instrumented_func)
+
+        assert len(self.get_finished_spans()) == 0
@@ -0,0 +1,93 @@
+"""Benchmark the LLM parsers.
+
+Per-parse latency regressions can be checked against a saved run, e.g.:
+
+    pytest tests/benchmarks --benchmark-autosave
+    pytest tests/benchmarks --benchmark-compare --benchmark-compare-fail=min:20%
+
+CI runs this check on pull requests, against a run of the base branch.
+
+Peak memory regressions are checked in `test_parsers_memory.py`.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from tests.benchmarks._corpus import (
+    CORPUS,
+    CORPUS_CASES,
+    get_corpus_bodies,
+    get_parser,
+    parse_bodies,
+)
+from tests.benchmarks._utils import measure_peak_memory
+
+with open(Path(__file__).parents[1] / "test_data" / "mock_responses.json", "r") as f:
+    _MOCK_RESPONSES = json.load(f)
+
+_FIXTURES = ["openai_chat_completions", "openai_chat_completions_tool_calls"]
+
+
+class TestOpenAIParserBenchmark:
+    """Benchmark the OpenAI chat completion parser on recorded responses."""
+
+    @pytest.mark.benchmark(group="openai-parser")
+    @pytest.mark.parametrize("fixture", _FIXTURES)
+    def test_parse_response_body(self, benchmark: BenchmarkFixture, fixture: str) -> None:
+        """Benchmark parsing a response body."""
+        from atla_insights.parsers.parse_openai import OpenAIChatCompletionParser
+
+        parser = OpenAIChatCompletionParser()
+        response = _MOCK_RESPONSES[fixture]
+
+        benchmark(lambda: dict(parser.parse_response_body(response)))
+
+    @pytest.mark.benchmark(group="openai-parser")
+    @pytest.mark.parametrize("fixture", _FIXTURES)
+    def test_validate_response_body(
+        self, benchmark: BenchmarkFixture, fixture: str
+    ) -> None:
+        """Benchmark validating a response body (the parser's fallback path)."""
+        import openai
+        from openai.types.chat import ChatCompletion
+        from openinference.instrumentation.openai._response_attributes_extractor import (
+            _ResponseAttributesExtractor,
+        )
+
+        extractor = _ResponseAttributesExtractor(openai)
+        response = _MOCK_RESPONSES[fixture]
+
+        benchmark(
+            lambda: dict(
+                extractor.get_attributes_from_response(
+                    response=ChatCompletion.model_validate(response),
+                    request_parameters={},
+                )
+            )
+        )
+
+
+class TestParserCorpusBenchmark:
+    """Benchmark the parsers on a corpus of request and response bodies."""
+
+    @pytest.mark.benchmark(group="parser-corpus")
+    @pytest.mark.parametrize("case", CORPUS_CASES)
+    @pytest.mark.parametrize("parser_name", list(CORPUS))
+    def test_parse(
+        self, benchmark: BenchmarkFixture, parser_name: str, case: str
+    ) -> None:
+        """Benchmark parsing a request and response body."""
+        parser = get_parser(parser_name)
+        request, response = get_corpus_bodies(parser_name, case)
+
+        def _parse() -> None:
+            parse_bodies(parser, request, response)
+
+        benchmark.extra_info["peak_memory_bytes"] = measure_peak_memory(_parse)
+        benchmark(_parse)
@@ -0,0 +1,71 @@
+"""Check the LLM parsers for peak memory regressions.
+
+The peak memory (as traced by `tracemalloc`) of parsing each corpus case is compared
+against `parser_memory_baseline.json`. A test fails if it exceeds the baseline by more
+than `ATLA_BENCHMARK_MAX_REGRESSION` (a fraction, defaults to 0.25), plus a small
+fixed allowance for interpreter differences.
+
+Set `ATLA_BENCHMARK_UPDATE_BASELINE=1` to record a new baseline instead.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from tests.benchmarks._corpus import (
+    CORPUS,
+    CORPUS_CASES,
+    get_corpus_bodies,
+    get_parser,
+    parse_bodies,
+)
+from tests.benchmarks._utils import measure_peak_memory
+
+_BASELINE_PATH = Path(__file__).parent / "parser_memory_baseline.json"
+_MAX_REGRESSION = float(os.environ.get("ATLA_BENCHMARK_MAX_REGRESSION", "0.25"))
+_ALLOWANCE_BYTES = 2048
+_UPDATE_BASELINE = os.environ.get("ATLA_BENCHMARK_UPDATE_BASELINE") == "1"
+
+
+@pytest.fixture(scope="module")
+def baseline() -> Iterator[dict[str, int]]:
+    """The peak memory baseline, by corpus case. Written back if it is being updated."""
+    with open(_BASELINE_PATH, "r") as f:
+        baseline: dict[str, int] = json.load(f)
+
+    yield baseline
+
+    if _UPDATE_BASELINE:
+        with open(_BASELINE_PATH, "w") as f:
+            json.dump(dict(sorted(baseline.items())), f, indent=4)
+            f.write("\n")
+
+
+class TestParsersMemory:
+    """Check the LLM parsers for peak memory regressions."""
+
+    @pytest.mark.parametrize("case", CORPUS_CASES)
+    @pytest.mark.parametrize("parser_name", list(CORPUS))
+    def test_peak_memory(
+        self, baseline: dict[str, int], parser_name: str, case: str
+    ) -> None:
+        """Test that parsing a corpus case does not regress in peak memory."""
+        parser = get_parser(parser_name)
+        request, response = get_corpus_bodies(parser_name, case)
+
+        peak_memory = measure_peak_memory(lambda: parse_bodies(parser, request, response))
+
+        key = f"{parser_name}.{case}"
+        if _UPDATE_BASELINE:
+            baseline[key] = peak_memory
+            return
+
+        assert key in baseline, f"No baseline for {key}."
+        max_peak_memory = baseline[key] * (1 + _MAX_REGRESSION) + _ALLOWANCE_BYTES
+        assert peak_memory <= max_peak_memory, (
+            f"Peak memory of {key} regressed: {peak_memory} bytes "
+            f"(baseline: {baseline[key]} bytes)."
+        )
@@ -0,0 +1,58 @@
+"""Benchmark the serialization of LLM request and response payloads."""
+
+import json
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+_REQUEST: dict[str, Any] = {
+    "model": "some-model",
+    "temperature": 0.7,
+    "messages": [
+        {"role": "system", "content": "You are a helpful assistant. " * 20},
+        *(
+            {"role": role, "content": f"Message {idx}. " * 50}
+            for idx, role in enumerate(["user", "assistant"] * 10)
+        ),
+    ],
+    "tools": [
+        {
+            "type": "function",
+            "function": {
+                "name": f"tool_{idx}",
+                "description": "Some tool. " * 10,
+                "parameters": {
+                    "type": "object",
+                    "properties": {"arg": {"type": "string"}},
+                    "required": ["arg"],
+                },
+            },
+        }
+        for idx in range(10)
+    ],
+}
+
+
+class TestSerializationBenchmark:
+    """Benchmark the serialization of LLM request and response payloads."""
+
+    @pytest.mark.benchmark(group="serialization")
+    def test_repr(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark the Python repr of a payload (not valid JSON)."""
+        benchmark(str, _REQUEST)
+
+    @pytest.mark.benchmark(group="serialization")
+    def test_stdlib(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark serializing a payload with the standard library."""
+        benchmark(json.dumps, _REQUEST)
+
+    @pytest.mark.benchmark(group="serialization")
+    def test_json_dumps(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark serializing a payload with the shared serializer."""
+        from atla_insights.serialization import json_dumps
+
+        benchmark(json_dumps, _REQUEST)
@@ -0,0 +1,111 @@
+"""Benchmark the per-call overhead of the tool decorator."""
+
+import inspect
+from typing import Any, AsyncIterator, Callable, Iterator
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from tests._otel import BaseLocalOtel
+from tests.benchmarks._utils import consume_async_iterator, run_coroutine
+
+
+def _sync_tool(query: str, limit: int = 10, *, verbose: bool = False) -> str:
+    """Sync tool."""
+    return query
+
+
+async def _async_tool(query: str, limit: int = 10, *, verbose: bool = False) -> str:
+    """Async tool."""
+    return query
+
+
+def _generator_tool(
+    query: str, limit: int = 10, *, verbose: bool = False
+) -> Iterator[str]:
+    """Generator tool."""
+    yield query
+
+
+async def _async_generator_tool(
+    query: str, limit: int = 10, *, verbose: bool = False
+) -> AsyncIterator[str]:
+    """Async generator tool."""
+    yield query
+
+
+def _call_sync(func: Callable[..., Any]) -> Any:
+    return func("some-query", verbose=True)
+
+
+def _call_async(func: Callable[..., Any]) -> Any:
+    return run_coroutine(func("some-query", verbose=True))
+
+
+def _call_generator(func: Callable[..., Any]) -> Any:
+    return list(func("some-query", verbose=True))
+
+
+def _call_async_generator(func: Callable[..., Any]) -> Any:
+    return consume_async_iterator(func("some-query", verbose=True))
+
+
+_TOOL_TYPES = [
+    pytest.param(_sync_tool, _call_sync, id="sync"),
+    pytest.param(_async_tool, _call_async, id="async"),
+    pytest.param(_generator_tool, _call_generator, id="generator"),
+    pytest.param(_async_generator_tool, _call_async_generator, id="async-generator"),
+]
+
+
+class TestToolBenchmark(BaseLocalOtel):
+    """Benchmark the per-call overhead of the tool decorator."""
+
+    @pytest.mark.benchmark(group="tool-baseline")
+    @pytest.mark.parametrize("func, call", _TOOL_TYPES)
+    def test_baseline(
+        self,
+        benchmark: BenchmarkFixture,
+        func: Callable[..., Any],
+        call: Callable[[Callable[..., Any]], Any],
+    ) -> None:
+        """Benchmark calling an uninstrumented tool."""
+        benchmark(call, func)
+
+    @pytest.mark.benchmark(group="tool-recording")
+    @pytest.mark.parametrize("func, call", _TOOL_TYPES)
+    def test_recording(
+        self,
+        benchmark: BenchmarkFixture,
+        func: Callable[..., Any],
+        call: Callable[[Callable[..., Any]], Any],
+    ) -> None:
+        """Benchmark calling an instrumented tool that records a span."""
+        from atla_insights import tool
+
+        benchmark(call, tool(func))
+
+        assert len(self.get_finished_spans()) > 0
+
+    @pytest.mark.benchmark(group="tool-binding")
+    def test_binding_signature(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark binding tool arguments by inspecting the signature on each call."""
+
+        def bind() -> dict[str, Any]:
+            bound = inspect.signature(_sync_tool).bind("some-query", verbose=True)
+            bound.apply_defaults()
+            return bound.arguments
+
+        benchmark(bind)
+
+    @pytest.mark.benchmark(group="tool-binding")
+    def test_binding_plan(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark binding tool arguments with a precomputed argument capture plan."""
+        from atla_insights.capture import ArgumentCapturePlan
+
+        plan = ArgumentCapturePlan(_sync_tool)
+
+        benchmark(plan.bind, ("some-query",), {"verbose": True})
@@ -358,6 +358,10 @@ def mock_async_elevenlabs_client() -> Generator[AsyncElevenLabs, None, None]:
             "atla_insights.llm_providers.elevenlabs._has_elevenlabs_api_key",
             return_value=True,
         ),
+        patch(
+            "atla_insights.llm_providers.elevenlabs._ahas_elevenlabs_api_key",
+            new=AsyncMock(return_value=True),
+        ),
     ):
         yield AsyncElevenLabs(api_key="unit-test")
 
@@ -0,0 +1,129 @@
+"""Unit tests for the BAML instrumentation."""
+
+import asyncio
+from contextvars import copy_context
+from typing import Any
+from unittest.mock import patch
+
+from tests._otel import BaseLocalOtel
+
+
+class _FakeCallManager:
+    """Fake BAML call manager, recording its state rewrites."""
+
+    def __init__(self) -> None:
+        self.state: dict[str, Any] = {"baml_options": {}}
+        self.num_setstate_calls = 0
+
+    def __getstate__(self) -> dict[str, Any]:
+        return self.state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.state = state
+        self.num_setstate_calls += 1
+
+
+class TestBamlCollectors(BaseLocalOtel):
+    """Test the collectors of the BAML instrumentation."""
+
+    def test_collector_reused(self) -> None:
+        """Test that the collector is reused, without rewriting the state."""
+        from atla_insights.frameworks.instrumentors.baml import _set_up_collector
+
+        def _run() -> None:
+            call_manager = _FakeCallManager()
+
+            collector = _set_up_collector(call_manager)
+            assert call_manager.state["baml_options"]["collector"] == [collector]
+            assert call_manager.num_setstate_calls == 1
+
+            assert _set_up_collector(call_manager) is collector
+            assert call_manager.num_setstate_calls == 1
+
+        copy_context().run(_run)
+
+    def test_collector_per_task(self) -> None:
+        """Test that concurrent tasks don't share a collector."""
+        from atla_insights.frameworks.instrumentors.baml import _get_atla_collector
+
+        async def _get_collector() -> Any:
+            await asyncio.sleep(0)
+            return _get_atla_collector()
+
+        async def _run() -> None:
+            collector = _get_atla_collector()
+            collectors = await asyncio.gather(_get_collector(), _get_collector())
+
+            assert len({id(c) for c in [collector, *collectors]}) == 3
+            assert _get_atla_collector() is collector
+
+        asyncio.run(_run())
+
+    def test_collector_not_reused_during_stream(self) -> None:
+        """Test that calls made while consuming a stream don't reuse its collector."""
+        from atla_insights.frameworks.instrumentors.baml import AtlaBamlInstrumentor
+
+        instrumentor = AtlaBamlInstrumentor(
+            llm_provider="openai", include_functions="all", exclude_functions=None
+        )
+
+        class _FakeStream:
+            def __iter__(self) -> Any:
+                yield "partial"
+
+            def get_final_response(self) -> str:
+                return "final"
+
+        def _run() -> Any:
+            stream = instrumentor._create_stream_wrapper(
+                lambda: _FakeStream(), _FakeCallManager(), (), {}
+            )
+            for _ in instrumentor._sync_stream_wrapper(stream.__iter__, stream, (), {}):
+                instrumentor._call_function_sync_wrapper(
+                    lambda: "result", _FakeCallManager(), (), {}
+                )
+            instrumentor._sync_stream_final_response_wrapper(
+                stream.get_final_response, stream, (), {}
+            )
+            instrumentor._call_function_sync_wrapper(
+                lambda: "result", _FakeCallManager(), (), {}
+            )
+            return stream._atla_collector
+
+        with patch.object(instrumentor, "_record_selected_call") as mock_record:
+            stream_collector = copy_context().run(_run)
+
+        [call_collector, iter_collector, final_collector, next_call_collector] = [
+            call.args[1] for call in mock_record.call_args_list
+        ]
+        assert call_collector is not stream_collector
+        assert iter_collector is final_collector is stream_collector
+        assert next_call_collector is call_collector
+
+    def test_unsampled_call_not_parsed(self) -> None:
+        """Test that LLM calls of recorded, but unsampled spans are not parsed."""
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.sampling import ALWAYS_OFF
+
+        from atla_insights.frameworks.instrumentors.baml import AtlaBamlInstrumentor
+        from atla_insights.sampling import _RecordUnsampledSampler
+
+        instrumentor = AtlaBamlInstrumentor(
+            llm_provider="openai", include_functions="all", exclude_functions=None
+        )
+        tracer = TracerProvider(sampler=_RecordUnsampledSampler(ALWAYS_OFF)).get_tracer(
+            __name__
+        )
+
+        class _FakeCollector:
+            @property
+            def last(self) -> Any:
+                raise AssertionError("The LLM call must not be parsed.")
+
+        with tracer.start_as_current_span("llm") as span:
+            assert span.is_recording()
+            instrumentor._record_selected_call(
+                span,
+                _FakeCollector(),  # type: ignore[arg-type]
+                record_response=True,
+            )
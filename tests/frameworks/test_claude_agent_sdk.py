@@ -1,6 +1,10 @@
 """Test the Claude Agent SDK instrumentation."""
 
 import asyncio
+import itertools
+import json
+from typing import Any, AsyncIterator, Generator
+from unittest.mock import MagicMock, patch
 
 import pytest
 from claude_agent_sdk import ClaudeAgentOptions, query
@@ -8,6 +12,33 @@ from claude_agent_sdk import ClaudeAgentOptions, query
 from tests._otel import BaseLocalOtel
 
 
+def _get_output_messages(
+    messages: list[dict[str, Any]], num_inputs: int
+) -> Generator[tuple[str, Any], None, None]:
+    """Get the attributes of a full transcript of received messages."""
+    from atla_insights.frameworks.instrumentors.claude_agent_sdk import (
+        _get_output_message,
+    )
+
+    if not messages:
+        return
+
+    last_assistant_idx = None
+    for i, msg in enumerate(messages):
+        if msg.get("type") == "assistant":
+            last_assistant_idx = i
+
+    if last_assistant_idx is not None:
+        yield from _get_output_message(messages[last_assistant_idx], 0, as_input=False)
+        messages = messages[:last_assistant_idx]
+
+    if messages[0].get("type") == "system":
+        num_inputs -= 1
+
+    for message_idx, message in enumerate(messages, start=num_inputs):
+        yield from _get_output_message(message, message_idx, as_input=True)
+
+
 class TestClaudeAgentSdkInstrumentation(BaseLocalOtel):
     """Test the Claude Agent SDK instrumentation."""
 
@@ -45,31 +76,83 @@ class TestClaudeAgentSdkInstrumentation(BaseLocalOtel):
 
         assert llm_call.name == "Claude Agent SDK Response"
 
+    @pytest.mark.asyncio
+    async def test_record_turns(self) -> None:
+        """Test that turns are recorded as child spans."""
+        from atla_insights import instrument_claude_agent_sdk
+
+        with instrument_claude_agent_sdk(record_turns=True):
+            async for _ in query(prompt="foo", options=ClaudeAgentOptions()):
+                pass
+
+        llm_call, turn = self.get_finished_spans()
+
+        assert turn.name == "Claude Agent SDK Turn"
+        assert turn.parent is not None
+        assert llm_call.context is not None
+        assert turn.parent.span_id == llm_call.context.span_id
+        assert turn.attributes is not None
+        assert turn.attributes["output.value"] == (
+            '{"role":"assistant","model":"some-model",'
+            '"content":[{"type":"text","text":"bar"}]}'
+        )
+
+    @pytest.mark.asyncio
+    async def test_streamed_prompt(self) -> None:
+        """Test that a streamed prompt is passed on to the SDK and recorded."""
+        from claude_agent_sdk._internal.query import Query
+
+        from atla_insights import instrument_claude_agent_sdk
+
+        async def prompt() -> AsyncIterator[dict[str, Any]]:
+            for text in ["foo", "baz"]:
+                yield {"type": "user", "message": {"role": "user", "content": text}}
+
+        sent_messages: list[dict[str, Any]] = []
+
+        async def stream_input(query: Query) -> None:
+            async for message in query.transport._prompt:  # type: ignore[attr-defined]
+                sent_messages.append(message)
+
+        with (
+            patch.object(Query, "start", stream_input),
+            instrument_claude_agent_sdk(),
+        ):
+            async for _ in query(prompt=prompt(), options=ClaudeAgentOptions()):
+                pass
+
+        assert [message["message"]["content"] for message in sent_messages] == [
+            "foo",
+            "baz",
+        ]
+
+        [llm_call] = self.get_finished_spans()
+
+        assert llm_call.attributes is not None
+        input_value = json.loads(str(llm_call.attributes["input.value"]))
+        assert input_value[:-1] == sent_messages
+        assert llm_call.attributes["llm.input_messages.0.message.content"] == "foo"
+        assert llm_call.attributes["llm.input_messages.1.message.content"] == "baz"
+
     def test_tool_result_in_input_is_marked_as_tool(self) -> None:
         """Ensure input messages with tool_result are labeled as role 'tool'."""
         from atla_insights.frameworks.instrumentors.claude_agent_sdk import (
-            _get_input_messages,
+            _get_input_message,
         )
 
-        messages = [
-            {
-                "role": "user",
-                "content": [
-                    {"type": "tool_result", "content": "some tool output"},
-                ],
-            }
-        ]
+        message = {
+            "role": "user",
+            "content": [
+                {"type": "tool_result", "content": "some tool output"},
+            ],
+        }
 
-        attrs = dict(_get_input_messages(messages, options={}))
+        attrs = dict(_get_input_message(message, 0))
 
         assert attrs.get("llm.input_messages.0.message.role") == "tool"
 
     def test_tool_result_in_output_is_converted_to_tool_input(self) -> None:
         """Ensure prior tool_result message is recorded as tool role in inputs."""
-        from atla_insights.frameworks.instrumentors.claude_agent_sdk import (
-            _get_output_messages,
-        )
-
         messages = [
             {
                 "type": "user",
@@ -137,7 +220,7 @@ class TestClaudeAgentSdkInstrumentation(BaseLocalOtel):
             attrs.get(
                 "llm.output_messages.0.message.tool_calls.0.tool_call.function.arguments"
             )
-            == '{"command": "ls -la"}'
+            == '{"command":"ls -la"}'
         )
 
     def test_thinking_blocks_extraction(self) -> None:
@@ -183,3 +266,144 @@ class TestClaudeAgentSdkInstrumentation(BaseLocalOtel):
 
         mcp_tool_schema = attrs.get("llm.tools.3.tool.json_schema")
         assert "mcp__custom_tool" in mcp_tool_schema  # type: ignore[operator]
+
+    def test_message_recorder(self) -> None:
+        """Test that messages recorded incrementally match the full transcript."""
+        from atla_insights.frameworks.instrumentors.claude_agent_sdk import (
+            _MessageRecorder,
+        )
+
+        def _message(type_: str, role: str, text: str) -> dict[str, Any]:
+            return {
+                "type": type_,
+                "message": {"role": role, "content": [{"type": "text", "text": text}]},
+            }
+
+        messages = [
+            {"type": "system", "subtype": "init"},
+            _message("assistant", "assistant", "first"),
+            {
+                "type": "user",
+                "message": {
+                    "role": "user",
+                    "content": [{"type": "tool_result", "content": "tool output"}],
+                },
+            },
+            _message("assistant", "assistant", "second"),
+            _message("user", "user", "follow-up"),
+            _message("assistant", "assistant", "third"),
+            {"type": "result", "subtype": "success"},
+        ]
+
+        recorded_attributes: dict[str, Any] = {}
+        span = MagicMock()
+        span.set_attributes.side_effect = recorded_attributes.update
+
+        recorder = _MessageRecorder(
+            MagicMock(),
+            span,
+            next_message_idx=itertools.count(2).__next__,
+            record_turns=False,
+        )
+        for message in messages:
+            recorder.add(message)
+
+        assert recorded_attributes == dict(_get_output_messages(messages, num_inputs=2))
+        assert len(recorder._pending) == 2
+
+    def test_prompt_recorder_input_value(self) -> None:
+        """Test that the input value is only serialized when the span starts and ends."""
+        from atla_insights.frameworks.instrumentors.claude_agent_sdk import (
+            _PromptRecorder,
+        )
+
+        recorded_attributes: dict[str, Any] = {}
+        span = MagicMock()
+        span.set_attributes.side_effect = recorded_attributes.update
+        span.set_attribute.side_effect = recorded_attributes.__setitem__
+
+        prompt_recorder = _PromptRecorder({})
+        prompt_recorder.add({"role": "user", "content": "q0"})
+        span.set_attributes(prompt_recorder.get_attributes())
+        prompt_recorder.span = span
+
+        for idx in range(1, 50):
+            prompt_recorder.add({"role": "user", "content": f"q{idx}"})
+            assert json.loads(recorded_attributes["input.value"]) == [
+                {"role": "user", "content": "q0"},
+                {},
+            ]
+        assert recorded_attributes["llm.input_messages.49.message.content"] == "q49"
+
+        prompt_recorder.detach()
+
+        # Only the first few messages are kept for the input value.
+        input_value = json.loads(recorded_attributes["input.value"])
+        assert input_value[0] == {"role": "user", "content": "q0"}
+        assert input_value[-2:] == ["... 19 more items", {}]
+        assert prompt_recorder.span is None
+
+    def test_message_recorder_interleaved_prompt(self) -> None:
+        """Test that streamed prompt messages do not overwrite received messages."""
+        from atla_insights.frameworks.instrumentors.claude_agent_sdk import (
+            _MessageRecorder,
+            _PromptRecorder,
+        )
+
+        def _message(type_: str, role: str, text: str) -> dict[str, Any]:
+            return {"type": type_, "message": {"role": role, "content": text}}
+
+        recorded_attributes: dict[str, Any] = {}
+        span = MagicMock()
+        span.set_attributes.side_effect = recorded_attributes.update
+
+        prompt_recorder = _PromptRecorder({"system_prompt": "be helpful"})
+        prompt_recorder.add(_message("user", "user", "q1"))
+        span.set_attributes(prompt_recorder.get_attributes())
+        prompt_recorder.span = span
+
+        message_recorder = _MessageRecorder(
+            MagicMock(),
+            span,
+            next_message_idx=prompt_recorder.next_message_idx,
+            record_turns=False,
+        )
+        message_recorder.add(
+            {
+                "type": "assistant",
+                "message": {
+                    "role": "assistant",
+                    "content": [{"type": "text", "text": "a1"}],
+                },
+            }
+        )
+        message_recorder.add({"type": "result", "subtype": "success"})
+        prompt_recorder.add(_message("user", "user", "q2"))
+        message_recorder.add(
+            {
+                "type": "assistant",
+                "message": {
+                    "role": "assistant",
+                    "content": [{"type": "text", "text": "a2"}],
+                },
+            }
+        )
+        message_recorder.add({"type": "result", "subtype": "success"})
+
+        messages = {
+            key: value
+            for key, value in recorded_attributes.items()
+            if key.startswith(("llm.input_messages.", "llm.output_messages."))
+        }
+        assert messages == {
+            "llm.input_messages.0.message.role": "system",
+            "llm.input_messages.0.message.content": "be helpful",
+            "llm.input_messages.1.message.role": "user",
+            "llm.input_messages.1.message.content": "q1",
+            "llm.input_messages.2.message.role": "assistant",
+            "llm.input_messages.2.message.content": "a1",
+            "llm.input_messages.4.message.role": "user",
+            "llm.input_messages.4.message.content": "q2",
+            "llm.output_messages.0.message.role": "assistant",
+            "llm.output_messages.0.message.content": "a2",
+        }
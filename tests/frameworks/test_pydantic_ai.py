@@ -360,3 +360,28 @@ class TestPydanticAIInstrumentation(BaseLocalOtel):
         finished_spans = self.get_finished_spans()
 
         assert len(finished_spans) == 2
+
+    def test_suppressed(self, mock_async_openai_client: AsyncOpenAI) -> None:
+        """Test that suppression applies to Pydantic AI instrumentation."""
+        from atla_insights import instrument_pydantic_ai, suppress_instrumentation
+
+        mock_model_name = "mock-model"
+
+        agent = Agent(
+            model=OpenAIChatModel(
+                model_name=mock_model_name,
+                provider=OpenAIProvider(openai_client=mock_async_openai_client),
+            ),
+            system_prompt="You are a helpful assistant.",
+        )
+
+        with instrument_pydantic_ai():
+            with suppress_instrumentation():
+                # This call should not get picked up
+                agent.run_sync("Hello world!")
+
+            agent.run_sync("Hello world!")
+
+        finished_spans = self.get_finished_spans()
+
+        assert len(finished_spans) == 2
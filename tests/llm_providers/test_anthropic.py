@@ -182,6 +182,9 @@ class TestAnthropicInstrumentation(BaseLocalOtel):
         assert (
             span.attributes.get("llm.input_messages.0.message.content") == "Hello, Claude"
         )
+        chunk_count = span.attributes.get("atla.streaming.chunk_count")
+        assert isinstance(chunk_count, int) and chunk_count > 0
+        assert "atla.streaming.time_to_first_token_ms" in span.attributes
 
     def test_context_manager(self, mock_anthropic_client: Anthropic) -> None:
         """Test that instrumentation only applies within context."""
@@ -1,8 +1,10 @@
 """Test ElevenLabs instrumentation."""
 
 import asyncio
+import gc
 import time
-from typing import Awaitable, Callable
+from typing import Awaitable, Callable, Generator
+from unittest.mock import MagicMock, patch
 
 import pytest
 from elevenlabs import AsyncElevenLabs, ElevenLabs
@@ -12,6 +14,8 @@ from elevenlabs.conversational_ai.conversation import (
     AudioInterface,
     Conversation,
 )
+from opentelemetry.trace import StatusCode
+from pytest_httpserver import HTTPServer
 
 from tests._otel import BaseLocalOtel
 
@@ -118,6 +122,20 @@ class TestElevenLabsInstrumentation(BaseLocalOtel):
         assert span.attributes is not None
         assert span.attributes.get("atla.audio.conversation_id") == "unit-test"
 
+    @pytest.mark.asyncio
+    async def test_ainstrument(self, mock_async_conversation: AsyncConversation) -> None:
+        """Test ElevenLabs instrumentation from within an event loop."""
+        from atla_insights import ainstrument_elevenlabs
+
+        with await ainstrument_elevenlabs():
+            await mock_async_conversation.start_session()
+            await asyncio.sleep(0.1)  # simulate activity
+            await mock_async_conversation.end_session()
+
+        finished_spans = self.get_finished_spans()
+
+        assert len(finished_spans) == 1
+
     def test_ctx(self, mock_conversation: Conversation) -> None:
         """Test ElevenLabs instrumentation context manager."""
         from atla_insights import instrument_elevenlabs
@@ -134,3 +152,220 @@ class TestElevenLabsInstrumentation(BaseLocalOtel):
 
         finished_spans = self.get_finished_spans()
         assert len(finished_spans) == 1
+
+    def test_reaped_session(self, mock_conversation: Conversation) -> None:
+        """Test that sessions exceeding their maximum age are ended."""
+        from atla_insights import instrument_elevenlabs
+        from atla_insights.main import ATLA_INSTANCE
+
+        with (
+            instrument_elevenlabs(session_max_age_s=0.0),
+            patch.object(mock_conversation, "_run"),  # Keep the session open.
+        ):
+            mock_conversation._conversation_id = "unit-test"  # type: ignore[assignment]
+            mock_conversation.start_session()
+
+            [instrumentor] = ATLA_INSTANCE._active_instrumentors["elevenlabs"]
+            instrumentor._sessions.reap()  # type: ignore[attr-defined]
+
+            mock_conversation.end_session()
+
+        finished_spans = self.get_finished_spans()
+
+        assert len(finished_spans) == 1
+        [span] = finished_spans
+
+        assert span.status.status_code == StatusCode.ERROR
+        assert span.attributes is not None
+        assert span.attributes.get("atla.audio.session_end_reason") == "max_age_exceeded"
+        assert span.attributes.get("atla.audio.conversation_id") == "unit-test"
+
+
+class TestSessionRegistry:
+    """Test the registry of active ElevenLabs sessions."""
+
+    def test_idle_timeout(self) -> None:
+        """Test that idle sessions are reaped, while active sessions are kept."""
+        from atla_insights.llm_providers.instrumentors.elevenlabs import (
+            _SessionRegistry,
+        )
+
+        registry = _SessionRegistry(idle_timeout_s=0.05, max_age_s=60.0)
+        conversation, idle_conversation = _Conversation(), _Conversation()
+        span, idle_span = MagicMock(), MagicMock()
+        registry.add(conversation, span)
+        registry.add(idle_conversation, idle_span)
+
+        time.sleep(0.1)
+        registry.touch(conversation)
+        registry.reap()
+
+        span.end.assert_not_called()
+        idle_span.set_attribute.assert_called_with(
+            "atla.audio.session_end_reason", "idle_timeout"
+        )
+        idle_span.end.assert_called_once()
+
+        assert registry.pop(conversation) is span
+        assert registry.pop(idle_conversation) is None
+
+    def test_garbage_collected(self) -> None:
+        """Test that the sessions of garbage collected conversations are reaped."""
+        from atla_insights.llm_providers.instrumentors.elevenlabs import (
+            _SessionRegistry,
+        )
+
+        registry = _SessionRegistry(idle_timeout_s=60.0, max_age_s=60.0)
+        span = MagicMock()
+        registry.add(_Conversation(), span)
+        gc.collect()
+
+        registry.reap()
+
+        span.set_attribute.assert_called_with(
+            "atla.audio.session_end_reason", "abandoned"
+        )
+        span.end.assert_called_once()
+        assert not registry._sessions
+
+    def test_ended_session_not_reaped(self) -> None:
+        """Test that ended sessions are not reaped once garbage collected."""
+        from atla_insights.llm_providers.instrumentors.elevenlabs import (
+            _SessionRegistry,
+        )
+
+        registry = _SessionRegistry(idle_timeout_s=60.0, max_age_s=60.0)
+        conversation, span = _Conversation(), MagicMock()
+        registry.add(conversation, span)
+
+        assert registry.pop(conversation) is span
+        del conversation
+        gc.collect()
+        registry.reap()
+
+        span.end.assert_not_called()
+
+
+class _Conversation:
+    """Stand-in for an ElevenLabs conversation."""
+
+
+_VERIFY_PATH = "/api/sdk/v1/integrations/elevenlabs"
+
+
+@pytest.fixture(scope="function")
+def api_key_verify_server() -> Generator[HTTPServer, None, None]:
+    """Local stand-in for the ElevenLabs API key verification endpoint."""
+    from atla_insights.llm_providers import elevenlabs
+
+    elevenlabs._api_key_verifications.clear()
+    with HTTPServer() as httpserver:
+        yield httpserver
+    elevenlabs._api_key_verifications.clear()
+
+
+class TestElevenLabsApiKeyVerification:
+    """Test the ElevenLabs API key verification."""
+
+    def test_cached(self, api_key_verify_server: HTTPServer) -> None:
+        """Test that verifications are cached."""
+        from atla_insights.llm_providers.elevenlabs import _has_elevenlabs_api_key
+
+        api_key_verify_server.expect_request(_VERIFY_PATH).respond_with_json(
+            {"hasApiKey": True}
+        )
+        url = api_key_verify_server.url_for(_VERIFY_PATH)
+
+        assert _has_elevenlabs_api_key(url)
+        assert _has_elevenlabs_api_key(url)
+        assert len(api_key_verify_server.log) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_cached(self, api_key_verify_server: HTTPServer) -> None:
+        """Test that the async verification shares the cache."""
+        from atla_insights.llm_providers.elevenlabs import (
+            _ahas_elevenlabs_api_key,
+            _has_elevenlabs_api_key,
+        )
+
+        api_key_verify_server.expect_request(_VERIFY_PATH).respond_with_json(
+            {"hasApiKey": True}
+        )
+        url = api_key_verify_server.url_for(_VERIFY_PATH)
+
+        assert await _ahas_elevenlabs_api_key(url)
+        assert _has_elevenlabs_api_key(url)
+        assert len(api_key_verify_server.log) == 1
+
+    def test_missing_api_key(self, api_key_verify_server: HTTPServer) -> None:
+        """Test that a missing API key is cached, and warned about."""
+        from atla_insights.llm_providers.elevenlabs import _has_elevenlabs_api_key
+
+        api_key_verify_server.expect_request(_VERIFY_PATH).respond_with_json(
+            {"hasApiKey": False}
+        )
+        url = api_key_verify_server.url_for(_VERIFY_PATH)
+
+        for _ in range(2):
+            with pytest.warns(UserWarning, match="not yet uploaded"):
+                assert not _has_elevenlabs_api_key(url)
+        assert len(api_key_verify_server.log) == 1
+
+    def test_failure_not_cached(self, api_key_verify_server: HTTPServer) -> None:
+        """Test that failed verifications are retried."""
+        from atla_insights.llm_providers.elevenlabs import _has_elevenlabs_api_key
+
+        api_key_verify_server.expect_ordered_request(_VERIFY_PATH).respond_with_data(
+            status=500
+        )
+        api_key_verify_server.expect_ordered_request(_VERIFY_PATH).respond_with_json(
+            {"hasApiKey": True}
+        )
+        url = api_key_verify_server.url_for(_VERIFY_PATH)
+
+        with pytest.warns(UserWarning, match="unable to verify"):
+            assert not _has_elevenlabs_api_key(url)
+        assert _has_elevenlabs_api_key(url)
+        assert len(api_key_verify_server.log) == 2
+
+    def test_expired(self, api_key_verify_server: HTTPServer) -> None:
+        """Test that expired verifications are verified again."""
+        from atla_insights.llm_providers.elevenlabs import _has_elevenlabs_api_key
+
+        api_key_verify_server.expect_request(_VERIFY_PATH).respond_with_json(
+            {"hasApiKey": True}
+        )
+        url = api_key_verify_server.url_for(_VERIFY_PATH)
+
+        with patch(
+            "atla_insights.llm_providers.elevenlabs._API_KEY_VERIFICATION_TTL_S", 0.0
+        ):
+            assert _has_elevenlabs_api_key(url)
+            assert _has_elevenlabs_api_key(url)
+        assert len(api_key_verify_server.log) == 2
+
+    def test_background_refresh(self, api_key_verify_server: HTTPServer) -> None:
+        """Test that verifications close to expiry are refreshed in the background."""
+        from atla_insights.llm_providers import elevenlabs
+
+        api_key_verify_server.expect_ordered_request(_VERIFY_PATH).respond_with_json(
+            {"hasApiKey": True}
+        )
+        api_key_verify_server.expect_ordered_request(_VERIFY_PATH).respond_with_json(
+            {"hasApiKey": False}
+        )
+        url = api_key_verify_server.url_for(_VERIFY_PATH)
+
+        with patch.object(elevenlabs, "_API_KEY_VERIFICATION_REFRESH_S", 0.0):
+            assert elevenlabs._has_elevenlabs_api_key(url)
+            # Served from the cache, while refreshing in the background.
+            assert elevenlabs._has_elevenlabs_api_key(url)
+
+            deadline = time.monotonic() + 5
+            while elevenlabs._api_key_verifications_refreshing:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+
+        assert len(api_key_verify_server.log) == 2
+        [(has_api_key, _)] = elevenlabs._api_key_verifications.values()
+        assert has_api_key is False
@@ -178,7 +178,7 @@ class TestGoogleGenAIInstrumentation(BaseLocalOtel):
             span.attributes.get(
                 "llm.output_messages.0.message.tool_calls.0.tool_call.function.arguments"
             )
-            == '{"some_arg": "some value"}'
+            == '{"some_arg":"some value"}'
         )
         assert (
             span.attributes.get(
@@ -190,7 +190,7 @@ class TestGoogleGenAIInstrumentation(BaseLocalOtel):
             span.attributes.get(
                 "llm.output_messages.0.message.tool_calls.1.tool_call.function.arguments"
             )
-            == '{"other_arg": "other value"}'
+            == '{"other_arg":"other value"}'
         )
         assert (
             span.attributes.get(
@@ -201,11 +201,11 @@ class TestGoogleGenAIInstrumentation(BaseLocalOtel):
 
         assert (
             span.attributes.get("llm.tools.0.tool.json_schema")
-            == '{"type": "function", "function": {"name": "some_tool", "description": "Some mock tool for unit testing.", "parameters": {"type": "object", "properties": {"some_arg": {"type": "string", "description": "Some mock argument"}}, "required": ["some_arg"]}, "strict": null}}'  # noqa: E501
+            == '{"type":"function","function":{"name":"some_tool","description":"Some mock tool for unit testing.","parameters":{"type":"object","properties":{"some_arg":{"type":"string","description":"Some mock argument"}},"required":["some_arg"]},"strict":null}}'  # noqa: E501
         )
         assert (
             span.attributes.get("llm.tools.1.tool.json_schema")
-            == '{"type": "function", "function": {"name": "other_tool", "description": "Another mock tool for unit testing.", "parameters": {"type": "object", "properties": {"other_arg": {"type": "string", "description": "Another mock argument"}}, "required": ["other_arg"]}, "strict": null}}'  # noqa: E501
+            == '{"type":"function","function":{"name":"other_tool","description":"Another mock tool for unit testing.","parameters":{"type":"object","properties":{"other_arg":{"type":"string","description":"Another mock argument"}},"required":["other_arg"]},"strict":null}}'  # noqa: E501
         )
 
     def test_streaming(self, mock_google_genai_stream_client: Client) -> None:
@@ -230,6 +230,9 @@ class TestGoogleGenAIInstrumentation(BaseLocalOtel):
         assert (
             span.attributes.get("llm.input_messages.0.message.content") == "Hello, World!"
         )
+        chunk_count = span.attributes.get("atla.streaming.chunk_count")
+        assert isinstance(chunk_count, int) and chunk_count > 0
+        assert "atla.streaming.time_to_first_token_ms" in span.attributes
 
     @pytest.mark.asyncio
     async def test_async_streaming(self, mock_google_genai_stream_client: Client) -> None:
@@ -256,6 +259,9 @@ class TestGoogleGenAIInstrumentation(BaseLocalOtel):
         assert (
             span.attributes.get("llm.input_messages.0.message.content") == "Hello, World!"
         )
+        chunk_count = span.attributes.get("atla.streaming.chunk_count")
+        assert isinstance(chunk_count, int) and chunk_count > 0
+        assert "atla.streaming.time_to_first_token_ms" in span.attributes
 
     def test_context_manager(self, mock_google_genai_client: Client) -> None:
         """Test that instrumentation only applies within context."""
@@ -294,7 +300,7 @@ class TestGoogleGenAIInstrumentationHelpers:
                 [
                     (
                         "message.tool_calls.0.tool_call.function.arguments",
-                        '{"some_arg": "some value"}',
+                        '{"some_arg":"some value"}',
                     ),
                     ("message.tool_calls.0.tool_call.function.name", "some_tool"),
                 ],
@@ -316,12 +322,12 @@ class TestGoogleGenAIInstrumentationHelpers:
                 [
                     (
                         "message.tool_calls.0.tool_call.function.arguments",
-                        '{"some_arg": "some value"}',
+                        '{"some_arg":"some value"}',
                     ),
                     ("message.tool_calls.0.tool_call.function.name", "some_tool"),
                     (
                         "message.tool_calls.1.tool_call.function.arguments",
-                        '{"other_arg": "other value"}',
+                        '{"other_arg":"other value"}',
                     ),
                     ("message.tool_calls.1.tool_call.function.name", "other_tool"),
                 ],
@@ -366,7 +372,7 @@ class TestGoogleGenAIInstrumentationHelpers:
                 [
                     (
                         "llm.tools.0.tool.json_schema",
-                        '{"type": "function", "function": {"name": "some_tool", "description": "Some mock tool for unit testing.", "parameters": {"type": "object"}, "strict": null}}',  # noqa: E501
+                        '{"type":"function","function":{"name":"some_tool","description":"Some mock tool for unit testing.","parameters":{"type":"object"},"strict":null}}',  # noqa: E501
                     ),
                 ],
                 id="single_function_declaration",
@@ -399,11 +405,11 @@ class TestGoogleGenAIInstrumentationHelpers:
                 [
                     (
                         "llm.tools.0.tool.json_schema",
-                        '{"type": "function", "function": {"name": "tool_1", "description": "First test tool", "parameters": {"type": "object"}, "strict": null}}',  # noqa: E501
+                        '{"type":"function","function":{"name":"tool_1","description":"First test tool","parameters":{"type":"object"},"strict":null}}',  # noqa: E501
                     ),
                     (
                         "llm.tools.1.tool.json_schema",
-                        '{"type": "function", "function": {"name": "tool_2", "description": "Second test tool", "parameters": {"type": "object"}, "strict": null}}',  # noqa: E501
+                        '{"type":"function","function":{"name":"tool_2","description":"Second test tool","parameters":{"type":"object"},"strict":null}}',  # noqa: E501
                     ),
                 ],
                 id="multiple_function_declarations",
@@ -430,7 +436,7 @@ class TestGoogleGenAIInstrumentationHelpers:
                     ),
                     (
                         "llm.input_messages.0.message.tool_calls.0.tool_call.function.arguments",
-                        '{"arg1": "value1"}',
+                        '{"arg1":"value1"}',
                     ),
                 ],
                 id="single_function_call",
@@ -509,7 +515,7 @@ class TestGoogleGenAIInstrumentationHelpers:
                     ),
                     (
                         "llm.input_messages.0.message.tool_calls.0.tool_call.function.arguments",
-                        '{"x": 1}',
+                        '{"x":1}',
                     ),
                     (
                         "llm.input_messages.0.message.tool_calls.1.tool_call.function.name",
@@ -517,7 +523,7 @@ class TestGoogleGenAIInstrumentationHelpers:
                     ),
                     (
                         "llm.input_messages.0.message.tool_calls.1.tool_call.function.arguments",
-                        '{"y": 2}',
+                        '{"y":2}',
                     ),
                 ],
                 id="multiple_function_calls",
@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 from litellm import acompletion, completion
@@ -194,6 +195,95 @@ class TestLitellmInstrumentation(BaseLocalOtel):
         assert request.parent is not None
         assert request.parent.span_id == root_span.context.span_id
 
+    def test_message_deltas(self) -> None:
+        """Test that the input messages of LiteLLM spans are delta encoded."""
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+            InMemorySpanExporter,
+        )
+
+        from atla_insights import instrument, instrument_litellm
+        from atla_insights.message_deltas import (
+            MessageDeltaSpanExporter,
+            expand_message_deltas,
+        )
+
+        @instrument("my_agent")
+        def my_agent() -> None:
+            messages = [{"role": "user", "content": "hello world"}]
+            with instrument_litellm():
+                for step in range(3):
+                    completion(
+                        model="openai/gpt-3.5-turbo",
+                        messages=messages,
+                        mock_response=f"step {step}",
+                    )
+                    messages = [
+                        *messages,
+                        {"role": "assistant", "content": f"step {step}"},
+                        {"role": "user", "content": "continue"},
+                    ]
+
+        my_agent()
+
+        # Spans are exported in the order they ended.
+        finished_spans = sorted(
+            self.get_finished_spans(), key=lambda span: span.end_time or 0
+        )
+        span_exporter = InMemorySpanExporter()
+        MessageDeltaSpanExporter(span_exporter).export(finished_spans)
+
+        first, second, third, _root = span_exporter.get_finished_spans()
+        assert first.attributes is not None
+        assert second.attributes is not None
+        assert third.attributes is not None
+
+        assert "atla.message_delta.parent_span_id" not in first.attributes
+        assert second.attributes["atla.message_delta.prefix_length"] == 1
+        assert "gen_ai.prompt.0.content" not in second.attributes
+        assert second.attributes["gen_ai.prompt.2.content"] == "continue"
+        assert third.attributes["atla.message_delta.prefix_length"] == 3
+        assert "gen_ai.prompt.2.content" not in third.attributes
+
+        expanded_spans = expand_message_deltas(span_exporter.get_finished_spans())
+        assert [dict(span.attributes or {}) for span in expanded_spans] == [
+            dict(span.attributes or {}) for span in finished_spans
+        ]
+
+    def test_nesting_concurrent(self) -> None:
+        """Test that concurrent Litellm callbacks attach to their caller's span."""
+        from atla_insights import instrument, instrument_litellm
+
+        num_calls = 8
+
+        @instrument
+        def my_function(idx: int) -> None:
+            completion(
+                model="openai/gpt-3.5-turbo",
+                messages=[{"role": "user", "content": f"hello {idx}"}],
+                mock_response=f"hello {idx}",
+            )
+
+        with instrument_litellm():
+            with ThreadPoolExecutor(max_workers=num_calls) as pool:
+                list(pool.map(my_function, range(num_calls)))
+
+        finished_spans = self.get_finished_spans()
+        assert len(finished_spans) == 2 * num_calls
+
+        root_spans = {
+            span.context.span_id: span
+            for span in finished_spans
+            if span.name != "litellm_request" and span.context is not None
+        }
+        requests = [span for span in finished_spans if span.name == "litellm_request"]
+        assert len(root_spans) == len(requests) == num_calls
+
+        for request in requests:
+            assert request.parent is not None
+            root_span = root_spans[request.parent.span_id]
+            assert request.context is not None
+            assert request.context.trace_id == root_span.context.trace_id
+
     def test_streaming(self, mock_openai_stream_client: OpenAI) -> None:
         """Test streaming with LiteLLM."""
         from atla_insights import instrument_litellm
@@ -217,6 +307,9 @@ class TestLitellmInstrumentation(BaseLocalOtel):
         assert span.attributes is not None
         assert span.attributes.get("gen_ai.prompt.0.role") == "user"
         assert span.attributes.get("gen_ai.prompt.0.content") == "hello world"
+        chunk_count = span.attributes.get("atla.streaming.chunk_count")
+        assert isinstance(chunk_count, int) and chunk_count > 0
+        assert "atla.streaming.time_to_first_token_ms" in span.attributes
 
     @pytest.mark.asyncio
     async def test_async_streaming(self, mock_async_openai_stream_client: OpenAI) -> None:
@@ -243,6 +336,9 @@ class TestLitellmInstrumentation(BaseLocalOtel):
         assert span.attributes is not None
         assert span.attributes.get("gen_ai.prompt.0.role") == "user"
         assert span.attributes.get("gen_ai.prompt.0.content") == "hello world"
+        chunk_count = span.attributes.get("atla.streaming.chunk_count")
+        assert isinstance(chunk_count, int) and chunk_count > 0
+        assert "atla.streaming.time_to_first_token_ms" in span.attributes
 
     def test_context_manager(self) -> None:
         """Test that instrumentation only applies within context."""
@@ -295,6 +295,9 @@ class TestOpenAIInstrumentation(BaseLocalOtel):
         assert (
             span.attributes.get("llm.input_messages.0.message.content") == "hello world"
         )
+        chunk_count = span.attributes.get("atla.streaming.chunk_count")
+        assert isinstance(chunk_count, int) and chunk_count > 0
+        assert "atla.streaming.time_to_first_token_ms" in span.attributes
 
     @pytest.mark.asyncio
     async def test_async_streaming(
@@ -321,6 +324,9 @@ class TestOpenAIInstrumentation(BaseLocalOtel):
         assert (
             span.attributes.get("llm.input_messages.0.message.content") == "hello world"
         )
+        chunk_count = span.attributes.get("atla.streaming.chunk_count")
+        assert isinstance(chunk_count, int) and chunk_count > 0
+        assert "atla.streaming.time_to_first_token_ms" in span.attributes
 
     def test_responses_streaming(self, mock_openai_stream_client: OpenAI) -> None:
         """Test streaming with Responses API."""
@@ -0,0 +1,168 @@
+"""Test the bounded capture of function arguments and return values."""
+
+import inspect
+import json
+from collections import deque
+from dataclasses import dataclass
+
+from pydantic import BaseModel
+
+from atla_insights.capture import (
+    MAX_CAPTURE_BYTES,
+    MAX_CAPTURE_ITEMS,
+    MAX_CAPTURE_STRING_LENGTH,
+    ArgumentCapturePlan,
+    bounded_json_dumps,
+)
+
+
+class _SomeModel(BaseModel):
+    name: str
+    values: list[int]
+
+
+@dataclass
+class _SomeDataclass:
+    name: str
+    nested: dict
+
+
+class _FailingMapping(dict):
+    def items(self):
+        raise RuntimeError("unreadable")
+
+
+def test_bounded_json_dumps_simple() -> None:
+    """Test that small values are serialized as is."""
+    value = {"a": 1, "b": [True, None, 1.5], "c": "some-string", 1: (2, 3)}
+
+    assert json.loads(bounded_json_dumps(value)) == {
+        "a": 1,
+        "b": [True, None, 1.5],
+        "c": "some-string",
+        "1": [2, 3],
+    }
+
+
+def test_bounded_json_dumps_objects() -> None:
+    """Test serializing pydantic models, dataclasses and arbitrary objects."""
+    value = [
+        _SomeModel(name="model", values=[1, 2]),
+        _SomeDataclass(name="dataclass", nested={"a": 1}),
+        b"some-bytes",
+        object,
+    ]
+
+    assert json.loads(bounded_json_dumps(value)) == [
+        {"name": "model", "values": [1, 2]},
+        {"name": "dataclass", "nested": {"a": 1}},
+        "<bytes: 10 bytes>",
+        "<class 'object'>",
+    ]
+
+
+def test_bounded_json_dumps_limits() -> None:
+    """Test that the depth, length and string length limits are applied."""
+    deep = {"a": {"b": {"c": {"d": {"e": 1}}}}}
+    assert json.loads(bounded_json_dumps(deep)) == {
+        "a": {"b": {"c": {"d": "<dict: 1 items>"}}}
+    }
+
+    long_list = json.loads(bounded_json_dumps(list(range(100))))
+    assert long_list[:MAX_CAPTURE_ITEMS] == list(range(MAX_CAPTURE_ITEMS))
+    assert long_list[MAX_CAPTURE_ITEMS:] == [f"... {100 - MAX_CAPTURE_ITEMS} more items"]
+
+    long_string = json.loads(bounded_json_dumps("x" * 10_000))
+    assert long_string == "x" * MAX_CAPTURE_STRING_LENGTH + "..."
+
+
+def test_bounded_json_dumps_huge_value() -> None:
+    """Test that serializing a huge value stops early, within the byte limit."""
+    huge = {f"key-{i}": ["y" * 500] * 20 for i in range(1_000)}
+
+    serialized = bounded_json_dumps(huge)
+
+    assert len(serialized) < MAX_CAPTURE_BYTES + MAX_CAPTURE_STRING_LENGTH
+    assert json.loads(serialized)["..."].endswith("more items")
+
+
+def test_argument_capture_plan() -> None:
+    """Test binding call arguments with a precomputed argument capture plan."""
+
+    def func(a, /, b, c=3, *args, d, e=5, **kwargs):
+        pass
+
+    plan = ArgumentCapturePlan(func)
+
+    assert plan.bind((1, 2), {"d": 4}) == {
+        "a": 1,
+        "b": 2,
+        "c": 3,
+        "args": (),
+        "d": 4,
+        "e": 5,
+        "kwargs": {},
+    }
+    assert plan.bind((1,), {"b": 2, "d": 4, "f": 6}) == {
+        "a": 1,
+        "b": 2,
+        "c": 3,
+        "args": (),
+        "d": 4,
+        "e": 5,
+        "kwargs": {"f": 6},
+    }
+    assert plan.bind((1, 2, 3, 7, 8), {"d": 4, "e": 9}) == {
+        "a": 1,
+        "b": 2,
+        "c": 3,
+        "args": (7, 8),
+        "d": 4,
+        "e": 9,
+        "kwargs": {},
+    }
+
+    for args, kwargs in [((1, 2), {"d": 4}), ((1, 2, 3, 7), {"d": 4, "f": 6})]:
+        bound = inspect.signature(func).bind(*args, **kwargs)
+        bound.apply_defaults()
+        assert list(plan.bind(args, kwargs).items()) == list(bound.arguments.items())
+
+
+def test_argument_capture_plan_method() -> None:
+    """Test that `self` is left out when binding method call arguments."""
+
+    class SomeClass:
+        def method(self, a: int) -> None:
+            pass
+
+    plan = ArgumentCapturePlan(SomeClass.method)
+
+    assert json.loads(plan.dumps((SomeClass(), 1), {})) == {"a": 1}
+
+
+def test_bounded_json_dumps_unserializable() -> None:
+    """Test that values that can't be encoded as is result in valid JSON."""
+    value = {
+        "huge": 10**5000,
+        "floats": [float("nan"), float("inf"), float("-inf")],
+        "mapping": _FailingMapping(a=1),
+        "ok": 1,
+    }
+
+    assert json.loads(bounded_json_dumps(value)) == {
+        "huge": "<unserializable int>",
+        "floats": ["NaN", "Infinity", "-Infinity"],
+        "mapping": "<unserializable _FailingMapping>",
+        "ok": 1,
+    }
+
+
+def test_bounded_json_dumps_collections() -> None:
+    """Test that other collections are encoded item by item, within the limits."""
+    serialized = json.loads(bounded_json_dumps(deque(range(10_000))))
+
+    assert serialized[:MAX_CAPTURE_ITEMS] == list(range(MAX_CAPTURE_ITEMS))
+    assert serialized[MAX_CAPTURE_ITEMS:] == [
+        f"... {10_000 - MAX_CAPTURE_ITEMS} more items"
+    ]
+    assert json.loads(bounded_json_dumps({"a": 1}.keys())) == ["a"]
@@ -0,0 +1,397 @@
+"""Test the data API client."""
+
+import asyncio
+import json
+import re
+import threading
+import time
+import warnings
+from typing import Any, Callable, Generator, Optional
+from unittest.mock import patch
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from atla_insights.client import AsyncClient, Client
+from atla_insights.client._generated_client.exceptions import (
+    NotFoundException,
+    ServiceException,
+)
+
+_TRACE = {
+    "id": "trace-1",
+    "environment": "DEV",
+    "isSuccess": True,
+    "isCompleted": True,
+    "metadata": {"key": "value"},
+    "startedAt": "2025-01-01T00:00:00Z",
+    "endedAt": "2025-01-01T00:00:01Z",
+}
+_TRACE_WITH_DETAILS = {
+    **_TRACE,
+    "stepCount": 1,
+    "durationSeconds": 1.0,
+    "ingestedAt": "2025-01-01T00:00:02Z",
+    "spans": [],
+    "customMetricValues": [],
+}
+_AUDIO = bytes(range(256)) * 64
+
+
+def _get_host(httpserver: HTTPServer) -> str:
+    """Get the base URL of a local server, without trailing slash."""
+    return httpserver.url_for("").rstrip("/")
+
+
+@pytest.fixture
+def httpserver() -> Generator[HTTPServer, None, None]:
+    """A local data API server."""
+    with HTTPServer(threaded=True) as httpserver:
+        yield httpserver
+
+
+def _serve_traces(
+    httpserver: HTTPServer, num_traces: int, total: Optional[int] = None
+) -> list[int]:
+    """Serve a paginated trace listing.
+
+    :param httpserver (HTTPServer): The local server.
+    :param num_traces (int): The number of traces served.
+    :param total (Optional[int]): The reported total count. Defaults to `num_traces`.
+    :return (list[int]): The requested page numbers, in request order.
+    """
+    requested_pages: list[int] = []
+
+    def handler(request: Request) -> Response:
+        page, page_size = int(request.args["page"]), int(request.args["pageSize"])
+        requested_pages.append(page)
+        traces = [
+            {**_TRACE, "id": f"trace-{idx}"}
+            for idx in range((page - 1) * page_size, min(page * page_size, num_traces))
+        ]
+        body = {
+            "traces": traces,
+            "total": num_traces if total is None else total,
+            "page": page,
+            "pageSize": page_size,
+        }
+        return Response(json.dumps(body), content_type="application/json")
+
+    httpserver.expect_request("/api/sdk/v1/traces").respond_with_handler(handler)
+    return requested_pages
+
+
+def _serve_traces_by_ids(
+    httpserver: HTTPServer, num_failures: int = 0, status: int = 503
+) -> list[list[str]]:
+    """Serve traces by ID, failing the first requests.
+
+    :param httpserver (HTTPServer): The local server.
+    :param num_failures (int): The number of requests to fail. Defaults to 0.
+    :param status (int): The status code of failed requests. Defaults to 503.
+    :return (list[list[str]]): The requested trace IDs of each request.
+    """
+    lock = threading.Lock()
+    requested_ids: list[list[str]] = []
+
+    def handler(request: Request) -> Response:
+        trace_ids = request.args.getlist("ids")
+        with lock:
+            requested_ids.append(trace_ids)
+            if len(requested_ids) <= num_failures:
+                return Response(status=status)
+
+        traces = [{**_TRACE_WITH_DETAILS, "id": trace_id} for trace_id in trace_ids]
+        body = {"traces": traces}
+        return Response(json.dumps(body), content_type="application/json")
+
+    httpserver.expect_request("/api/sdk/v1/traces/ids").respond_with_handler(handler)
+    return requested_ids
+
+
+def _wait_for(condition: Callable[[], bool], timeout_s: float = 5.0) -> None:
+    """Wait until a condition holds."""
+    deadline = time.monotonic() + timeout_s
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+class TestClient:
+    """Test the data API client."""
+
+    def test_iter_traces(self, httpserver: HTTPServer) -> None:
+        """Test iterating over all traces."""
+        requested_pages = _serve_traces(httpserver, num_traces=5)
+        client = Client(api_key="unit-test", host=_get_host(httpserver))
+
+        traces = list(client.iter_traces(page_size=2))
+
+        assert [trace.id for trace in traces] == [f"trace-{idx}" for idx in range(5)]
+        assert sorted(requested_pages) == [1, 2, 3]
+
+    def test_iter_traces_prefetch(self, httpserver: HTTPServer) -> None:
+        """Test that the next page is fetched while the current one is consumed."""
+        requested_pages = _serve_traces(httpserver, num_traces=6)
+        client = Client(api_key="unit-test", host=_get_host(httpserver))
+
+        iterator = client.iter_traces(page_size=2, max_prefetch_pages=1)
+        assert next(iterator).id == "trace-0"
+        _wait_for(lambda: 2 in requested_pages)
+        time.sleep(0.1)
+        assert requested_pages == [1, 2]
+
+        assert [trace.id for trace in iterator] == [f"trace-{idx}" for idx in range(1, 6)]
+        assert requested_pages == [1, 2, 3]
+
+    def test_iter_traces_total(self, httpserver: HTTPServer) -> None:
+        """Test that iteration stops on the total count of the first page."""
+        requested_pages = _serve_traces(httpserver, num_traces=8, total=5)
+        client = Client(api_key="unit-test", host=_get_host(httpserver))
+
+        traces = list(client.iter_traces(page_size=2))
+
+        assert [trace.id for trace in traces] == [f"trace-{idx}" for idx in range(5)]
+        assert sorted(requested_pages) == [1, 2, 3]
+
+    def test_iter_traces_empty(self, httpserver: HTTPServer) -> None:
+        """Test iterating over an empty listing."""
+        requested_pages = _serve_traces(httpserver, num_traces=0)
+        client = Client(api_key="unit-test", host=_get_host(httpserver))
+
+        assert list(client.iter_traces(page_size=2)) == []
+        assert requested_pages == [1]
+
+    def test_iter_traces_by_ids(self, httpserver: HTTPServer) -> None:
+        """Test getting many traces in chunks, retrying failed chunks."""
+        requested_ids = _serve_traces_by_ids(httpserver, num_failures=2)
+        client = Client(api_key="unit-test", host=_get_host(httpserver))
+
+        trace_ids = [f"trace-{idx}" for idx in range(25)]
+        traces = list(
+            client.iter_traces_by_ids(
+                iter(trace_ids), chunk_size=10, max_concurrency=2, retry_backoff_s=0
+            )
+        )
+
+        assert sorted(trace.id for trace in traces) == sorted(trace_ids)
+        assert len(requested_ids) == 5
+        assert all(len(chunk) <= 10 for chunk in requested_ids)
+
+    def test_iter_traces_by_ids_error(self, httpserver: HTTPServer) -> None:
+        """Test that client errors are not retried."""
+        requested_ids = _serve_traces_by_ids(httpserver, num_failures=1, status=404)
+        client = Client(api_key="unit-test", host=_get_host(httpserver))
+
+        with pytest.raises(NotFoundException):
+            list(client.iter_traces_by_ids(["trace-0"], retry_backoff_s=0))
+        assert requested_ids == [["trace-0"]]
+
+    def test_iter_traces_by_ids_max_retries(self, httpserver: HTTPServer) -> None:
+        """Test that chunks are retried at most `max_retries` times."""
+        requested_ids = _serve_traces_by_ids(httpserver, num_failures=10)
+        client = Client(api_key="unit-test", host=_get_host(httpserver))
+
+        with pytest.raises(ServiceException):
+            list(client.iter_traces_by_ids(["trace-0"], max_retries=2, retry_backoff_s=0))
+        assert len(requested_ids) == 3
+
+
+class TestAsyncClient:
+    """Test the async data API client."""
+
+    @pytest.mark.asyncio
+    async def test_list_traces(self, httpserver: HTTPServer) -> None:
+        """Test listing traces."""
+        metadata_filter = [{"key": "environment", "value": "prod"}]
+        httpserver.expect_request(
+            "/api/sdk/v1/traces",
+            query_string={
+                "metadataFilter": json.dumps(metadata_filter),
+                "page": "2",
+                "pageSize": "10",
+            },
+            headers={"Authorization": "Bearer unit-test"},
+        ).respond_with_json({"traces": [_TRACE], "total": 11, "page": 2, "pageSize": 10})
+
+        async with AsyncClient(api_key="unit-test", host=_get_host(httpserver)) as client:
+            result = await client.list_traces(
+                metadata_filter=metadata_filter, page=2, page_size=10
+            )
+
+        assert result.total == 11
+        assert [trace.id for trace in result.traces] == ["trace-1"]
+
+    @pytest.mark.asyncio
+    async def test_iter_traces(self, httpserver: HTTPServer) -> None:
+        """Test iterating over all traces, with prefetching."""
+        requested_pages = _serve_traces(httpserver, num_traces=7, total=5)
+
+        async with AsyncClient(api_key="unit-test", host=_get_host(httpserver)) as client:
+            iterator = client.iter_traces(page_size=2, max_prefetch_pages=1)
+            trace_ids = [(await iterator.__anext__()).id]
+            await asyncio.sleep(0.1)
+            assert requested_pages == [1, 2]
+
+            trace_ids.extend([trace.id async for trace in iterator])
+
+        assert trace_ids == [f"trace-{idx}" for idx in range(5)]
+        assert requested_pages == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_iter_traces_by_ids(self, httpserver: HTTPServer) -> None:
+        """Test getting many traces in chunks, retrying failed chunks."""
+        requested_ids = _serve_traces_by_ids(httpserver, num_failures=2)
+
+        trace_ids = [f"trace-{idx}" for idx in range(25)]
+        async with AsyncClient(
+            api_key="unit-test", host=_get_host(httpserver), max_concurrency=2
+        ) as client:
+            traces = [
+                trace
+                async for trace in client.iter_traces_by_ids(
+                    iter(trace_ids), chunk_size=10, retry_backoff_s=0
+                )
+            ]
+
+        assert sorted(trace.id for trace in traces) == sorted(trace_ids)
+        assert len(requested_ids) == 5
+        assert all(len(chunk) <= 10 for chunk in requested_ids)
+
+    @pytest.mark.asyncio
+    async def test_iter_close(self, httpserver: HTTPServer) -> None:
+        """Test that closing an iterator early leaves none of its requests pending."""
+        _serve_traces(httpserver, num_traces=7, total=7)
+        _serve_traces_by_ids(httpserver, num_failures=0)
+
+        async with AsyncClient(api_key="unit-test", host=_get_host(httpserver)) as client:
+            iterator = client.iter_traces(page_size=2, max_prefetch_pages=2)
+            await iterator.__anext__()
+            await iterator.aclose()  # type: ignore[attr-defined]
+            assert asyncio.all_tasks() == {asyncio.current_task()}
+
+            trace_ids = [f"trace-{idx}" for idx in range(25)]
+            by_ids_iterator = client.iter_traces_by_ids(trace_ids, chunk_size=5)
+            await by_ids_iterator.__anext__()
+            await by_ids_iterator.aclose()  # type: ignore[attr-defined]
+            assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    def test_http2(self) -> None:
+        """Test that HTTP/2 is used if the `h2` package is installed."""
+        from atla_insights.client import client as client_module
+
+        def uses_http2(client: AsyncClient) -> bool:
+            return client._http_client._transport._pool._http2  # type: ignore[attr-defined]
+
+        assert uses_http2(AsyncClient(api_key="unit-test"))
+        assert not uses_http2(AsyncClient(api_key="unit-test", http2=False))
+
+        with patch.object(client_module, "_HAS_H2", False):
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                assert not uses_http2(AsyncClient(api_key="unit-test"))
+
+            with pytest.warns(UserWarning, match="h2"):
+                assert not uses_http2(AsyncClient(api_key="unit-test", http2=True))
+
+    @pytest.mark.asyncio
+    async def test_get_trace(self, httpserver: HTTPServer) -> None:
+        """Test getting a trace."""
+        httpserver.expect_request(
+            "/api/sdk/v1/traces/trace-1",
+            query_string="include=spans&include=annotations&include=customMetrics",
+        ).respond_with_json({"trace": _TRACE_WITH_DETAILS})
+
+        async with AsyncClient(api_key="unit-test", host=_get_host(httpserver)) as client:
+            result = await client.get_trace("trace-1")
+
+        assert result.trace.id == "trace-1"
+        assert result.trace.step_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_traces(self, httpserver: HTTPServer) -> None:
+        """Test getting multiple traces."""
+        httpserver.expect_request(
+            "/api/sdk/v1/traces/ids",
+            query_string=(
+                "ids=trace-1&ids=trace-2"
+                "&include=spans&include=annotations&include=customMetrics"
+            ),
+        ).respond_with_json(
+            {"traces": [_TRACE_WITH_DETAILS, {**_TRACE_WITH_DETAILS, "id": "trace-2"}]}
+        )
+
+        async with AsyncClient(api_key="unit-test", host=_get_host(httpserver)) as client:
+            result = await client.get_traces(["trace-1", "trace-2"])
+
+        assert [trace.id for trace in result.traces] == ["trace-1", "trace-2"]
+
+    @pytest.mark.asyncio
+    async def test_get_audio(self, httpserver: HTTPServer) -> None:
+        """Test getting and streaming audio."""
+        httpserver.expect_request("/api/sdk/v1/audio/audio-1").respond_with_data(
+            _AUDIO, content_type="audio/mpeg"
+        )
+
+        async with AsyncClient(api_key="unit-test", host=_get_host(httpserver)) as client:
+            audio = await client.get_audio("audio-1")
+            chunks = [
+                chunk
+                async for chunk in client.get_audio_stream("audio-1", chunk_size=1024)
+            ]
+
+        assert audio == _AUDIO
+        assert b"".join(chunks) == _AUDIO
+        assert all(len(chunk) <= 1024 for chunk in chunks)
+
+    @pytest.mark.asyncio
+    async def test_error(self, httpserver: HTTPServer) -> None:
+        """Test that error responses raise the generated client's exceptions."""
+        httpserver.expect_request("/api/sdk/v1/traces/missing").respond_with_json(
+            {"error": "Trace not found"}, status=404
+        )
+        httpserver.expect_request("/api/sdk/v1/audio/missing").respond_with_json(
+            {"error": "Audio not found"}, status=404
+        )
+
+        async with AsyncClient(api_key="unit-test", host=_get_host(httpserver)) as client:
+            with pytest.raises(NotFoundException):
+                await client.get_trace("missing")
+            with pytest.raises(NotFoundException):
+                async for _ in client.get_audio_stream("missing"):
+                    pass
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency(self, httpserver: HTTPServer) -> None:
+        """Test that concurrent requests are limited."""
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+
+        def handler(request: Request) -> Response:
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            trace_id = request.path.rsplit("/", 1)[-1]
+            body: dict[str, Any] = {"trace": {**_TRACE_WITH_DETAILS, "id": trace_id}}
+            return Response(json.dumps(body), content_type="application/json")
+
+        httpserver.expect_request(
+            re.compile(r"/api/sdk/v1/traces/trace-\d+")
+        ).respond_with_handler(handler)
+
+        trace_ids = [f"trace-{idx}" for idx in range(12)]
+        async with AsyncClient(
+            api_key="unit-test", host=_get_host(httpserver), max_concurrency=3
+        ) as client:
+            results = await asyncio.gather(
+                *(client.get_trace(trace_id) for trace_id in trace_ids)
+            )
+
+        assert [result.trace.id for result in results] == trace_ids
+        assert 1 < max_in_flight <= 3
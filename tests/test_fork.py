@@ -0,0 +1,94 @@
+"""Test fork safety."""
+
+import multiprocessing
+import sys
+import time
+from multiprocessing.queues import Queue
+from typing import Any
+
+import pytest
+
+from tests._otel import BaseLocalOtel
+
+_NUM_PROCESSES = 4
+_NUM_TRACES = 5
+
+
+def _run_traces(queue: "Queue[Any]") -> None:
+    """Run instrumented functions in a child process and report the exported spans."""
+    from atla_insights import instrument
+    from tests.conftest import in_memory_span_exporter
+
+    @instrument("child_func")
+    def test_function():
+        return "test result"
+
+    for _ in range(_NUM_TRACES):
+        test_function()
+
+    queue.put(
+        [
+            (span.context.trace_id, span.context.span_id)
+            for span in in_memory_span_exporter.get_finished_spans()
+            if span.context is not None
+        ]
+    )
+
+
+def _check_tail_sampler(queue: "Queue[Any]", sampler: Any) -> None:
+    """Report whether the tail sampler works in a child process."""
+    queue.put((sampler._reaper.is_alive(), len(sampler._traces)))
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fork is not available on Windows")
+class TestFork(BaseLocalOtel):
+    """Test fork safety."""
+
+    def test_forked_processes(self) -> None:
+        """Test that forked processes generate unique IDs and export their spans."""
+        ctx = multiprocessing.get_context("fork")
+        queue = ctx.Queue()
+
+        processes = [
+            ctx.Process(target=_run_traces, args=(queue,)) for _ in range(_NUM_PROCESSES)
+        ]
+        for process in processes:
+            process.start()
+        results = [queue.get(timeout=30) for _ in processes]
+        for process in processes:
+            process.join(timeout=30)
+            assert process.exitcode == 0
+
+        for ids in results:
+            assert len(ids) == _NUM_TRACES
+
+        trace_ids = [trace_id for ids in results for trace_id, _ in ids]
+        span_ids = [span_id for ids in results for _, span_id in ids]
+        assert len(set(trace_ids)) == _NUM_PROCESSES * _NUM_TRACES
+        assert len(set(span_ids)) == _NUM_PROCESSES * _NUM_TRACES
+
+    def test_forked_tail_sampler(self) -> None:
+        """Test that the tail sampler is reinitialized in forked processes."""
+        from atla_insights.sampling import _TailSampler
+
+        sampler = _TailSampler(lambda _: True, reap_interval_ms=10)
+        sampler._traces[1] = {
+            "spans": [],
+            "open": 1,
+            "root_seen": False,
+            "first_seen": time.time(),
+            "last_update": time.time(),
+        }
+
+        ctx = multiprocessing.get_context("fork")
+        queue = ctx.Queue()
+        process = ctx.Process(target=_check_tail_sampler, args=(queue, sampler))
+        process.start()
+        reaper_alive, num_traces = queue.get(timeout=30)
+        process.join(timeout=30)
+
+        assert reaper_alive
+        assert num_traces == 0
+
+        sampler._traces.clear()
+        sampler.shutdown()
@@ -0,0 +1,261 @@
+"""Test the instrument decorator."""
+
+import asyncio
+import json
+import warnings
+from unittest.mock import patch
+
+import pytest
+from opentelemetry.trace import (
+    NonRecordingSpan,
+    SpanContext,
+    TraceFlags,
+    use_span,
+)
+
+from tests._otel import BaseLocalOtel
+
+
+class TestInstrument(BaseLocalOtel):
+    """Test the instrument decorator."""
+
+    def test_sync(self) -> None:
+        """Test instrumenting a sync function."""
+        from atla_insights import instrument
+
+        @instrument
+        def test_function() -> str:
+            return "some-result"
+
+        assert test_function() == "some-result"
+
+        [span] = self.get_finished_spans()
+        assert span.name.endswith("test_function")
+        assert span.parent is None
+
+    @pytest.mark.asyncio
+    async def test_async(self) -> None:
+        """Test instrumenting an async function."""
+        from atla_insights import instrument
+
+        @instrument("My async function")
+        async def test_function() -> str:
+            await asyncio.sleep(0)
+            return "some-result"
+
+        assert await test_function() == "some-result"
+
+        [span] = self.get_finished_spans()
+        assert span.name == "My async function"
+
+    def test_generator(self) -> None:
+        """Test instrumenting a generator function, with nested spans."""
+        from atla_insights import instrument
+
+        @instrument("child")
+        def child() -> int:
+            return 1
+
+        @instrument("My generator")
+        def test_function():
+            yield child()
+            yield child()
+
+        assert list(test_function()) == [1, 1]
+
+        spans = self.get_finished_spans()
+        assert len(spans) == 3
+
+        parent, *children = spans
+        assert parent.name == "My generator"
+        assert parent.context is not None
+        for span in children:
+            assert span.parent is not None
+            assert span.parent.span_id == parent.context.span_id
+
+    @pytest.mark.asyncio
+    async def test_async_generator(self) -> None:
+        """Test instrumenting an async generator function."""
+        from atla_insights import instrument
+
+        @instrument("My async generator")
+        async def test_function():
+            for i in range(3):
+                await asyncio.sleep(0)
+                yield i
+
+        assert [x async for x in test_function()] == [0, 1, 2]
+
+        [span] = self.get_finished_spans()
+        assert span.name == "My async generator"
+
+    def test_exception(self) -> None:
+        """Test that exceptions get recorded on the span."""
+        from atla_insights import instrument
+
+        @instrument("My function")
+        def test_function() -> None:
+            raise ValueError("some-error")
+
+        with pytest.raises(ValueError):
+            test_function()
+
+        [span] = self.get_finished_spans()
+        assert span.status.status_code.name == "ERROR"
+        assert span.status.description == "ValueError: some-error"
+        assert [event.name for event in span.events] == ["exception"]
+
+    def test_unsampled_parent(self) -> None:
+        """Test that no spans are created within a trace that is not sampled."""
+        from atla_insights import instrument
+
+        @instrument("My function")
+        def test_function() -> str:
+            return "some-result"
+
+        unsampled_parent = NonRecordingSpan(
+            SpanContext(
+                trace_id=1,
+                span_id=1,
+                is_remote=False,
+                trace_flags=TraceFlags(TraceFlags.DEFAULT),
+            )
+        )
+        with use_span(unsampled_parent):
+            assert test_function() == "some-result"
+
+        assert len(self.get_finished_spans()) == 0
+
+    def test_capture(self) -> None:
+        """Test capturing the arguments and return value of a function."""
+        from atla_insights import instrument
+
+        @instrument("My function", capture_args=True, capture_result=True)
+        def test_function(a: int, b: str = "b") -> dict[str, object]:
+            return {"a": a, "b": b}
+
+        assert test_function(1) == {"a": 1, "b": "b"}
+
+        [span] = self.get_finished_spans()
+        assert span.attributes is not None
+        assert json.loads(str(span.attributes["input.value"])) == {"a": 1, "b": "b"}
+        assert span.attributes["input.mime_type"] == "application/json"
+        assert json.loads(str(span.attributes["output.value"])) == {"a": 1, "b": "b"}
+        assert span.attributes["output.mime_type"] == "application/json"
+
+    def test_capture_failure(self) -> None:
+        """Test that failing to capture a value does not fail the function call."""
+        from atla_insights import instrument
+
+        @instrument("My function", capture_args=True, capture_result=True)
+        def test_function(a: int) -> int:
+            return a
+
+        assert test_function(10**5000) == 10**5000
+
+        with patch(
+            "atla_insights.capture.ArgumentCapturePlan.dumps", side_effect=RuntimeError
+        ):
+            assert test_function(1) == 1
+
+        [unserializable_span, failed_span] = self.get_finished_spans()
+        assert unserializable_span.attributes is not None
+        assert json.loads(str(unserializable_span.attributes["input.value"])) == {
+            "a": "<unserializable int>"
+        }
+        assert failed_span.attributes is not None
+        assert "input.value" not in failed_span.attributes
+        assert failed_span.attributes["output.value"] == "1"
+
+    def test_capture_default(self) -> None:
+        """Test that arguments and return values are not captured by default."""
+        from atla_insights import instrument
+
+        @instrument
+        def test_function(a: int) -> int:
+            return a
+
+        assert test_function(1) == 1
+
+        [span] = self.get_finished_spans()
+        assert span.attributes is not None
+        assert "input.value" not in span.attributes
+        assert "output.value" not in span.attributes
+
+    def test_capture_generator_send(self) -> None:
+        """Test that captured generators still get sent values and return a value."""
+        from atla_insights import instrument
+
+        @instrument("My generator", capture_result=True)
+        def test_function():
+            total = 0
+            while (value := (yield total)) is not None:
+                total += value
+            return total
+
+        generator = test_function()
+        assert [next(generator), generator.send(2), generator.send(3)] == [0, 2, 5]
+        with pytest.raises(StopIteration) as exc_info:
+            generator.send(None)
+        assert exc_info.value.value == 5
+
+        [span] = self.get_finished_spans()
+        assert span.attributes is not None
+        assert json.loads(str(span.attributes["output.value"])) == [0, 2, 5]
+
+    def test_capture_generator_throw(self) -> None:
+        """Test that exceptions thrown into captured generators are forwarded as is."""
+        from atla_insights import instrument
+
+        @instrument("My generator", capture_result=True)
+        def test_function():
+            try:
+                yield "first"
+            except ValueError as e:
+                yield str(e)
+
+        generator = test_function()
+        assert next(generator) == "first"
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            assert generator.throw(ValueError("thrown")) == "thrown"
+        generator.close()
+
+        [span] = self.get_finished_spans()
+        assert span.attributes is not None
+        assert json.loads(str(span.attributes["output.value"])) == ["first", "thrown"]
+
+    @pytest.mark.asyncio
+    async def test_capture_async_generator(self) -> None:
+        """Test capturing the yielded items of an async generator function."""
+        from atla_insights import instrument
+
+        @instrument("My async generator", capture_args=True, capture_result=True)
+        async def test_function(n: int):
+            for i in range(n):
+                await asyncio.sleep(0)
+                yield i
+
+        assert [x async for x in test_function(100)] == list(range(100))
+
+        [span] = self.get_finished_spans()
+        assert span.attributes is not None
+        assert json.loads(str(span.attributes["input.value"])) == {"n": 100}
+
+        output = json.loads(str(span.attributes["output.value"]))
+        assert output[:-1] == list(range(len(output) - 1))
+        assert output[-1] == f"... {100 - len(output) + 1} more items"
+
+    def test_disabled(self) -> None:
+        """Test that the decorator is a no-op when instrumentation is disabled."""
+        from atla_insights import instrument
+
+        def test_function() -> str:
+            return "some-result"
+
+        with patch.dict("os.environ", {"ATLA_DISABLE_INSTRUMENTATION": "1"}):
+            instrumented_function = instrument("My function")(test_function)
+
+        assert instrumented_function is test_function
+        assert instrumented_function() == "some-result"
+        assert len(self.get_finished_spans()) == 0
@@ -0,0 +1,161 @@
+"""Test the LLM metrics."""
+
+import gc
+from typing import Any
+
+from openinference.semconv.trace import OpenInferenceSpanKindValues, SpanAttributes
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF
+from opentelemetry.trace import StatusCode
+
+
+def _get_data_points(reader: InMemoryMetricReader) -> dict[str, list[Any]]:
+    """Get the recorded metric data points, by metric name."""
+    metrics_data = reader.get_metrics_data()
+    if metrics_data is None:
+        return {}
+    return {
+        metric.name: list(metric.data.data_points)
+        for resource_metrics in metrics_data.resource_metrics
+        for scope_metrics in resource_metrics.scope_metrics
+        for metric in scope_metrics.metrics
+    }
+
+
+def _llm_attributes(model: str = "some-model") -> dict[str, Any]:
+    """Get the span attributes of an LLM call."""
+    return {
+        SpanAttributes.OPENINFERENCE_SPAN_KIND: OpenInferenceSpanKindValues.LLM.value,
+        SpanAttributes.LLM_MODEL_NAME: model,
+        SpanAttributes.LLM_PROVIDER: "openai",
+    }
+
+
+class TestLLMMetrics:
+    """Test the LLM metrics span processor."""
+
+    def setup_method(self) -> None:
+        """Set up a tracer provider with an LLM metrics span processor."""
+        from atla_insights.llm_metrics import LLMMetricsSpanProcessor
+
+        self.metric_reader = InMemoryMetricReader()
+        self.tracer_provider = TracerProvider()
+        self.tracer_provider.add_span_processor(
+            LLMMetricsSpanProcessor(
+                MeterProvider(metric_readers=[self.metric_reader]), "unit-testing"
+            )
+        )
+        self.tracer = self.tracer_provider.get_tracer(__name__)
+
+    def test_llm_metrics(self) -> None:
+        """Test that LLM spans are recorded as metrics."""
+        with self.tracer.start_as_current_span("root"):
+            with self.tracer.start_as_current_span(
+                "llm", attributes=_llm_attributes()
+            ) as span:
+                span.set_attribute(SpanAttributes.LLM_TOKEN_COUNT_PROMPT, 10)
+                span.set_attribute(SpanAttributes.LLM_TOKEN_COUNT_COMPLETION, 5)
+
+                data_points = _get_data_points(self.metric_reader)
+                [in_flight] = data_points["atla.llm.in_flight"]
+                assert in_flight.value == 1
+
+            with self.tracer.start_as_current_span(
+                "llm", attributes=_llm_attributes(), set_status_on_exception=False
+            ) as span:
+                span.set_status(StatusCode.ERROR)
+
+        data_points = _get_data_points(self.metric_reader)
+
+        [in_flight] = data_points["atla.llm.in_flight"]
+        assert in_flight.value == 0
+
+        calls = {
+            dp.attributes["status"]: dp.value for dp in data_points["atla.llm.calls"]
+        }
+        assert calls == {"ok": 1, "error": 1}
+
+        [duration] = data_points["atla.llm.duration"]
+        assert duration.count == 2
+        assert dict(duration.attributes) == {
+            "model": "some-model",
+            "provider": "openai",
+            "environment": "unit-testing",
+        }
+
+        tokens = {
+            dp.attributes["token_type"]: dp.sum for dp in data_points["atla.llm.tokens"]
+        }
+        assert tokens == {"prompt": 10, "completion": 5}
+
+    def test_non_llm_spans_ignored(self) -> None:
+        """Test that spans other than LLM calls are not recorded as metrics."""
+        with self.tracer.start_as_current_span("root"):
+            pass
+
+        assert _get_data_points(self.metric_reader) == {}
+
+    def test_unsampled_llm_metrics(self) -> None:
+        """Test that LLM calls in unsampled traces are recorded, but not exported."""
+        from atla_insights.sampling import _RecordUnsampledSampler
+
+        span_exporter = InMemorySpanExporter()
+        self.tracer_provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+        self.tracer_provider.sampler = _RecordUnsampledSampler(ALWAYS_OFF)
+        tracer = self.tracer_provider.get_tracer(__name__)
+
+        with tracer.start_as_current_span("root"):
+            with tracer.start_as_current_span("llm", attributes=_llm_attributes()):
+                pass
+
+        assert span_exporter.get_finished_spans() == ()
+
+        data_points = _get_data_points(self.metric_reader)
+        [calls] = data_points["atla.llm.calls"]
+        assert calls.value == 1
+
+    def test_litellm_metrics(self) -> None:
+        """Test that LiteLLM spans (with GenAI attributes) are recorded as metrics."""
+        with self.tracer.start_as_current_span("litellm_request") as span:
+            span.set_attributes(
+                {
+                    "atla.instrumentation.name": "litellm",
+                    "gen_ai.system": "openai",
+                    "gen_ai.request.model": "some-model",
+                    "gen_ai.response.model": "some-model-2024",
+                    "gen_ai.usage.prompt_tokens": 10,
+                    "gen_ai.usage.completion_tokens": 5,
+                }
+            )
+
+        data_points = _get_data_points(self.metric_reader)
+
+        [calls] = data_points["atla.llm.calls"]
+        assert dict(calls.attributes) == {
+            "model": "some-model-2024",
+            "provider": "openai",
+            "environment": "unit-testing",
+            "status": "ok",
+        }
+
+        tokens = {
+            dp.attributes["token_type"]: dp.sum for dp in data_points["atla.llm.tokens"]
+        }
+        assert tokens == {"prompt": 10, "completion": 5}
+
+    def test_unended_llm_span(self) -> None:
+        """Test that LLM spans that never end stop counting as in-flight once dropped."""
+        span = self.tracer.start_span("llm", attributes=_llm_attributes())
+
+        [in_flight] = _get_data_points(self.metric_reader)["atla.llm.in_flight"]
+        assert in_flight.value == 1
+
+        del span
+        gc.collect()
+
+        [in_flight] = _get_data_points(self.metric_reader)["atla.llm.in_flight"]
+        assert in_flight.value == 0
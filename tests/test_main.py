@@ -0,0 +1,216 @@
+"""Test the core Atla Insights functionality."""
+
+import threading
+import time
+from typing import Any, Collection, Optional
+from unittest.mock import patch
+
+from openai import OpenAI
+from opentelemetry.instrumentation.instrumentor import (  # type: ignore[attr-defined]
+    BaseInstrumentor,
+)
+
+from tests._otel import BaseLocalOtel
+
+
+class _CountingInstrumentor(BaseInstrumentor):
+    """Instrumentor that keeps track of its (un)instrumentation calls."""
+
+    def __init__(self) -> None:
+        self.is_patched = False
+        self.num_instrument_calls = 0
+        self.num_uninstrument_calls = 0
+
+    def instrumentation_dependencies(self) -> Collection[str]:
+        return ()
+
+    def _instrument(self, **kwargs: Any) -> None:
+        self.is_patched = True
+        self.num_instrument_calls += 1
+
+    def _uninstrument(self, **kwargs: Any) -> None:
+        self.is_patched = False
+        self.num_uninstrument_calls += 1
+
+
+class _StatefulInstrumentor(BaseInstrumentor):
+    """Singleton instrumentor that saves an original while instrumenting, slowly."""
+
+    def __init__(self) -> None:
+        if self.is_instrumented_by_opentelemetry:
+            return
+        self.saved_original: Optional[str] = None
+        self.restored_original: Optional[str] = None
+        self.is_instrumenting = threading.Event()
+
+    def instrumentation_dependencies(self) -> Collection[str]:
+        return ()
+
+    def _instrument(self, **kwargs: Any) -> None:
+        self.saved_original = "original"
+        self.is_instrumenting.set()
+        time.sleep(0.05)
+
+    def _uninstrument(self, **kwargs: Any) -> None:
+        self.restored_original = self.saved_original
+        self.saved_original = None
+
+
+class TestInstrumentationRegistry(BaseLocalOtel):
+    """Test the instrumentation registry."""
+
+    def test_nested(self, mock_openai_client: OpenAI) -> None:
+        """Test that nested instrumentation only uninstruments on the last exit."""
+        from atla_insights import instrument_openai
+
+        def call_openai() -> None:
+            mock_openai_client.chat.completions.create(
+                model="some-model",
+                messages=[{"role": "user", "content": "hello world"}],
+            )
+
+        with instrument_openai():
+            with instrument_openai():
+                call_openai()
+            call_openai()
+        call_openai()
+
+        assert len(self.get_finished_spans()) == 2
+
+    def test_concurrent(self) -> None:
+        """Test concurrent instrumentation contexts for the same service."""
+        from atla_insights.main import ATLA_INSTANCE
+
+        instrumentor = _CountingInstrumentor()
+        num_threads = 16
+        num_iterations = 200
+
+        barrier = threading.Barrier(num_threads)
+        errors: list[str] = []
+
+        def run() -> None:
+            barrier.wait()
+            for _ in range(num_iterations):
+                with ATLA_INSTANCE.instrument_service("counting", lambda: [instrumentor]):
+                    if not instrumentor.is_patched:
+                        errors.append("Service got uninstrumented while in use.")
+                    with ATLA_INSTANCE.instrument_service(
+                        "counting", lambda: [instrumentor]
+                    ):
+                        if not instrumentor.is_patched:
+                            errors.append("Service got uninstrumented while in use.")
+
+        threads = [threading.Thread(target=run) for _ in range(num_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert not instrumentor.is_patched
+        assert instrumentor.num_instrument_calls == instrumentor.num_uninstrument_calls
+        assert instrumentor.num_instrument_calls <= num_threads * num_iterations
+        assert "counting" not in ATLA_INSTANCE._active_instrumentors
+        assert "counting" not in ATLA_INSTANCE._instrumentation_ref_counts
+
+    def test_originals_restored(self) -> None:
+        """Test that nested and concurrent use restores the patched originals."""
+        from anthropic.resources.messages import AsyncMessages
+        from openinference.instrumentation.anthropic._stream import _MessagesStream
+
+        from atla_insights import instrument_anthropic
+
+        original_async_messages_stream = AsyncMessages.stream
+        original_messages_stream_init = _MessagesStream.__init__
+
+        def assert_restored() -> None:
+            assert AsyncMessages.stream is original_async_messages_stream
+            assert _MessagesStream.__init__ is original_messages_stream_init
+
+        with instrument_anthropic():
+            patched_messages_stream_init = _MessagesStream.__init__
+            with instrument_anthropic():
+                assert _MessagesStream.__init__ is patched_messages_stream_init
+        assert_restored()
+
+        num_threads = 8
+        barrier = threading.Barrier(num_threads)
+        errors: list[str] = []
+
+        def run() -> None:
+            barrier.wait()
+            for _ in range(20):
+                with instrument_anthropic():
+                    patched_messages_stream_init = _MessagesStream.__init__
+                    with instrument_anthropic():
+                        if _MessagesStream.__init__ is not patched_messages_stream_init:
+                            errors.append("Instrumentation got re-applied while in use.")
+
+        threads = [threading.Thread(target=run) for _ in range(num_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert_restored()
+
+    def test_instrumentors_created_under_lock(self) -> None:
+        """Test that instrumentors are not re-initialized while being instrumented."""
+        from atla_insights.main import ATLA_INSTANCE
+
+        instrumentor = _StatefulInstrumentor()
+
+        def run() -> None:
+            with ATLA_INSTANCE.instrument_service(
+                "stateful", lambda: [_StatefulInstrumentor()]
+            ):
+                pass
+
+        first_thread = threading.Thread(target=run)
+        first_thread.start()
+        assert instrumentor.is_instrumenting.wait(timeout=5)
+        second_thread = threading.Thread(target=run)
+        second_thread.start()
+        first_thread.join()
+        second_thread.join()
+
+        assert instrumentor.restored_original == "original"
+
+    def test_config_mismatch(self) -> None:
+        """Test that a different configuration of an active service is warned about."""
+        from atla_insights.main import ATLA_INSTANCE
+
+        instrumentor = _CountingInstrumentor()
+
+        with ATLA_INSTANCE.instrument_service(
+            "counting", lambda: [instrumentor], config={"record_turns": False}
+        ):
+            with patch("atla_insights.main.logger.warning") as mock_warning:
+                with ATLA_INSTANCE.instrument_service(
+                    "counting", lambda: [instrumentor], config={"record_turns": False}
+                ):
+                    pass
+                mock_warning.assert_not_called()
+
+                with ATLA_INSTANCE.instrument_service(
+                    "counting", lambda: [instrumentor], config={"record_turns": True}
+                ):
+                    pass
+                mock_warning.assert_called_once()
+
+        assert instrumentor.num_instrument_calls == 1
+        assert "counting" not in ATLA_INSTANCE._instrumentation_configs
+
+    def test_uninstrument_unregistered(self) -> None:
+        """Test that uninstrumenting an unregistered service is a no-op."""
+        from atla_insights.main import ATLA_INSTANCE
+
+        instrumentor = _CountingInstrumentor()
+
+        with ATLA_INSTANCE.instrument_service("counting", lambda: [instrumentor]):
+            pass
+        ATLA_INSTANCE.uninstrument_service("counting")
+
+        assert instrumentor.num_instrument_calls == 1
+        assert instrumentor.num_uninstrument_calls == 1
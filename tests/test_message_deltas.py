@@ -0,0 +1,123 @@
+"""Test the delta encoding of LLM input messages."""
+
+import json
+from typing import Any
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+
+def _message_attributes(prefix: str, messages: list[tuple[str, str]]) -> dict[str, Any]:
+    """Get the span attributes of a list of (role, content) messages."""
+    attributes = {}
+    for idx, (role, content) in enumerate(messages):
+        attributes[f"{prefix}.{idx}.message.role"] = role
+        attributes[f"{prefix}.{idx}.message.content"] = content
+    return attributes
+
+
+class TestMessageDeltas:
+    """Test the delta encoding of LLM input messages."""
+
+    def setup_method(self) -> None:
+        """Set up a tracer provider exporting with message deltas."""
+        from atla_insights.message_deltas import MessageDeltaSpanExporter
+
+        self.span_exporter = InMemorySpanExporter()
+        self.tracer_provider = TracerProvider()
+        self.tracer_provider.add_span_processor(
+            SimpleSpanProcessor(MessageDeltaSpanExporter(self.span_exporter))
+        )
+        self.tracer = self.tracer_provider.get_tracer(__name__)
+
+    def _run_agent(self, num_steps: int) -> list[dict[str, Any]]:
+        """Run a fake agent loop, returning the original attributes of its LLM spans."""
+        messages = [("system", "Be helpful."), ("user", "Hello!")]
+        llm_span_attributes = []
+
+        with self.tracer.start_as_current_span("root"):
+            for step in range(num_steps):
+                attributes = {
+                    **_message_attributes("llm.input_messages", messages),
+                    **_message_attributes(
+                        "llm.output_messages", [("assistant", f"Step {step}.")]
+                    ),
+                    "llm.model_name": "some-model",
+                    "input.value": json.dumps(
+                        {"messages": messages, "model": "some-model"}
+                    ),
+                }
+                with self.tracer.start_as_current_span("llm", attributes=attributes):
+                    pass
+
+                llm_span_attributes.append(attributes)
+                messages.extend([("assistant", f"Step {step}."), ("tool", "Result.")])
+
+        return llm_span_attributes
+
+    def test_message_deltas(self) -> None:
+        """Test that LLM spans only record new input messages."""
+        self._run_agent(num_steps=3)
+
+        first, second, third, _root = self.span_exporter.get_finished_spans()
+        assert first.attributes is not None
+        assert second.attributes is not None
+        assert third.attributes is not None
+        assert first.context is not None
+        assert second.context is not None
+
+        assert "atla.message_delta.parent_span_id" not in first.attributes
+        assert "llm.input_messages.0.message.role" in first.attributes
+
+        assert second.attributes["atla.message_delta.parent_span_id"] == format(
+            first.context.span_id, "016x"
+        )
+        assert second.attributes["atla.message_delta.prefix_length"] == 3
+        assert "llm.input_messages.2.message.content" not in second.attributes
+        assert second.attributes["llm.input_messages.3.message.content"] == "Result."
+
+        assert third.attributes["atla.message_delta.parent_span_id"] == format(
+            second.context.span_id, "016x"
+        )
+        assert third.attributes["atla.message_delta.prefix_length"] == 5
+        assert third.attributes["llm.model_name"] == "some-model"
+
+        # Only the input value following that of the previous LLM span is recorded.
+        assert second.attributes["input.value"] == (
+            ', ["assistant", "Step 0."], ["tool", "Result."]], "model": "some-model"}'
+        )
+        assert second.attributes["atla.message_delta.input_value_prefix_length"] == len(
+            str(first.attributes["input.value"])
+        ) - len('], "model": "some-model"}')
+
+    def test_message_deltas_size(self) -> None:
+        """Test that the size of a trace grows linearly with its number of steps."""
+        llm_span_attributes = self._run_agent(num_steps=50)
+
+        original_size = sum(len(str(attributes)) for attributes in llm_span_attributes)
+        encoded_size = sum(
+            len(str(dict(span.attributes or {})))
+            for span in self.span_exporter.get_finished_spans()[:-1]
+        )
+        assert encoded_size * 10 < original_size
+
+    def test_expand_message_deltas(self) -> None:
+        """Test that the full input messages can be rebuilt."""
+        from atla_insights.message_deltas import expand_message_deltas
+
+        llm_span_attributes = self._run_agent(num_steps=5)
+
+        spans = expand_message_deltas(self.span_exporter.get_finished_spans())
+
+        assert [dict(span.attributes or {}) for span in spans[:-1]] == (
+            llm_span_attributes
+        )
+
+    def test_separate_traces(self) -> None:
+        """Test that LLM spans are not encoded as deltas across traces."""
+        self._run_agent(num_steps=1)
+        self._run_agent(num_steps=1)
+
+        for span in self.span_exporter.get_finished_spans():
+            assert "atla.message_delta.parent_span_id" not in (span.attributes or {})
@@ -2,7 +2,8 @@
 
 import asyncio
 import json
-from typing import cast
+from typing import Optional, cast
+from unittest.mock import patch
 
 import pytest
 
@@ -12,6 +13,12 @@ from tests._otel import BaseLocalOtel
 class TestMetadata(BaseLocalOtel):
     """Test the metadata."""
 
+    def setup_method(self) -> None:
+        """Clear any trace metadata left over in the current context."""
+        from atla_insights.context import metadata_var
+
+        metadata_var.set(None)
+
     def test_metadata(self) -> None:
         """Test that run metadata is added to the root span correctly."""
         from atla_insights import instrument
@@ -128,6 +135,83 @@ class TestMetadata(BaseLocalOtel):
         assert await simulate_async_api_request("user1", "session1")
         assert await simulate_async_api_request("user2", "session2")
 
+    def test_update_metadata(self) -> None:
+        """Test that the metadata is updated with only the given fields."""
+        from atla_insights import instrument, update_metadata
+        from atla_insights.constants import METADATA_MARK
+
+        @instrument()
+        def test_function():
+            update_metadata({"some_key": "some-value"})
+            update_metadata({"other_key": "other-value"})
+            return "test result"
+
+        test_function()
+        [span] = self.get_finished_spans()
+
+        assert span.attributes is not None
+        metadata = json.loads(cast(str, span.attributes.get(METADATA_MARK)))
+        assert metadata == {
+            "environment": "unit-testing",
+            "some_key": "some-value",
+            "other_key": "other-value",
+        }
+
+    def test_request_metadata(self) -> None:
+        """Test that request metadata applies to all traces within its context."""
+        from atla_insights import instrument, request_metadata, set_metadata
+        from atla_insights.constants import METADATA_MARK
+
+        @instrument()
+        def test_function(trace_metadata: Optional[dict[str, str]] = None):
+            if trace_metadata is not None:
+                set_metadata(trace_metadata)
+            return "test result"
+
+        with request_metadata({"user_id": "some-user"}):
+            test_function()
+        test_function()
+        with request_metadata({"user_id": "some-user"}):
+            test_function({"some_key": "some-value"})
+
+        spans = self.get_finished_spans()
+        assert len(spans) == 3
+
+        metadatas = [
+            json.loads(cast(str, (span.attributes or {}).get(METADATA_MARK)))
+            for span in spans
+        ]
+        assert metadatas == [
+            {"user_id": "some-user"},
+            {"environment": "unit-testing"},
+            {"some_key": "some-value"},
+        ]
+
+    def test_metadata_json_cached(self) -> None:
+        """Test that the serialized metadata is cached per metadata layer."""
+        from atla_insights.metadata import get_metadata_json, set_metadata
+
+        with patch("atla_insights.metadata.json.dumps", wraps=json.dumps) as mock_dumps:
+            set_metadata({"some_key": "some-value"})
+            for _ in range(3):
+                assert get_metadata_json() == '{"some_key": "some-value"}'
+
+        assert mock_dumps.call_count == 1
+
+    def test_update_metadata_too_many_fields(self) -> None:
+        """Test that updates beyond the maximum number of fields are ignored."""
+        from atla_insights import get_metadata, set_metadata, update_metadata
+        from atla_insights.constants import MAX_METADATA_FIELDS
+
+        set_metadata({f"{i}": f"{i}" for i in range(MAX_METADATA_FIELDS)})
+        update_metadata({"0": "updated", "new_key": "new-value"})
+
+        metadata = get_metadata()
+        assert metadata is not None
+        assert len(metadata) == MAX_METADATA_FIELDS
+        assert metadata["0"] == "updated"
+        assert "new_key" not in metadata
+
     @pytest.mark.parametrize(
         "metadata, is_valid",
         [
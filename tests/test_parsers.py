@@ -0,0 +1,89 @@
+"""Test the LLM parsers."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+with open(Path(__file__).parent / "test_data" / "mock_responses.json", "r") as f:
+    _MOCK_RESPONSES = json.load(f)
+
+
+def _get_validated_attributes(response: dict[str, Any]) -> dict[str, Any]:
+    """Get the response attributes extracted from the validated chat completion."""
+    import openai
+    from openai.types.chat import ChatCompletion
+    from openinference.instrumentation.openai._response_attributes_extractor import (
+        _ResponseAttributesExtractor,
+    )
+
+    return dict(
+        _ResponseAttributesExtractor(openai).get_attributes_from_response(
+            response=ChatCompletion.model_validate(response), request_parameters={}
+        )
+    )
+
+
+class TestOpenAIChatCompletionParser:
+    """Test the OpenAI chat completion parser."""
+
+    @pytest.mark.parametrize(
+        "fixture", ["openai_chat_completions", "openai_chat_completions_tool_calls"]
+    )
+    def test_parse_response_body(self, fixture: str) -> None:
+        """Test that the fast path matches the attributes of the validated response."""
+        from atla_insights.parsers.parse_openai import OpenAIChatCompletionParser
+
+        response = _MOCK_RESPONSES[fixture]
+        attributes = dict(OpenAIChatCompletionParser().parse_response_body(response))
+
+        assert attributes.pop("output.value") == json.dumps(
+            response, separators=(",", ":")
+        )
+        assert attributes.pop("output.mime_type") == "application/json"
+        assert attributes == _get_validated_attributes(response)
+
+    def test_parse_response_body_tool_calls(self) -> None:
+        """Test that tool calls are parsed from the response."""
+        from atla_insights.parsers.parse_openai import OpenAIChatCompletionParser
+
+        response = _MOCK_RESPONSES["openai_chat_completions_tool_calls"]
+        attributes = dict(OpenAIChatCompletionParser().parse_response_body(response))
+
+        prefix = "llm.output_messages.0.message.tool_calls"
+        assert attributes[f"{prefix}.0.tool_call.id"] == "call_abc123"
+        assert attributes[f"{prefix}.0.tool_call.function.name"] == "get_weather"
+        assert attributes[f"{prefix}.1.tool_call.function.name"] == "get_time"
+        assert attributes["llm.token_count.prompt_details.cache_read"] == 64
+
+    def test_parse_malformed_response_body(self) -> None:
+        """Test that malformed responses fall back to validation."""
+        from atla_insights.parsers.parse_openai import OpenAIChatCompletionParser
+
+        response = {"model": "some-model", "choices": "not-a-list"}
+        attributes = dict(OpenAIChatCompletionParser().parse_response_body(response))
+
+        assert set(attributes) == {"output.value", "output.mime_type"}
+
+
+class TestAnthropicParser:
+    """Test the Anthropic parser."""
+
+    def test_parse_request_body_tools(self) -> None:
+        """Test that tools are parsed from the request."""
+        from atla_insights.parsers.parse_anthropic import AnthropicParser
+
+        tool = {
+            "name": "get_weather",
+            "description": "Get the weather.",
+            "input_schema": {"type": "object", "properties": {}},
+        }
+        request = {
+            "model": "some-model",
+            "messages": [{"role": "user", "content": "What is the weather?"}],
+            "tools": [tool],
+        }
+        attributes = dict(AnthropicParser().parse_request_body(request))
+
+        assert json.loads(attributes["llm.tools.0.tool.json_schema"]) == tool
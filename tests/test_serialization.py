@@ -0,0 +1,153 @@
+"""Test the JSON serialization."""
+
+import json
+from dataclasses import dataclass
+from enum import Enum
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+
+
+class _Model(BaseModel):
+    name: str
+    tags: list[str]
+
+
+@dataclass
+class _DataClass:
+    name: str
+    count: int
+
+
+class _Color(Enum):
+    RED = "red"
+
+
+_VALUES = [
+    pytest.param(
+        {"messages": [{"role": "user", "content": "héllo"}], "n": 1, "t": 0.5},
+        {"messages": [{"role": "user", "content": "héllo"}], "n": 1, "t": 0.5},
+        id="json",
+    ),
+    pytest.param(
+        {"model": _Model(name="a", tags=["b"])},
+        {"model": {"name": "a", "tags": ["b"]}},
+        id="pydantic",
+    ),
+    pytest.param(
+        _DataClass(name="a", count=1), {"name": "a", "count": 1}, id="dataclass"
+    ),
+    pytest.param({"color": _Color.RED}, {"color": "red"}, id="enum"),
+    pytest.param({1: "a", None: "b"}, {"1": "a", "null": "b"}, id="non-str keys"),
+    pytest.param(
+        {"body": b'{"a": 1}', "image": b"\xff\xd8"},
+        {"body": '{"a": 1}', "image": "<bytes: 2 bytes>"},
+        id="bytes",
+    ),
+    pytest.param({"obj": object}, {"obj": "<class 'object'>"}, id="other"),
+    pytest.param({"big": 2**70}, {"big": 2**70}, id="big int"),
+]
+
+
+class TestSerialization:
+    """Test the JSON serialization."""
+
+    @pytest.mark.parametrize("value, expected", _VALUES)
+    def test_json_dumps(self, value: Any, expected: Any) -> None:
+        """Test that values are serialized to valid JSON."""
+        from atla_insights.serialization import json_dumps
+
+        assert json.loads(json_dumps(value)) == expected
+
+    @pytest.mark.parametrize("value, expected", _VALUES)
+    def test_json_dumps_stdlib(self, value: Any, expected: Any) -> None:
+        """Test that the stdlib fallback matches orjson for common payload values."""
+        from atla_insights.serialization import json_dumps
+
+        serialized = json_dumps(value)
+        with patch("atla_insights.serialization.orjson", None):
+            assert json_dumps(value) == serialized
+
+    def test_json_dumps_circular(self) -> None:
+        """Test that values that can't be serialized as is result in valid JSON."""
+        from atla_insights.serialization import json_dumps
+
+        value: dict[str, Any] = {}
+        value["self"] = value
+
+        assert isinstance(json.loads(json_dumps(value)), str)
+
+    def test_tool_attributes(self) -> None:
+        """Test that the attributes of a tool set are serialized once."""
+        from atla_insights.serialization import get_tool_attributes
+
+        def get_schema(tool: SimpleNamespace) -> dict[str, Any]:
+            return {"type": "function", "function": {"name": tool.name}}
+
+        tools = [SimpleNamespace(name="get_weather"), SimpleNamespace(name="get_time")]
+
+        with patch(
+            "atla_insights.serialization.json_dumps", wraps=json.dumps
+        ) as mock_dumps:
+            attributes = get_tool_attributes("llm.tools", tools, get_schema)
+            assert get_tool_attributes("llm.tools", list(tools), get_schema) is (
+                attributes
+            )
+
+        assert mock_dumps.call_count == 2
+        assert attributes == (
+            ("llm.tools.0.tool.json_schema", json.dumps(get_schema(tools[0]))),
+            ("llm.tools.1.tool.json_schema", json.dumps(get_schema(tools[1]))),
+        )
+
+        # Tools are keyed on identity, so equal (but distinct) tools are a cache miss.
+        copied_tools = [SimpleNamespace(**vars(tool)) for tool in tools]
+        assert get_tool_attributes("llm.tools", copied_tools, get_schema) is not (
+            attributes
+        )
+
+    def test_tool_attributes_mutable(self) -> None:
+        """Test that tools given as plain dicts are not cached, as they may be mutated."""
+        from atla_insights.serialization import get_tool_attributes
+
+        tools: list[dict[str, Any]] = [
+            {"type": "function", "function": {"name": "get_weather"}}
+        ]
+        get_tool_attributes("llm.tools", tools)
+
+        tools[0]["function"]["description"] = "Get the weather."
+
+        [(_, schema)] = get_tool_attributes("llm.tools", tools)
+        assert json.loads(schema) == tools[0]
+
+    def test_tool_attributes_by_name(self) -> None:
+        """Test that the attributes of tools given by name are cached by value."""
+        from atla_insights.serialization import get_tool_attributes
+
+        def get_schema(tool: str) -> dict[str, Any]:
+            return {"type": "function", "function": {"name": tool}}
+
+        attributes = get_tool_attributes("llm.tools", ["Bash", "Read"], get_schema)
+
+        assert get_tool_attributes("llm.tools", ["Bash", "Read"], get_schema) is (
+            attributes
+        )
+        assert get_tool_attributes("llm.tools", ["Bash"], get_schema) == attributes[:1]
+
+    def test_tool_attributes_eviction(self) -> None:
+        """Test that only the most recently used tool sets are cached."""
+        from atla_insights import serialization
+
+        tool_sets = [[f"tool_{idx}"] for idx in range(3)]
+
+        with patch.object(serialization, "_TOOL_ATTRIBUTES_CACHE_SIZE", 2):
+            serialization._tool_attributes_cache.clear()
+            for tools in tool_sets:
+                serialization.get_tool_attributes("llm.tools", tools)
+
+            cache = serialization._tool_attributes_cache
+            cached_tools = [cast(tuple, key)[2] for key in cache]
+            assert cached_tools == [("tool_1",), ("tool_2",)]
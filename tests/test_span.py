@@ -1,6 +1,11 @@
 """Test the lower-level span API."""
 
+import asyncio
 import json
+import time
+from typing import cast
+
+import pytest
 
 from tests._otel import BaseLocalOtel
 
@@ -152,7 +157,7 @@ class TestSpan(BaseLocalOtel):
             == '{"country": "Germany"}'
         )
 
-        assert span.attributes["llm.tools.0.tool.json_schema"] == json.dumps(
+        assert json.loads(cast(str, span.attributes["llm.tools.0.tool.json_schema"])) == (
             {
                 "type": "function",
                 "function": {
@@ -191,3 +196,70 @@ class TestSpan(BaseLocalOtel):
         assert secondary_agent.attributes is not None
         assert secondary_agent.attributes.get("graph.node.id") == "secondary-agent"
         assert secondary_agent.attributes.get("graph.node.parent_id") == "main-agent"
+
+    @pytest.mark.asyncio
+    async def test_async_basic(self) -> None:
+        """Test the async span API."""
+        from atla_insights.span import astart_as_current_span
+
+        async with astart_as_current_span("my-llm-generation") as atla_span:
+            await asyncio.sleep(0)
+            atla_span.record_generation(
+                input_messages=[{"role": "user", "content": "Hello"}],
+                output_messages=[{"role": "assistant", "content": "Hi!"}],
+            )
+
+        [span] = self.get_finished_spans()
+
+        assert span.name == "my-llm-generation"
+        assert span.attributes is not None
+        assert span.attributes["llm.input_messages.0.message.content"] == "Hello"
+        assert span.attributes["llm.output_messages.0.message.content"] == "Hi!"
+
+    @pytest.mark.asyncio
+    async def test_async_multi_agent_fan_out(self) -> None:
+        """Test async agent span parenting across many concurrent child tasks."""
+        from atla_insights.span import arecord_agent, astart_as_current_span
+
+        num_sub_agents = 200
+
+        async def sub_agent(idx: int) -> None:
+            async with arecord_agent(f"sub-agent-{idx}", "main-agent"):
+                # Interleave with other tasks at every step.
+                await asyncio.sleep(0)
+                async with astart_as_current_span(f"generation-{idx}"):
+                    await asyncio.sleep(0)
+                await asyncio.sleep(0)
+
+        start = time.perf_counter()
+        async with arecord_agent("main-agent") as main_agent_span:
+            await asyncio.gather(*(sub_agent(idx) for idx in range(num_sub_agents)))
+        elapsed = time.perf_counter() - start
+
+        spans = self.get_finished_spans()
+        assert len(spans) == 2 * num_sub_agents + 1
+
+        spans_by_name = {span.name: span for span in spans}
+        main_agent = spans_by_name["main-agent"]
+        assert main_agent.context is not None
+        assert main_agent.context.span_id == main_agent_span.get_span_context().span_id
+        assert main_agent.parent is None
+
+        for idx in range(num_sub_agents):
+            sub_agent_span = spans_by_name[f"sub-agent-{idx}"]
+            generation_span = spans_by_name[f"generation-{idx}"]
+
+            assert sub_agent_span.parent is not None
+            assert sub_agent_span.parent.span_id == main_agent.context.span_id
+            assert sub_agent_span.attributes is not None
+            assert sub_agent_span.attributes["graph.node.parent_id"] == "main-agent"
+
+            assert sub_agent_span.context is not None
+            assert generation_span.parent is not None
+            assert generation_span.parent.span_id == sub_agent_span.context.span_id
+            assert generation_span.context is not None
+            assert generation_span.context.trace_id == main_agent.context.trace_id
+
+        # Generous bound on the per-task overhead of entering/exiting spans across
+        # context switches, to catch pathological regressions only.
+        assert elapsed / num_sub_agents < 0.01
@@ -1,8 +1,27 @@
 """Test the span processors."""
 
+from typing import Optional
+
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor, TracerProvider
+
 from tests._otel import BaseLocalOtel
 
 
+class _RecordingSpanProcessor(SpanProcessor):
+    """Span processor recording the names of the spans it processes."""
+
+    def __init__(self, name: str, calls: list[tuple[str, str]]) -> None:
+        self.name = name
+        self.calls = calls
+
+    def on_start(self, span: Span, parent_context: Optional[Context] = None) -> None:
+        self.calls.append((self.name, f"start {span.name}"))
+
+    def on_end(self, span: ReadableSpan) -> None:
+        self.calls.append((self.name, f"end {span.name}"))
+
+
 class TestSpanProcessors(BaseLocalOtel):
     """Test the span processors."""
 
@@ -67,3 +86,95 @@ class TestSpanProcessors(BaseLocalOtel):
         assert span_1.attributes.get(SUCCESS_MARK) == -1
         assert span_2.attributes is not None
         assert span_2.attributes.get(SUCCESS_MARK) == -1
+
+
+class TestScopeRoutingSpanProcessor:
+    """Test the scope routing span processor."""
+
+    def test_routing(self) -> None:
+        """Test that spans are only dispatched to the processors of their scope."""
+        from atla_insights.span_processors import ScopeRoutingSpanProcessor
+
+        calls: list[tuple[str, str]] = []
+        span_processor = ScopeRoutingSpanProcessor()
+        span_processor.add_span_processor(_RecordingSpanProcessor("all", calls))
+        span_processor.add_span_processor(
+            _RecordingSpanProcessor("openinference", calls),
+            scopes=["openinference.instrumentation.*"],
+        )
+
+        tracer_provider = TracerProvider()
+        tracer_provider.add_span_processor(span_processor)
+
+        with tracer_provider.get_tracer("opentelemetry.instrumentation.httpx").start_span(
+            "http"
+        ):
+            pass
+        with tracer_provider.get_tracer(
+            "openinference.instrumentation.openai"
+        ).start_span("llm"):
+            pass
+
+        assert calls == [
+            ("all", "start http"),
+            ("all", "end http"),
+            ("all", "start llm"),
+            ("openinference", "start llm"),
+            ("all", "end llm"),
+            ("openinference", "end llm"),
+        ]
+
+    def test_add_first(self) -> None:
+        """Test that processors can be added in front, after spans were routed."""
+        from atla_insights.span_processors import ScopeRoutingSpanProcessor
+
+        calls: list[tuple[str, str]] = []
+        span_processor = ScopeRoutingSpanProcessor()
+        span_processor.add_span_processor(_RecordingSpanProcessor("all", calls))
+
+        tracer_provider = TracerProvider()
+        tracer_provider.add_span_processor(span_processor)
+        tracer = tracer_provider.get_tracer("pydantic-ai")
+
+        with tracer.start_span("before"):
+            pass
+
+        span_processor.add_span_processor(
+            _RecordingSpanProcessor("pydantic-ai", calls),
+            scopes=["pydantic-ai"],
+            first=True,
+        )
+        with tracer.start_span("after"):
+            pass
+
+        assert calls == [
+            ("all", "start before"),
+            ("all", "end before"),
+            ("pydantic-ai", "start after"),
+            ("all", "start after"),
+            ("pydantic-ai", "end after"),
+            ("all", "end after"),
+        ]
+
+    def test_suppressed(self) -> None:
+        """Test that spans started while suppressed are not dispatched."""
+        from atla_insights import suppress_instrumentation
+        from atla_insights.span_processors import ScopeRoutingSpanProcessor
+
+        calls: list[tuple[str, str]] = []
+        span_processor = ScopeRoutingSpanProcessor()
+        span_processor.add_span_processor(_RecordingSpanProcessor("all", calls))
+
+        tracer_provider = TracerProvider()
+        tracer_provider.add_span_processor(span_processor)
+        tracer = tracer_provider.get_tracer("openinference.instrumentation.openai")
+
+        with suppress_instrumentation():
+            suppressed_span = tracer.start_span("suppressed")
+        # The span is still suppressed when it ends outside of the suppressed context.
+        suppressed_span.end()
+        with tracer.start_span("recorded"):
+            pass
+
+        assert calls == [("all", "start recorded"), ("all", "end recorded")]
+        assert len(span_processor._suppressed_spans) == 0
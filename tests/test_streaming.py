@@ -0,0 +1,129 @@
+"""Test the streaming latency instrumentation."""
+
+import asyncio
+import time
+from typing import AsyncIterator, Iterator
+
+import pytest
+
+from tests._otel import BaseLocalOtel
+
+
+def _sync_stream(num_chunks: int, delay_s: float) -> Iterator[int]:
+    """A mock sync stream with a fixed delay between chunks."""
+    for chunk_idx in range(num_chunks):
+        time.sleep(delay_s)
+        yield chunk_idx
+
+
+async def _async_stream(num_chunks: int, delay_s: float) -> AsyncIterator[int]:
+    """A mock async stream with a fixed delay between chunks."""
+    for chunk_idx in range(num_chunks):
+        await asyncio.sleep(delay_s)
+        yield chunk_idx
+
+
+class TestStreaming(BaseLocalOtel):
+    """Test the streaming latency instrumentation."""
+
+    def test_recorder(self) -> None:
+        """Test the streaming latency recorder."""
+        from atla_insights.streaming import StreamingLatencyRecorder
+
+        recorder = StreamingLatencyRecorder()
+        assert recorder.get_attributes() == {"atla.streaming.chunk_count": 0}
+
+        for _ in _sync_stream(num_chunks=5, delay_s=0.01):
+            recorder.record_chunk()
+
+        attributes = recorder.get_attributes()
+        assert attributes["atla.streaming.chunk_count"] == 5
+        ttft_ms = attributes["atla.streaming.time_to_first_token_ms"]
+        assert isinstance(ttft_ms, float) and 10 <= ttft_ms < 1_000
+
+        p50 = attributes["atla.streaming.inter_chunk_latency_ms.p50"]
+        p99 = attributes["atla.streaming.inter_chunk_latency_ms.p99"]
+        max_latency = attributes["atla.streaming.inter_chunk_latency_ms.max"]
+        assert isinstance(p50, float) and isinstance(p99, float)
+        assert isinstance(max_latency, float)
+        assert 10 / 1.25 <= p50 <= p99 <= max_latency
+
+    def test_recorder_constant_memory(self) -> None:
+        """Test that the recorder state does not grow with the number of chunks."""
+        from atla_insights.streaming import StreamingLatencyRecorder
+
+        recorder = StreamingLatencyRecorder()
+        num_buckets = len(recorder._buckets)
+
+        for _ in range(10_000):
+            recorder.record_chunk()
+
+        assert recorder.chunk_count == 10_000
+        assert len(recorder._buckets) == num_buckets
+        assert sum(recorder._buckets) == 9_999
+
+    def test_record_stream(self) -> None:
+        """Test recording a sync stream on a span."""
+        from atla_insights.main import ATLA_INSTANCE
+        from atla_insights.streaming import record_stream
+
+        with ATLA_INSTANCE.get_tracer().start_as_current_span("stream") as span:
+            items = list(record_stream(_sync_stream(num_chunks=3, delay_s=0.005), span))
+
+        assert items == [0, 1, 2]
+
+        [finished_span] = self.get_finished_spans()
+        assert finished_span.attributes is not None
+        assert finished_span.attributes["atla.streaming.chunk_count"] == 3
+        ttft_ms = finished_span.attributes["atla.streaming.time_to_first_token_ms"]
+        assert isinstance(ttft_ms, float) and ttft_ms >= 5
+        assert "atla.streaming.inter_chunk_latency_ms.p90" in finished_span.attributes
+
+    def test_record_stream_early_exit(self) -> None:
+        """Test that the time-to-first-token is kept when a stream is abandoned."""
+        from atla_insights.main import ATLA_INSTANCE
+        from atla_insights.streaming import record_stream
+
+        with ATLA_INSTANCE.get_tracer().start_as_current_span("stream") as span:
+            for _ in record_stream(_sync_stream(num_chunks=3, delay_s=0.001), span):
+                break
+
+        [finished_span] = self.get_finished_spans()
+        assert finished_span.attributes is not None
+        assert finished_span.attributes["atla.streaming.chunk_count"] == 1
+        assert "atla.streaming.time_to_first_token_ms" in finished_span.attributes
+
+    @pytest.mark.asyncio
+    async def test_timed_stream_async(self) -> None:
+        """Test recording an async stream on a span through a stream proxy."""
+        from atla_insights.main import ATLA_INSTANCE
+        from atla_insights.streaming import TimedStream, time_stream
+
+        with ATLA_INSTANCE.get_tracer().start_as_current_span("stream") as span:
+            stream = time_stream(_async_stream(num_chunks=4, delay_s=0.001), span)
+            assert isinstance(stream, TimedStream)
+            assert time_stream(stream, span) is stream
+
+            items = [item async for item in stream]
+
+        assert items == [0, 1, 2, 3]
+
+        [finished_span] = self.get_finished_spans()
+        assert finished_span.attributes is not None
+        assert finished_span.attributes["atla.streaming.chunk_count"] == 4
+
+    def test_timed_stream_next(self) -> None:
+        """Test recording a stream advanced one chunk at a time by an outer proxy."""
+        from atla_insights.main import ATLA_INSTANCE
+        from atla_insights.streaming import time_stream
+
+        with ATLA_INSTANCE.get_tracer().start_as_current_span("stream") as span:
+            stream = time_stream(_sync_stream(num_chunks=3, delay_s=0.001), span)
+            assert [next(stream), next(stream), next(stream)] == [0, 1, 2]
+            with pytest.raises(StopIteration):
+                next(stream)
+
+        [finished_span] = self.get_finished_spans()
+        assert finished_span.attributes is not None
+        assert finished_span.attributes["atla.streaming.chunk_count"] == 3
+        assert "atla.streaming.inter_chunk_latency_ms.p50" in finished_span.attributes
@@ -1,6 +1,10 @@
 """Test the suppression functionality."""
 
-from openai import OpenAI
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from openai import AsyncOpenAI, OpenAI
 
 from tests._otel import BaseLocalOtel
 from tests.conftest import in_memory_span_exporter
@@ -66,3 +70,88 @@ class TestSuppression(BaseLocalOtel):
         with instrument_openai():
             test_function()
         assert len(self.get_finished_spans()) == 2
+
+    def test_suppress_instrumentation_keeps_instrumentors(
+        self, mock_openai_client: OpenAI
+    ) -> None:
+        """Test that suppression does not (un)instrument any active instrumentors."""
+        from openinference.instrumentation.openai import OpenAIInstrumentor
+
+        from atla_insights import instrument_openai, suppress_instrumentation
+
+        with instrument_openai():
+            with (
+                patch.object(OpenAIInstrumentor, "uninstrument") as mock_uninstrument,
+                patch.object(OpenAIInstrumentor, "instrument") as mock_instrument,
+            ):
+                with suppress_instrumentation():
+                    mock_openai_client.chat.completions.create(
+                        model="some-model",
+                        messages=[{"role": "user", "content": "hello world"}],
+                    )
+
+            mock_uninstrument.assert_not_called()
+            mock_instrument.assert_not_called()
+            assert len(self.get_finished_spans()) == 0
+
+            mock_openai_client.chat.completions.create(
+                model="some-model",
+                messages=[{"role": "user", "content": "hello world"}],
+            )
+            assert len(self.get_finished_spans()) == 1
+
+    def test_suppress_instrumentation_nested(self) -> None:
+        """Test that nested suppression restores the outer suppression state."""
+        from atla_insights import suppress_instrumentation
+        from atla_insights.suppression import is_instrumentation_suppressed
+
+        with suppress_instrumentation():
+            with suppress_instrumentation():
+                assert is_instrumentation_suppressed()
+            assert is_instrumentation_suppressed()
+        assert not is_instrumentation_suppressed()
+
+    def test_suppress_instrumentation_other_instrumentation(self) -> None:
+        """Test that suppression does not affect other OpenTelemetry instrumentation."""
+        from opentelemetry import context as context_api
+
+        from atla_insights import enable_instrumentation, suppress_instrumentation
+
+        with suppress_instrumentation():
+            assert not context_api.get_value(context_api._SUPPRESS_INSTRUMENTATION_KEY)
+
+            current_context = context_api.get_current()
+            enable_instrumentation()
+            assert context_api.get_current() is current_context
+
+    @pytest.mark.asyncio
+    async def test_suppress_instrumentation_task_scoped(
+        self, mock_async_openai_client: AsyncOpenAI
+    ) -> None:
+        """Test that suppression only applies to the current task."""
+        from atla_insights import (
+            instrument,
+            instrument_openai,
+            suppress_instrumentation,
+        )
+
+        @instrument("test_function")
+        async def test_function() -> None:
+            """Test function."""
+            for _ in range(3):
+                await asyncio.sleep(0)
+                await mock_async_openai_client.chat.completions.create(
+                    model="some-model",
+                    messages=[{"role": "user", "content": "hello world"}],
+                )
+
+        async def suppressed_task() -> None:
+            with suppress_instrumentation():
+                await test_function()
+
+        with instrument_openai():
+            await asyncio.gather(suppressed_task(), test_function(), suppressed_task())
+
+        spans = self.get_finished_spans()
+        assert len(spans) == 4
+        assert len({span.context.trace_id for span in spans if span.context}) == 1
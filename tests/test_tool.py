@@ -1,5 +1,9 @@
 """Test the tool decorator."""
 
+import asyncio
+
+import pytest
+
 from tests._otel import BaseLocalOtel
 
 
@@ -220,3 +224,162 @@ class TestTool(BaseLocalOtel):
         assert event.attributes is not None
         assert event.attributes.get("exception.type") == "ValueError"
         assert event.attributes.get("exception.message") == "some-error"
+
+    @pytest.mark.asyncio
+    async def test_async(self) -> None:
+        """Test the tool decorator with an async tool."""
+        from atla_insights import tool
+
+        @tool
+        async def test_function(some_arg: str) -> str:
+            """Test function."""
+            await asyncio.sleep(0.01)
+            return "some-result"
+
+        assert await test_function(some_arg="some-value") == "some-result"
+
+        finished_spans = self.get_finished_spans()
+        assert len(finished_spans) == 1
+
+        [span] = finished_spans
+
+        assert span.name == "test_function"
+        assert span.start_time is not None and span.end_time is not None
+        assert span.end_time - span.start_time >= 10_000_000
+
+        assert span.attributes is not None
+        assert span.attributes.get("tool.parameters") == '{"some_arg": "some-value"}'
+        assert span.attributes.get("output.value") == "some-result"
+
+    @pytest.mark.asyncio
+    async def test_async_exception(self) -> None:
+        """Test the tool decorator with a failing async tool."""
+        from atla_insights import tool
+
+        @tool
+        async def test_function(some_arg: str) -> str:
+            """Test function."""
+            raise ValueError("some-error")
+
+        with pytest.raises(ValueError):
+            await test_function(some_arg="some-value")
+
+        [span] = self.get_finished_spans()
+
+        assert span.status.status_code.name == "ERROR"
+        assert span.status.description == "some-error"
+        assert [event.name for event in span.events] == ["exception"]
+
+    def test_generator(self) -> None:
+        """Test the tool decorator with a generator tool."""
+        from atla_insights import tool
+
+        @tool
+        def test_function(some_arg: str):
+            """Test function."""
+            yield "some"
+            yield "result"
+
+        assert list(test_function(some_arg="some-value")) == ["some", "result"]
+
+        [span] = self.get_finished_spans()
+
+        assert span.name == "test_function"
+        assert span.attributes is not None
+        assert span.attributes.get("tool.parameters") == '{"some_arg": "some-value"}'
+        assert span.attributes.get("output.value") == "['some', 'result']"
+
+    def test_generator_send(self) -> None:
+        """Test that generator tools still get sent values and return a value."""
+        from atla_insights import tool
+
+        @tool
+        def test_function(start: int):
+            """Test function."""
+            total = start
+            while (value := (yield total)) is not None:
+                total += value
+            return total
+
+        generator = test_function(start=1)
+        assert [next(generator), generator.send(2), generator.send(3)] == [1, 3, 6]
+        with pytest.raises(StopIteration) as exc_info:
+            generator.send(None)
+        assert exc_info.value.value == 6
+
+        [span] = self.get_finished_spans()
+        assert span.attributes is not None
+        assert span.attributes.get("output.value") == "[1, 3, 6]"
+
+    @pytest.mark.asyncio
+    async def test_async_generator(self) -> None:
+        """Test the tool decorator with an async generator tool."""
+        from atla_insights import tool
+
+        @tool
+        async def test_function(some_arg: str):
+            """Test function."""
+            for item in ["some", "result"]:
+                await asyncio.sleep(0)
+                yield item
+
+        assert [x async for x in test_function(some_arg="some-value")] == [
+            "some",
+            "result",
+        ]
+
+        [span] = self.get_finished_spans()
+
+        assert span.name == "test_function"
+        assert span.attributes is not None
+        assert span.attributes.get("tool.parameters") == '{"some_arg": "some-value"}'
+        assert span.attributes.get("output.value") == "['some', 'result']"
+
+    def test_generator_output_is_bounded(self) -> None:
+        """Test that only the first few items yielded by a generator tool are kept."""
+        from atla_insights import tool
+        from atla_insights.capture import MAX_CAPTURE_ITEMS
+
+        @tool
+        def test_function(n: int):
+            """Test function."""
+            yield from range(n)
+
+        assert list(test_function(n=1_000)) == list(range(1_000))
+
+        [span] = self.get_finished_spans()
+        assert span.attributes is not None
+        expected = [
+            *range(MAX_CAPTURE_ITEMS - 1),
+            f"... {1_001 - MAX_CAPTURE_ITEMS} more items",
+        ]
+        assert span.attributes.get("output.value") == str(expected)
+
+    @pytest.mark.asyncio
+    async def test_async_generator_asend_athrow(self) -> None:
+        """Test that async generator tools still get sent values and thrown errors."""
+        from atla_insights import tool
+
+        @tool
+        async def test_function(start: int):
+            """Test function."""
+            total = start
+            while True:
+                try:
+                    value = yield total
+                except ValueError:
+                    value = -total
+                total += value or 0
+
+        generator = test_function(start=1)
+        assert [
+            await generator.__anext__(),
+            await generator.asend(2),
+            await generator.athrow(ValueError("reset")),
+            await generator.asend(5),
+        ] == [1, 3, 0, 5]
+        await generator.aclose()
+
+        [span] = self.get_finished_spans()
+        assert span.attributes is not None
+        assert span.attributes.get("output.value") is None